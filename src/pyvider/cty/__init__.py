@@ -24,7 +24,15 @@ from pyvider.cty.exceptions import (
     CtyValidationError,
 )
 from pyvider.cty.graphemes import grapheme_cluster_count, grapheme_clusters
-from pyvider.cty.json_codec import cty_from_json, cty_to_json, implied_json_type
+from pyvider.cty.json_codec import (
+    cty_from_json,
+    cty_from_json_many,
+    cty_from_json_stream,
+    cty_to_json,
+    cty_to_json_into,
+    cty_to_json_many,
+    implied_json_type,
+)
 from pyvider.cty.mark_paths import PathMarks, mark_with_paths, unmark_deep_with_paths
 from pyvider.cty.marks import CtyMark, collect_marks_deep, unmark_deep
 from pyvider.cty.parser import parse_tf_type_to_ctytype, parse_type_string_to_ctytype
@@ -43,10 +51,11 @@ from pyvider.cty.types import (
     CtyString,
     CtyTuple,
     CtyType,
+    intern_type,
 )
 from pyvider.cty.unknown import unknown_as_null
 from pyvider.cty.value_range import ValueRange, value_range
-from pyvider.cty.values import CtyValue
+from pyvider.cty.values import CtyValue, columnar, validate_columnar
 from pyvider.cty.walk import deep_values, transform, walk
 
 """
@@ -85,14 +94,20 @@ __all__ = [
     "ValueRange",
     "__version__",
     "collect_marks_deep",
+    "columnar",
     "conformance_errors",
     "convert",
     "cty_from_json",
+    "cty_from_json_many",
+    "cty_from_json_stream",
     "cty_to_json",
+    "cty_to_json_into",
+    "cty_to_json_many",
     "deep_values",
     "grapheme_cluster_count",
     "grapheme_clusters",
     "implied_json_type",
+    "intern_type",
     "mark_with_paths",
     "parse_tf_type_to_ctytype",
     "parse_type_string_to_ctytype",
@@ -103,6 +118,7 @@ __all__ = [
     "unknown_as_null",
     "unmark_deep",
     "unmark_deep_with_paths",
+    "validate_columnar",
     "value_range",
     "walk",
 ]
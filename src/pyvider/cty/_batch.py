@@ -0,0 +1,55 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
+from itertools import repeat
+from typing import Any, TypeVar
+
+from pyvider.cty.config.defaults import CODEC_BATCH_CHUNK_SIZE, CODEC_BATCH_PARALLEL_THRESHOLD
+from pyvider.cty.types import CtyType
+
+"""The fan-out shared by the batch codecs in `codec` and `json_codec`.
+
+Each batch codec is a chunk worker -- a module-level function from a list of
+inputs and one schema to a list of outputs, so that a process pool can pickle
+it by name -- and this module decides whether the chunk is the whole batch,
+run here, or one of many handed to an executor.
+"""
+
+_In = TypeVar("_In")
+_Out = TypeVar("_Out")
+
+
+def run_batch(
+    work: Callable[[list[_In], CtyType[Any]], list[_Out]],
+    items: Sequence[_In],
+    schema: CtyType[Any],
+    executor: Executor | None,
+) -> list[_Out]:
+    """`work` over every item, in order, in this process or across `executor`.
+
+    An executor is only used above `CODEC_BATCH_PARALLEL_THRESHOLD` items; a
+    smaller batch does not repay shipping the schema and its values to a
+    worker. Results come back in input order either way, and the first failing
+    item's exception is the one raised -- `Executor.map` yields chunk results
+    in submission order, and a chunk stops at its first failure just as the
+    sequential path does. Exceptions cross a process boundary by pickling,
+    which every `CtyError` survives.
+    """
+    batch = list(items)
+    if executor is None or len(batch) < CODEC_BATCH_PARALLEL_THRESHOLD:
+        return work(batch, schema)
+    chunks = [batch[i : i + CODEC_BATCH_CHUNK_SIZE] for i in range(0, len(batch), CODEC_BATCH_CHUNK_SIZE)]
+    results: list[_Out] = []
+    for chunk_results in executor.map(work, chunks, repeat(schema)):
+        results.extend(chunk_results)
+    return results
+
+
+# 🌊🪢🔚
@@ -6,13 +6,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
 from decimal import Decimal
+from functools import lru_cache
 import json
-from typing import Any, cast
+import threading
+from typing import IO, Any, cast
+import unicodedata
 
 import msgpack
 
+from pyvider.cty._batch import run_batch
 from pyvider.cty.config.defaults import (
+    CODEC_FRAGMENT_CACHE_MIN_SIZE,
     ERR_DECODE_DYNAMIC_TYPE,
     ERR_DECODE_REFINED_UNKNOWN,
     ERR_DYNAMIC_MALFORMED,
@@ -22,9 +29,11 @@ from pyvider.cty.config.defaults import (
     ERR_VALUE_FOR_MAP,
     ERR_VALUE_FOR_OBJECT,
     ERR_VALUE_FOR_TUPLE,
+    MSGPACK_ENCODER_PLAN_CACHE_SIZE,
     MSGPACK_EXT_TYPE_CTY,
     MSGPACK_EXT_TYPE_REFINED_UNKNOWN,
     MSGPACK_RAW_FALSE,
+    MSGPACK_RETAINED_PACKER_BYTES,
     MSGPACK_STRICT_MAP_KEY_FALSE,
     MSGPACK_USE_BIN_TYPE_TRUE,
     REFINEMENT_COLLECTION_LENGTH_LOWER_BOUND,
@@ -35,30 +44,41 @@ from pyvider.cty.config.defaults import (
     REFINEMENT_STRING_PREFIX,
     TWO_VALUE,
 )
-from pyvider.cty.conversion import encode_cty_type_to_wire_json
+from pyvider.cty.conversion import type_from_spec_bytes, type_spec_bytes
 from pyvider.cty.exceptions import (
+    CtyError,
     CtyMarksSerializationError,
+    CtyValidationError,
     DeserializationError,
     SerializationError,
 )
 from pyvider.cty.marks import collect_marks_deep
-from pyvider.cty.parser import parse_tf_type_to_ctytype
 from pyvider.cty.types import (
+    CtyBool,
+    CtyCapsule,
     CtyDynamic,
     CtyList,
     CtyMap,
+    CtyNumber,
     CtyObject,
     CtySet,
+    CtyString,
     CtyTuple,
     CtyType,
 )
 from pyvider.cty.values import CtyValue
+from pyvider.cty.values.frozen import FrozenDict
+from pyvider.cty.values.lazy import LazyObjectPayload
 from pyvider.cty.values.markers import (
     UNREFINED_UNKNOWN,
     RefinedUnknownValue,
     UnknownValue,
 )
-from pyvider.cty.values.set_order import order_key as set_order_key
+from pyvider.cty.values.set_order import (
+    identity_key as set_identity_key,
+    in_order as set_in_order,
+    order_key as set_order_key,
+)
 
 
 def _decode_number_value(val: Any) -> Decimal:
@@ -225,10 +245,7 @@ def _serialize_dynamic(value: CtyValue[Any], path: str = "") -> list[Any] | Any:
 
     actual_type = inner_value.type
     serializable_inner = _convert_value_to_serializable(inner_value, actual_type, path)
-
-    type_spec_json = encode_cty_type_to_wire_json(actual_type)
-    type_spec_bytes = json.dumps(type_spec_json, separators=(",", ":")).encode("utf-8")
-    return [type_spec_bytes, serializable_inner]
+    return [type_spec_bytes(actual_type), serializable_inner]
 
 
 def _serialize_object_value(inner_val: Any, schema: CtyObject, path: str = "") -> dict[str, Any]:
@@ -254,13 +271,12 @@ def _serialize_map_value(inner_val: Any, schema: CtyMap[Any], path: str = "") ->
 def _serialize_collection_value(
     inner_val: Any, schema: CtyList[Any] | CtySet[Any], path: str = ""
 ) -> list[Any]:
-    """Serialize a CtyList or CtySet value."""
+    """Serialize a CtyList or CtySet value; a set's members arrive in `set_in_order`'s order."""
     if not hasattr(inner_val, "__iter__"):
         raise TypeError(ERR_VALUE_FOR_LIST_SET)
-    items = sorted(list(inner_val), key=set_order_key) if isinstance(schema, CtySet) else inner_val
     return [
         _convert_value_to_serializable(item, schema.element_type, f"{path}[{i}]")
-        for i, item in enumerate(items)
+        for i, item in enumerate(inner_val)
     ]
 
 
@@ -274,8 +290,19 @@ def _serialize_tuple_value(inner_val: Any, schema: CtyTuple, path: str = "") ->
     ]
 
 
-def _serialize_decimal_value(decimal_val: Decimal) -> int | float | str:
-    """Serialize a Decimal value for MessagePack encoding.
+# msgpack writes an int natively only within int64; go-cty writes anything
+# wider as its decimal text (`cty/msgpack/marshal.go:88`).
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+def _serialize_int_value(int_val: int) -> int | str:
+    """An `int` payload for MessagePack: itself, or its text past int64."""
+    return int_val if _INT64_MIN <= int_val <= _INT64_MAX else str(int_val)
+
+
+def _serialize_decimal_value(decimal_val: Decimal | int) -> int | float | str:
+    """Serialize a number payload for MessagePack encoding.
 
     Returns int for integers in int64 range, str for large integers, or float for non-integers.
     For non-integers, checks if float conversion would lose precision and encodes as string if so.
@@ -298,6 +325,8 @@ def _serialize_decimal_value(decimal_val: Decimal) -> int | float | str:
     `format` still spells it the way Go's `fmt` does. The wire is the boundary
     that has to hold.
     """
+    if not isinstance(decimal_val, Decimal):
+        return _serialize_int_value(decimal_val)
     if decimal_val.is_nan():
         raise SerializationError(ERR_NAN_NOT_SERIALIZABLE)
 
@@ -394,14 +423,331 @@ def _convert_value_to_serializable(value: CtyValue[Any], schema: CtyType[Any], p
         return _serialize_map_value(inner_val, schema, path)
     if isinstance(schema, CtyList | CtySet):
         schema_narrowed = cast(CtyList[Any] | CtySet[Any], schema)  # type: ignore[redundant-cast]
-        return _serialize_collection_value(inner_val, schema_narrowed, path)
+        items = set_in_order(value) if isinstance(schema, CtySet) else inner_val
+        return _serialize_collection_value(items, schema_narrowed, path)
     if isinstance(schema, CtyTuple):
         return _serialize_tuple_value(inner_val, schema, path)
-    if isinstance(inner_val, Decimal):
+    if type(inner_val) is int or isinstance(inner_val, Decimal):
         return _serialize_decimal_value(inner_val)
     return inner_val
 
 
+class _MarkedAt(Exception):
+    """A marked value found by a compiled plan, carrying its location inside-out.
+
+    The generic walk formats a path string for every element it visits so that
+    the one element that turns out to be marked can be named. A plan does not:
+    each container appends its own step to `steps` as this propagates outward,
+    and `cty_to_msgpack` joins them into the same path the generic walk would
+    have built. Nothing is formatted unless something is wrong.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.steps: list[str] = []
+
+    def path(self) -> str | None:
+        return "".join(reversed(self.steps)) or None
+
+
+_Writer = Callable[[Any, "_Packer"], None]
+"""A compiled plan: writes one value of its schema into a packer."""
+
+
+def _prepared(value: Any, schema: CtyType[Any]) -> CtyValue[Any]:
+    """The per-node preamble of `_convert_value_to_serializable`, minus the path."""
+    checked: CtyValue[Any] = value if isinstance(value, CtyValue) else schema.validate(value)
+    if checked.marks:
+        raise _MarkedAt()
+    return checked
+
+
+def _reuse_fragment(value: CtyValue[Any], schema: CtyType[Any], packer: _Packer) -> bool:
+    """Write `value`'s kept encoding under `schema`, if it has one."""
+    encoded = value._encoded
+    if encoded is not None:
+        kept = encoded.get("msgpack")
+        # By identity: a plan's schema is the one object its cache entry was
+        # built for, and comparing two schemas structurally is a walk.
+        if kept is not None and kept[0] is schema:
+            packer.write_verbatim(kept[1])
+            return True
+    return False
+
+
+def _keep_fragment(
+    value: CtyValue[Any], schema: CtyType[Any], packer: _Packer, start: tuple[int, int] | None
+) -> None:
+    """Keep what was written since `start` as `value`'s encoding under `schema`.
+
+    Only while the packer is still sealed: the root was proven immutable and
+    no capsule has been written since. The fragments are what make a tree
+    re-encoded after a small change cheap -- `evolve` shares every untouched
+    subtree, and each of those is now one copy rather than a walk.
+
+    The node's mark memo is filled alongside. The root's walk proved this
+    subtree immutable and unmarked, but memoized only the root; without this
+    the next root's `_refuse_marks_deep` walked every shared subtree again,
+    and that walk was most of what a re-encode after a small change still cost.
+    """
+    if start is None or not packer.sealed:
+        return
+    fragment = packer.since(start, CODEC_FRAGMENT_CACHE_MIN_SIZE)
+    if fragment is not None:
+        object.__setattr__(value, "_encoded", {**(value._encoded or {}), "msgpack": (schema, fragment)})
+        if value._deep_marks is None:
+            object.__setattr__(value, "_deep_marks", frozenset())
+
+
+def _compile_dynamic(schema: CtyDynamic) -> _Writer:
+    def write(value: Any, packer: _Packer) -> None:
+        value = _prepared(value, schema)
+        inner_value = value.value
+        if not isinstance(inner_value, CtyValue):
+            packer.pack(_serialize_dynamic(value))
+            return
+        actual_type = inner_value.type
+        packer.pack_array_header(TWO_VALUE)
+        packer.pack(type_spec_bytes(actual_type))
+        _encoder_plan(actual_type)(inner_value, packer)
+
+    return write
+
+
+def _write_arrived(
+    payload: LazyObjectPayload, ordered: tuple[tuple[str, _Writer], ...], packer: _Packer
+) -> None:
+    # Decoded lazily under this schema: each attribute that arrived goes back
+    # out as the bytes it arrived as, read since or not. None of them can hold
+    # a mark, so there is no path to track; an attribute that did not arrive
+    # is an optional one's null, which has none either.
+    packer.pack_map_header(len(ordered))
+    for name, plan in ordered:
+        packer.pack(name)
+        arrived = payload.encoded(name)
+        if arrived is None:
+            plan(payload[name], packer)
+        else:
+            packer.write_verbatim(arrived)
+
+
+def _write_attributes(
+    inner_val: dict[str, Any],
+    ordered: tuple[tuple[str, _Writer], ...],
+    attribute_plans: dict[str, _Writer],
+    packer: _Packer,
+) -> None:
+    name = ""
+    try:
+        if len(inner_val) == len(ordered):
+            packer.pack_map_header(len(ordered))
+            for name, plan in ordered:
+                packer.pack(name)
+                plan(inner_val[name], packer)
+        else:
+            items = sorted(inner_val.items())
+            plans = [attribute_plans[name] for name, _ in items]
+            packer.pack_map_header(len(items))
+            for (name, item), plan in zip(items, plans, strict=True):
+                packer.pack(name)
+                plan(item, packer)
+    except _MarkedAt as marked:
+        marked.steps.append(f".{name}")
+        raise
+
+
+def _compile_object(schema: CtyObject) -> _Writer:
+    attribute_plans = {name: _encoder_plan(t) for name, t in schema.attribute_types.items()}
+    # A validated payload holds every attribute, so the sorted order is known in
+    # advance; a hand-built one missing some falls back to sorting what it has.
+    ordered = tuple(sorted(attribute_plans.items()))
+
+    def write(value: Any, packer: _Packer) -> None:
+        value = _prepared(value, schema)
+        if value.is_unknown:
+            packer.pack(_serialize_unknown(value))
+            return
+        if value.is_null:
+            packer.pack(None)
+            return
+        if value._encoded is not None and _reuse_fragment(value, schema, packer):
+            return
+        inner_val = value.value
+        if not isinstance(inner_val, dict):
+            raise TypeError(ERR_VALUE_FOR_OBJECT)
+        start = packer.position() if packer.sealed else None
+        if type(inner_val) is LazyObjectPayload and (
+            inner_val.schema is schema or inner_val.schema.equal(schema)
+        ):
+            _write_arrived(inner_val, ordered, packer)
+        else:
+            _write_attributes(inner_val, ordered, attribute_plans, packer)
+        _keep_fragment(value, schema, packer, start)
+
+    return write
+
+
+def _compile_map(schema: CtyMap[Any]) -> _Writer:
+    element_plan = _encoder_plan(schema.element_type)
+
+    def write(value: Any, packer: _Packer) -> None:
+        value = _prepared(value, schema)
+        if value.is_unknown:
+            packer.pack(_serialize_unknown(value))
+            return
+        if value.is_null:
+            packer.pack(None)
+            return
+        if value._encoded is not None and _reuse_fragment(value, schema, packer):
+            return
+        inner_val = value.value
+        if not isinstance(inner_val, dict):
+            raise TypeError(ERR_VALUE_FOR_MAP)
+        start = packer.position() if packer.sealed else None
+        key = ""
+        packer.pack_map_header(len(inner_val))
+        try:
+            for key, item in sorted(inner_val.items()):
+                packer.pack(key)
+                element_plan(item, packer)
+        except _MarkedAt as marked:
+            marked.steps.append(f'["{key}"]')
+            raise
+        _keep_fragment(value, schema, packer, start)
+
+    return write
+
+
+def _compile_collection(schema: CtyList[Any] | CtySet[Any]) -> _Writer:
+    element_plan = _encoder_plan(schema.element_type)
+    is_set = isinstance(schema, CtySet)
+
+    def write(value: Any, packer: _Packer) -> None:
+        value = _prepared(value, schema)
+        if value.is_unknown:
+            packer.pack(_serialize_unknown(value))
+            return
+        if value.is_null:
+            packer.pack(None)
+            return
+        if value._encoded is not None and _reuse_fragment(value, schema, packer):
+            return
+        inner_val = value.value
+        if not hasattr(inner_val, "__iter__"):
+            raise TypeError(ERR_VALUE_FOR_LIST_SET)
+        start = packer.position() if packer.sealed else None
+        items = set_in_order(value) if is_set else inner_val
+        if not hasattr(items, "__len__"):
+            items = list(items)
+        packer.pack_array_header(len(items))
+        index = 0
+        try:
+            for item in items:
+                element_plan(item, packer)
+                index += 1
+        except _MarkedAt as marked:
+            marked.steps.append(f"[{index}]")
+            raise
+        _keep_fragment(value, schema, packer, start)
+
+    return write
+
+
+def _compile_tuple(schema: CtyTuple) -> _Writer:
+    element_plans = tuple(_encoder_plan(t) for t in schema.element_types)
+
+    def write(value: Any, packer: _Packer) -> None:
+        value = _prepared(value, schema)
+        if value.is_unknown:
+            packer.pack(_serialize_unknown(value))
+            return
+        if value.is_null:
+            packer.pack(None)
+            return
+        if value._encoded is not None and _reuse_fragment(value, schema, packer):
+            return
+        inner_val = value.value
+        if not isinstance(inner_val, tuple):
+            raise TypeError(ERR_VALUE_FOR_TUPLE)
+        # The generic walk indexes the element types by position and so fails
+        # on a payload longer than the schema; checked up front here, because
+        # the header is written before the first element.
+        plans = [element_plans[i] for i in range(len(inner_val))]
+        start = packer.position() if packer.sealed else None
+        packer.pack_array_header(len(inner_val))
+        index = 0
+        try:
+            for item, plan in zip(inner_val, plans, strict=True):
+                plan(item, packer)
+                index += 1
+        except _MarkedAt as marked:
+            marked.steps.append(f"[{index}]")
+            raise
+        _keep_fragment(value, schema, packer, start)
+
+    return write
+
+
+def _compile_leaf(schema: CtyType[Any]) -> _Writer:
+    # A capsule's payload is an arbitrary Python object, which the mark memo's
+    # immutability proof says nothing about; nothing enclosing one is kept.
+    opaque = isinstance(schema, CtyCapsule)
+
+    def write(value: Any, packer: _Packer) -> None:
+        value = _prepared(value, schema)
+        if opaque:
+            packer.sealed = False
+        if value.is_unknown:
+            packer.pack(_serialize_unknown(value))
+        elif value.is_null:
+            packer.pack(None)
+        elif type(inner_val := value.value) is int:
+            packer.pack(inner_val if _INT64_MIN <= inner_val <= _INT64_MAX else str(inner_val))
+        elif isinstance(inner_val, Decimal):
+            packer.pack(_serialize_decimal_value(inner_val))
+        else:
+            packer.pack(inner_val)
+
+    return write
+
+
+@lru_cache(maxsize=MSGPACK_ENCODER_PLAN_CACHE_SIZE)
+def _encoder_plan(schema: CtyType[Any]) -> _Writer:
+    """The encoder for `schema`: `_convert_value_to_serializable`, specialized.
+
+    The generic walk asks at every node which kind of type it is holding --
+    six `isinstance` tests before a string is reached -- and formats a path
+    string per element in case that element turns out to be marked. Both depend
+    only on the schema, and a provider encodes the same few resource schemas
+    thousands of times per plan. So the type dispatch happens once, here, and
+    leaves behind a tree of closures shaped like the schema, each knowing its
+    children's writers; paths are assembled only when a mark is found (see
+    `_MarkedAt`).
+
+    A plan writes headers and leaves straight into a `msgpack.Packer` as it
+    walks, rather than building the dict-and-list mirror of the value that the
+    generic walk hands to `packb`. Every container used to be allocated twice,
+    once as a `CtyValue` and once as its mirror, and a large state held both at
+    the peak. The bytes are the same: a map or array header followed by its
+    entries is exactly what `packb` writes for the mirror, in the same order.
+    The generic walk stays as the reference the plans are tested against.
+
+    Cached by type, which is structural equality, so two equal schemas built
+    separately share a plan.
+    """
+    if isinstance(schema, CtyDynamic):
+        return _compile_dynamic(schema)
+    if isinstance(schema, CtyObject):
+        return _compile_object(schema)
+    if isinstance(schema, CtyMap):
+        return _compile_map(schema)
+    if isinstance(schema, CtyList | CtySet):
+        return _compile_collection(cast(CtyList[Any] | CtySet[Any], schema))  # type: ignore[redundant-cast]
+    if isinstance(schema, CtyTuple):
+        return _compile_tuple(schema)
+    return _compile_leaf(schema)
+
+
 def _msgpack_default_handler(obj: Any) -> Any:
     if isinstance(obj, Decimal):
         return _serialize_decimal_value(obj)
@@ -409,7 +755,102 @@ def _msgpack_default_handler(obj: Any) -> Any:
     raise TypeError(error_message)
 
 
-def cty_to_msgpack(value: CtyValue[Any], schema: CtyType[Any]) -> bytes:
+class _Packer(msgpack.Packer):  # type: ignore[misc]
+    """A packer that can also splice in bytes that are already encoded.
+
+    msgpack has no call for writing raw bytes into a packer's buffer, and an
+    attribute of a lazily decoded object is re-encoded by copying the bytes it
+    arrived as. So the buffer so far is set aside, the copy after it, and the
+    packer carries on from empty; `take` joins the pieces. An encoding with
+    nothing spliced in -- all but the lazy ones -- is one buffer, as before.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.spilled: list[bytes | memoryview] = []
+        # Whether what is written now may be kept as a fragment; see
+        # `_keep_fragment`. Set per encoding by `_write`.
+        self.sealed = False
+
+    def write_verbatim(self, encoded: bytes | memoryview) -> None:
+        self.spilled.append(self.bytes())
+        self.reset()
+        self.spilled.append(encoded)
+
+    # Both read the buffer through a `memoryview` that is never bound to a
+    # name, so it is released -- and the packer free to grow again -- as soon
+    # as the expression is done with it. A `with` block costs twice as much,
+    # and these run twice per container.
+
+    def position(self) -> tuple[int, int]:
+        """Where the next byte goes, for `since`."""
+        return len(self.spilled), len(self.getbuffer())
+
+    def since(self, start: tuple[int, int], minimum: int) -> bytes | None:
+        """A copy of everything written after `start`, or None if it is shorter than `minimum`."""
+        spilled_at, offset = start
+        if spilled_at == len(self.spilled):
+            if len(self.getbuffer()) - offset < minimum:
+                return None
+            return bytes(self.getbuffer()[offset:])
+        # The buffer `start` points into has been set aside since; it is the
+        # first of the spilled pieces that follow.
+        pieces = [self.spilled[spilled_at][offset:], *self.spilled[spilled_at + 1 :], self.bytes()]
+        if sum(len(piece) for piece in pieces) < minimum:
+            return None
+        return b"".join(pieces)
+
+    def take(self) -> bytes:
+        """Everything written since the last `discard`."""
+        if not self.spilled:
+            return cast(bytes, self.bytes())
+        return b"".join((*self.spilled, self.bytes()))
+
+    def discard(self) -> None:
+        self.spilled.clear()
+        self.reset()
+
+
+def _new_packer() -> _Packer:
+    # `autoreset=False` makes the packer accumulate instead of handing back a
+    # `bytes` per `pack` call: one growing buffer for the whole value.
+    return _Packer(
+        default=_msgpack_default_handler,
+        use_bin_type=MSGPACK_USE_BIN_TYPE_TRUE,
+        autoreset=False,
+    )
+
+
+_idle_packers = threading.local()
+
+
+def _borrow_packer() -> _Packer:
+    """This thread's packer, lent out for one encoding; see `_return_packer`.
+
+    A packer allocates its 256 KiB buffer up front, and `packb` builds a fresh
+    one per call: under memray that was one of every eight allocations the
+    codec stress made, and by far the largest. One is kept per thread instead,
+    taken out of the slot while in use so that a nested encoding -- a raw
+    member whose `validate` encodes something -- gets a packer of its own
+    rather than writing into the middle of this one.
+    """
+    packer: _Packer | None = getattr(_idle_packers, "packer", None)
+    if packer is None:
+        return _new_packer()
+    _idle_packers.packer = None
+    return packer
+
+
+def _return_packer(packer: _Packer, used: int) -> None:
+    # A packer that grew past the retained size encoded something unusually
+    # large; dropping it keeps one huge state from pinning its size in every
+    # worker thread for good.
+    if used <= MSGPACK_RETAINED_PACKER_BYTES:
+        packer.discard()
+        _idle_packers.packer = packer
+
+
+def _refuse_marks_deep(value: Any) -> None:
     # Asked once, deeply, before encoding. The per-level check inside the
     # encoder gives the path to the offending value, but it only sees values
     # the encoder actually descends into -- and it does not descend into an
@@ -419,24 +860,303 @@ def cty_to_msgpack(value: CtyValue[Any], schema: CtyType[Any]) -> bytes:
     if isinstance(value, CtyValue) and collect_marks_deep(value):
         _reject_marks(value, "")
         raise CtyMarksSerializationError()
-    serializable_data = _convert_value_to_serializable(value, schema)
-    result: bytes = msgpack.packb(
-        serializable_data,
-        default=_msgpack_default_handler,
-        use_bin_type=MSGPACK_USE_BIN_TYPE_TRUE,
-    )
+
+
+def _write(plan: _Writer, value: Any, packer: _Packer) -> None:
+    # A filled mark memo is the proof that nothing under `value` can change:
+    # `collect_marks_deep` only memoizes a subtree free of mutable containers,
+    # and `_refuse_marks_deep` has just asked it. Fragments are kept only then.
+    packer.sealed = isinstance(value, CtyValue) and value._deep_marks is not None
+    try:
+        plan(value, packer)
+    except _MarkedAt as marked:
+        raise CtyMarksSerializationError(path=marked.path()) from None
+
+
+def _write_with_plan(value: Any, schema: CtyType[Any], packer: _Packer) -> None:
+    _write(_encoder_plan(schema), value, packer)
+
+
+def cty_to_msgpack(value: CtyValue[Any], schema: CtyType[Any]) -> bytes:
+    _refuse_marks_deep(value)
+    packer = _borrow_packer()
+    result: bytes = b""
+    try:
+        _write_with_plan(value, schema, packer)
+        result = packer.take()
+    finally:
+        _return_packer(packer, len(result))
     return result
 
 
-def _unpacked_to_cty(data: Any, schema: CtyType[Any]) -> CtyValue[Any]:
+def _write_to(target: bytearray | IO[bytes], encoded: bytes | memoryview) -> None:
+    if isinstance(target, bytearray):
+        target += encoded
+    else:
+        target.write(encoded)
+
+
+def cty_to_msgpack_into(value: CtyValue[Any], schema: CtyType[Any], target: bytearray | IO[bytes]) -> int:
+    """Encode `value` onto the end of `target`, answering the number of bytes written.
+
+    The same bytes `cty_to_msgpack` returns, without the `bytes` object: a
+    `bytearray` is extended in place, anything else is handed the encoding in
+    one `write` call -- a file opened for binary writing, a socket's
+    `makefile("wb")`, an `io.BytesIO`. The encoded bytes are the only
+    intermediate; no Python mirror of the value is built on the way.
+
+    Nothing reaches `target` if encoding fails part way, so a refused value
+    (a mark, a NaN) cannot leave half a payload in a file.
+    """
+    _refuse_marks_deep(value)
+    packer = _borrow_packer()
+    written = 0
+    try:
+        _write_with_plan(value, schema, packer)
+        if packer.spilled:
+            encoded = packer.take()
+            written = len(encoded)
+            _write_to(target, encoded)
+        else:
+            with packer.getbuffer() as buffer:
+                written = len(buffer)
+                _write_to(target, buffer)
+    finally:
+        _return_packer(packer, written)
+    return written
+
+
+class _OffPlan(Exception):
+    """A payload a decoder plan will not vouch for; `schema.validate` decides it."""
+
+
+_Reader = Callable[[Any], CtyValue[Any]]
+"""A compiled decoder: one unpacked payload of its schema in, its `CtyValue` out."""
+
+
+def _read_absent(raw: Any, schema: CtyType[Any]) -> CtyValue[Any]:
+    """A null or an unknown where a plan expected a payload, as `validate` answers them."""
+    if raw is None:
+        return CtyValue.null(schema)
+    if isinstance(raw, UnknownValue):
+        return schema.unknown_like(raw)
+    raise _OffPlan()
+
+
+def _nfc(text: str) -> str:
+    # Wire strings are nearly all ASCII, and ASCII is already NFC.
+    return text if text.isascii() else unicodedata.normalize("NFC", text)
+
+
+def _compile_string_reader(schema: CtyType[Any]) -> _Reader:
+    def read(raw: Any) -> CtyValue[Any]:
+        if type(raw) is str:
+            return CtyValue._trusted(schema, _nfc(raw))
+        return _read_absent(raw, schema)
+
+    return read
+
+
+def _compile_number_reader(schema: CtyType[Any]) -> _Reader:
+    def read(raw: Any) -> CtyValue[Any]:
+        # int and float are what the encoder writes; str is how it writes a
+        # number that is neither an int64 nor exactly a float64. An int stays
+        # one (see `CtyNumber`): exact, and the cheapest payload to re-encode.
+        # Only within int64, as `validate` keeps one: a peer may write a
+        # uint64 past it as a msgpack integer, and that is held as a `Decimal`.
+        if type(raw) is int:
+            return CtyValue._trusted(schema, raw if _INT64_MIN <= raw <= _INT64_MAX else Decimal(raw))
+        if type(raw) in (float, str):
+            try:
+                return CtyValue._trusted(schema, Decimal(raw))
+            except (ValueError, ArithmeticError) as e:
+                raise _OffPlan() from e
+        return _read_absent(raw, schema)
+
+    return read
+
+
+def _compile_bool_reader(schema: CtyType[Any]) -> _Reader:
+    def read(raw: Any) -> CtyValue[Any]:
+        if raw is True or raw is False:
+            return CtyValue._boolean(schema, raw)
+        return _read_absent(raw, schema)
+
+    return read
+
+
+def _compile_delegating_reader(schema: CtyType[Any]) -> _Reader:
+    # `dynamic` carries its own type in the payload and a capsule decides its
+    # own payloads, so neither has a shape to plan for. They are validated as
+    # before, guard and all; a failure is sent back to the root so the error
+    # carries the full path `validate` would have given it.
+    def read(raw: Any) -> CtyValue[Any]:
+        try:
+            return schema.validate(raw)
+        except CtyError as e:
+            raise _OffPlan() from e
+
+    return read
+
+
+def _compile_list_reader(schema: CtyList[Any]) -> _Reader:
+    element_read = _decoder_plan(schema.element_type)
+
+    def read(raw: Any) -> CtyValue[Any]:
+        if type(raw) is list:
+            if not raw:
+                return CtyValue._empty(schema)
+            return CtyValue._trusted(schema, tuple([element_read(item) for item in raw]))
+        return _read_absent(raw, schema)
+
+    return read
+
+
+def _compile_set_reader(schema: CtySet[Any]) -> _Reader:
+    element_read = _decoder_plan(schema.element_type)
+
+    def read(raw: Any) -> CtyValue[Any]:
+        if type(raw) is not list:
+            return _read_absent(raw, schema)
+        if not raw:
+            return CtyValue._empty(schema)
+        # `CtySet.validate` without its mark hoisting: nothing off the wire is
+        # marked. De-duplication and the canonical order are the same.
+        unique: dict[tuple[Any, ...], CtyValue[Any]] = {}
+        undecided: list[CtyValue[Any]] = []
+        for item in raw:
+            element = element_read(item)
+            if element.is_unknown:
+                undecided.append(element)
+            else:
+                unique[set_identity_key(element)] = element
+        elements = sorted((*unique.values(), *undecided), key=set_order_key)
+        return CtyValue._trusted(schema, tuple(elements))
+
+    return read
+
+
+def _compile_map_reader(schema: CtyMap[Any]) -> _Reader:
+    element_read = _decoder_plan(schema.element_type)
+
+    def read(raw: Any) -> CtyValue[Any]:
+        if type(raw) is not dict:
+            return _read_absent(raw, schema)
+        if not raw:
+            return CtyValue._empty(schema)
+        out: dict[str, CtyValue[Any]] = {}
+        for key, item in raw.items():
+            if type(key) is not str:
+                raise _OffPlan()
+            normalized = _nfc(key)
+            if normalized in out:
+                raise _OffPlan()
+            out[normalized] = element_read(item)
+        return CtyValue._trusted(schema, FrozenDict(out))
+
+    return read
+
+
+def _compile_tuple_reader(schema: CtyTuple) -> _Reader:
+    element_reads = tuple(_decoder_plan(t) for t in schema.element_types)
+    width = len(element_reads)
+
+    def read(raw: Any) -> CtyValue[Any]:
+        if type(raw) is not list:
+            return _read_absent(raw, schema)
+        if len(raw) != width:
+            raise _OffPlan()
+        return CtyValue._trusted(
+            schema, tuple([element_read(item) for element_read, item in zip(element_reads, raw, strict=True)])
+        )
+
+    return read
+
+
+def _compile_object_reader(schema: CtyObject) -> _Reader:
+    fields = tuple(
+        (name, unicodedata.normalize("NFC", name), _decoder_plan(t), t, name in schema.optional_attributes)
+        for name, t in schema.attribute_types.items()
+    )
+
+    def read(raw: Any) -> CtyValue[Any]:
+        if type(raw) is not dict:
+            return _read_absent(raw, schema)
+        attrs: dict[str, CtyValue[Any]] = {}
+        found = 0
+        for name, lookup, attr_read, attr_type, optional in fields:
+            if lookup in raw:
+                attrs[name] = attr_read(raw[lookup])
+                found += 1
+            elif optional:
+                attrs[name] = CtyValue.null(attr_type)
+            else:
+                raise _OffPlan()
+        # Every key was an attribute, spelled in NFC. Anything else -- an
+        # unknown attribute, a key that is not a string, one spelled in another
+        # normal form -- is left to `validate`, which refuses or normalizes it.
+        if found != len(raw):
+            raise _OffPlan()
+        return CtyValue._trusted(schema, FrozenDict(attrs))
+
+    return read
+
+
+@lru_cache(maxsize=MSGPACK_ENCODER_PLAN_CACHE_SIZE)
+def _decoder_plan(schema: CtyType[Any]) -> _Reader:
+    """The decoder for `schema`: `schema.validate` for the payloads the encoder writes.
+
+    `cty_from_msgpack` used to unpack and then hand the whole tree to
+    `validate`, which walks it a second time through the recursion guard at
+    every container, re-checks every key, normalizes every attribute name and
+    builds a path per attribute in case one fails. A payload read off the wire
+    is overwhelmingly one that an encoder wrote for this schema, so a plan
+    compiled per schema builds the `CtyValue` tree directly, in one pass over
+    the unpacked payload, and vouches only for exactly that shape: `str` for a
+    string, a `dict` holding exactly the attributes for an object, and so on.
+
+    Anything else raises `_OffPlan`, and `_unpacked_to_cty` validates the
+    whole payload from the root as before. Errors therefore come from
+    `validate` itself -- the same exception, message and path -- and so does
+    every lenient reading `validate` allows (`"true"` for a bool, a non-NFC
+    attribute name), at the old price.
+    """
+    if isinstance(schema, CtyString):
+        return _compile_string_reader(schema)
+    if isinstance(schema, CtyNumber):
+        return _compile_number_reader(schema)
+    if isinstance(schema, CtyBool):
+        return _compile_bool_reader(schema)
+    if isinstance(schema, CtyObject):
+        return _compile_object_reader(schema)
+    if isinstance(schema, CtyMap):
+        return _compile_map_reader(schema)
+    if isinstance(schema, CtyList):
+        return _compile_list_reader(schema)
+    if isinstance(schema, CtySet):
+        return _compile_set_reader(schema)
+    if isinstance(schema, CtyTuple):
+        return _compile_tuple_reader(schema)
+    return _compile_delegating_reader(schema)
+
+
+def _unpacked_to_cty(data: Any, schema: CtyType[Any], plan: _Reader | None = None) -> CtyValue[Any]:
     if isinstance(data, UnknownValue):
         return CtyValue.unknown(schema, value=data)
     if data is None:
         return CtyValue.null(schema)
+    try:
+        return (plan or _decoder_plan(schema))(data)
+    except (_OffPlan, CtyValidationError):
+        # Off the plan, or refused by a `validate` the plan delegated to.
+        # Either way `validate` gives the answer it always gave, error
+        # included. Nothing else is caught: any other exception is a defect in
+        # the plan, and quietly re-decoding would hide it from the suite.
+        pass
     return schema.validate(data)
 
 
-def cty_from_msgpack(data: bytes, cty_type: CtyType[Any]) -> CtyValue[Any]:
+def _unpack(data: bytes) -> Any:
     # go-cty answers EOF here. This used to answer a null of `cty_type`, which
     # erased the difference between "a null was encoded" (the byte 0xc0) and
     # "nothing arrived"; a truncated or missing payload became valid state.
@@ -452,7 +1172,7 @@ def cty_from_msgpack(data: bytes, cty_type: CtyType[Any]) -> CtyValue[Any]:
     # caller wanting to catch every decode failure had to catch Exception.
     # `_ext_hook` raises DeserializationError itself and passes through.
     try:
-        raw_unpacked = msgpack.unpackb(
+        return msgpack.unpackb(
             data,
             ext_hook=_ext_hook,
             raw=MSGPACK_RAW_FALSE,
@@ -463,6 +1183,10 @@ def cty_from_msgpack(data: bytes, cty_type: CtyType[Any]) -> CtyValue[Any]:
     except (ValueError, TypeError) as e:
         raise DeserializationError(f"cty_from_msgpack: not a MessagePack payload: {e}") from e
 
+
+def _decode(data: bytes, cty_type: CtyType[Any], plan: _Reader | None) -> CtyValue[Any]:
+    raw_unpacked = _unpack(data)
+
     if (
         isinstance(cty_type, CtyDynamic)
         and isinstance(raw_unpacked, list)
@@ -470,14 +1194,163 @@ def cty_from_msgpack(data: bytes, cty_type: CtyType[Any]) -> CtyValue[Any]:
         and isinstance(raw_unpacked[0], bytes)
     ):
         try:
-            type_spec = json.loads(raw_unpacked[0].decode("utf-8"))
+            actual_type = type_from_spec_bytes(raw_unpacked[0])
         except (UnicodeDecodeError, json.JSONDecodeError) as e:
             raise DeserializationError(ERR_DECODE_DYNAMIC_TYPE) from e
-        actual_type = parse_tf_type_to_ctytype(type_spec)
         inner_value = _unpacked_to_cty(raw_unpacked[1], actual_type)
         return CtyValue(vtype=cty_type, value=inner_value)
 
-    return _unpacked_to_cty(raw_unpacked, cty_type)
+    return _unpacked_to_cty(raw_unpacked, cty_type, plan)
+
+
+def cty_from_msgpack(data: bytes, cty_type: CtyType[Any]) -> CtyValue[Any]:
+    return _decode(data, cty_type, None)
+
+
+def _index_object(view: memoryview, schema: CtyObject) -> dict[str, tuple[int, int]] | None:
+    """Where each attribute of a top-level msgpack map is encoded, without decoding any.
+
+    None unless the payload is one the decoder plan would vouch for at the top
+    level: a map holding every required attribute, each key an attribute name
+    spelled in NFC, nothing after it. Anything else -- a null, an unknown, an
+    extra key, trailing bytes, not msgpack at all -- is decoded eagerly, which
+    answers whatever `cty_from_msgpack` answers.
+    """
+    unpacker = msgpack.Unpacker(
+        raw=MSGPACK_RAW_FALSE,
+        strict_map_key=MSGPACK_STRICT_MAP_KEY_FALSE,
+        ext_hook=_ext_hook,
+        max_buffer_size=max(len(view), 1),
+    )
+    unpacker.feed(view)
+    names = {_nfc(name): name for name in schema.attribute_types}
+    spans: dict[str, tuple[int, int]] = {}
+    try:
+        for _ in range(unpacker.read_map_header()):
+            key = unpacker.unpack()
+            name = names.get(key) if type(key) is str else None
+            if name is None or name in spans:
+                return None
+            start = unpacker.tell()
+            unpacker.skip()
+            spans[name] = (start, unpacker.tell())
+    except (ValueError, TypeError, msgpack.OutOfData, DeserializationError):
+        return None
+    if unpacker.tell() != len(view):
+        return None
+    if any(name not in spans for name in schema.attribute_types if name not in schema.optional_attributes):
+        return None
+    return spans
+
+
+def cty_from_msgpack_lazy(data: bytes | memoryview, cty_type: CtyType[Any]) -> CtyValue[Any]:
+    """`cty_from_msgpack`, decoding an object's attributes only as they are read.
+
+    For an object schema the answer's payload is a `LazyObjectPayload`: the
+    top-level map is indexed, not decoded, and each attribute becomes a
+    `CtyValue` the first time anything reads it -- `value["name"]`, a path
+    step, `deep_values`. `cty_to_msgpack` of the answer under the same schema
+    copies every attribute's original bytes rather than encoding it, so a
+    large state passed through untouched costs one index and one copy. Any
+    other schema, and any payload the index will not vouch for, decodes
+    eagerly.
+
+    The value equals what `cty_from_msgpack` answers. What moves is *when* a
+    malformed attribute is noticed: on first read, not here -- and then the
+    whole payload is decoded eagerly so that the error raised is the one, path
+    and all, that `cty_from_msgpack` would have raised. An attribute never
+    read is never checked.
+
+    The bytes are kept, not copied, so a mutable buffer is copied once first:
+    an attribute decoded after the caller reused its `bytearray` would
+    otherwise decode from whatever was written there since.
+    """
+    view = memoryview(data)
+    if not view.readonly:
+        view = memoryview(bytes(view))
+    if not isinstance(cty_type, CtyObject) or not view:
+        return cty_from_msgpack(view, cty_type)  # type: ignore[arg-type]
+    spans = _index_object(view, cty_type)
+    if spans is None:
+        return cty_from_msgpack(view, cty_type)  # type: ignore[arg-type]
+
+    def decode(encoded: memoryview, attribute_type: CtyType[Any]) -> CtyValue[Any]:
+        try:
+            return _unpacked_to_cty(_unpack(encoded), attribute_type)  # type: ignore[arg-type]
+        except CtyError:
+            # Raises the eager decoder's error for this payload, path included.
+            cty_from_msgpack(view, cty_type)  # type: ignore[arg-type]
+            raise
+
+    absent = {
+        name: CtyValue.null(attribute_type)
+        for name, attribute_type in cty_type.attribute_types.items()
+        if name not in spans
+    }
+    payload = LazyObjectPayload(view, spans, cty_type, absent, decode)
+    return CtyValue(vtype=cty_type, value=payload, is_unknown=False)
+
+
+def _encode_chunk(values: list[CtyValue[Any]], schema: CtyType[Any]) -> list[bytes]:
+    # One plan lookup and one packer for the whole chunk. The lookup is not
+    # free: the plan cache hashes the schema, and a structural hash walks it
+    # -- 140 µs for a thirty-attribute resource schema, as much as encoding a
+    # small instance of it.
+    plan = _encoder_plan(schema)
+    packer = _borrow_packer()
+    encoded: list[bytes] = []
+    largest = 0
+    try:
+        for value in values:
+            _refuse_marks_deep(value)
+            _write(plan, value, packer)
+            result = packer.take()
+            largest = max(largest, len(result))
+            encoded.append(result)
+            packer.discard()
+    finally:
+        _return_packer(packer, largest)
+    return encoded
+
+
+def _decode_chunk(payloads: list[bytes], schema: CtyType[Any]) -> list[CtyValue[Any]]:
+    plan = _decoder_plan(schema)
+    return [_decode(data, schema, plan) for data in payloads]
+
+
+def cty_to_msgpack_many(
+    values: Sequence[CtyValue[Any]],
+    schema: CtyType[Any],
+    *,
+    executor: Executor | None = None,
+) -> list[bytes]:
+    """`cty_to_msgpack` of every value, in order, with the per-schema setup done once.
+
+    Byte-for-byte what encoding each value on its own returns, and the same
+    error for the first value that cannot be encoded. Refresh and import walk
+    hundreds of instances of one resource type back to back; this looks the
+    compiled plan up and borrows the packer once for all of them.
+
+    `executor` -- a `ProcessPoolExecutor` the caller owns, typically -- spreads
+    a batch of at least `CODEC_BATCH_PARALLEL_THRESHOLD` values across its
+    workers in chunks; a smaller batch is encoded here regardless.
+    """
+    return run_batch(_encode_chunk, values, schema, executor)
+
+
+def cty_from_msgpack_many(
+    payloads: Sequence[bytes],
+    schema: CtyType[Any],
+    *,
+    executor: Executor | None = None,
+) -> list[CtyValue[Any]]:
+    """`cty_from_msgpack` of every payload, in order, with the per-schema setup done once.
+
+    The batch counterpart of `cty_to_msgpack_many`, with the same `executor`
+    rule. The decoder plan is looked up once per batch -- once per chunk when
+    fanned out -- rather than once per payload.
+    """
+    return run_batch(_decode_chunk, payloads, schema, executor)
 
 
 # 🌊🪢🔚
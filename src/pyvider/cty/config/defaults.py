@@ -17,13 +17,40 @@ All defaults are defined here instead of inline in field definitions.
 # =================================
 ENABLE_TYPE_INFERENCE_CACHE = True  # Enable caching for type inference performance
 
+# Whether `parse_tf_type_to_ctytype` interns the types it builds, so that equal
+# types are one object (see `pyvider.cty.types.interning`). Off by default;
+# `PYVIDER_CTY_INTERN_TYPES` turns it on.
+INTERN_TYPES = False
+
+# Entries kept in each direction of the dynamic-value type-spec cache
+# (`conversion/type_spec.py`). The key space is the set of concrete types that
+# appear in dynamic positions, which is small for any real provider.
+TYPE_SPEC_CACHE_SIZE = 1024
+
+# Answers kept by the shared type-relation cache (`types/relations.py`):
+# `usable_as`, `can_convert_unsafe` and `conformance_errors` between container
+# types. An entry is a pair of types and a small answer; the key space is the
+# pairs a provider's schemas and function signatures meet, which is small.
+TYPE_RELATION_CACHE_SIZE = 4096
+
+# Collection types `values/membership.py` remembers whether a capsule is below,
+# one small answer per type. Bounded on the reasoning of the plan caches below.
+MEMBERSHIP_CAPSULE_CACHE_SIZE = 512
+
 # =================================
 # Validation defaults
 # =================================
-# Python frames consumed per level of nesting during validation: the
-# `with_recursion_detection` wrapper, then the `validate` it wraps. Measured,
-# not guessed -- stack depth at the innermost leaf is exactly
+# Python frames each level of nesting cost when validation recursed: the
+# `with_recursion_detection` wrapper, then the `validate` it wrapped. Measured,
+# not guessed -- stack depth at the innermost leaf was exactly
 # `FRAMES_PER_VALIDATION_LEVEL * levels + 2`.
+#
+# Validation no longer recurses per level (`validation/iterative.py`), but the
+# default depth limit is still derived from this. It is a published number, and
+# a value validated deeper than the stack could carry is then handed to code
+# that still recurses per level -- rendering one with `str` does -- so the
+# default stays what the rest of the package can carry too. A limit pinned with
+# `PYVIDER_CTY_MAX_VALIDATION_DEPTH` is honoured at any depth.
 FRAMES_PER_VALIDATION_LEVEL = 2
 
 # Frames left over for whoever called into validation, so that hitting the
@@ -66,7 +93,9 @@ def default_max_validation_depth() -> int:
 
     Deriving it keeps the promise true under whatever recursion limit is
     actually in force, including a host that has raised it. Set
-    `PYVIDER_CTY_MAX_VALIDATION_DEPTH` to override with a fixed value.
+    `PYVIDER_CTY_MAX_VALIDATION_DEPTH` to override with a fixed value; since
+    validation walks on a work stack, a fixed value above the derived one is
+    delivered without raising the recursion limit to match.
     """
     import os
 
@@ -115,6 +144,39 @@ MSGPACK_RAW_FALSE = False
 MSGPACK_STRICT_MAP_KEY_FALSE = False
 MSGPACK_USE_BIN_TYPE_TRUE = True
 
+# Compiled encoder plans kept by `cty_to_msgpack`, one per distinct schema. A
+# provider encodes a handful of resource schemas over and over; the bound only
+# has to stop a process that builds types on the fly from growing without
+# limit, and a plan is a few closures per schema node.
+MSGPACK_ENCODER_PLAN_CACHE_SIZE = 512
+
+# Most JSON marshal plans `cty_to_json` keeps, one per type, on the same
+# reasoning as the msgpack bound above.
+JSON_MARSHAL_PLAN_CACHE_SIZE = 512
+
+# Bytes `cty_from_json_stream` reads at a time. The window it holds is about
+# this size, so it bounds the decoder's own memory on a document of any length.
+JSON_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Largest buffer the per-thread msgpack packer keeps between encodings. A packer
+# starts at 256 KiB; one that grew past this encoded something unusually large
+# and is dropped instead of pinned.
+MSGPACK_RETAINED_PACKER_BYTES = 4 * 1024 * 1024
+
+# Batch codec fan-out (`cty_to_msgpack_many` and friends). Below the threshold a
+# batch is encoded in the calling process even when an executor is supplied:
+# pickling the schema and every value to a worker costs more than a few hundred
+# plan runs. Above it the batch is cut into chunks of the given size, one task
+# each, so a pool pays its per-task round trip per chunk rather than per value.
+CODEC_BATCH_PARALLEL_THRESHOLD = 256
+CODEC_BATCH_CHUNK_SIZE = 128
+
+# Smallest encoding, in bytes (msgpack) or characters (JSON), that an encoder
+# keeps on the container it encoded. A fragment is a copy of its share of the
+# output, so every cached level of nesting holds its subtree's encoding again;
+# below this size re-encoding is cheaper than the memory.
+CODEC_FRAGMENT_CACHE_MIN_SIZE = 256
+
 # Refinement payload field IDs
 REFINEMENT_IS_KNOWN_NULL = 1
 REFINEMENT_STRING_PREFIX = 2
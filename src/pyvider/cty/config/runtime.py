@@ -13,6 +13,7 @@ from provide.foundation.config import RuntimeConfig, env_field
 
 from pyvider.cty.config.defaults import (
     ENABLE_TYPE_INFERENCE_CACHE,
+    INTERN_TYPES,
     MAX_VALIDATION_DEPTH_AUTO,
 )
 
@@ -32,6 +33,13 @@ class CtyConfig(RuntimeConfig):
         default=ENABLE_TYPE_INFERENCE_CACHE,
     )
 
+    # Whether parsed types are interned. Read by `type_interning_enabled`
+    # straight from the environment, as the depth override below is.
+    intern_types: bool = env_field(
+        env_var="PYVIDER_CTY_INTERN_TYPES",
+        default=INTERN_TYPES,
+    )
+
     # Nesting depth ceiling for validation. Left at 0, it is derived from the
     # interpreter's recursion limit by `default_max_validation_depth`, which is
     # the only way the number can stay truthful. Set it to a positive value to
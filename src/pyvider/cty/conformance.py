@@ -57,17 +57,20 @@ _CtyTuple: Any = None
 # fresh `types.UnionType` on every `isinstance`, which measured ~40% slower than
 # an already-built tuple over 20,000 calls.
 _COLLECTION_TYPES: Any = None
+_cached_relation: Any = None
 
 
 def _bind() -> None:
     """Resolve the type classes into module globals, once."""
     global _BOUND, _CtyDynamic, _CtyList, _CtyMap, _CtyObject, _CtySet, _CtyTuple
-    global _COLLECTION_TYPES
+    global _COLLECTION_TYPES, _cached_relation
     from pyvider.cty.types import CtyDynamic, CtyList, CtyMap, CtyObject, CtySet, CtyTuple
+    from pyvider.cty.types.relations import cached_relation
 
     _CtyDynamic, _CtyList, _CtyMap = CtyDynamic, CtyList, CtyMap
     _CtyObject, _CtySet, _CtyTuple = CtyObject, CtySet, CtyTuple
     _COLLECTION_TYPES = (CtyList, CtySet, CtyMap)
+    _cached_relation = cached_relation
     _BOUND = True
 
 
@@ -89,10 +92,23 @@ class ConformanceError:
 
 
 def conformance_errors(given: CtyType[Any], want: CtyType[Any], /) -> list[ConformanceError]:
-    """Every way `given` fails to conform to `want`. Empty means it conforms."""
+    """Every way `given` fails to conform to `want`. Empty means it conforms.
+
+    Kept in the shared type-relation cache, which `CtyFunction.call` leans on:
+    it asks this of every argument and every result, and the declared type on
+    one side of the question is the same object on every call.
+    """
+    if not _BOUND:
+        _bind()
+    return list(_cached_relation("conformance", given, want, _conformance, ()))
+
+
+def _conformance(given: CtyType[Any], want: CtyType[Any]) -> tuple[ConformanceError, ...]:
+    # A tuple, so the answer kept in the cache cannot be changed through a
+    # list handed to one caller.
     errors: list[ConformanceError] = []
     _test(given, want, "", errors)
-    return errors
+    return tuple(errors)
 
 
 def _test(given: CtyType[Any], want: CtyType[Any], path: str, errors: list[ConformanceError]) -> None:
@@ -13,15 +13,19 @@ from pyvider.cty.conversion.explicit import can_convert_unsafe, convert
 from pyvider.cty.conversion.inference_cache import inference_cache_context, with_inference_cache
 from pyvider.cty.conversion.raw_to_cty import infer_cty_type_from_raw
 from pyvider.cty.conversion.type_encoder import encode_cty_type_to_wire_json
+from pyvider.cty.conversion.type_spec import clear_type_spec_cache, type_from_spec_bytes, type_spec_bytes
 from pyvider.cty.conversion.unify import unify
 
 __all__ = [
     "can_convert_unsafe",
+    "clear_type_spec_cache",
     "convert",
     "cty_to_native",
     "encode_cty_type_to_wire_json",
     "infer_cty_type_from_raw",
     "inference_cache_context",
+    "type_from_spec_bytes",
+    "type_spec_bytes",
     "unify",
     "with_inference_cache",
 ]
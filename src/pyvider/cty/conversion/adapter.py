@@ -19,6 +19,7 @@ from pyvider.cty.types import (
     CtyTuple,
 )
 from pyvider.cty.values import CtyValue
+from pyvider.cty.values.columnar import ColumnarRows
 
 # Module-level sentinel to avoid per-call allocation
 _POST_PROCESS = object()
@@ -55,6 +56,9 @@ def cty_to_native(value: CtyValue[Any] | Any) -> Any:  # noqa: C901
     work_stack: list[Any] = [value]
     results: dict[int, Any] = {}
     processing: set[int] = set()
+    # A columnar payload's rows, read once: it builds them on every read, so
+    # the rows converted below and the rows looked up here must be one set.
+    rows_of: dict[int, tuple[Any, ...]] = {}
 
     while work_stack:
         current_item = work_stack.pop()
@@ -81,7 +85,7 @@ def cty_to_native(value: CtyValue[Any] | Any) -> Any:  # noqa: C901
                 dict_val = cast(dict[str, Any], val_to_process.value)
                 results[val_id] = {k: results[id(v)] for k, v in dict_val.items()}
             elif isinstance(val_to_process.type, CtyList):
-                list_val = cast(list[Any], val_to_process.value)
+                list_val = cast(list[Any], rows_of.pop(val_id, val_to_process.value))
                 results[val_id] = [results[id(item)] for item in list_val]
             elif isinstance(val_to_process.type, CtySet):
                 # Sorted by the ELEMENTS, not by what they converted into. The
@@ -90,7 +94,7 @@ def cty_to_native(value: CtyValue[Any] | Any) -> Any:  # noqa: C901
                 # branch was unreachable and every set came out ordered by
                 # `repr`. `{10, 2, 9}` converted to [10, 2, 9], because "10"
                 # sorts before "2".
-                set_val = cast(set[Any], val_to_process.value)
+                set_val = cast(set[Any], rows_of.pop(val_id, val_to_process.value))
                 results[val_id] = [results[id(item)] for item in sorted(set_val, key=canonical_sort_key)]
             elif isinstance(val_to_process.type, CtyTuple):
                 tuple_val = cast(tuple[Any, ...], val_to_process.value)
@@ -127,6 +131,9 @@ def cty_to_native(value: CtyValue[Any] | Any) -> Any:  # noqa: C901
                 if isinstance(current_item.value, dict):
                     # dict.values() supports reversed() in Python 3.8+, no list() needed
                     work_stack.extend(reversed(current_item.value.values()))
+                elif type(current_item.value) is ColumnarRows:
+                    rows_of[item_id] = tuple(current_item.value)
+                    work_stack.extend(reversed(rows_of[item_id]))
                 elif isinstance(current_item.value, list | tuple):
                     # reversed() works directly on list/tuple, no intermediate list needed
                     work_stack.extend(reversed(current_item.value))
@@ -7,7 +7,6 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from functools import lru_cache
 from typing import Any, cast
 
 from provide.foundation.errors import error_boundary
@@ -43,6 +42,7 @@ from pyvider.cty.types import (
     CtyTuple,
     CtyType,
 )
+from pyvider.cty.types.relations import cached_relation
 from pyvider.cty.values import CtyValue
 from pyvider.cty.values.markers import RefinedUnknownValue, UnknownValue
 
@@ -187,8 +187,7 @@ def _list_of_unknown_length(target: CtyList[Any], stored: int, source: CtyValue[
     return refined.with_marks(set(source.marks))
 
 
-@lru_cache(maxsize=1024)
-def can_convert_unsafe(source: CtyType[Any], target: CtyType[Any]) -> bool:  # noqa: C901
+def can_convert_unsafe(source: CtyType[Any], target: CtyType[Any]) -> bool:
     """Whether `convert` might succeed from `source` to `target`, on types alone.
 
     go-cty's `GetConversionUnsafe` as a predicate. "Unsafe" is go-cty's word for
@@ -197,7 +196,15 @@ def can_convert_unsafe(source: CtyType[Any], target: CtyType[Any]) -> bool:  # n
     unification asks this question, so it must answer for exactly the
     conversions `convert` performs -- a divergence either way means unification
     proposes a type that cannot be reached, or refuses one that can.
+
+    Answers are kept in the shared type-relation cache, which replaced the
+    `lru_cache` this had: that one could not be watched or cleared alongside
+    the other relations, and was a second bound to size.
     """
+    return cached_relation("can_convert_unsafe", source, target, _can_convert_unsafe, True)
+
+
+def _can_convert_unsafe(source: CtyType[Any], target: CtyType[Any]) -> bool:  # noqa: C901
     if isinstance(target, CtyDynamic) or isinstance(source, CtyDynamic):
         return True
     if source.equal(target):
@@ -0,0 +1,116 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import json
+import threading
+from typing import Any
+
+from pyvider.cty.config.defaults import TYPE_SPEC_CACHE_SIZE
+from pyvider.cty.conversion.type_encoder import encode_cty_type_to_wire_json
+from pyvider.cty.types import CtyType
+
+"""The wire type-spec of a dynamic value, memoized in both directions.
+
+A value in a `dynamic` position crosses the wire as `[type-spec, value]`, the
+type-spec being the type's JSON encoding as bytes. Encoding one ran
+`encode_cty_type_to_wire_json` and `json.dumps` for every value; decoding one
+ran `json.loads` and `parse_tf_type_to_ctytype` -- inside a foundation error
+boundary -- for every value. A provider schema with a `dynamic` attribute in a
+list element paid both per element, for what is nearly always the same handful
+of types.
+
+One table answers both questions, and a lookup in either direction fills the
+other: a type encoded once is decoded from its own bytes for free, which is
+exactly the round trip plan and apply make.
+"""
+
+
+class _TypeSpecCache:
+    """A bounded, lock-guarded, two-way map between types and their spec bytes.
+
+    Bounded because the bytes come off the wire: a peer sending a stream of
+    distinct types must not grow this without limit. Least recently used goes
+    first, separately in each direction. Failures are never cached -- a
+    malformed spec raises every time, as it did before.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._to_bytes: OrderedDict[CtyType[Any], bytes] = OrderedDict()
+        self._to_type: OrderedDict[bytes, CtyType[Any]] = OrderedDict()
+
+    def spec_bytes(self, cty_type: CtyType[Any]) -> bytes:
+        with self._lock:
+            found = self._to_bytes.get(cty_type)
+            if found is not None:
+                self._to_bytes.move_to_end(cty_type)
+                return found
+        spec = json.dumps(encode_cty_type_to_wire_json(cty_type), separators=(",", ":")).encode("utf-8")
+        self._remember(cty_type, spec)
+        return spec
+
+    def parse(self, spec: bytes) -> CtyType[Any]:
+        with self._lock:
+            found = self._to_type.get(spec)
+            if found is not None:
+                self._to_type.move_to_end(spec)
+                return found
+        # Imported here: the parser imports the type modules, which import
+        # this package lazily from `CtyDynamic.validate`.
+        from pyvider.cty.parser import parse_tf_type_to_ctytype
+
+        cty_type = parse_tf_type_to_ctytype(json.loads(spec.decode("utf-8")))
+        # Only the decode direction is filled from here. The bytes a peer sent
+        # need not be the canonical spelling -- whitespace, key order -- and
+        # the encoder must keep writing the canonical one.
+        self._store(self._to_type, bytes(spec), cty_type)
+        return cty_type
+
+    def clear(self) -> None:
+        with self._lock:
+            self._to_bytes.clear()
+            self._to_type.clear()
+
+    def _remember(self, cty_type: CtyType[Any], spec: bytes) -> None:
+        self._store(self._to_bytes, cty_type, spec)
+        self._store(self._to_type, spec, cty_type)
+
+    def _store(self, table: OrderedDict[Any, Any], key: Any, answer: Any) -> None:
+        with self._lock:
+            table[key] = answer
+            table.move_to_end(key)
+            while len(table) > self._maxsize:
+                table.popitem(last=False)
+
+
+_cache = _TypeSpecCache(TYPE_SPEC_CACHE_SIZE)
+
+
+def type_spec_bytes(cty_type: CtyType[Any]) -> bytes:
+    """`cty_type`'s wire type-spec: its compact JSON encoding, as UTF-8 bytes."""
+    return _cache.spec_bytes(cty_type)
+
+
+def type_from_spec_bytes(spec: bytes) -> CtyType[Any]:
+    """The type a wire type-spec names.
+
+    Raises what decoding it raises -- `UnicodeDecodeError`, `JSONDecodeError`,
+    the parser's `CtyValidationError` -- for the caller to translate, as each
+    caller already did before this was shared.
+    """
+    return _cache.parse(spec)
+
+
+def clear_type_spec_cache() -> None:
+    """Forget every memoized type-spec, in both directions."""
+    _cache.clear()
+
+
+# 🌊🪢🔚
@@ -24,6 +24,15 @@ INT64_MIN = -(2**63)
 INT64_MAX = 2**63 - 1
 
 
+def decimal_of(value: CtyValue[Any]) -> Decimal:
+    """A number argument's payload as a `Decimal`, whichever way `CtyNumber` holds it.
+
+    Exact for an `int` payload, and for a `Decimal` one the same number. Every
+    body that reaches for a `Decimal` method goes through here.
+    """
+    return Decimal(cast("Decimal | int", value.value))
+
+
 def exact_int64(value: CtyValue[Any]) -> int | None:
     """A number argument as go-cty's `big.Float.Int64()` reads it, or `None`.
 
@@ -38,7 +47,10 @@ def exact_int64(value: CtyValue[Any]) -> int | None:
     differently then `index` refuses keys `hasindex` accepts, which is the
     contradiction those two functions exist to not have.
     """
-    raw = cast(Decimal, value.value)
+    raw = value.value
+    if type(raw) is int:
+        return raw if INT64_MIN <= raw <= INT64_MAX else None
+    raw = decimal_of(value)
     if not raw.is_finite() or raw != raw.to_integral_value() or not INT64_MIN <= raw <= INT64_MAX:
         return None
     return int(raw)
@@ -11,12 +11,18 @@ deliberate departures from go-cty they carry.
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, cast
 
 from pyvider.cty import (
+    CtyList,
+    CtyMap,
+    CtyObject,
+    CtyTuple,
+    CtyType,
     CtyValue,
 )
+from pyvider.cty.values.frozen import FrozenDict
 from pyvider.cty.values.set_order import order_key as set_order_key
 
 # The lowest number of stored elements at which a set's count can be in doubt.
@@ -37,6 +43,59 @@ def _sequence_elements(seq: CtyValue[Any]) -> list[CtyValue[Any]]:
     return list(cast("tuple[CtyValue[Any], ...]", seq.value))
 
 
+def _sequence_result(return_type: CtyType[Any], elements: Sequence[CtyValue[Any]]) -> CtyValue[Any]:
+    """`return_type.validate(elements)`, built directly where that would hand every element back as it is.
+
+    The functions that reorder, slice or de-duplicate a list return elements
+    they were given, and a list or tuple type's `validate` accepts an element
+    that already has the type its position declares without changing it --
+    so for those it only costs a guard entry and a fresh `CtyValue` per
+    element. Anything else, a set above all, which has to de-duplicate, goes
+    through `validate`.
+    """
+    if isinstance(return_type, CtyList):
+        element_type = return_type.element_type
+        if all(element.type == element_type for element in elements):
+            return CtyValue._trusted(return_type, tuple(elements))
+    elif isinstance(return_type, CtyTuple):
+        element_types = return_type.element_types
+        if len(elements) == len(element_types) and all(
+            element.type == element_type for element, element_type in zip(elements, element_types, strict=True)
+        ):
+            return CtyValue._trusted(return_type, tuple(elements))
+    return return_type.validate(elements)
+
+
+def _mapping_result(return_type: CtyType[Any], entries: Mapping[str, CtyValue[Any]]) -> CtyValue[Any]:
+    """`return_type.validate(entries)`, built directly where that would hand every entry back as it is.
+
+    `_sequence_result` for `merge` and `zipmap`, which file values they were
+    given under new keys. A map's entries must each have its element type and
+    keys already in NFC, which ASCII keys are. An object's names must be
+    exactly its attributes, each entry of its attribute's type, and it is laid
+    out in the schema's order as `validate` lays it out. Anything else goes
+    through `validate`.
+    """
+    if isinstance(return_type, CtyMap):
+        element_type = return_type.element_type
+        if "".join(entries).isascii() and all(entry.type == element_type for entry in entries.values()):
+            return (
+                CtyValue._trusted(return_type, FrozenDict(entries))
+                if entries
+                else CtyValue._empty(return_type)
+            )
+    elif isinstance(return_type, CtyObject):
+        attribute_types = return_type.attribute_types
+        if len(entries) == len(attribute_types) and all(
+            (entry := entries.get(name)) is not None and entry.type == attr_type
+            for name, attr_type in attribute_types.items()
+        ):
+            return CtyValue._trusted(
+                return_type, FrozenDict({name: entries[name] for name in attribute_types})
+            )
+    return return_type.validate(entries)
+
+
 def _set_length_is_known(collection: CtyValue[Any], stored: int) -> bool:
     """When a set knows how many elements it has. go-cty's `Value.Length()`.
 
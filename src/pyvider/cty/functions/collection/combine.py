@@ -40,6 +40,7 @@ from pyvider.cty.functions._framework import stdlib_function
 from pyvider.cty.functions._function import CtyParameter, refine_not_null
 from pyvider.cty.functions.collection._shared import (
     Args,
+    _mapping_result,
     _sequence_elements,
     _set_length_is_known,
 )
@@ -172,7 +173,7 @@ def merge(*args: CtyValue[Any], return_type: CtyType[Any]) -> CtyValue[Any]:
         # go-cty declares dynamic here but still returns a concrete ObjectVal,
         # so the value describes itself even though the signature could not.
         result_type = CtyObject(attribute_types={name: value.type for name, value in merged.items()})
-    return result_type.validate(merged).with_marks(marks)
+    return _mapping_result(result_type, merged).with_marks(marks)
 
 
 # ---------------------------------------------------------------------------
@@ -439,10 +440,11 @@ def zipmap(keys: CtyValue[Any], values: CtyValue[Any], *, return_type: CtyType[A
 
     output: dict[str, CtyValue[Any]] = {}
     for name, entry in zip(names, entries, strict=True):
-        unmarked_name, name_marks = name.unmark()
-        marks |= name_marks
-        output[str(unmarked_name.value)] = entry
-    return return_type.validate(output).with_marks(marks)
+        # A key's marks are the only thing unmarking it would change.
+        if name.marks:
+            marks |= name.marks
+        output[str(name.value)] = entry
+    return _mapping_result(return_type, output).with_marks(marks)
 
 
 # 🌊🪢🔚
@@ -15,6 +15,7 @@ from __future__ import annotations
 from collections.abc import Iterable, Mapping, Sized
 from decimal import Decimal
 from typing import Any, cast
+import unicodedata
 
 from pyvider.cty import (
     CtyBool,
@@ -42,10 +43,12 @@ from pyvider.cty.functions._function import CtyParameter, refine_not_null
 from pyvider.cty.functions.collection._shared import (
     Args,
     _sequence_elements,
+    _sequence_result,
     _set_length_is_known,
 )
 from pyvider.cty.refinement import refine
 from pyvider.cty.values.markers import RefinedUnknownValue
+from pyvider.cty.values.membership import _is_known_leaf, members_by_value, undecided_members
 
 # ---------------------------------------------------------------------------
 # length
@@ -132,21 +135,6 @@ def length(input_val: CtyValue[Any]) -> CtyValue[Any]:
 # contains
 # ---------------------------------------------------------------------------
 
-# Payloads that can hide an unknown below the top level. A CtyValue holding
-# anything else is a leaf, so `is_unknown` is the complete answer for it.
-_NESTING_PAYLOADS = (CtyValue, dict, list, tuple, set, frozenset)
-
-
-def _is_known_leaf(value: CtyValue[Any]) -> bool:
-    """Wholly known and non-null, decided without a walk.
-
-    Nulls are excluded deliberately. `CtyValue.__eq__` requires the types to
-    match, but `equals` treats nulls of any type as equal, as go-cty does -- so
-    the `==` shortcut disagrees with the real comparison for a null of one type
-    searched for in a collection of another. False here means "ask properly".
-    """
-    return not value.is_unknown and not value.is_null and not isinstance(value.value, _NESTING_PAYLOADS)
-
 
 @stdlib_function(
     "contains",
@@ -179,6 +167,15 @@ def contains(collection: CtyValue[Any], value: CtyValue[Any]) -> CtyValue[Any]:
     elements = tuple(cast("Iterable[Any]", collection.value))
     if not elements:
         return CtyBool().validate(False)
+    if value.is_wholly_known() and not value.is_null:
+        # A wholly known needle is `==` to a known leaf exactly when the scan
+        # below would find it, so the hashed members settle a hit and leave
+        # only the members `==` cannot settle to compare one by one.
+        members = members_by_value(collection)
+        if members is not None:
+            if value in members:
+                return CtyBool().validate(True)
+            elements = undecided_members(collection)
 
     # Comparison goes through the three-valued `equals`, as go-cty's
     # ContainsFunc does. Testing `is_unknown` on the element is not enough --
@@ -264,11 +261,24 @@ def keys(input_val: CtyValue[Any], *, return_type: CtyType[Any]) -> CtyValue[Any
     mapping, marks = input_val.unmark()
     if isinstance(mapping.type, CtyObject):
         names = sorted(mapping.type.attribute_types)
-        return return_type.validate(tuple(names)).with_marks(marks)
+        return _key_strings(return_type, names).with_marks(marks)
     if mapping.is_unknown:
         return CtyValue.unknown(return_type).with_marks(marks)
     ordered = sorted(cast("Mapping[str, Any]", mapping.value))
-    return return_type.validate(ordered).with_marks(marks)
+    return _key_strings(return_type, ordered).with_marks(marks)
+
+
+def _key_strings(return_type: CtyType[Any], names: list[Any]) -> CtyValue[Any]:
+    """`return_type.validate(names)`, the strings built in one pass when every name is a `str`.
+
+    A string's `validate` does nothing to a `str` but normalize it to NFC, which
+    an ASCII name already is; a name that is not a `str` is `validate`'s to
+    refuse.
+    """
+    if not all(type(name) is str for name in names):
+        return return_type.validate(names)
+    normalized = (name if name.isascii() else unicodedata.normalize("NFC", name) for name in names)
+    return CtyValue._trusted(return_type, CtyValue._trusted_many(CtyString(), normalized))
 
 
 def _values_return_type(args: Args) -> CtyType[Any]:
@@ -309,7 +319,7 @@ def values(input_val: CtyValue[Any], *, return_type: CtyType[Any]) -> CtyValue[A
     mapping, marks = input_val.unmark()
     payload = cast("Mapping[str, CtyValue[Any]]", mapping.value)
     ordered = [payload[name] for name in sorted(payload)]
-    return return_type.validate(ordered).with_marks(marks)
+    return _sequence_result(return_type, ordered).with_marks(marks)
 
 
 # ---------------------------------------------------------------------------
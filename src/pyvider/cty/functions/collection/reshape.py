@@ -52,6 +52,7 @@ from pyvider.cty.functions._function import CtyParameter, refine_not_null
 from pyvider.cty.functions.collection._shared import (
     Args,
     _sequence_elements,
+    _sequence_result,
     _set_length_is_known,
 )
 from pyvider.cty.types.structural.dynamic import unwrap_dynamic
@@ -110,7 +111,7 @@ def distinct(input_val: CtyValue[Any], *, return_type: CtyType[Any]) -> CtyValue
         if cty_element not in seen:
             seen.add(cty_element)
             result_elements.append(cty_element)
-    return return_type.validate(result_elements)
+    return _sequence_result(return_type, result_elements)
 
 
 # ---------------------------------------------------------------------------
@@ -211,7 +212,7 @@ def flatten(input_val: CtyValue[Any], *, return_type: CtyType[Any]) -> CtyValue[
     # taken from it is a no-op by construction -- one that cost more than the
     # flattening itself: 16 ms to 36 ms on a 10k-element input, because a tuple
     # type has one entry per element and each entry is entered separately.
-    return CtyValue(vtype=result_type, value=tuple(elements))
+    return CtyValue._trusted(result_type, tuple(elements))
 
 
 # ---------------------------------------------------------------------------
@@ -269,7 +270,7 @@ def sort(input_val: CtyValue[Any], *, return_type: CtyType[Any]) -> CtyValue[Any
             # the non-nullness `refine_result` already promises.
             return CtyValue.unknown(return_type)
         undecided = [CtyValue.unknown(element_type)] * len(cast("Sized", input_val.value))
-        return return_type.validate(undecided)
+        return _sequence_result(return_type, undecided)
 
     elements = _sequence_elements(input_val)
     for position, cty_element in enumerate(elements):
@@ -277,7 +278,7 @@ def sort(input_val: CtyValue[Any], *, return_type: CtyType[Any]) -> CtyValue[Any
             raise CtyFunctionError(
                 f"sort: cannot sort list with null or unknown elements at index {position}."
             )
-    return return_type.validate(sorted(elements, key=lambda element: cast("Any", element.value)))
+    return _sequence_result(return_type, sorted(elements, key=lambda element: cast("Any", element.value)))
 
 
 # ---------------------------------------------------------------------------
@@ -376,7 +377,7 @@ def slice(
     sequence, marks = input_val.unmark()
     start_index, end_index, _ = _slice_indexes(sequence, start_val, end_val)
     elements = _sequence_elements(sequence)[start_index:end_index]
-    return return_type.validate(elements).with_marks(marks)
+    return _sequence_result(return_type, elements).with_marks(marks)
 
 
 # ---------------------------------------------------------------------------
@@ -444,13 +445,17 @@ def concat(*sequences: CtyValue[Any], return_type: CtyType[Any]) -> CtyValue[Any
         unmarked.append(stripped)
 
     if isinstance(return_type, CtyList):
-        converted = [
-            convert(element, return_type.element_type)
-            for sequence in unmarked
-            for element in cast("Iterable[CtyValue[Any]]", sequence.value)
-        ]
-        widened: CtyValue[Any] = return_type.validate(converted)
-        return widened.with_marks(marks)
+        element_type = return_type.element_type
+        converted: list[CtyValue[Any]] = []
+        for sequence in unmarked:
+            elements = cast("Iterable[CtyValue[Any]]", sequence.value)
+            if isinstance(sequence.type, CtyList) and sequence.type.element_type == element_type:
+                # `convert` hands back an element already of the target type,
+                # so a list of it is taken whole rather than one call apiece.
+                converted.extend(elements)
+            else:
+                converted.extend(convert(element, element_type) for element in elements)
+        return _sequence_result(return_type, converted).with_marks(marks)
 
     elements = [
         element for sequence in unmarked for element in cast("Iterable[CtyValue[Any]]", sequence.value)
@@ -458,7 +463,7 @@ def concat(*sequences: CtyValue[Any], return_type: CtyType[Any]) -> CtyValue[Any
     result_type = CtyTuple(element_types=tuple(element.type for element in elements))
     # Built directly: the type is derived from the elements' own types, so
     # validating each against the type taken from it is a no-op by construction.
-    return CtyValue(vtype=result_type, value=tuple(elements)).with_marks(marks)
+    return CtyValue._trusted(result_type, tuple(elements)).with_marks(marks)
 
 
 # ---------------------------------------------------------------------------
@@ -494,7 +499,7 @@ def reverse(input_val: CtyValue[Any], *, return_type: CtyType[Any]) -> CtyValue[
     """
     sequence, marks = input_val.unmark()
     reversed_elements = list(reversed(_sequence_elements(sequence)))
-    return return_type.validate(reversed_elements).with_marks(marks)
+    return _sequence_result(return_type, reversed_elements).with_marks(marks)
 
 
 # ---------------------------------------------------------------------------
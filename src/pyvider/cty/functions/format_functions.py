@@ -39,6 +39,7 @@ from pyvider.cty.config.defaults import (
 from pyvider.cty.conversion import convert
 from pyvider.cty.conversion._utils import exact_normalize, non_finite_text
 from pyvider.cty.exceptions import CtyConversionError, CtyFunctionError
+from pyvider.cty.functions._args import decimal_of
 from pyvider.cty.functions._framework import stdlib_function
 from pyvider.cty.functions._function import CtyParameter, refine_not_null
 from pyvider.cty.functions._unknowns import unknown_not_null
@@ -182,7 +183,7 @@ def _json_of(value: CtyValue[Any], verb: _Verb) -> str:
     if value.is_null:
         return "null"
     if isinstance(value.type, CtyNumber):
-        return _json_number(cast(Decimal, value.value), verb)
+        return _json_number(decimal_of(value), verb)
     if isinstance(value.type, CtyString):
         # The codec's encoder, not `json.dumps`: Go's `encoding/json` escapes
         # `<`, `>` and `&` by default and Python's does not, so `%#v` of
@@ -393,7 +394,7 @@ def _format_one(verb: _Verb, value: CtyValue[Any]) -> str:  # noqa: C901
             if isinstance(value.type, CtyString):
                 return _pad(verb, str(value.value))
             if isinstance(value.type, CtyNumber):
-                return _pad(verb, _number_text(cast(Decimal, value.value)))
+                return _pad(verb, _number_text(decimal_of(value)))
         return _pad(verb, _json_of(value, verb))
 
     if verb.verb == "t":
@@ -403,10 +404,10 @@ def _format_one(verb: _Verb, value: CtyValue[Any]) -> str:  # noqa: C901
         return "true" if _as(value, CtyBool(), verb).value else "false"
 
     if verb.verb in _INTEGER_VERBS:
-        return _format_integer(verb, cast(Decimal, _as(value, CtyNumber(), verb).value))
+        return _format_integer(verb, decimal_of(_as(value, CtyNumber(), verb)))
 
     if verb.verb in _FLOAT_VERBS:
-        return _format_float(verb, cast(Decimal, _as(value, CtyNumber(), verb).value))
+        return _format_float(verb, decimal_of(_as(value, CtyNumber(), verb)))
 
     if verb.verb in ("s", "q"):
         text = str(_as(value, CtyString(), verb).value)
@@ -66,7 +66,7 @@ from typing import Any, cast
 from pyvider.cty import CtyDynamic, CtyNumber, CtyString, CtyType, CtyValue
 from pyvider.cty.config.defaults import ERR_PARSEINT_BASE_NOT_WHOLE, ERR_SIGNUM_NOT_WHOLE
 from pyvider.cty.exceptions import CtyFunctionError
-from pyvider.cty.functions._args import whole_number
+from pyvider.cty.functions._args import decimal_of, whole_number
 from pyvider.cty.functions._framework import stdlib_function
 from pyvider.cty.functions._function import CtyArgumentError, CtyParameter, refine_not_null
 
@@ -134,8 +134,25 @@ def _quotient_width(a: Decimal, b: Decimal) -> int:
 
 
 def _numbers(*values: CtyValue[Any]) -> tuple[Decimal, ...]:
-    """The payloads of number arguments, which the framework has already checked."""
-    return tuple(cast(Decimal, value.value) for value in values)
+    """The payloads of number arguments, which the framework has already checked.
+
+    As `Decimal`s whichever way they are held; an `int` payload converts exactly.
+    """
+    return tuple(decimal_of(value) for value in values)
+
+
+def _integers(a: CtyValue[Any], b: CtyValue[Any]) -> tuple[int, int] | None:
+    """Both payloads, if both are `int`s -- the case that needs no `Decimal` at all.
+
+    `CtyNumber` keeps an `int` only within int64, so a sum, difference or
+    product of two of them has at most 39 digits: exact in the 155-digit
+    context too, and so the same number `_at_go_width` would have computed,
+    without entering it.
+    """
+    a_val, b_val = a.value, b.value
+    if type(a_val) is int and type(b_val) is int:
+        return a_val, b_val
+    return None
 
 
 def _float64(value: Decimal) -> float:
@@ -289,10 +306,12 @@ def abs_fn(input_val: CtyValue[Any]) -> CtyValue[Any]:
     implementation must not forget the second half.
     """
     number, marks = input_val.unmark()
+    if type(number.value) is int:
+        return CtyNumber().validate(abs(number.value)).with_marks(marks)
     # `copy_abs`, which only clears the sign. `abs` is a context operation and
     # rounds, which is the same fault the width of `_at_go_width` exists to
     # avoid -- and it would round *before* anything could widen the context.
-    magnitude = cast(Decimal, number.value).copy_abs()
+    magnitude = decimal_of(number).copy_abs()
     return CtyNumber().validate(magnitude).with_marks(marks)
 
 
@@ -308,6 +327,8 @@ def abs_fn(input_val: CtyValue[Any]) -> CtyValue[Any]:
 )
 def add(a: CtyValue[Any], b: CtyValue[Any]) -> CtyValue[Any]:
     """go-cty's `AddFunc` (`stdlib/number.go:30`)."""
+    if (integers := _integers(a, b)) is not None:
+        return CtyNumber().validate(integers[0] + integers[1])
     a_val, b_val = _numbers(a, b)
     try:
         with _at_go_width():
@@ -330,6 +351,8 @@ def add(a: CtyValue[Any], b: CtyValue[Any]) -> CtyValue[Any]:
 )
 def subtract(a: CtyValue[Any], b: CtyValue[Any]) -> CtyValue[Any]:
     """go-cty's `SubtractFunc` (`stdlib/number.go:65`)."""
+    if (integers := _integers(a, b)) is not None:
+        return CtyNumber().validate(integers[0] - integers[1])
     a_val, b_val = _numbers(a, b)
     try:
         with _at_go_width():
@@ -358,6 +381,11 @@ def multiply(a: CtyValue[Any], b: CtyValue[Any]) -> CtyValue[Any]:
     which is also what the oracle answers, and `multiply(0, Infinity)` is the
     error below rather than zero.
     """
+    integers = _integers(a, b)
+    # Not for a zero product: `0 * -5` is `-0` in both `big.Float` and
+    # `Decimal`, and an `int` has no sign to put on a zero.
+    if integers is not None and integers[0] and integers[1]:
+        return CtyNumber().validate(integers[0] * integers[1])
     a_val, b_val = _numbers(a, b)
     try:
         with _at_go_width():
@@ -469,7 +497,9 @@ def negate(a: CtyValue[Any]) -> CtyValue[Any]:
     # `0 - 0`, which the decimal specification defines as `+0`. The sign of a
     # zero survives the wire on both sides, so the two wrote different bytes for
     # the same call. Found 2026-08-19 by the stdlib fuzz.
-    negated = cast(Decimal, number.value).copy_negate()
+    if type(number.value) is int and number.value:
+        return CtyNumber().validate(-number.value).with_marks(marks)
+    negated = decimal_of(number).copy_negate()
     return CtyNumber().validate(negated).with_marks(marks)
 
 
@@ -492,7 +522,9 @@ def int_fn(val: CtyValue[Any]) -> CtyValue[Any]:
     refuses it instead, in the words go-cty's own `stdlib.Int` wrapper uses for
     the same condition (`number.go:681`).
     """
-    number = cast(Decimal, val.value)
+    if type(val.value) is int:
+        return val
+    number = decimal_of(val)
     if not number.is_finite():
         raise CtyFunctionError("can't truncate infinity to an integer")
     truncated = number.to_integral_value(rounding=ROUND_DOWN)
@@ -521,7 +553,9 @@ def ceil_fn(input_val: CtyValue[Any]) -> CtyValue[Any]:
     `AllowDynamicType` here where `abs` and `int` have one; that is go-cty's
     declaration, not an omission.
     """
-    number = cast(Decimal, input_val.value)
+    if type(input_val.value) is int:
+        return input_val
+    number = decimal_of(input_val)
     if not number.is_finite():
         return input_val
     rounded = number.to_integral_value(rounding=ROUND_CEILING)
@@ -541,7 +575,9 @@ def ceil_fn(input_val: CtyValue[Any]) -> CtyValue[Any]:
 )
 def floor_fn(input_val: CtyValue[Any]) -> CtyValue[Any]:
     """go-cty's `FloorFunc` (`stdlib/number.go:432`)."""
-    number = cast(Decimal, input_val.value)
+    if type(input_val.value) is int:
+        return input_val
+    number = decimal_of(input_val)
     if not number.is_finite():
         return input_val
     rounded = number.to_integral_value(rounding=ROUND_FLOOR)
@@ -626,10 +662,10 @@ def signum_fn(input_val: CtyValue[Any]) -> CtyValue[Any]:
     """
     number = whole_number(input_val, ERR_SIGNUM_NOT_WHOLE)
     if number < 0:
-        return CtyNumber().validate(Decimal(-1))
+        return CtyNumber().validate(-1)
     if number > 0:
-        return CtyNumber().validate(Decimal(1))
-    return CtyNumber().validate(Decimal(0))
+        return CtyNumber().validate(1)
+    return CtyNumber().validate(0)
 
 
 def _parseint_return_type(args: Sequence[CtyValue[Any]]) -> CtyType[Any]:
@@ -670,7 +706,7 @@ def parseint_fn(str_val: CtyValue[Any], base_val: CtyValue[Any]) -> CtyValue[Any
     parsed = _set_string(text, base)
     if parsed is None:
         raise CtyArgumentError(0, f'cannot parse "{text}" as a base {base} integer')
-    return CtyNumber().validate(Decimal(parsed))
+    return CtyNumber().validate(parsed)
 
 
 # 🌊🪢🔚
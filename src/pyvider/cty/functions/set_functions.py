@@ -19,8 +19,17 @@ from pyvider.cty.conversion import convert, unify
 from pyvider.cty.exceptions import CtyConversionError, CtyFunctionError
 from pyvider.cty.functions._framework import stdlib_function
 from pyvider.cty.functions._function import CtyParameter, TypeFunc, refine_not_null
+from pyvider.cty.values.membership import members_by_identity, members_by_value, ordered_members
 from pyvider.cty.values.set_order import identity_key as set_identity_key
 
+# A set's elements, each beside its `order_key`, in that order.
+_Keyed = list[tuple[tuple[Any, ...], CtyValue[Any]]]
+
+# What an operation does with an element only one side holds: `combine` asked
+# about one stand-in member on the left, and then on the right.
+_ONE: frozenset[Any] = frozenset({0})
+_NONE: frozenset[Any] = frozenset()
+
 # go-cty's `cty.Set(cty.DynamicPseudoType)`, the declared type of every set
 # parameter in `set.go`. Built once: a parameter's type is read on every call.
 _SET_OF_ANY = CtySet(element_type=CtyDynamic())
@@ -83,7 +92,9 @@ def _as_set_of(value: CtyValue[Any], element_type: CtyType[Any], func: str) -> f
     """
     elements = cast(Iterable[CtyValue[Any]], value.value or ())
     if cast(CtySet[Any], value.type).element_type.equal(element_type):
-        return frozenset(elements)
+        # Kept on the set, so a set that is an argument again is not hashed again.
+        members = members_by_value(value)
+        return frozenset(elements) if members is None else members
     try:
         return frozenset(convert(element, element_type) for element in elements)
     except CtyConversionError as e:
@@ -105,6 +116,120 @@ def _ordered_elements(value: CtyValue[Any], element_type: CtyType[Any], func: st
         raise CtyFunctionError(ERR_SET_OP_INCOMPATIBLE_ELEMENTS.format(func=func)) from e
 
 
+def _canonical_elements(value: CtyValue[Any], element_type: CtyType[Any]) -> _Keyed | None:
+    """The argument's elements with their order keys, or None if they cannot be merged.
+
+    Only a set already of the result's element type, with no unknown element,
+    laid out in the order `CtySet.validate` sorts into. The keys are kept on
+    the set value, so a set that is an argument again is not keyed again.
+    """
+    if not value.value:
+        return []
+    if not cast(CtySet[Any], value.type).element_type.equal(element_type):
+        return None
+    keyed = ordered_members(value)
+    return None if keyed is None else list(keyed)
+
+
+def _run_end(keyed: _Keyed, start: int, key: tuple[Any, ...]) -> int:
+    """Where the run of elements sharing `key` that begins at `start` ends."""
+    end = start
+    while end < len(keyed) and keyed[end][0] == key:
+        end += 1
+    return end
+
+
+def _ties_are_one_element(key: tuple[Any, ...]) -> bool:
+    """Whether two elements sharing `key` are the same element.
+
+    A string, bool or composite key carries all of `identity_key` -- a
+    composite's holds its hash bytes and canonical key -- so a tie is a match.
+    A number's holds the value, which ties across `0` and `-0`; a null's, which
+    is only a rank, ties across types. Those go to `_combine_run`.
+    """
+    last = key[-1]
+    return len(key) > 1 and isinstance(last, str | bool | tuple)
+
+
+def _combine_run(
+    ours: _Keyed, theirs: _Keyed, combine: Callable[[frozenset[Any], frozenset[Any]], frozenset[Any]]
+) -> _Keyed:
+    """The elements of one order key on both sides, combined by identity.
+
+    Sharing an order key is not being the same element: `0` and `-0` tie in the
+    order and are two members of a set. So the run is settled by `identity_key`,
+    which is what `CtySet.validate` de-duplicates on -- and, as there, an
+    element both sides hold is the later argument's (`1` against `1.0`).
+    """
+    left = {set_identity_key(element): (key, element) for key, element in ours}
+    right = {set_identity_key(element): (key, element) for key, element in theirs}
+    kept = combine(frozenset(left), frozenset(right))
+    both = left | right
+    return [entry for identity, entry in both.items() if identity in kept]
+
+
+def _merge(
+    ours: _Keyed, theirs: _Keyed, combine: Callable[[frozenset[Any], frozenset[Any]], frozenset[Any]]
+) -> _Keyed:
+    """Two canonically ordered sets, walked once side by side; the result is in order too."""
+    keep_ours, keep_theirs = bool(combine(_ONE, _NONE)), bool(combine(_NONE, _ONE))
+    keep_shared = bool(combine(_ONE, _ONE))
+    merged: _Keyed = []
+    i = j = 0
+    while i < len(ours) and j < len(theirs):
+        if ours[i][0] < theirs[j][0]:
+            if keep_ours:
+                merged.append(ours[i])
+            i += 1
+        elif theirs[j][0] < ours[i][0]:
+            if keep_theirs:
+                merged.append(theirs[j])
+            j += 1
+        elif _ties_are_one_element(ours[i][0]):
+            if keep_shared:
+                merged.append(theirs[j])
+            i += 1
+            j += 1
+        else:
+            key = ours[i][0]
+            i_end, j_end = _run_end(ours, i, key), _run_end(theirs, j, key)
+            merged.extend(_combine_run(ours[i:i_end], theirs[j:j_end], combine))
+            i, j = i_end, j_end
+    if keep_ours:
+        merged.extend(ours[i:])
+    if keep_theirs:
+        merged.extend(theirs[j:])
+    return merged
+
+
+def _merged_operation(
+    combine: Callable[[frozenset[Any], frozenset[Any]], frozenset[Any]],
+    args: Sequence[CtyValue[Any]],
+    return_type: CtyType[Any],
+) -> CtyValue[Any] | None:
+    """The operation as a linear merge over the arguments' canonical order, or None.
+
+    Every set `CtySet.validate` makes is a tuple sorted by `order_key`, so two
+    of them can be combined the way sorted runs are: one walk, and a result
+    that comes out already in order and of the element type, with nothing to
+    sort, hash or validate again. The frozenset route below paid for all three.
+    None, and that route, for an argument that needs converting, holds an
+    unknown element, or is not in canonical order.
+    """
+    element_type = cast(CtySet[Any], return_type).element_type
+    merged = _canonical_elements(args[0], element_type)
+    for arg in args[1:]:
+        keyed = _canonical_elements(arg, element_type)
+        if merged is None or keyed is None:
+            return None
+        merged = _merge(merged, keyed, combine)
+    if merged is None:
+        return None
+    if not merged:
+        return CtyValue._empty(return_type)
+    return CtyValue._trusted(return_type, tuple(element for _, element in merged))
+
+
 def _set_operation(
     func: str,
     combine: Callable[[frozenset[CtyValue[Any]], frozenset[CtyValue[Any]]], frozenset[CtyValue[Any]]],
@@ -125,6 +250,10 @@ def _set_operation(
     if not allow_unknowns and not all(arg.is_wholly_known() for arg in args):
         return CtyValue.unknown(return_type)
 
+    answer = _merged_operation(combine, args, return_type)
+    if answer is not None:
+        return answer
+
     if allow_unknowns:
         # Union is the only operation that admits unknown elements, and a Python
         # frozenset is the wrong container for them twice over.
@@ -250,10 +379,7 @@ def sethaselement(collection: CtyValue[Any], element: CtyValue[Any]) -> CtyValue
     # in the set however it compares. `sethaselement(toset([0]), -0)` is false in
     # go-cty and was true here, for the same reason `toset([0, -0])` had one
     # element instead of two.
-    wanted = set_identity_key(element)
-    if any(
-        set_identity_key(member) == wanted for member in cast(Iterable[CtyValue[Any]], collection.value or ())
-    ):
+    if set_identity_key(element) in members_by_identity(collection):
         # A hit cannot be un-hit by whatever any unknown element turns out to be.
         return cast(CtyValue[Any], CtyBool().validate(True))
     if not collection.is_wholly_known():
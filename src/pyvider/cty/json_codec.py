@@ -29,11 +29,27 @@ Two things JSON cannot carry, both of which raise rather than degrade:
 from __future__ import annotations
 
 import base64
+import codecs
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor
 from decimal import Decimal
+from functools import lru_cache
 import json
-from typing import Any, cast
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from json.encoder import encode_basestring
+from json.scanner import NUMBER_RE
+import mmap
+import re
+from typing import IO, Any, cast
 import unicodedata
 
+from pyvider.cty._batch import run_batch
+from pyvider.cty.config.defaults import (
+    CODEC_FRAGMENT_CACHE_MIN_SIZE,
+    JSON_MARSHAL_PLAN_CACHE_SIZE,
+    JSON_STREAM_CHUNK_SIZE,
+)
+from pyvider.cty.conversion import type_spec_bytes
 from pyvider.cty.conversion.explicit import _number_to_string
 from pyvider.cty.exceptions import CtyValidationError
 from pyvider.cty.types import (
@@ -51,9 +67,17 @@ from pyvider.cty.types import (
 )
 from pyvider.cty.values import CtyValue
 from pyvider.cty.values.frozen import FrozenDict
-from pyvider.cty.values.set_order import order_key as set_order_key
+from pyvider.cty.values.set_order import in_order as set_in_order
 
-__all__ = ["cty_from_json", "cty_to_json", "implied_json_type"]
+__all__ = [
+    "cty_from_json",
+    "cty_from_json_many",
+    "cty_from_json_stream",
+    "cty_to_json",
+    "cty_to_json_into",
+    "cty_to_json_many",
+    "implied_json_type",
+]
 
 
 class CtyJsonError(CtyValidationError):
@@ -80,6 +104,24 @@ class _RawNumber(Decimal):
         return number
 
 
+# `-9223372036854775808`: nineteen digits and a sign.
+_INT64_TOKEN_LENGTH = 20
+
+
+def _parse_int(text: str) -> int | _RawNumber:
+    """An integer token as an `int`, which is the payload `CtyNumber` keeps for one.
+
+    JSON's grammar allows no leading zeros or sign but `-`, so `str()` of the
+    `int` is the token again and `_RawNumber` has nothing to remember -- except
+    for `-0`, whose sign an `int` cannot hold and go-cty's `big.Float` keeps.
+    A token too long to be an int64 stays a `_RawNumber` as well, since that is
+    what `validate` would make of it.
+    """
+    if text == "-0" or len(text) > _INT64_TOKEN_LENGTH:
+        return _RawNumber(text)
+    return int(text)
+
+
 def _reject_constant(literal: str) -> Any:
     """`NaN`, `Infinity` and `-Infinity` are Python extensions, not JSON.
 
@@ -122,7 +164,7 @@ def _loads(payload: bytes | str) -> Any:
         text,
         object_pairs_hook=_JsonObject,
         parse_float=_RawNumber,
-        parse_int=_RawNumber,
+        parse_int=_parse_int,
         parse_constant=_reject_constant,
     )
 
@@ -139,6 +181,15 @@ def cty_to_json(value: CtyValue[Any], cty_type: CtyType[Any], /) -> bytes:
     without complaint -- which is the silent declassification this refusal
     exists to prevent, arrived at by a different route.
     """
+    return _marshal_one(value, cty_type)
+
+
+def _marshal_one(value: CtyValue[Any], cty_type: CtyType[Any]) -> bytes:
+    """`cty_to_json`'s body, shared with the batch workers so the two cannot drift.
+
+    The conformance question is answered from the shared type-relation cache,
+    so a batch of one resource's instances walks each distinct type once.
+    """
     from pyvider.cty.conformance import conformance_errors
     from pyvider.cty.marks import collect_marks_deep
 
@@ -149,7 +200,24 @@ def cty_to_json(value: CtyValue[Any], cty_type: CtyType[Any], /) -> bytes:
         from pyvider.cty.conversion import convert
 
         value = convert(value, cty_type)
-    return _marshal(value, cty_type, "").encode()
+    return "".join(_write_json(value, cty_type)).encode()
+
+
+def cty_to_json_into(value: CtyValue[Any], cty_type: CtyType[Any], target: bytearray | IO[bytes], /) -> int:
+    """Serialize `value` onto the end of `target`, answering the number of bytes written.
+
+    The same bytes `cty_to_json` returns, as `cty_to_msgpack_into` is to
+    `cty_to_msgpack`: a `bytearray` is extended in place, anything else is
+    handed the document in one `write` call. Nothing reaches `target` if
+    marshalling is refused part way, so an unknown or a NaN deep in a state
+    cannot leave half a document in a file.
+    """
+    encoded = cty_to_json(value, cty_type)
+    if isinstance(target, bytearray):
+        target += encoded
+    else:
+        target.write(encoded)
+    return len(encoded)
 
 
 def cty_from_json(payload: bytes | str, cty_type: CtyType[Any], /) -> CtyValue[Any]:
@@ -157,6 +225,71 @@ def cty_from_json(payload: bytes | str, cty_type: CtyType[Any], /) -> CtyValue[A
     return _unmarshal(_loads(payload), cty_type, "")
 
 
+def cty_from_json_stream(fp: IO[bytes] | mmap.mmap, cty_type: CtyType[Any], /) -> CtyValue[Any]:
+    """`cty_from_json` of a document read from a binary file, or an mmap, as it is decoded.
+
+    `cty_from_json` parses the whole payload into a tree of dicts, lists and
+    numbers before the first `CtyValue` is built, so decoding a large state
+    snapshot holds the payload, that tree and the result at once. This reads
+    `JSON_STREAM_CHUNK_SIZE` bytes at a time and decodes a list, set, map or
+    object element by element as its text goes past; only a dynamic value, a
+    tuple or a primitive is parsed whole before it is decoded, since their
+    rules need all of it first.
+
+    The same value, and for a well-formed document the same errors, as
+    `cty_from_json(fp.read(), cty_type)`: numbers keep their written digits,
+    every occurrence of a repeated property is decoded and the last kept. A
+    document that is malformed *and* does not fit `cty_type` may be refused
+    for whichever comes first in it, where `cty_from_json` reports the syntax
+    error. Reading starts at the stream's current position and stops at the
+    end of the document's text, which is where the stream must end.
+    """
+    reader = _JsonReader(fp, JSON_STREAM_CHUNK_SIZE)
+    reader.need(1)
+    if reader.text.startswith("\ufeff"):
+        raise reader.error("Unexpected UTF-8 BOM (decode using utf-8-sig)", 0)
+    value = _read_value(reader, cty_type, "")
+    if reader.peek():
+        raise reader.error("Extra data", reader.pos)
+    return value
+
+
+def _marshal_chunk(values: list[CtyValue[Any]], cty_type: CtyType[Any]) -> list[bytes]:
+    return [_marshal_one(value, cty_type) for value in values]
+
+
+def _unmarshal_chunk(payloads: list[bytes | str], cty_type: CtyType[Any]) -> list[CtyValue[Any]]:
+    return [_unmarshal(_loads(payload), cty_type, "") for payload in payloads]
+
+
+def cty_to_json_many(
+    values: Sequence[CtyValue[Any]],
+    cty_type: CtyType[Any],
+    /,
+    *,
+    executor: Executor | None = None,
+) -> list[bytes]:
+    """`cty_to_json` of every value, in order.
+
+    The same bytes, and the same first error, as serializing each value on
+    its own. `executor` fans a batch of at least
+    `CODEC_BATCH_PARALLEL_THRESHOLD` values out in chunks, as
+    `cty_to_msgpack_many` does.
+    """
+    return run_batch(_marshal_chunk, values, cty_type, executor)
+
+
+def cty_from_json_many(
+    payloads: Sequence[bytes | str],
+    cty_type: CtyType[Any],
+    /,
+    *,
+    executor: Executor | None = None,
+) -> list[CtyValue[Any]]:
+    """`cty_from_json` of every payload, in order; `executor` as for `cty_to_json_many`."""
+    return run_batch(_unmarshal_chunk, payloads, cty_type, executor)
+
+
 def implied_json_type(payload: bytes | str, /) -> CtyType[Any]:
     """The type a JSON document implies, as go-cty's `json.ImpliedType` does.
 
@@ -167,10 +300,15 @@ def implied_json_type(payload: bytes | str, /) -> CtyType[Any]:
 
 
 def _marshal(value: CtyValue[Any], cty_type: CtyType[Any], path: str) -> str:
+    """The reference marshaller: one node, answered as a string its parent joins.
+
+    `cty_to_json` writes through a compiled plan instead (`_json_plan`); this
+    walk is what those plans are tested against, byte for byte.
+    """
     if value.marks:
-        raise CtyJsonError(f"{path or 'value'} has marks, so it cannot be serialized as JSON")
+        raise CtyJsonError(f"{path or 'value'}{_HAS_MARKS}")
     if value.is_unknown:
-        raise CtyJsonError(f"{path or 'value'} is not known")
+        raise CtyJsonError(f"{path or 'value'}{_NOT_KNOWN}")
 
     # A dynamic *target* has to carry its real type alongside, or the decoder on
     # the far side has nothing to decode against.
@@ -202,7 +340,10 @@ def _marshal_by_type(value: CtyValue[Any], cty_type: CtyType[Any], path: str) ->
         return _marshal_map(value, cty_type.element_type, path)
     if isinstance(cty_type, CtyObject):
         return _marshal_object(value, cty_type, path)
+    return _marshal_capsule(value, cty_type, path)
+
 
+def _marshal_capsule(value: CtyValue[Any], cty_type: CtyType[Any], path: str) -> str:
     if cty_type.equal(BytesCapsule):
         # go-cty does *not* refuse a capsule: `cty/json/marshal.go:165` hands the
         # encapsulated Go value to `encoding/json`, and for the `[]byte` behind
@@ -219,6 +360,9 @@ def _marshal_by_type(value: CtyValue[Any], cty_type: CtyType[Any], path: str) ->
     raise CtyJsonError(f"{path or 'value'}: cannot serialize {cty_type.ctype} as JSON")
 
 
+_HAS_MARKS = " has marks, so it cannot be serialized as JSON"
+_NOT_KNOWN = " is not known"
+
 _HTML_ESCAPES = {
     "<": "\\u003c",
     ">": "\\u003e",
@@ -234,30 +378,49 @@ that are compared textually, so a `<` written two ways is a diff on every plan.
 Non-ASCII is *not* in this table: Go writes it raw, as `ensure_ascii=False` does.
 """
 
+_HTML_ESCAPED = re.compile("[<>&\u2028\u2029]")
+
+
+def _html_escape(match: re.Match[str]) -> str:
+    return _HTML_ESCAPES[match.group()]
+
 
 def _marshal_string(text: str) -> str:
-    encoded = json.dumps(text, ensure_ascii=False)
-    for character, escape in _HTML_ESCAPES.items():
-        encoded = encoded.replace(character, escape)
-    return encoded
+    # `encode_basestring` is what `json.dumps(text, ensure_ascii=False)` calls
+    # for a bare string, without building an encoder first; and one scan for
+    # all five characters, rather than five `replace` passes over every string.
+    return _HTML_ESCAPED.sub(_html_escape, encode_basestring(text))
 
 
-def _marshal_number(value: CtyValue[Any], path: str) -> str:
-    raw = value.value
+def _non_finite(raw: Any) -> str | None:
+    """What a number JSON cannot spell is called in the refusal, or None."""
     if isinstance(raw, Decimal) and not raw.is_finite():
         # go-cty refuses too: JSON has no infinity, and the alternatives are a
         # string (changing the type) or null (changing the value). The infinity
         # wording is go-cty's own and is pinned by a sweep row; a NaN says so
         # instead, because it said "infinity" for a NaN and go-cty -- which
         # cannot hold a NaN at all -- has no message of its own to match.
-        what = "NaN" if raw.is_nan() else "infinity"
+        return "NaN" if raw.is_nan() else "infinity"
+    return None
+
+
+def _marshal_number(value: CtyValue[Any], path: str) -> str:
+    raw = value.value
+    if type(raw) is int:
+        return str(raw)
+    what = _non_finite(raw)
+    if what is not None:
         raise CtyJsonError(f"{path or 'value'}: cannot serialize {what} as JSON")
     return _number_to_string(raw)
 
 
 def _marshal_dynamic(value: CtyValue[Any], path: str) -> str:
-    type_json = json.dumps(value.type._to_wire_json(), separators=(",", ":"))
-    return f'{{"value":{_marshal(value, value.type, path)},"type":{type_json}}}'
+    return f'{{"value":{_marshal(value, value.type, path)},"type":{_type_json(value.type)}}}'
+
+
+def _type_json(cty_type: CtyType[Any]) -> str:
+    # The same compact encoding as msgpack's dynamic envelope, memoized there.
+    return type_spec_bytes(cty_type).decode("utf-8")
 
 
 def _marshal_sequence(value: CtyValue[Any], element_type: CtyType[Any], path: str) -> str:
@@ -297,10 +460,330 @@ def _marshal_object(value: CtyValue[Any], cty_type: CtyObject, path: str) -> str
     return f"{{{','.join(rendered)}}}"
 
 
+class _Refused(Exception):
+    """A node a compiled plan will not write, carrying its location inside-out.
+
+    The reference walk formats a path string for every node it visits, in case
+    that node is the one refused. A plan records one step per container on the
+    way back out instead, and only when something was refused -- the same
+    trade `codec._MarkedAt` makes for msgpack.
+    """
+
+    def __init__(self, reason: str) -> None:
+        super().__init__()
+        self.reason = reason
+        self.steps: list[str] = []
+
+    def error(self) -> CtyJsonError:
+        return CtyJsonError(f"{''.join(reversed(self.steps)) or 'value'}{self.reason}")
+
+
+class _JsonOut:
+    """The text one marshalling has written so far, as chunks, and whether it may keep fragments.
+
+    `sealed` is set only under a root whose mark memo proved the whole tree
+    immutable, and cleared for the rest of the call by the first capsule
+    written -- a capsule's payload is a Python object that proof says nothing
+    about.
+    """
+
+    __slots__ = ("chunks", "sealed")
+
+    def __init__(self, sealed: bool) -> None:
+        self.chunks: list[str] = []
+        self.sealed = sealed
+
+
+_JsonWriter = Callable[[CtyValue[Any], _JsonOut], None]
+"""A compiled plan: appends one value of its type to a `_JsonOut`."""
+
+
+def _absent(value: CtyValue[Any]) -> str:
+    """The text for a marked, unknown or null value: a refusal for the first two."""
+    if value.marks:
+        raise _Refused(_HAS_MARKS)
+    if value.is_unknown:
+        raise _Refused(_NOT_KNOWN)
+    return "null"
+
+
+def _reuse_fragment(value: CtyValue[Any], cty_type: CtyType[Any], out: _JsonOut) -> bool:
+    """Append `value`'s kept JSON under `cty_type`, if it has one.
+
+    Reused whether or not this call could keep one: it was only kept because
+    the subtree could not change. Matched by identity, as msgpack's are.
+    """
+    encoded = value._encoded
+    if encoded is not None:
+        kept = encoded.get("json")
+        if kept is not None and kept[0] is cty_type:
+            out.chunks.append(kept[1])
+            return True
+    return False
+
+
+def _keep_fragment(value: CtyValue[Any], cty_type: CtyType[Any], out: _JsonOut, start: int) -> None:
+    """Keep what was written since `start` as `value`'s JSON, while the call is sealed.
+
+    The chunks are joined into one either way, so an enclosing container that
+    is kept too joins a handful of pieces rather than every leaf again.
+    """
+    if not out.sealed:
+        return
+    chunks = out.chunks
+    text = "".join(chunks[start:])
+    chunks[start:] = [text]
+    if len(text) >= CODEC_FRAGMENT_CACHE_MIN_SIZE:
+        object.__setattr__(value, "_encoded", {**(value._encoded or {}), "json": (cty_type, text)})
+        if value._deep_marks is None:
+            object.__setattr__(value, "_deep_marks", frozenset())
+
+
+def _compile_json_dynamic() -> _JsonWriter:
+    def write(value: CtyValue[Any], out: _JsonOut) -> None:
+        if value.marks or value.is_unknown:
+            _absent(value)
+        if isinstance(value.type, CtyDynamic):
+            inner = value.value
+            if not isinstance(inner, CtyValue):
+                out.chunks.append("null")
+                return
+            value = inner
+        out.chunks.append('{"value":')
+        _json_plan(value.type)(value, out)
+        out.chunks.append(f',"type":{_type_json(value.type)}}}')
+
+    return write
+
+
+def _compile_json_string() -> _JsonWriter:
+    def write(value: CtyValue[Any], out: _JsonOut) -> None:
+        if value.marks or value.is_unknown or value.is_null:
+            out.chunks.append(_absent(value))
+        else:
+            out.chunks.append(_marshal_string(str(value.value)))
+
+    return write
+
+
+def _compile_json_number() -> _JsonWriter:
+    def write(value: CtyValue[Any], out: _JsonOut) -> None:
+        if value.marks or value.is_unknown or value.is_null:
+            out.chunks.append(_absent(value))
+        elif type(raw := value.value) is int:
+            out.chunks.append(str(raw))
+        elif (what := _non_finite(raw)) is not None:
+            raise _Refused(f": cannot serialize {what} as JSON")
+        else:
+            out.chunks.append(_number_to_string(raw))
+
+    return write
+
+
+def _compile_json_bool() -> _JsonWriter:
+    def write(value: CtyValue[Any], out: _JsonOut) -> None:
+        if value.marks or value.is_unknown or value.is_null:
+            out.chunks.append(_absent(value))
+        else:
+            out.chunks.append("true" if value.value else "false")
+
+    return write
+
+
+def _compile_json_sequence(cty_type: CtyList[Any] | CtySet[Any]) -> _JsonWriter:
+    element_plan = _json_plan(cty_type.element_type)
+    is_set = isinstance(cty_type, CtySet)
+
+    def write(value: CtyValue[Any], out: _JsonOut) -> None:
+        if value.marks or value.is_unknown or value.is_null:
+            out.chunks.append(_absent(value))
+            return
+        if value._encoded is not None and _reuse_fragment(value, cty_type, out):
+            return
+        chunks = out.chunks
+        start = len(chunks)
+        elements = cast("Iterable[CtyValue[Any]]", value.value or ())
+        chunks.append("[")
+        index = 0
+        try:
+            for element in set_in_order(value) if is_set else elements:
+                element_plan(element, out)
+                chunks.append(",")
+                index += 1
+        except _Refused as refused:
+            refused.steps.append(f"[{index}]")
+            raise
+        # The separator after the last element becomes the bracket.
+        if index:
+            chunks[-1] = "]"
+        else:
+            chunks.append("]")
+        _keep_fragment(value, cty_type, out, start)
+
+    return write
+
+
+def _compile_json_tuple(cty_type: CtyTuple) -> _JsonWriter:
+    element_plans = tuple(_json_plan(element_type) for element_type in cty_type.element_types)
+
+    def write(value: CtyValue[Any], out: _JsonOut) -> None:
+        if value.marks or value.is_unknown or value.is_null:
+            out.chunks.append(_absent(value))
+            return
+        if value._encoded is not None and _reuse_fragment(value, cty_type, out):
+            return
+        chunks = out.chunks
+        start = len(chunks)
+        chunks.append("[")
+        index = 0
+        try:
+            for element, plan in zip(cast("tuple[Any, ...]", value.value or ()), element_plans, strict=True):
+                plan(element, out)
+                chunks.append(",")
+                index += 1
+        except _Refused as refused:
+            refused.steps.append(f"[{index}]")
+            raise
+        if index:
+            chunks[-1] = "]"
+        else:
+            chunks.append("]")
+        _keep_fragment(value, cty_type, out, start)
+
+    return write
+
+
+def _compile_json_map(cty_type: CtyMap[Any]) -> _JsonWriter:
+    element_plan = _json_plan(cty_type.element_type)
+
+    def write(value: CtyValue[Any], out: _JsonOut) -> None:
+        if value.marks or value.is_unknown or value.is_null:
+            out.chunks.append(_absent(value))
+            return
+        if value._encoded is not None and _reuse_fragment(value, cty_type, out):
+            return
+        chunks = out.chunks
+        start = len(chunks)
+        chunks.append("{")
+        key = ""
+        try:
+            for key, item in sorted(cast("dict[str, Any]", value.value or {}).items()):
+                chunks.append(f",{_marshal_string(key)}:")
+                element_plan(item, out)
+        except _Refused as refused:
+            refused.steps.append(f"[{key!r}]")
+            raise
+        _close_members(chunks, start)
+        _keep_fragment(value, cty_type, out, start)
+
+    return write
+
+
+def _close_members(chunks: list[str], start: int) -> None:
+    # Every member was written behind a comma; the first one's is dropped.
+    if len(chunks) > start + 1:
+        chunks[start + 1] = chunks[start + 1][1:]
+    chunks.append("}")
+
+
+def _compile_json_object(cty_type: CtyObject) -> _JsonWriter:
+    # Sorted by name, which is go-cty's order; each name's text, comma in
+    # front, is written once here rather than escaped again per value.
+    ordered = tuple(
+        (name, f",{_marshal_string(name)}:", _json_plan(attribute_type))
+        for name, attribute_type in sorted(cty_type.attribute_types.items())
+    )
+
+    def write(value: CtyValue[Any], out: _JsonOut) -> None:
+        if value.marks or value.is_unknown or value.is_null:
+            out.chunks.append(_absent(value))
+            return
+        if value._encoded is not None and _reuse_fragment(value, cty_type, out):
+            return
+        chunks = out.chunks
+        start = len(chunks)
+        items = cast("dict[str, Any]", value.value or {})
+        chunks.append("{")
+        name = ""
+        try:
+            for name, key, plan in ordered:
+                if name in items:
+                    chunks.append(key)
+                    plan(items[name], out)
+        except _Refused as refused:
+            refused.steps.append(f".{name}")
+            raise
+        _close_members(chunks, start)
+        _keep_fragment(value, cty_type, out, start)
+
+    return write
+
+
+def _compile_json_capsule(cty_type: CtyType[Any]) -> _JsonWriter:
+    def write(value: CtyValue[Any], out: _JsonOut) -> None:
+        if value.marks or value.is_unknown or value.is_null:
+            out.chunks.append(_absent(value))
+            return
+        out.sealed = False
+        try:
+            out.chunks.append(_marshal_capsule(value, cty_type, ""))
+        except CtyJsonError:
+            raise _Refused(f": cannot serialize {cty_type.ctype} as JSON") from None
+
+    return write
+
+
+@lru_cache(maxsize=JSON_MARSHAL_PLAN_CACHE_SIZE)
+def _json_plan(cty_type: CtyType[Any]) -> _JsonWriter:
+    """The marshaller for `cty_type`: `_marshal`, specialized and writing into chunks.
+
+    `_marshal` answers every node as a string that its parent joins into a
+    bigger one, so a leaf's text is copied once per container above it, and a
+    multi-megabyte state was assembled that many times over. A plan appends
+    each leaf's text to one list, once; the whole document is joined a single
+    time at the end. The type dispatch and every attribute name's escaped text
+    are worked out here, once per type, and a path is assembled only for a node
+    that is refused (see `_Refused`).
+
+    Cached by type, like msgpack's `_encoder_plan`.
+    """
+    if isinstance(cty_type, CtyDynamic):
+        return _compile_json_dynamic()
+    if isinstance(cty_type, CtyString):
+        return _compile_json_string()
+    if isinstance(cty_type, CtyNumber):
+        return _compile_json_number()
+    if isinstance(cty_type, CtyBool):
+        return _compile_json_bool()
+    if isinstance(cty_type, CtyList | CtySet):
+        return _compile_json_sequence(cty_type)
+    if isinstance(cty_type, CtyTuple):
+        return _compile_json_tuple(cty_type)
+    if isinstance(cty_type, CtyMap):
+        return _compile_json_map(cty_type)
+    if isinstance(cty_type, CtyObject):
+        return _compile_json_object(cty_type)
+    return _compile_json_capsule(cty_type)
+
+
+def _write_json(value: CtyValue[Any], cty_type: CtyType[Any]) -> list[str]:
+    """`value`'s JSON under `cty_type`, as the chunks that join into it.
+
+    Asked after `collect_marks_deep(value)`, whose memo is filled only for a
+    tree that can no longer change; fragments are kept only then.
+    """
+    out = _JsonOut(sealed=value._deep_marks is not None)
+    try:
+        _json_plan(cty_type)(value, out)
+    except _Refused as refused:
+        raise refused.error() from None
+    return out.chunks
+
+
 def _ordered(value: CtyValue[Any], elements: Any) -> list[CtyValue[Any]]:
     """Set elements in the order the msgpack codec uses, so the two agree."""
     if isinstance(value.type, CtySet):
-        return sorted(elements, key=set_order_key)
+        return list(set_in_order(value))
     return list(elements)
 
 
@@ -405,32 +888,30 @@ def _unmarshal_dynamic(raw: Any, path: str) -> CtyValue[Any]:
 def _unmarshal_sequence(raw: Any, cty_type: CtyList[Any] | CtySet[Any] | CtyTuple, path: str) -> CtyValue[Any]:
     if not isinstance(raw, list):
         raise CtyJsonError(f"{path or 'value'}: an array is required for {cty_type.ctype}")
-    if isinstance(cty_type, CtySet):
-        element_type = cty_type.element_type
-        return cast(
-            "CtyValue[Any]",
-            cty_type.validate(
-                [_unmarshal(item, element_type, f"{path}[{index}]") for index, item in enumerate(raw)]
-            ),
-        )
     if isinstance(cty_type, CtyTuple):
         expected = len(cty_type.element_types)
         if len(raw) != expected:
             raise CtyJsonError(f"{path or 'value'}: {expected} elements are required, got {len(raw)}")
-        return CtyValue(
-            vtype=cty_type,
-            value=tuple(
+        return CtyValue._trusted(
+            cty_type,
+            tuple(
                 _unmarshal(item, element_type, f"{path}[{index}]")
                 for index, (item, element_type) in enumerate(zip(raw, cty_type.element_types, strict=True))
             ),
         )
     element_type = cty_type.element_type
-    return CtyValue(
-        vtype=cty_type,
-        value=tuple(_unmarshal(item, element_type, f"{path}[{index}]") for index, item in enumerate(raw)),
+    return _collection_value(
+        cty_type, [_unmarshal(item, element_type, f"{path}[{index}]") for index, item in enumerate(raw)]
     )
 
 
+def _collection_value(cty_type: CtyList[Any] | CtySet[Any], elements: list[CtyValue[Any]]) -> CtyValue[Any]:
+    """A decoded list or set; a set is validated, which drops its duplicates."""
+    if isinstance(cty_type, CtySet):
+        return cast("CtyValue[Any]", cty_type.validate(elements))
+    return CtyValue._trusted(cty_type, tuple(elements)) if elements else CtyValue._empty(cty_type)
+
+
 def _unmarshal_mapping(raw: Any, cty_type: CtyMap[Any] | CtyObject, path: str) -> CtyValue[Any]:
     if not isinstance(raw, dict):
         raise CtyJsonError(f"{path or 'value'}: an object is required for {cty_type.ctype}")
@@ -442,20 +923,252 @@ def _unmarshal_mapping(raw: Any, cty_type: CtyMap[Any] | CtyObject, path: str) -
         for name, item in _pairs(raw):
             attribute_type = cty_type.attribute_types.get(name)
             if attribute_type is None:
-                raise CtyJsonError(f'{path or "value"}: unsupported attribute "{name}"')
+                raise _unsupported_attribute(name, path)
             decoded[name] = _unmarshal(item, attribute_type, f"{path}.{name}")
-        return CtyValue(
-            vtype=cty_type,
-            value=FrozenDict(
-                (name, decoded[name] if name in decoded else CtyValue.null(attribute_type))
-                for name, attribute_type in cty_type.attribute_types.items()
-            ),
-        )
+        return _object_value(cty_type, decoded)
 
     element_type = cty_type.element_type
     for key, item in _pairs(raw):
         decoded[unicodedata.normalize("NFC", str(key))] = _unmarshal(item, element_type, f"{path}[{key!r}]")
-    return CtyValue(vtype=cty_type, value=FrozenDict(decoded))
+    return CtyValue._trusted(cty_type, FrozenDict(decoded)) if decoded else CtyValue._empty(cty_type)
+
+
+def _unsupported_attribute(name: str, path: str) -> CtyJsonError:
+    return CtyJsonError(f'{path or "value"}: unsupported attribute "{name}"')
+
+
+def _object_value(cty_type: CtyObject, decoded: dict[str, CtyValue[Any]]) -> CtyValue[Any]:
+    """A decoded object, every attribute the document left out a typed null."""
+    return CtyValue._trusted(
+        cty_type,
+        FrozenDict(
+            (name, decoded[name] if name in decoded else CtyValue.null(attribute_type))
+            for name, attribute_type in cty_type.attribute_types.items()
+        ),
+    )
+
+
+class _StreamDecodeError(json.JSONDecodeError):
+    """`json.JSONDecodeError`, located in a document that is never held whole.
+
+    The stdlib's constructor works the line and column out from the document
+    it is given; a streamed document's earlier text is gone by the time an
+    error is found, so `_JsonReader` counts them as it discards text and hands
+    them over ready-made. `doc` is empty for the same reason.
+    """
+
+    def __init__(self, msg: str, pos: int, lineno: int, colno: int) -> None:
+        ValueError.__init__(self, f"{msg}: line {lineno} column {colno} (char {pos})")
+        self.msg = msg
+        self.doc = ""
+        self.pos = pos
+        self.lineno = lineno
+        self.colno = colno
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__, (self.msg, self.pos, self.lineno, self.colno)
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_RUN = re.compile(r"[-+.eE0-9]*")
+_LITERALS = (("true", True), ("false", False), ("null", None))
+_CONSTANTS = ("NaN", "Infinity", "-Infinity")
+
+
+class _JsonReader:
+    """A JSON document read a chunk at a time from a binary stream.
+
+    `text` holds what has been read and not yet consumed, from `pos` on. Text
+    before `pos` is dropped at the next read, so the window stays around one
+    chunk however large the document -- except while a single token spans
+    reads, when each read asks for as much again as the window holds, so a
+    long string is rescanned a logarithmic number of times rather than once
+    per chunk.
+
+    Tokens are answered as `_loads` answers them: strings through the
+    stdlib's `scanstring`, numbers as `_RawNumber` or `_parse_int`, and a
+    malformed document as the `json.JSONDecodeError` `json.loads` raises,
+    message and position included.
+    """
+
+    __slots__ = ("_chunk_size", "_column", "_decode", "_lines", "_offset", "_read", "eof", "pos", "text")
+
+    def __init__(self, fp: IO[bytes] | mmap.mmap, chunk_size: int) -> None:
+        self._read = fp.read
+        self._decode = codecs.getincrementaldecoder("utf-8")().decode
+        self._chunk_size = chunk_size
+        # Characters dropped so far, the newlines among them, and the number
+        # dropped since the last newline: what an error's position needs.
+        self._offset = 0
+        self._lines = 0
+        self._column = 0
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read the next chunk onto the window; False once the stream is exhausted."""
+        if self.eof:
+            return False
+        consumed = self.text[: self.pos]
+        if consumed:
+            newlines = consumed.count("\n")
+            if newlines:
+                self._lines += newlines
+                self._column = len(consumed) - consumed.rfind("\n") - 1
+            else:
+                self._column += len(consumed)
+            self._offset += len(consumed)
+            self.text = self.text[self.pos :]
+            self.pos = 0
+        data = self._read(max(self._chunk_size, len(self.text)))
+        if data:
+            self.text += self._decode(data)
+        else:
+            self.text += self._decode(b"", True)
+            self.eof = True
+        return True
+
+    def need(self, count: int) -> None:
+        """Read until `count` characters follow `pos`, or the stream ends."""
+        while len(self.text) - self.pos < count and self.fill():
+            pass
+
+    def peek(self) -> str:
+        """The next character after whitespace, without consuming it; "" at the end."""
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()  # type: ignore[union-attr]
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def error(self, msg: str, pos: int) -> _StreamDecodeError:
+        newlines = self.text.count("\n", 0, pos)
+        colno = pos - self.text.rfind("\n", 0, pos) if newlines else self._column + pos + 1
+        return _StreamDecodeError(msg, self._offset + pos, self._lines + newlines + 1, colno)
+
+    def string(self) -> str:
+        """The string whose opening quote is at `pos`."""
+        while True:
+            try:
+                text, end = scanstring(self.text, self.pos + 1)
+            except json.JSONDecodeError as error:
+                # Unterminated, or an escape cut short by the end of the window:
+                # more text may complete it. Anything else is in the document.
+                truncated = error.msg.startswith("Unterminated") or error.pos >= len(self.text) - 6
+                if truncated and self.fill():
+                    continue
+                raise self.error(error.msg, error.pos) from None
+            self.pos = end
+            return cast(str, text)
+
+    def scalar(self) -> Any:
+        """The number or literal at `pos`."""
+        while _NUMBER_RUN.match(self.text, self.pos).end() == len(self.text) and self.fill():  # type: ignore[union-attr]
+            pass
+        match = NUMBER_RE.match(self.text, self.pos)
+        if match is not None:
+            integer, fraction, exponent = match.groups()
+            self.pos = match.end()
+            if fraction or exponent:
+                return _RawNumber(integer + (fraction or "") + (exponent or ""))
+            return _parse_int(integer)
+        self.need(len("-Infinity"))
+        for word, literal in _LITERALS:
+            if self.text.startswith(word, self.pos):
+                self.pos += len(word)
+                return literal
+        for constant in _CONSTANTS:
+            if self.text.startswith(constant, self.pos):
+                return _reject_constant(constant)
+        raise self.error("Expecting value", self.pos)
+
+    def array(self) -> Iterator[int]:
+        """Step through the array at `pos`, yielding once per element for the caller to read."""
+        self.pos += 1
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            char = self.peek()
+            self.pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise self.error("Expecting ',' delimiter", self.pos - 1)
+
+    def members(self) -> Iterator[str]:
+        """Step through the object at `pos`, yielding each property name for the caller to read its value."""
+        self.pos += 1
+        char = self.peek()
+        if char == "}":
+            self.pos += 1
+            return
+        while True:
+            if char != '"':
+                raise self.error("Expecting property name enclosed in double quotes", self.pos)
+            name = self.string()
+            if self.peek() != ":":
+                raise self.error("Expecting ':' delimiter", self.pos)
+            self.pos += 1
+            yield name
+            char = self.peek()
+            self.pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise self.error("Expecting ',' delimiter", self.pos - 1)
+            char = self.peek()
+
+
+def _read_raw(reader: _JsonReader) -> Any:
+    """The next value as `_loads` would have built it."""
+    char = reader.peek()
+    if char == '"':
+        return reader.string()
+    if char == "[":
+        return [_read_raw(reader) for _ in reader.array()]
+    if char == "{":
+        pairs: list[tuple[str, Any]] = []
+        for name in reader.members():
+            pairs.append((name, _read_raw(reader)))
+        return _JsonObject(pairs)
+    return reader.scalar()
+
+
+def _read_value(reader: _JsonReader, cty_type: CtyType[Any], path: str) -> CtyValue[Any]:
+    """`_unmarshal` of the next value, without building it raw first where its type allows.
+
+    A list, set, map or object is decoded element by element as it is read.
+    Anything else is read raw and handed to `_unmarshal`, which is where its
+    rules are: a primitive's coercions; a tuple's length, checked before any
+    element is decoded; and a dynamic value, whose `"type"` may follow its
+    `"value"` and whose every `"type"` occurrence is parsed.
+    """
+    char = reader.peek()
+    decoded: dict[str, CtyValue[Any]] = {}
+    if char == "[" and isinstance(cty_type, CtyList | CtySet):
+        element_type = cty_type.element_type
+        return _collection_value(
+            cty_type, [_read_value(reader, element_type, f"{path}[{index}]") for index in reader.array()]
+        )
+    if char == "{" and isinstance(cty_type, CtyObject):
+        for name in reader.members():
+            attribute_type = cty_type.attribute_types.get(name)
+            if attribute_type is None:
+                raise _unsupported_attribute(name, path)
+            decoded[name] = _read_value(reader, attribute_type, f"{path}.{name}")
+        return _object_value(cty_type, decoded)
+    if char == "{" and isinstance(cty_type, CtyMap):
+        element_type = cty_type.element_type
+        for key in reader.members():
+            decoded[unicodedata.normalize("NFC", key)] = _read_value(reader, element_type, f"{path}[{key!r}]")
+        return CtyValue._trusted(cty_type, FrozenDict(decoded)) if decoded else CtyValue._empty(cty_type)
+    return _unmarshal(_read_raw(reader), cty_type, path)
 
 
 def _implied(raw: Any) -> CtyType[Any]:
@@ -12,7 +12,9 @@ from attrs import define, evolve, field
 
 from pyvider.cty.exceptions import CtyValidationError
 from pyvider.cty.values import CtyValue
+from pyvider.cty.values.columnar import ColumnarRows
 from pyvider.cty.values.frozen import FrozenDict
+from pyvider.cty.values.lazy import LazyObjectPayload
 
 
 def _convert_details(value: Any) -> frozenset[Any] | None:
@@ -139,7 +141,16 @@ def _push_children(current: Any, stack: list[Any], visited: set[int]) -> bool:
     current_id = id(current)
     if current_id not in visited:
         visited.add(current_id)
-        if isinstance(current, dict):
+        if type(current) is LazyObjectPayload:
+            # Only what has been decoded: an attribute still in wire bytes
+            # carries no mark, and asking `values()` would decode all of them.
+            stack.extend(current.decoded_values())
+        elif type(current) is ColumnarRows:
+            # Only what is held as a value: a column entry stored raw is a
+            # known, unmarked primitive, and building every row to find that
+            # out is the cost the columns exist to avoid.
+            stack.extend(current.boxed_values())
+        elif isinstance(current, dict):
             stack.extend(current.values())
         else:
             stack.extend(current)
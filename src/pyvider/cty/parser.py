@@ -29,6 +29,7 @@ from pyvider.cty.types import (
     CtyTuple,
     CtyType,
 )
+from pyvider.cty.types.interning import intern_shallow, type_interning_enabled
 
 # pyvider-cty/src/pyvider/cty/parser.py
 """
@@ -37,11 +38,24 @@ into the framework's internal CtyType objects.
 """
 
 
-def parse_tf_type_to_ctytype(tf_type: Any) -> CtyType[Any]:  # noqa: C901
+def parse_tf_type_to_ctytype(tf_type: Any) -> CtyType[Any]:
     """
     Parses a Terraform type constraint, represented as a raw Python object
     (typically from JSON), into a CtyType instance.
+
+    With `PYVIDER_CTY_INTERN_TYPES` set, each container is interned as it is
+    built, so every equal type parsed is the same object.
     """
+    return _parse_type(tf_type, type_interning_enabled())
+
+
+def _parse_type(tf_type: Any, intern: bool) -> CtyType[Any]:
+    """`parse_tf_type_to_ctytype` below the entry point, the interning setting read once there."""
+    parsed = _parse(tf_type, intern)
+    return intern_shallow(parsed) if intern else parsed
+
+
+def _parse(tf_type: Any, intern: bool) -> CtyType[Any]:  # noqa: C901
     with error_boundary(
         context={
             "operation": "terraform_type_parsing",
@@ -78,7 +92,7 @@ def parse_tf_type_to_ctytype(tf_type: Any) -> CtyType[Any]:  # noqa: C901
 
             # Handle collection types where the spec is a single type
             if type_kind in (TYPE_KIND_LIST, TYPE_KIND_SET, TYPE_KIND_MAP):
-                element_type = parse_tf_type_to_ctytype(type_spec)
+                element_type = _parse_type(type_spec, intern)
                 match type_kind:
                     case "list":
                         return CtyList(element_type=element_type)
@@ -103,7 +117,7 @@ def parse_tf_type_to_ctytype(tf_type: Any) -> CtyType[Any]:  # noqa: C901
                         raise CtyValidationError(
                             f"Object optional attribute names must be a list of strings, got {optional_names!r}"
                         )
-                    attr_types = {name: parse_tf_type_to_ctytype(spec) for name, spec in type_spec.items()}
+                    attr_types = {name: _parse_type(spec, intern) for name, spec in type_spec.items()}
                     return CtyObject(
                         attribute_types=attr_types,
                         optional_attributes=frozenset(optional_names),
@@ -113,7 +127,7 @@ def parse_tf_type_to_ctytype(tf_type: Any) -> CtyType[Any]:  # noqa: C901
                         raise CtyValidationError(
                             f"Tuple type spec must be a list, got {type(type_spec).__name__}"
                         )
-                    elem_types = tuple(parse_tf_type_to_ctytype(spec) for spec in type_spec)
+                    elem_types = tuple(_parse_type(spec, intern) for spec in type_spec)
                     return CtyTuple(element_types=elem_types)
 
         raise CtyValidationError(f"Invalid Terraform type specification: {tf_type}")
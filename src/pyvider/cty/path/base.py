@@ -136,10 +136,12 @@ class KeyStep(PathStep):
 
     def _apply_to_set(self, value: CtyValue[Any]) -> CtyValue[Any]:
         from pyvider.cty.types.collections import CtySet
+        from pyvider.cty.values.membership import members_by_value
 
         element_type = cast(CtySet[Any], value.type).element_type
         elements = cast("tuple[CtyValue[Any], ...]", value.value)
-        if self.key in elements:
+        members = members_by_value(value)
+        if self.key in (elements if members is None else members):
             # The set's marks come along: cty cannot hold marks on set elements,
             # so an element's sensitivity is recorded on the set as a whole.
             return cast(CtyValue[Any], self.key).with_marks(value.marks)
@@ -14,11 +14,17 @@ from pyvider.cty.types.collections import (
     CtyMap,
     CtySet,
 )
+from pyvider.cty.types.interning import intern_type
 from pyvider.cty.types.primitives import (
     CtyBool,
     CtyNumber,
     CtyString,
 )
+from pyvider.cty.types.relations import (
+    TypeRelationCacheInfo,
+    clear_type_relation_cache,
+    type_relation_cache_info,
+)
 from pyvider.cty.types.structural import (
     CtyDynamic,
     CtyObject,
@@ -50,6 +56,10 @@ __all__ = [
     "CtyString",
     "CtyTuple",
     "CtyType",
+    "TypeRelationCacheInfo",
+    "clear_type_relation_cache",
+    "intern_type",
+    "type_relation_cache_info",
 ]
 
 # 🌊🪢🔚
@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -14,10 +15,13 @@ from typing import (
     Generic,
     Protocol,
     TypeVar,
+    cast,
     runtime_checkable,
 )
 
-from attrs import define
+from attrs import define, fields
+
+from pyvider.cty.types.relations import cached_relation
 
 # Forward reference to CtyValue to avoid importing it directly at runtime
 if TYPE_CHECKING:
@@ -57,6 +61,12 @@ def equal_iteratively(left: Any, right: Any) -> bool:
     child comparison and hands back the child pairs still to compare, so the
     per-type rules stay with their types.
     """
+    if left is right:
+        return True
+    # Two hashes already worked out that differ settle it without a walk.
+    mine, theirs = getattr(left, "_hash_memo", None), getattr(right, "_hash_memo", None)
+    if mine is not None and theirs is not None and mine != theirs:
+        return False
     children = left._equal_shallow(right)
     if children is None:
         return False
@@ -65,6 +75,11 @@ def equal_iteratively(left: Any, right: Any) -> bool:
     stack = list(children)
     while stack:
         this, that = stack.pop()
+        # The same object is equal to itself without a look inside, which is
+        # the whole answer for two interned types (see `intern_type`) and for
+        # a schema that reuses one attribute type in many places.
+        if this is that:
+            continue
         pairs = this._equal_shallow(that)
         if pairs is None:
             return False
@@ -79,7 +94,14 @@ def usable_as_iteratively(left: Any, right: Any) -> bool:
     relation: it is directional, `dynamic` accepts anything on the right, and an
     object is usable as one asking for *fewer* attributes. Only the traversal is
     shared, and only the traversal was the problem.
+
+    The answer depends on the two types alone, so it is kept in the shared
+    type-relation cache (`pyvider.cty.types.relations`).
     """
+    return cached_relation("usable_as", left, right, _usable_walk, True)
+
+
+def _usable_walk(left: Any, right: Any) -> bool:
     children = left._usable_shallow(right)
     if children is None:
         return False
@@ -124,7 +146,7 @@ def render_iteratively(root: Any) -> str:
 
 
 def hash_iteratively(root: Any) -> int:
-    """A structural hash of a type, without a frame per level of nesting.
+    """A structural hash of a type, without a frame per level of nesting, worked out once.
 
     The same problem `equal_iteratively` solves, and it has to be solved in the
     same place: Python requires `a == b` to imply `hash(a) == hash(b)`, so a
@@ -134,24 +156,58 @@ def hash_iteratively(root: Any) -> int:
     avoid recursion" -- which was a workaround for this, one level deep, in one
     type.
 
-    The walk is a deterministic pre-order over `_structure`, and each node
-    contributes its own token and its child count, so two types with the same
-    tokens in the same shape are the same type. A leaf contributes its own hash,
-    which is O(1) and already agrees with its own equality.
+    Each node's hash is its `_structure` token combined with its children's
+    hashes, so two types with the same tokens in the same shape hash alike. A
+    leaf contributes its own hash, which is O(1) and already agrees with its
+    own equality.
+
+    Types are immutable, so a container's hash is kept on it (`_hash_memo`)
+    the first time it is asked for, and each of its container descendants'
+    with it; the walk stops at a node that already has one. It used to walk
+    the whole tree on every call, and a type is hashed on every `lru_cache`
+    lookup keyed by it -- `unify`, both codecs' plan caches. The memo stays in
+    the process: a hash of a string is only stable within one, so pickling a
+    type (`reduce_rebuilding`) builds it afresh on the other side.
     """
-    tokens: list[Any] = []
+    memo: int | None = root._hash_memo
+    if memo is not None:
+        return memo
+    order: list[tuple[Any, tuple[Any, tuple[Any, ...]]]] = []
     stack: list[Any] = [root]
     while stack:
         node = stack.pop()
         structure = node._structure()
-        if structure is None:
-            tokens.append(hash(node))
-            continue
-        token, children = structure
-        tokens.append(token)
-        tokens.append(len(children))
-        stack.extend(reversed(children))
-    return hash(tuple(tokens))
+        order.append((node, structure))
+        stack.extend(child for child in structure[1] if getattr(child, "_hash_memo", _LEAF) is None)
+    # Pre-order reversed: every node after all of its descendants.
+    for node, (token, children) in reversed(order):
+        if node._hash_memo is None:
+            parts = tuple(
+                hash(child) if (part := getattr(child, "_hash_memo", _LEAF)) is _LEAF else part
+                for child in children
+            )
+            object.__setattr__(node, "_hash_memo", hash((token, parts)))
+    return cast(int, root._hash_memo)
+
+
+_LEAF = object()
+"""What `getattr(node, "_hash_memo", _LEAF)` answers for a type that keeps no memo: a leaf."""
+
+
+def reduce_rebuilding(cty_type: Any) -> tuple[Any, ...]:
+    """`__reduce__` for a type that keeps a hash memo: pickled as its constructor arguments.
+
+    attrs pickles every field of a slotted class, the memo with them, and the
+    memo is a `hash()` of strings, which differs between processes unless
+    PYTHONHASHSEED is pinned. A type that crossed to a pool worker with its
+    parent's memo would sit in the wrong bucket of every dict there.
+    """
+    cls = type(cty_type)
+    return _rebuilt_type, (cls, {a.alias: getattr(cty_type, a.name) for a in fields(cls) if a.init})
+
+
+def _rebuilt_type(cls: Any, arguments: dict[str, Any]) -> Any:
+    return cls(**arguments)
 
 
 @runtime_checkable
@@ -207,6 +263,24 @@ class CtyType(Generic[T], ABC):
     def _to_wire_json(self) -> Any:
         """Abstract method for JSON wire format encoding."""
 
+    def compile_validator(self) -> Callable[[object], CtyValue[T]]:
+        """A callable that validates as `validate` does, compiled for this type where it can be.
+
+        A container with no `dynamic` anywhere below it answers the closure
+        tree `validate` itself runs (see `pyvider.cty.validation.compiled`),
+        with no recursion guard at all: its values are no deeper than it is.
+        Worth holding on to where one schema validates many values. Any other
+        type -- and a container deeper than the derived validation depth, which
+        only the guard can stop cleanly -- answers its own `validate`.
+        """
+        from pyvider.cty.config.defaults import default_max_validation_depth
+        from pyvider.cty.validation.compiled import compiled_validation
+
+        plan = compiled_validation(self, at_once=True)
+        if plan is None or plan[1] > default_max_validation_depth():
+            return self.validate
+        return plan[0]
+
     def unknown_like(self, value: object) -> CtyValue[T]:
         """This type's unknown value, keeping the refinement `value` carries.
 
@@ -287,6 +361,14 @@ class CtyType(Generic[T], ABC):
         """
         return None
 
+    def _with_children(self, children: tuple[Any, ...]) -> CtyType[T]:
+        """This type with `children` in place of its own, in `_structure`'s order.
+
+        `intern_type` builds a canonical type from canonical children with this.
+        A leaf has no children and is answered as it is.
+        """
+        return self
+
     def _render(self, children: list[str]) -> str | None:
         """How this type spells itself, given its children's spellings.
 
@@ -16,10 +16,14 @@ from pyvider.cty.types.base import (
     CtyType,
     equal_iteratively,
     hash_iteratively,
+    reduce_rebuilding,
     render_iteratively,
     usable_as_iteratively,
 )
 from pyvider.cty.types.structural import CtyDynamic
+from pyvider.cty.validation.compiled import Validator
+from pyvider.cty.validation.iterative import ValidationSteps, validate_iteratively
+from pyvider.cty.validation.marks import reapply_marks
 from pyvider.cty.validation.recursion import with_recursion_detection
 from pyvider.cty.values import CtyValue
 
@@ -29,12 +33,24 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
+def _element_error(error: CtyValidationError, index: int, item: object) -> CtyListValidationError:
+    """`error`, raised validating the element at `index`, as the list's own error at that path."""
+    path = CtyPath(steps=(IndexStep(index), *(error.path.steps if error.path else ())))
+    return CtyListValidationError(error.message, value=item, path=path, original_exception=error)
+
+
 @final
 @define(frozen=True, slots=True)
 class CtyList(CtyType[tuple[T, ...]], Generic[T]):
     ctype: ClassVar[str] = "list"
     _type_order: ClassVar[int] = 5
     element_type: CtyType[T] = field(kw_only=True)
+    # The structural hash, once asked for; see `hash_iteratively`.
+    _hash_memo: int | None = field(default=None, init=False, eq=False, repr=False)
+    # The compiled validator, once asked for; see `validation.compiled`.
+    _validator_memo: Any = field(default=None, init=False, eq=False, repr=False)
+    # Its shared null, unknown and empty value, once asked for; see `values.base._shared`.
+    _flyweight_memo: Any = field(default=None, init=False, eq=False, repr=False)
 
     def __attrs_post_init__(self) -> None:
         if not isinstance(self.element_type, CtyType):
@@ -42,31 +58,43 @@ class CtyList(CtyType[tuple[T, ...]], Generic[T]):
                 f"Expected CtyType for element_type, got {type(self.element_type).__name__}"
             )
 
-    @with_recursion_detection
-    def validate(self, value: object) -> CtyValue[tuple[T, ...]]:
+    def _prepare(self, value: object) -> tuple[CtyValue[tuple[T, ...]] | None, Any]:
+        """The answers that need no element validation, or the elements to validate.
 
+        Returns (answer, elements). Shared by `validate` and the compiled
+        validator, which differ only in how each element is validated.
+        """
         if isinstance(value, CtyValue):
             if self.equal(value.type) and isinstance(value.value, tuple):
-                return cast(CtyValue[tuple[T, ...]], value)  # Fast path for already-validated values
+                return cast(CtyValue[tuple[T, ...]], value), None  # Fast path for already-validated values
             if value.is_null:
-                return CtyValue.null(self)
+                return CtyValue.null(self), None
             if value.is_unknown:
-                return self.unknown_like(value)
+                return self.unknown_like(value), None
             value = value.value
 
         if value is None:
-            return CtyValue.null(self)
+            return CtyValue.null(self), None
 
         if (unknown := self.unknown_marker(value)) is not None:
-            return unknown
+            return unknown, None
 
         # Ordered input only. A `set` used to be accepted, and the list it
         # produced changed order with PYTHONHASHSEED -- the same configuration
         # serialized to different state bytes in different processes.
         if isinstance(value, list | tuple):
-            raw_list_to_validate = cast(list[object] | tuple[object, ...], value)
-        else:
-            raise CtyListValidationError(f"Expected list, tuple, or CtyValue list, got {type(value).__name__}")
+            return None, value
+        raise CtyListValidationError(f"Expected list, tuple, or CtyValue list, got {type(value).__name__}")
+
+    @with_recursion_detection
+    def validate(self, value: object) -> CtyValue[tuple[T, ...]]:
+        return cast(CtyValue[tuple[T, ...]], validate_iteratively(self._validation_steps(value)))
+
+    def _validation_steps(self, value: object) -> ValidationSteps:
+        """`validate`'s work, yielding each element to be validated; see `validation.iterative`."""
+        answer, raw_list_to_validate = self._prepare(value)
+        if answer is not None:
+            return answer
 
         validated_elements: list[CtyValue[T]] = []
         for i, item in enumerate(raw_list_to_validate):
@@ -79,11 +107,9 @@ class CtyList(CtyType[tuple[T, ...]], Generic[T]):
             # returns a null of the element type, which is what set, tuple and
             # map have always relied on here.
             try:
-                validated_item = self.element_type.validate(item)
-                validated_elements.append(validated_item)
+                validated_elements.append((yield self.element_type, item))
             except CtyValidationError as e:
-                new_path = CtyPath(steps=(IndexStep(i), *(e.path.steps if e.path else ())))
-                raise CtyListValidationError(e.message, value=item, path=new_path, original_exception=e) from e
+                raise _element_error(e, i, item) from e
 
         # A list holding an unknown element is a *known* list. go-cty draws this
         # line at `IsKnown` vs `IsWhollyKnown`, and the distinction is the whole
@@ -91,7 +117,29 @@ class CtyList(CtyType[tuple[T, ...]], Generic[T]):
         # one element is undecided. Hoisting the element's unknownness onto the
         # container threw all of that away -- `["a", unknown]` encoded to the
         # wire as a bare unknown, losing "a" and the length with it.
-        return CtyValue(vtype=self, value=tuple(validated_elements))
+        if not validated_elements:
+            return CtyValue._empty(self)
+        return CtyValue._trusted(self, tuple(validated_elements))
+
+    def _compile_validation(self, children: tuple[Validator, ...]) -> Validator:
+        """`validate` without the guard, each element through `children[0]`; see `validation.compiled`."""
+        prepare, validate_element = self._prepare, children[0]
+
+        def validate_list(value: object) -> CtyValue[Any]:
+            answer, items = prepare(value)
+            if answer is not None:
+                return cast(CtyValue[Any], reapply_marks(value, answer))
+            validated: list[CtyValue[Any]] = []
+            append = validated.append
+            for i, item in enumerate(items):
+                try:
+                    append(validate_element(item))
+                except CtyValidationError as e:
+                    raise _element_error(e, i, item) from e
+            result = CtyValue._trusted(self, tuple(validated)) if validated else CtyValue._empty(self)
+            return cast(CtyValue[Any], reapply_marks(value, result))
+
+        return validate_list
 
     def element_at(self, container: object, index: int) -> CtyValue[T]:
 
@@ -133,6 +181,9 @@ class CtyList(CtyType[tuple[T, ...]], Generic[T]):
     def _structure(self) -> tuple[Any, tuple[Any, ...]] | None:
         return ((self.ctype,), (self.element_type,))
 
+    def _with_children(self, children: tuple[Any, ...]) -> CtyList[T]:
+        return CtyList(element_type=children[0])
+
     def __eq__(self, other: object) -> bool:
         # Written out rather than left to attrs, which generates a field-by-field
         # comparison that recurses once per level of nesting. `equal` walks.
@@ -142,6 +193,9 @@ class CtyList(CtyType[tuple[T, ...]], Generic[T]):
     def __hash__(self) -> int:
         return hash_iteratively(self)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return reduce_rebuilding(self)
+
     def usable_as(self, other: CtyType[Any]) -> bool:
         return usable_as_iteratively(self, other)
 
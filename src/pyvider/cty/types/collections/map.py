@@ -22,9 +22,13 @@ from pyvider.cty.types.base import (
     CtyType,
     equal_iteratively,
     hash_iteratively,
+    reduce_rebuilding,
     render_iteratively,
     usable_as_iteratively,
 )
+from pyvider.cty.validation.compiled import Validator
+from pyvider.cty.validation.iterative import ValidationSteps, validate_iteratively
+from pyvider.cty.validation.marks import reapply_marks
 from pyvider.cty.validation.recursion import with_recursion_detection
 from pyvider.cty.values import CtyValue
 from pyvider.cty.values.frozen import FrozenDict
@@ -32,11 +36,35 @@ from pyvider.cty.values.frozen import FrozenDict
 V = TypeVar("V")
 
 
+def _normalized_key(key: object, validated: dict[str, Any]) -> str:
+    """`key` in NFC, refused if it is not a string or names a key already in `validated`."""
+    if not isinstance(key, str):
+        raise CtyMapValidationError(f"Map keys must be strings, but got key of type {type(key).__name__}")
+    normalized_key = unicodedata.normalize("NFC", key)
+    if normalized_key in validated:
+        raise CtyMapValidationError(
+            f"Map keys {key!r} and {normalized_key!r} normalize to the same NFC string"
+        )
+    return normalized_key
+
+
+def _element_error(error: CtyValidationError, key: str, raw: object) -> CtyMapValidationError:
+    """`error`, raised validating the element at `key`, as the map's own error at that path."""
+    path = CtyPath(steps=(KeyStep(key), *(error.path.steps if error.path else ())))
+    return CtyMapValidationError(error.message, value=raw, path=path, original_exception=error)
+
+
 @define(frozen=True, slots=True)
 class CtyMap(CtyType[dict[str, V]], Generic[V]):
     ctype: ClassVar[str] = "map"
     _type_order: ClassVar[int] = 6
     element_type: CtyType[V] = field(kw_only=True)
+    # The structural hash, once asked for; see `hash_iteratively`.
+    _hash_memo: int | None = field(default=None, init=False, eq=False, repr=False)
+    # The compiled validator, once asked for; see `validation.compiled`.
+    _validator_memo: Any = field(default=None, init=False, eq=False, repr=False)
+    # Its shared null, unknown and empty value, once asked for; see `values.base._shared`.
+    _flyweight_memo: Any = field(default=None, init=False, eq=False, repr=False)
 
     def __attrs_post_init__(self) -> None:
         if not isinstance(self.element_type, CtyType):
@@ -61,6 +89,10 @@ class CtyMap(CtyType[dict[str, V]], Generic[V]):
 
     @with_recursion_detection
     def validate(self, value: object) -> CtyValue[dict[str, V]]:
+        return cast(CtyValue[dict[str, V]], validate_iteratively(self._validation_steps(value)))
+
+    def _validation_steps(self, value: object) -> ValidationSteps:
+        """`validate`'s work, yielding each element to be validated; see `validation.iterative`."""
         answer, value = self._short_circuit(value)
         if answer is not None:
             return answer
@@ -69,25 +101,38 @@ class CtyMap(CtyType[dict[str, V]], Generic[V]):
             raise CtyMapValidationError(f"Input must be a dictionary, got {type(value).__name__}.")
         validated_map: dict[str, CtyValue[V]] = {}
         for k, v in value.items():
-            if not isinstance(k, str):
-                raise CtyMapValidationError(
-                    f"Map keys must be strings, but got key of type {type(k).__name__}"
-                )
-
-            normalized_key = unicodedata.normalize("NFC", k)
-            if normalized_key in validated_map:
-                raise CtyMapValidationError(
-                    f"Map keys {k!r} and {normalized_key!r} normalize to the same NFC string"
-                )
-
+            normalized_key = _normalized_key(k, validated_map)
             try:
-                validated_map[normalized_key] = self.element_type.validate(v)
+                validated_map[normalized_key] = yield self.element_type, v
             except CtyValidationError as e:
-                new_path = CtyPath(steps=(KeyStep(normalized_key), *(e.path.steps if e.path else ())))
-                raise CtyMapValidationError(e.message, value=v, path=new_path, original_exception=e) from e
+                raise _element_error(e, normalized_key, v) from e
 
         # Known map, undecided element -- see the note in CtyList.validate.
-        return CtyValue(vtype=self, value=FrozenDict(validated_map))
+        if not validated_map:
+            return CtyValue._empty(self)
+        return CtyValue._trusted(self, FrozenDict(validated_map))
+
+    def _compile_validation(self, children: tuple[Validator, ...]) -> Validator:
+        """`validate` without the guard, each element through `children[0]`; see `validation.compiled`."""
+        short_circuit, validate_element = self._short_circuit, children[0]
+
+        def validate_map(value: object) -> CtyValue[Any]:
+            answer, raw = short_circuit(value)
+            if answer is not None:
+                return cast(CtyValue[Any], reapply_marks(value, answer))
+            if not isinstance(raw, dict):
+                raise CtyMapValidationError(f"Input must be a dictionary, got {type(raw).__name__}.")
+            validated: dict[str, CtyValue[Any]] = {}
+            for k, v in raw.items():
+                normalized_key = _normalized_key(k, validated)
+                try:
+                    validated[normalized_key] = validate_element(v)
+                except CtyValidationError as e:
+                    raise _element_error(e, normalized_key, v) from e
+            result = CtyValue._trusted(self, FrozenDict(validated)) if validated else CtyValue._empty(self)
+            return cast(CtyValue[Any], reapply_marks(value, result))
+
+        return validate_map
 
     def get(
         self,
@@ -119,6 +164,9 @@ class CtyMap(CtyType[dict[str, V]], Generic[V]):
     def _structure(self) -> tuple[Any, tuple[Any, ...]] | None:
         return ((self.ctype,), (self.element_type,))
 
+    def _with_children(self, children: tuple[Any, ...]) -> CtyMap[V]:
+        return CtyMap(element_type=children[0])
+
     def __eq__(self, other: object) -> bool:
         # Written out rather than left to attrs, which generates a field-by-field
         # comparison that recurses once per level of nesting. `equal` walks.
@@ -128,6 +176,9 @@ class CtyMap(CtyType[dict[str, V]], Generic[V]):
     def __hash__(self) -> int:
         return hash_iteratively(self)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return reduce_rebuilding(self)
+
     def usable_as(self, other: CtyType[Any]) -> bool:
         return usable_as_iteratively(self, other)
 
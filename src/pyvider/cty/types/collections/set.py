@@ -17,9 +17,13 @@ from pyvider.cty.types.base import (
     CtyType,
     equal_iteratively,
     hash_iteratively,
+    reduce_rebuilding,
     render_iteratively,
     usable_as_iteratively,
 )
+from pyvider.cty.validation.compiled import Validator
+from pyvider.cty.validation.iterative import ValidationSteps, validate_iteratively
+from pyvider.cty.validation.marks import reapply_marks
 from pyvider.cty.validation.recursion import with_recursion_detection
 from pyvider.cty.values import CtyValue
 from pyvider.cty.values.set_order import identity_key as set_identity_key, order_key as set_order_key
@@ -46,12 +50,76 @@ def _has_marked_elements(value: CtyValue[Any]) -> bool:
     return any(collect_marks_deep(element) for element in elements)
 
 
+class _Members:
+    """A set's validated elements as they are admitted, de-duplicated, and the value they make."""
+
+    __slots__ = ("element_marks", "undecided", "unique_items")
+
+    def __init__(self) -> None:
+        self.unique_items: OrderedDict[tuple[Any, ...], CtyValue[Any]] = OrderedDict()
+        # Marks are hoisted off the elements onto the set itself, as go-cty's
+        # `SetVal` does (cty/value_init.go). A set cannot hold a marked element:
+        # de-duplication keys on the element's value, which is mark-blind, so an
+        # element marked sensitive that collides with an equal unmarked one was
+        # simply overwritten and its mark lost. go-cty goes further and panics on
+        # hashing a marked element (cty/set_internals.go) rather than trust the
+        # invariant to callers.
+        self.element_marks: set[Any] = set()
+        # Unknown elements are held apart from the de-duplicated ones. go-cty is
+        # explicit that "two unknown values are not equivalent for the sake of
+        # set membership" (cty/set_internals.go): its `Equivalent` compares
+        # `Equals(...) == true`, and unknown-against-unknown is undecided, so
+        # both survive. De-duplicating them would claim a cardinality the value
+        # does not have -- `toset([a.id, b.id])` at plan time is two elements,
+        # not one, and the count reaches Terraform.
+        self.undecided: list[CtyValue[Any]] = []
+
+    def admit(self, validated_item: CtyValue[Any]) -> None:
+        # Only look for marks where one could be hiding, and only rebuild an
+        # element that actually carries one. A leaf answers from its own
+        # `marks`; `_strip` walks and reconstructs the whole element, which on
+        # an unmarked set is pure overhead paid once per member.
+        if validated_item.marks or isinstance(validated_item.value, _NESTING_PAYLOADS):
+            item_marks = collect_marks_deep(validated_item)
+            if item_marks:
+                self.element_marks.update(item_marks)
+                validated_item = _strip(validated_item)
+        if validated_item.is_unknown:
+            self.undecided.append(validated_item)
+        else:
+            self.unique_items[set_identity_key(validated_item)] = validated_item
+
+    def value(self, set_type: CtySet[Any]) -> CtyValue[Any]:
+        # Canonical order, not a frozenset. Two unknowns of one type are `==` and
+        # hash-equal here, so a frozenset payload could not hold both however the
+        # de-duplication above was written -- the container itself was the
+        # constraint. An ordered tuple is also what `CtySet` has always declared
+        # (`CtyType[tuple[T, ...]]`), and it makes the wire order a property of
+        # the value rather than something each encoder re-derives.
+        #
+        # The sort is stable and `_canonical_sort_key` ranks known 0, unknown 1,
+        # null 2, so this reproduces go-cty's observed iteration order exactly:
+        # known elements sorted by value, then the unknowns in the order they
+        # were supplied, then nulls last.
+        if not (self.unique_items or self.undecided):
+            return CtyValue._empty(set_type)
+        elements = sorted((*self.unique_items.values(), *self.undecided), key=set_order_key)
+        result: CtyValue[Any] = CtyValue._trusted(set_type, tuple(elements))
+        return result.with_marks(self.element_marks) if self.element_marks else result
+
+
 @final
 @define(frozen=True, slots=True)
 class CtySet(CtyType[tuple[T, ...]], Generic[T]):
     ctype: ClassVar[str] = "set"
     _type_order: ClassVar[int] = 4
     element_type: CtyType[T] = field(kw_only=True)
+    # The structural hash, once asked for; see `hash_iteratively`.
+    _hash_memo: int | None = field(default=None, init=False, eq=False, repr=False)
+    # The compiled validator, once asked for; see `validation.compiled`.
+    _validator_memo: Any = field(default=None, init=False, eq=False, repr=False)
+    # Its shared null, unknown and empty value, once asked for; see `values.base._shared`.
+    _flyweight_memo: Any = field(default=None, init=False, eq=False, repr=False)
 
     def __attrs_post_init__(self) -> None:
         if not isinstance(self.element_type, CtyType):
@@ -83,6 +151,10 @@ class CtySet(CtyType[tuple[T, ...]], Generic[T]):
 
     @with_recursion_detection
     def validate(self, value: object) -> CtyValue[tuple[T, ...]]:
+        return cast(CtyValue[tuple[T, ...]], validate_iteratively(self._validation_steps(value)))
+
+    def _validation_steps(self, value: object) -> ValidationSteps:
+        """`validate`'s work, yielding each element to be validated; see `validation.iterative`."""
         answer, value = self._short_circuit(value)
         if answer is not None:
             return answer
@@ -93,59 +165,41 @@ class CtySet(CtyType[tuple[T, ...]], Generic[T]):
             )
 
         value_iterable = cast(list[Any] | tuple[Any, ...] | set[Any] | frozenset[Any], value)  # type: ignore[redundant-cast]
-        unique_items: OrderedDict[tuple[Any, ...], CtyValue[Any]] = OrderedDict()
-        # Marks are hoisted off the elements onto the set itself, as go-cty's
-        # `SetVal` does (cty/value_init.go). A set cannot hold a marked element:
-        # de-duplication keys on the element's value, which is mark-blind, so an
-        # element marked sensitive that collides with an equal unmarked one was
-        # simply overwritten and its mark lost. go-cty goes further and panics on
-        # hashing a marked element (cty/set_internals.go) rather than trust the
-        # invariant to callers.
-        element_marks: set[Any] = set()
-        # Unknown elements are held apart from the de-duplicated ones. go-cty is
-        # explicit that "two unknown values are not equivalent for the sake of
-        # set membership" (cty/set_internals.go): its `Equivalent` compares
-        # `Equals(...) == true`, and unknown-against-unknown is undecided, so
-        # both survive. De-duplicating them would claim a cardinality the value
-        # does not have -- `toset([a.id, b.id])` at plan time is two elements,
-        # not one, and the count reaches Terraform.
-        undecided: list[CtyValue[Any]] = []
+        members = _Members()
         for raw_item in value_iterable:
             try:
-                validated_item = self.element_type.validate(raw_item)
-                # Only look for marks where one could be hiding, and only
-                # rebuild an element that actually carries one. A leaf answers
-                # from its own `marks`; `_strip` walks and reconstructs the
-                # whole element, which on an unmarked set is pure overhead paid
-                # once per member.
-                if validated_item.marks or isinstance(validated_item.value, _NESTING_PAYLOADS):
-                    item_marks = collect_marks_deep(validated_item)
-                    if item_marks:
-                        element_marks.update(item_marks)
-                        validated_item = _strip(validated_item)
-                if validated_item.is_unknown:
-                    undecided.append(validated_item)
-                else:
-                    unique_items[set_identity_key(validated_item)] = validated_item
+                members.admit((yield self.element_type, raw_item))
             except CtyValidationError as e:
                 raise CtySetValidationError(e.message, value=raw_item) from e
             except Exception as e:
                 raise CtySetValidationError(f"Failed to process element for set: {e}", value=raw_item) from e
-
-        # Canonical order, not a frozenset. Two unknowns of one type are `==` and
-        # hash-equal here, so a frozenset payload could not hold both however the
-        # de-duplication above was written -- the container itself was the
-        # constraint. An ordered tuple is also what `CtySet` has always declared
-        # (`CtyType[tuple[T, ...]]`), and it makes the wire order a property of
-        # the value rather than something each encoder re-derives.
-        #
-        # The sort is stable and `_canonical_sort_key` ranks known 0, unknown 1,
-        # null 2, so this reproduces go-cty's observed iteration order exactly:
-        # known elements sorted by value, then the unknowns in the order they
-        # were supplied, then nulls last.
-        elements = sorted((*unique_items.values(), *undecided), key=set_order_key)
-        result: CtyValue[tuple[T, ...]] = CtyValue(vtype=self, value=tuple(elements))
-        return result.with_marks(element_marks) if element_marks else result
+        return members.value(self)
+
+    def _compile_validation(self, children: tuple[Validator, ...]) -> Validator:
+        """`validate` without the guard, each element through `children[0]`; see `validation.compiled`."""
+        short_circuit, validate_element = self._short_circuit, children[0]
+
+        def validate_set(value: object) -> CtyValue[Any]:
+            answer, raw = short_circuit(value)
+            if answer is not None:
+                return cast(CtyValue[Any], reapply_marks(value, answer))
+            if not isinstance(raw, list | tuple | set | frozenset):
+                raise CtySetValidationError(
+                    f"Expected a Python set, frozenset, list, or tuple, got {type(raw).__name__}"
+                )
+            members = _Members()
+            for raw_item in raw:
+                try:
+                    members.admit(validate_element(raw_item))
+                except CtyValidationError as e:
+                    raise CtySetValidationError(e.message, value=raw_item) from e
+                except Exception as e:
+                    raise CtySetValidationError(
+                        f"Failed to process element for set: {e}", value=raw_item
+                    ) from e
+            return cast(CtyValue[Any], reapply_marks(value, members.value(self)))
+
+        return validate_set
 
     def equal(self, other: CtyType[Any]) -> bool:
         return equal_iteratively(self, other)
@@ -153,6 +207,9 @@ class CtySet(CtyType[tuple[T, ...]], Generic[T]):
     def _structure(self) -> tuple[Any, tuple[Any, ...]] | None:
         return ((self.ctype,), (self.element_type,))
 
+    def _with_children(self, children: tuple[Any, ...]) -> CtySet[T]:
+        return CtySet(element_type=children[0])
+
     def __eq__(self, other: object) -> bool:
         # Written out rather than left to attrs, which generates a field-by-field
         # comparison that recurses once per level of nesting. `equal` walks.
@@ -162,6 +219,9 @@ class CtySet(CtyType[tuple[T, ...]], Generic[T]):
     def __hash__(self) -> int:
         return hash_iteratively(self)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return reduce_rebuilding(self)
+
     def usable_as(self, other: CtyType[Any]) -> bool:
         return usable_as_iteratively(self, other)
 
@@ -0,0 +1,120 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, TypeVar
+import weakref
+
+from pyvider.cty.config.defaults import INTERN_TYPES
+from pyvider.cty.types.base import _LEAF, CtyType
+
+"""One instance per structurally distinct type, for the types that contain others.
+
+Every `CtyList(element_type=CtyString())` is a new object, so comparing two of
+them is a walk over both trees, and a provider's deeply nested schema is
+compared on every `validate` fast path, every `unify` lookup and every
+conformance check. `intern_type` answers the one canonical instance for a
+type's structure instead; two interned types are equal exactly when they are
+the same object, and `equal_iteratively` asks that first, so the walk is
+skipped for them and for every shared subtree under two that are not.
+
+Interning is opt-in. `intern_type` interns one type on request, and setting
+`PYVIDER_CTY_INTERN_TYPES` makes `parse_tf_type_to_ctytype` -- through which
+every type a peer sends arrives -- intern what it builds. Nothing is made
+mutable by it: a canonical type is an ordinary frozen type that happened to be
+built first.
+"""
+
+T = TypeVar("T")
+
+_ENABLED_VALUES = frozenset({"1", "true", "yes", "on"})
+
+# Weak in its values: a canonical type no longer referenced anywhere leaves
+# the table with it, so the table is as large as the set of live distinct
+# types and no larger.
+_canonical: weakref.WeakValueDictionary[tuple[Any, ...], CtyType[Any]] = weakref.WeakValueDictionary()
+_lock = threading.Lock()
+
+
+def type_interning_enabled() -> bool:
+    """Whether `PYVIDER_CTY_INTERN_TYPES` asks the parser to intern the types it builds.
+
+    Read from the environment on each call, as the validation depth override
+    is, so a setting made after import takes effect.
+    """
+    setting = os.environ.get("PYVIDER_CTY_INTERN_TYPES")
+    if setting is None:
+        return INTERN_TYPES
+    return setting.strip().lower() in _ENABLED_VALUES
+
+
+def intern_type(cty_type: CtyType[T]) -> CtyType[T]:
+    """The canonical instance of `cty_type`'s structure, every container below it canonical too.
+
+    Equal to `cty_type`, and the same object for every equal type interned
+    while it is alive. A leaf -- a primitive, `dynamic`, a capsule -- is
+    answered as it is: its equality is already constant-time. An object's
+    attribute order is part of what it is interned by, since that order is
+    the order of its values' attributes.
+    """
+    order: list[tuple[Any, Any]] = []
+    stack: list[Any] = [cty_type]
+    while stack:
+        node = stack.pop()
+        structure = node._structure()
+        order.append((node, structure))
+        if structure is not None:
+            stack.extend(structure[1])
+    # Pre-order reversed: every node after all of its descendants.
+    canonical: dict[int, Any] = {}
+    for node, structure in reversed(order):
+        if structure is None:
+            canonical[id(node)] = node
+        elif id(node) not in canonical:
+            children = tuple(canonical[id(child)] for child in structure[1])
+            canonical[id(node)] = _canonical_for(node, structure[0], structure[1], children)
+    return canonical[id(cty_type)]  # type: ignore[no-any-return]
+
+
+def intern_shallow(cty_type: CtyType[T]) -> CtyType[T]:
+    """`intern_type` for a type whose children are canonical already, as a parser's are.
+
+    A parser builds bottom-up, so by the time it builds a container every
+    container below it came out of this too; interning each as it is built
+    costs one lookup, where `intern_type` on each would walk the subtree again.
+    """
+    structure = cty_type._structure()
+    if structure is None:
+        return cty_type
+    token, children = structure
+    return _canonical_for(cty_type, token, children, children)  # type: ignore[no-any-return]
+
+
+def _canonical_for(node: Any, token: Any, children: tuple[Any, ...], canonical: tuple[Any, ...]) -> Any:
+    # A container child is keyed by the identity of its canonical instance.
+    # The entry's value holds that child, so the identity cannot be reused by
+    # another object while the entry exists. A leaf is keyed by itself.
+    key = (
+        type(node),
+        token,
+        tuple(child if getattr(child, "_hash_memo", _LEAF) is _LEAF else id(child) for child in canonical),
+        tuple(node.attribute_types) if hasattr(node, "attribute_types") else None,
+    )
+    with _lock:
+        found = _canonical.get(key)
+        if found is None:
+            if all(mine is theirs for mine, theirs in zip(children, canonical, strict=True)):
+                found = node
+            else:
+                found = node._with_children(canonical)
+            _canonical[key] = found
+    return found
+
+
+# 🌊🪢🔚
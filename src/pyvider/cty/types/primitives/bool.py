@@ -39,17 +39,17 @@ class CtyBool(CtyType[bool]):
             return CtyValue.null(self)
 
         if isinstance(raw_value, bool):
-            return CtyValue(vtype=self, value=raw_value)
+            return CtyValue._boolean(self, raw_value)
         if isinstance(raw_value, str):
             if raw_value.lower() == "true":
-                return CtyValue(vtype=self, value=True)
+                return CtyValue._boolean(self, True)
             if raw_value.lower() == "false":
-                return CtyValue(vtype=self, value=False)
+                return CtyValue._boolean(self, False)
         if isinstance(raw_value, int | float):
             if raw_value == 1:
-                return CtyValue(vtype=self, value=True)
+                return CtyValue._boolean(self, True)
             if raw_value == 0:
-                return CtyValue(vtype=self, value=False)
+                return CtyValue._boolean(self, False)
 
         raise CtyBoolValidationError(f"Cannot convert {type(raw_value).__name__} to bool.")
 
@@ -16,14 +16,39 @@ from pyvider.cty.types.base import CtyType
 from pyvider.cty.validation.marks import preserves_marks
 from pyvider.cty.values import CtyValue, UnknownValue
 
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
 
 @define(frozen=True, slots=True)
-class CtyNumber(CtyType[Decimal]):
+class CtyNumber(CtyType[Decimal | int]):
+    """An arbitrary-precision number, go-cty's `big.Float`.
+
+    The payload is a Python `int` when the number arrived as one within the
+    int64 range -- from an `int` or a `bool` handed to `validate`, or an
+    integer off either wire -- and a `Decimal` otherwise. Counts, ports, sizes
+    and IDs are most of the numbers in a state, and every `Decimal` among them
+    cost a `% 1`, an `int()` and often a `localcontext` each time it was
+    encoded or added. The two compare, hash and order alike (`Decimal(5) ==
+    5`, and their hashes agree by the language's own rule), so nothing reading
+    `.value` for its number can tell them apart; anything that needs a
+    `Decimal` method asks for `Decimal(payload)`, which is exact.
+
+    A `Decimal` handed in stays one, integral or not: `Decimal("1.50")` and
+    `Decimal("-0")` carry a spelling and a sign an `int` cannot, and a caller
+    who built one asked for it. So does an integer past int64, which the wire
+    writes as text anyway, and which `str()` refuses past 4300 digits where a
+    `Decimal` does not.
+    """
+
     ctype: ClassVar[str] = "number"
     _type_order: ClassVar[int] = 0
 
     @preserves_marks
-    def validate(self, value: object) -> CtyValue[Decimal]:
+    def validate(self, value: object) -> CtyValue[Decimal | int]:
+        if type(value) is int and _INT64_MIN <= value <= _INT64_MAX:
+            return CtyValue._trusted(self, value)
+
         if isinstance(value, UnknownValue):
             return self.unknown_like(value)
 
@@ -39,14 +64,15 @@ class CtyNumber(CtyType[Decimal]):
         if raw_value is None:
             return CtyValue.null(self)
 
-        if isinstance(raw_value, bool):
-            raw_value = 1 if raw_value else 0
+        # A bool is an int here, and `int()` makes it 1 or 0.
+        if isinstance(raw_value, int) and _INT64_MIN <= raw_value <= _INT64_MAX:
+            return CtyValue._trusted(self, int(raw_value))
 
         if isinstance(raw_value, bytes):
             raw_value = raw_value.decode("utf-8")
 
         try:
-            return CtyValue(vtype=self, value=Decimal(raw_value))  # type: ignore
+            return CtyValue._trusted(self, Decimal(raw_value))  # type: ignore
         except (TypeError, ValueError, InvalidOperation) as e:
             raise CtyNumberValidationError(
                 f"Cannot represent {type(raw_value).__name__} value '{raw_value}' as Decimal"
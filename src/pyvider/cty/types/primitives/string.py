@@ -45,7 +45,7 @@ class CtyString(CtyType[str]):
         try:
             str_value = raw_value.decode("utf-8") if isinstance(raw_value, bytes) else str(raw_value)
             normalized_value = unicodedata.normalize("NFC", str_value)
-            return CtyValue(vtype=self, value=normalized_value)
+            return CtyValue._trusted(self, normalized_value)
         except Exception as e:
             raise CtyStringValidationError(f"Cannot convert {type(raw_value).__name__} to string: {e}") from e
 
@@ -0,0 +1,137 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+import threading
+from typing import Any, NamedTuple, TypeVar
+
+from pyvider.cty.config.defaults import TYPE_RELATION_CACHE_SIZE
+
+"""Answers about pairs of types, worked out once per pair.
+
+`usable_as`, `can_convert_unsafe` and `conformance_errors` each depend only
+on the two types they are asked about, and types are immutable, so an answer
+given once is the answer forever. Each still walked both trees on every call,
+and `CtyFunction.call` asks `conformance_errors` of every argument and every
+result: a stdlib call returning `list(object({...}))` compared the declared
+return type against the result's, attribute by attribute, on every evaluation.
+
+One table holds all three relations, keyed on `(relation, source, target)`.
+`can_convert_unsafe` had an `lru_cache` of its own; it moved here so that
+there is one bound to size, one set of counters to watch and one place to
+clear. A key is hashed through each type's memoized hash, so a lookup costs a
+dict probe once a type has been hashed; finding the entry compares the types,
+which is an identity check for interned types (`intern_type`) and for the
+same object asked about twice.
+
+Only containers are looked up. A question about two primitives is answered by
+a couple of `isinstance` checks, which is cheaper than the lock.
+"""
+
+R = TypeVar("R")
+
+_MISSING = object()
+_NOT_A_CONTAINER = object()
+
+
+class TypeRelationCacheInfo(NamedTuple):
+    """The shared type-relation cache's counters, shaped as `functools`' `cache_info()` is."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _TypeRelationCache:
+    """A bounded, lock-guarded map from `(relation, source, target)` to an answer.
+
+    Least recently used goes first. The answer is computed outside the lock,
+    so two threads asking the same new question may both compute it; both get
+    the same answer, and the second store is a no-op in effect. An exception
+    is never cached -- a relation that raises raises every time.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._answers: OrderedDict[tuple[str, Any, Any], Any] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def answer(self, relation: str, source: Any, target: Any, compute: Callable[[Any, Any], R]) -> R:
+        # `cached_relation` hashed both types before the lock is taken: the
+        # first hash of a type walks it, and the dict's reads the memo.
+        key = (relation, source, target)
+        with self._lock:
+            found = self._answers.get(key, _MISSING)
+            if found is not _MISSING:
+                self._answers.move_to_end(key)
+                self._hits += 1
+                return found  # type: ignore[no-any-return]
+            self._misses += 1
+        answer = compute(source, target)
+        with self._lock:
+            self._answers[key] = answer
+            self._answers.move_to_end(key)
+            while len(self._answers) > self._maxsize:
+                self._answers.popitem(last=False)
+        return answer
+
+    def info(self) -> TypeRelationCacheInfo:
+        with self._lock:
+            return TypeRelationCacheInfo(self._hits, self._misses, self._maxsize, len(self._answers))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._answers.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_cache = _TypeRelationCache(TYPE_RELATION_CACHE_SIZE)
+
+
+def cached_relation(
+    relation: str, source: Any, target: Any, compute: Callable[[Any, Any], R], if_equal: R
+) -> R:
+    """`compute(source, target)`, remembered under `relation` when either type is a container.
+
+    `compute` must depend on nothing but the two types; that is what makes
+    the answer safe to keep. A mutable answer is the caller's to copy.
+
+    `if_equal` is the answer for two equal types, given without a lookup.
+    Finding an entry compares the asked-about types with the stored ones, so
+    two equal types that are distinct objects would pay for that comparison
+    twice -- once per side of the key -- where the relation itself pays it
+    once. Asking it first keeps that case at the cost it had, and once both
+    types are hashed it settles an unequal pair at once.
+    """
+    if (
+        getattr(source, "_hash_memo", _NOT_A_CONTAINER) is _NOT_A_CONTAINER
+        and getattr(target, "_hash_memo", _NOT_A_CONTAINER) is _NOT_A_CONTAINER
+    ):
+        return compute(source, target)
+    hash(source), hash(target)
+    if source == target:
+        return if_equal
+    return _cache.answer(relation, source, target, compute)
+
+
+def type_relation_cache_info() -> TypeRelationCacheInfo:
+    """Hits, misses, bound and current size of the shared type-relation cache."""
+    return _cache.info()
+
+
+def clear_type_relation_cache() -> None:
+    """Forget every remembered type relation, and reset the counters."""
+    _cache.clear()
+
+
+# 🌊🪢🔚
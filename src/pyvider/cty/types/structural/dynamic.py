@@ -31,7 +31,7 @@ class CtyDynamic(CtyType[object]):
         CtyValue of type CtyDynamic, which wraps the inferred concrete value.
         """
         from pyvider.cty.conversion.raw_to_cty import infer_cty_type_from_raw
-        from pyvider.cty.parser import parse_tf_type_to_ctytype
+        from pyvider.cty.conversion.type_spec import type_from_spec_bytes
 
         if isinstance(value, CtyValue):
             if isinstance(value.type, CtyDynamic):
@@ -43,8 +43,7 @@ class CtyDynamic(CtyType[object]):
 
         if isinstance(value, list) and len(value) == 2 and isinstance(value[0], bytes):
             try:
-                type_spec = json.loads(value[0].decode("utf-8"))
-                actual_type = parse_tf_type_to_ctytype(type_spec)
+                actual_type = type_from_spec_bytes(value[0])
                 concrete_value = actual_type.validate(value[1])
                 return CtyValue(vtype=self, value=concrete_value)
             except json.JSONDecodeError as e:
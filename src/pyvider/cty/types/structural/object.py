@@ -6,7 +6,7 @@
 
 from __future__ import annotations
 
-from typing import Any, ClassVar, cast
+from typing import Any, ClassVar, TypeAlias, cast
 import unicodedata
 
 from attrs import define, field
@@ -23,13 +23,75 @@ from pyvider.cty.types.base import (
     CtyType,
     equal_iteratively,
     hash_iteratively,
+    reduce_rebuilding,
     usable_as_iteratively,
 )
+from pyvider.cty.validation.compiled import Validator
+from pyvider.cty.validation.iterative import ValidationSteps, validate_iteratively
+from pyvider.cty.validation.marks import reapply_marks
 from pyvider.cty.validation.recursion import with_recursion_detection
 from pyvider.cty.values import CtyValue
 from pyvider.cty.values.frozen import FrozenDict
 
 
+def _by_nfc_name(value: dict[object, Any]) -> dict[str, Any]:
+    # Keys are strings (CtyMap already refused anything else; `str(k)` here
+    # let `{1: ...}` satisfy an attribute named "1"), normalized to NFC so the
+    # two spellings of an accented name are one attribute -- and two keys that
+    # are the *same* attribute spelled two ways are refused rather than the
+    # later one silently winning.
+    if type(value) is dict:
+        # Every key an ASCII string, which is nearly every input: NFC leaves
+        # ASCII as it is, so no two such keys collide and the dict is already
+        # keyed by NFC name. It is only read from, so it is handed on as it
+        # is -- one C-level join and `isascii` instead of a `normalize` call
+        # and an insert per key. A subclass is copied, as its lookups may not
+        # be a plain dict's.
+        try:
+            if "".join(cast(dict[str, Any], value)).isascii():
+                return cast(dict[str, Any], value)
+        except TypeError:
+            pass  # A non-string key, refused below.
+    normalized: dict[str, Any] = {}
+    for raw_key, v in value.items():
+        if not isinstance(raw_key, str):
+            raise CtyAttributeValidationError(
+                f"Object attribute names must be strings, but got key of type {type(raw_key).__name__}"
+            )
+        key = unicodedata.normalize("NFC", raw_key)
+        if key in normalized:
+            raise CtyAttributeValidationError(
+                f"Attribute names {raw_key!r} and {key!r} normalize to the same NFC string"
+            )
+        normalized[key] = v
+    return normalized
+
+
+def _refuse_unknown(value: dict[str, Any], expected: frozenset[str]) -> None:
+    # `issuperset` walks the keys without building anything; the set of the
+    # unexpected ones is only worked out to name them.
+    if not expected.issuperset(value):
+        unknown = set(value) - expected
+        raise CtyAttributeValidationError(f"Unknown attributes: {', '.join(sorted(unknown))}")
+
+
+def _missing_attribute(name: str) -> CtyAttributeValidationError:
+    return CtyAttributeValidationError(
+        "Missing required attribute", value=None, path=CtyPath(steps=[GetAttrStep(name)])
+    )
+
+
+def _attribute_error(error: CtyValidationError, name: str, raw: object) -> CtyAttributeValidationError:
+    """`error`, raised validating attribute `name`, as the object's own error at that path."""
+    path = CtyPath(steps=(GetAttrStep(name), *(error.path.steps if error.path else ())))
+    return CtyAttributeValidationError(error.message, value=raw, path=path, original_exception=error)
+
+
+# A schema's validation plan: each attribute in declared order as (name, NFC
+# name, optional, type), and the set of NFC names an input may carry.
+_ObjectPlan: TypeAlias = tuple[tuple[tuple[str, str, bool, CtyType[Any]], ...], frozenset[str]]
+
+
 @define(frozen=True, slots=True)
 class CtyObject(CtyType[dict[str, object]]):
     ctype: ClassVar[str] = "object"
@@ -39,6 +101,15 @@ class CtyObject(CtyType[dict[str, object]]):
     # change the hash of a type already used as a key.
     attribute_types: dict[str, CtyType[Any]] = field(factory=dict, converter=FrozenDict)
     optional_attributes: frozenset[str] = field(factory=frozenset, converter=frozenset)
+    # The structural hash, once asked for; see `hash_iteratively`.
+    _hash_memo: int | None = field(default=None, init=False, eq=False, repr=False)
+    # The compiled validator, once asked for; see `validation.compiled`.
+    _validator_memo: Any = field(default=None, init=False, eq=False, repr=False)
+    # Its shared null, unknown and empty value, once asked for; see `values.base._shared`.
+    _flyweight_memo: Any = field(default=None, init=False, eq=False, repr=False)
+    # What validating against this schema needs from it, worked out on first
+    # use; see `_plan`.
+    _plan_memo: _ObjectPlan | None = field(default=None, init=False, eq=False, repr=False)
 
     def __attrs_post_init__(self) -> None:
         # The same two rules `validate` applies to a value's keys, applied to the
@@ -82,22 +153,26 @@ class CtyObject(CtyType[dict[str, object]]):
         optional_display = f", optional={optional_list}" if optional_list else ""
         return f"CtyObject(attributes={attr_display}{optional_display})"
 
-    @with_recursion_detection
-    def validate(self, value: object) -> CtyValue[dict[str, Any]]:  # noqa: C901
+    def _prepare(self, value: object) -> tuple[CtyValue[dict[str, Any]] | None, dict[str, Any]]:
+        """The answers that need no attribute validation, or the input keyed by NFC name.
+
+        Returns (answer, attributes). Shared by `validate` and the compiled
+        validator, which differ only in how each attribute is validated.
+        """
         if isinstance(value, CtyValue):
             if self.equal(value.type) and isinstance(value.value, dict):
-                return cast(CtyValue[dict[str, Any]], value)  # Fast path
+                return cast(CtyValue[dict[str, Any]], value), {}  # Fast path
             if value.is_unknown:
-                return self.unknown_like(value)
+                return self.unknown_like(value), {}
             if value.is_null:
-                return CtyValue.null(self)
+                return CtyValue.null(self), {}
             value = value.value
 
         if value is None:
-            return CtyValue.null(self)
+            return CtyValue.null(self), {}
 
         if (unknown_marker := self.unknown_marker(value)) is not None:
-            return unknown_marker
+            return unknown_marker, {}
 
         if hasattr(type(value), "__attrs_attrs__"):
             value = _attrs_to_dict_safe(value)
@@ -106,58 +181,40 @@ class CtyObject(CtyType[dict[str, object]]):
                 f"Expected a dictionary for CtyObject, got {type(value).__name__}"
             )
 
-        # Keys are strings (CtyMap already refused anything else; `str(k)` here
-        # let `{1: ...}` satisfy an attribute named "1"), normalized to NFC so the
-        # two spellings of an accented name are one attribute -- and two keys that
-        # are the *same* attribute spelled two ways are refused rather than the
-        # later one silently winning.
-        normalized: dict[str, Any] = {}
-        for raw_key, v in cast(dict[object, Any], value).items():
-            if not isinstance(raw_key, str):
-                raise CtyAttributeValidationError(
-                    f"Object attribute names must be strings, but got key of type {type(raw_key).__name__}"
-                )
-            key = unicodedata.normalize("NFC", raw_key)
-            if key in normalized:
-                raise CtyAttributeValidationError(
-                    f"Attribute names {raw_key!r} and {key!r} normalize to the same NFC string"
-                )
-            normalized[key] = v
-        value = normalized
+        return None, _by_nfc_name(cast(dict[object, Any], value))
 
-        validated_attrs: dict[str, CtyValue[Any]] = {}
-        # Normalize attribute_types keys to NFC for consistent comparison
-        all_expected_attrs = {unicodedata.normalize("NFC", k) for k in self.attribute_types}
-        unknown = set(value.keys()) - all_expected_attrs
-        if unknown:
-            raise CtyAttributeValidationError(f"Unknown attributes: {', '.join(sorted(list(unknown)))}")
+    @with_recursion_detection
+    def validate(self, value: object) -> CtyValue[dict[str, Any]]:
+        return cast(CtyValue[dict[str, Any]], validate_iteratively(self._validation_steps(value)))
 
-        for name, attr_type in self.attribute_types.items():
-            # Normalize the attribute name for lookup in the NFC-normalized value dict
-            normalized_name = unicodedata.normalize("NFC", name)
-            path = CtyPath(steps=[GetAttrStep(name)])
+    def _validation_steps(self, value: object) -> ValidationSteps:
+        """`validate`'s work, yielding each attribute to be validated; see `validation.iterative`."""
+        answer, value = self._prepare(value)
+        if answer is not None:
+            return answer
+
+        attributes, expected = self._plan()
+        _refuse_unknown(value, expected)
+
+        validated_attrs: dict[str, CtyValue[Any]] = {}
+        for name, normalized_name, optional, attr_type in attributes:
             if normalized_name not in value:
-                if name in self.optional_attributes:
+                if optional:
                     validated_attrs[name] = CtyValue.null(attr_type)
                     continue
-                raise CtyAttributeValidationError("Missing required attribute", value=None, path=path)
+                raise _missing_attribute(name)
 
-            raw_attr_value = value.get(normalized_name)
+            raw_attr_value = value[normalized_name]
             try:
-                # Marks on raw_attr_value survive this call. Leaf types get that
-                # from @preserves_marks; the recursing types get it from inside
-                # @with_recursion_detection, which restores marks on every exit
+                # Marks on raw_attr_value survive this step. Leaf types get that
+                # from @preserves_marks; the recursing types get it from the
+                # guard -- @with_recursion_detection, or `validate_iteratively`
+                # opening them in place -- which restores marks on every exit
                 # including its early ones. A type carrying neither would
                 # silently drop them here.
-                validated_attr = attr_type.validate(raw_attr_value)
+                validated_attr = yield attr_type, raw_attr_value
             except CtyValidationError as e:
-                new_path = CtyPath(steps=(GetAttrStep(name), *(e.path.steps if e.path else ())))
-                raise CtyAttributeValidationError(
-                    e.message,
-                    value=raw_attr_value,
-                    path=new_path,
-                    original_exception=e,
-                ) from e
+                raise _attribute_error(e, name, raw_attr_value) from e
 
             # A null is a value of every type, so there is deliberately no check
             # here that a non-optional attribute is non-null. go-cty has none --
@@ -181,7 +238,68 @@ class CtyObject(CtyType[dict[str, object]]):
         # Don't mark the entire object as unknown just because some fields are unknown
         # Terraform expects field-level unknown tracking, not object-level
         # The object itself is only unknown if explicitly passed as unknown
-        return CtyValue(vtype=self, value=FrozenDict(validated_attrs), is_unknown=False)
+        return CtyValue._trusted(self, FrozenDict(validated_attrs))
+
+    def _plan(self) -> _ObjectPlan:
+        """Each attribute's NFC name and optionality, and the names an input may carry.
+
+        These were worked out on every `validate` -- a `normalize` per
+        attribute twice over and a fresh set of the names -- which for a
+        50-attribute schema validated once per resource per plan was most of
+        what the object itself cost. Worked out once per schema instead and
+        kept on it, as its hash is. ASCII names are their own NFC form and
+        skip `normalize`.
+        """
+        plan = self._plan_memo
+        if plan is None:
+            attributes = tuple(
+                (
+                    name,
+                    name if name.isascii() else unicodedata.normalize("NFC", name),
+                    name in self.optional_attributes,
+                    attr_type,
+                )
+                for name, attr_type in self.attribute_types.items()
+            )
+            plan = attributes, frozenset(normalized for _, normalized, _, _ in attributes)
+            object.__setattr__(self, "_plan_memo", plan)
+        return plan
+
+    def _compile_validation(self, children: tuple[Validator, ...]) -> Validator:
+        """`validate` without the guard, each attribute through its child; see `validation.compiled`.
+
+        `children` are in `_structure` order, which is sorted by name; the
+        rest is the schema's `_plan`.
+        """
+        by_name = dict(zip(sorted(self.attribute_types), children, strict=True))
+        plan, expected = self._plan()
+        attributes = tuple(
+            (name, normalized, by_name[name], optional, attr_type)
+            for name, normalized, optional, attr_type in plan
+        )
+        prepare = self._prepare
+
+        def validate_object(value: object) -> CtyValue[Any]:
+            answer, raw = prepare(value)
+            if answer is not None:
+                return cast(CtyValue[Any], reapply_marks(value, answer))
+            _refuse_unknown(raw, expected)
+            validated: dict[str, CtyValue[Any]] = {}
+            for name, normalized, validate_attribute, optional, attr_type in attributes:
+                if normalized not in raw:
+                    if optional:
+                        validated[name] = CtyValue.null(attr_type)
+                        continue
+                    raise _missing_attribute(name)
+                raw_attr_value = raw[normalized]
+                try:
+                    validated[name] = validate_attribute(raw_attr_value)
+                except CtyValidationError as e:
+                    raise _attribute_error(e, name, raw_attr_value) from e
+            result = CtyValue._trusted(self, FrozenDict(validated))
+            return cast(CtyValue[Any], reapply_marks(value, result))
+
+        return validate_object
 
     def get_attribute(self, obj_value: CtyValue[Any], name: str) -> CtyValue[Any]:
         if not isinstance(obj_value, CtyValue):
@@ -211,6 +329,14 @@ class CtyObject(CtyType[dict[str, object]]):
             tuple(self.attribute_types[name] for name in names),
         )
 
+    def _with_children(self, children: tuple[Any, ...]) -> CtyObject:
+        # `children` is in sorted order; the rebuilt object keeps this one's.
+        by_name = dict(zip(sorted(self.attribute_types), children, strict=True))
+        return CtyObject(
+            attribute_types={name: by_name[name] for name in self.attribute_types},
+            optional_attributes=self.optional_attributes,  # type: ignore[arg-type]  # attrs converter takes any set
+        )
+
     def __eq__(self, other: object) -> bool:
         # Written out rather than left to attrs, which generates a field-by-field
         # comparison that recurses once per level of nesting. `equal` walks.
@@ -220,6 +346,9 @@ class CtyObject(CtyType[dict[str, object]]):
     def __hash__(self) -> int:
         return hash_iteratively(self)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return reduce_rebuilding(self)
+
     def usable_as(self, other: CtyType[Any]) -> bool:
         return usable_as_iteratively(self, other)
 
@@ -21,18 +21,34 @@ from pyvider.cty.types.base import (
     CtyType,
     equal_iteratively,
     hash_iteratively,
+    reduce_rebuilding,
     render_iteratively,
     usable_as_iteratively,
 )
+from pyvider.cty.validation.compiled import Validator
+from pyvider.cty.validation.iterative import ValidationSteps, validate_iteratively
+from pyvider.cty.validation.marks import reapply_marks
 from pyvider.cty.validation.recursion import with_recursion_detection
 from pyvider.cty.values import CtyValue
 
 
+def _element_error(error: CtyValidationError, index: int, raw: object) -> CtyTupleValidationError:
+    """`error`, raised validating element `index`, as the tuple's own error at that path."""
+    path = CtyPath(steps=(IndexStep(index), *(error.path.steps if error.path else ())))
+    return CtyTupleValidationError(error.message, value=raw, path=path, original_exception=error)
+
+
 @define(frozen=True, slots=True)
 class CtyTuple(CtyType[tuple[object, ...]]):
     ctype: ClassVar[str] = "tuple"
     _type_order: ClassVar[int] = 3
     element_types: tuple[CtyType[Any], ...] = field()
+    # The structural hash, once asked for; see `hash_iteratively`.
+    _hash_memo: int | None = field(default=None, init=False, eq=False, repr=False)
+    # The compiled validator, once asked for; see `validation.compiled`.
+    _validator_memo: Any = field(default=None, init=False, eq=False, repr=False)
+    # Its shared null, unknown and empty value, once asked for; see `values.base._shared`.
+    _flyweight_memo: Any = field(default=None, init=False, eq=False, repr=False)
 
     @element_types.validator
     def _validate_element_types(self, attribute: str, value: tuple[CtyType[Any], ...]) -> None:
@@ -44,39 +60,68 @@ class CtyTuple(CtyType[tuple[object, ...]]):
                     f"Element type at index {i} must be a CtyType, got {type(typ).__name__}"
                 )
 
-    @with_recursion_detection
-    def validate(self, value: object) -> CtyValue[tuple[Any, ...]]:
+    def _prepare(self, value: object) -> tuple[CtyValue[tuple[Any, ...]] | None, Any]:
+        """The answers that need no element validation, or the elements to validate.
+
+        Returns (answer, elements). Shared by `validate` and the compiled
+        validator, which differ only in how each element is validated.
+        """
         if isinstance(value, CtyValue):
             if isinstance(value.type, CtyTuple) and value.type.equal(self) and isinstance(value.value, tuple):
-                return cast(CtyValue[tuple[Any, ...]], value)
+                return cast(CtyValue[tuple[Any, ...]], value), None
             if value.is_unknown:
-                return self.unknown_like(value)
+                return self.unknown_like(value), None
             if value.is_null:
-                return CtyValue.null(self)
+                return CtyValue.null(self), None
             value = value.value
 
         if (unknown := self.unknown_marker(value)) is not None:
-            return unknown
+            return unknown, None
 
         if not isinstance(value, list | tuple):
             raise CtyTupleValidationError(f"Expected tuple or list, got {type(value).__name__}")
         value_seq = cast(list[Any] | tuple[Any, ...], value)  # type: ignore[redundant-cast]
         if len(value_seq) != len(self.element_types):
             raise CtyTupleValidationError(f"Expected {len(self.element_types)} elements, got {len(value_seq)}")
+        return None, value_seq
+
+    @with_recursion_detection
+    def validate(self, value: object) -> CtyValue[tuple[Any, ...]]:
+        return validate_iteratively(self._validation_steps(value))
+
+    def _validation_steps(self, value: object) -> ValidationSteps:
+        """`validate`'s work, yielding each element to be validated; see `validation.iterative`."""
+        answer, value_seq = self._prepare(value)
+        if answer is not None:
+            return answer
 
-        validated_elements = []
+        validated_elements: list[CtyValue[Any]] = []
         for i, (raw_element, element_type) in enumerate(zip(value_seq, self.element_types, strict=False)):
             try:
-                validated_element = element_type.validate(raw_element)
-                validated_elements.append(validated_element)
+                validated_elements.append((yield element_type, raw_element))
             except CtyValidationError as e:
-                new_path = CtyPath(steps=(IndexStep(i), *(e.path.steps if e.path else ())))
-                raise CtyTupleValidationError(
-                    e.message, value=raw_element, path=new_path, original_exception=e
-                ) from e
+                raise _element_error(e, i, raw_element) from e
 
         # Known tuple, undecided element -- see the note in CtyList.validate.
-        return CtyValue(self, tuple(validated_elements))
+        return CtyValue._trusted(self, tuple(validated_elements))
+
+    def _compile_validation(self, children: tuple[Validator, ...]) -> Validator:
+        """`validate` without the guard, element `i` through `children[i]`; see `validation.compiled`."""
+        prepare = self._prepare
+
+        def validate_tuple(value: object) -> CtyValue[Any]:
+            answer, items = prepare(value)
+            if answer is not None:
+                return cast(CtyValue[Any], reapply_marks(value, answer))
+            validated: list[CtyValue[Any]] = []
+            for i, (raw_element, validate_element) in enumerate(zip(items, children, strict=False)):
+                try:
+                    validated.append(validate_element(raw_element))
+                except CtyValidationError as e:
+                    raise _element_error(e, i, raw_element) from e
+            return cast(CtyValue[Any], reapply_marks(value, CtyValue._trusted(self, tuple(validated))))
+
+        return validate_tuple
 
     def element_at(self, container_value: CtyValue[Any], index: int | builtins.slice) -> CtyValue[Any]:
         if not isinstance(index, int | slice):
@@ -121,6 +166,9 @@ class CtyTuple(CtyType[tuple[object, ...]]):
     def _structure(self) -> tuple[Any, tuple[Any, ...]] | None:
         return ((self.ctype, len(self.element_types)), tuple(self.element_types))
 
+    def _with_children(self, children: tuple[Any, ...]) -> CtyTuple:
+        return CtyTuple(element_types=children)
+
     def __eq__(self, other: object) -> bool:
         # Written out rather than left to attrs, which generates a field-by-field
         # comparison that recurses once per level of nesting. `equal` walks.
@@ -130,6 +178,9 @@ class CtyTuple(CtyType[tuple[object, ...]]):
     def __hash__(self) -> int:
         return hash_iteratively(self)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return reduce_rebuilding(self)
+
     def usable_as(self, other: CtyType[Any]) -> bool:
         return usable_as_iteratively(self, other)
 
@@ -36,6 +36,7 @@ from pyvider.cty.types import (
     CtyTuple,
 )
 from pyvider.cty.values import CtyValue
+from pyvider.cty.values.frozen import FrozenDict
 
 __all__ = ["unknown_as_null"]
 
@@ -82,7 +83,9 @@ def _rewrite_sequence(value: CtyValue[Any]) -> CtyValue[Any]:
         # `SetVal` does. Two elements that differed only in being unknown can
         # become equal once both are null, and a set must not hold both.
         return cast("CtyValue[Any]", value.type.validate(rewritten))
-    return CtyValue(vtype=value.type, value=tuple(rewritten))
+    # Every element is the one it replaced or a null of that one's type, so
+    # the list or tuple is as well formed as the one it was built from.
+    return CtyValue._trusted(value.type, tuple(rewritten))
 
 
 def _rewrite_mapping(value: CtyValue[Any]) -> CtyValue[Any]:
@@ -96,8 +99,9 @@ def _rewrite_mapping(value: CtyValue[Any]) -> CtyValue[Any]:
     # Built with the original type rather than inferred from the payload, which
     # is what go-cty's `ObjectVal` does. Inference would discard the object's
     # optional-attribute set, and that set is part of the wire type Terraform
-    # is told about.
-    return value.type.validate(rewritten)
+    # is told about. Trusted for the same reason a sequence is: the keys are
+    # the original's, in its order, and each element keeps its type.
+    return CtyValue._trusted(value.type, FrozenDict(rewritten))
 
 
 # 🌊🪢🔚
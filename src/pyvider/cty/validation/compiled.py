@@ -0,0 +1,111 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+if TYPE_CHECKING:
+    from pyvider.cty.values.base import CtyValue
+
+"""Validators compiled per schema, for schemas with no `dynamic` anywhere in them.
+
+Every container `validate` runs under `with_recursion_detection`, which per
+node fetches the thread's context, pushes and pops the validation path, asks
+`should_continue_validation` -- a time check, a depth check, an identity
+count, and for a list of primitives a scan of every item -- and re-applies
+marks. That guard exists because a value can be deeper than anything its type
+says: a `dynamic` position takes whatever it is given, and what it is given
+can nest until the stack runs out, or refer to itself.
+
+A type with no `dynamic` in it cannot be given that. Every level of its value
+is a level of the type, so the value is no deeper than the type, and a raw
+structure that refers to itself is refused by the type at the bottom rather
+than followed. For such a type, one guard entry at the top does the job of one
+per node: `with_recursion_detection` checks the whole depth the type can reach
+against the limit once, then hands the value to a tree of closures, one per
+container node, that validate with nothing else in the way. Each closure does
+what its type's `validate` does, through the same `_prepare` and error
+helpers, so the refusals and their paths are the ones `validate` raises.
+
+A type with `dynamic` below it is not compiled; it is validated node by node
+as before, and the `dynamic`-free subtrees under it compile on their own the
+first time their `validate` is called.
+"""
+
+Validator: TypeAlias = Callable[[object], "CtyValue[Any]"]
+
+# What a container's `_validator_memo` holds once it is known to need the guard
+# at every node: it has a `dynamic` somewhere below it.
+_GUARDED = object()
+# What it holds after one validation. Compiling costs about what validating a
+# small value does, and a type `dynamic` inferred for one value is never asked
+# again, so a type is compiled on its second use -- which for the element type
+# of a schema's list is its second element.
+_SEEN = object()
+# What `getattr(node, "_validator_memo", _LEAF)` answers for a type that keeps
+# no memo, which is a type with no children to compile.
+_LEAF = object()
+
+
+def compiled_validation(cty_type: Any, *, at_once: bool = False) -> tuple[Validator, int] | None:
+    """`cty_type`'s compiled validator and the container depth it reaches, or None.
+
+    None for a leaf, for `dynamic` and for any container with a `dynamic` below
+    it, and -- unless `at_once` -- the first time a type is asked about.
+    Compiled once per type and kept on it, as its hash is.
+    """
+    memo: Any = getattr(cty_type, "_validator_memo", _LEAF)
+    if memo is None and not at_once:
+        object.__setattr__(cty_type, "_validator_memo", _SEEN)
+        return None
+    if memo is None or memo is _SEEN:
+        memo = _compile(cty_type)
+    if memo is _GUARDED or memo is _LEAF:
+        return None
+    return memo  # type: ignore[no-any-return]
+
+
+def _compile(root: Any) -> Any:
+    # Post-order, iteratively for the same reason the type walks are: a type
+    # can be nested deeper than Python's stack.
+    order: list[tuple[Any, tuple[Any, ...]]] = []
+    stack: list[Any] = [root]
+    while stack:
+        node = stack.pop()
+        children = node._structure()[1]
+        order.append((node, children))
+        stack.extend(child for child in children if _uncompiled(child))
+    for node, children in reversed(order):
+        if not _uncompiled(node):
+            continue
+        validators: list[Validator] = []
+        depth = 0
+        for child in children:
+            memo: Any = getattr(child, "_validator_memo", _LEAF)
+            if memo is _GUARDED or (memo is _LEAF and child.is_dynamic_type()):
+                break
+            if memo is _LEAF:
+                validators.append(child.validate)
+            else:
+                validators.append(memo[0])
+                depth = max(depth, memo[1])
+        else:
+            object.__setattr__(
+                node, "_validator_memo", (node._compile_validation(tuple(validators)), depth + 1)
+            )
+            continue
+        object.__setattr__(node, "_validator_memo", _GUARDED)
+    return root._validator_memo
+
+
+def _uncompiled(node: Any) -> bool:
+    memo = getattr(node, "_validator_memo", _LEAF)
+    return memo is None or memo is _SEEN
+
+
+# 🌊🪢🔚
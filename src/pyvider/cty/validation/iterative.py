@@ -0,0 +1,164 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+from pyvider.cty.validation.marks import reapply_marks
+from pyvider.cty.validation.recursion import (
+    RecursionDetector,
+    _recover_from_overflow,
+    _unknown_with_source_marks,
+    get_recursion_context,
+    guard_answer,
+)
+
+if TYPE_CHECKING:
+    from pyvider.cty.types.base import CtyType
+    from pyvider.cty.values.base import CtyValue
+
+"""Validation of nested containers on a work stack rather than the Python stack.
+
+A container's `validate` used to validate each element by calling the element
+type's `validate`, which for a nested container was the guard's wrapper and
+then that container's own `validate`: two frames per level, held for the whole
+descent. That is what tied the depth limit to `sys.getrecursionlimit()` and
+what `_recover_from_overflow` exists to catch.
+
+Each container now writes its validation as a generator, `_validation_steps`,
+which yields `(element_type, raw_element)` wherever it used to call
+`element_type.validate(raw_element)` and is sent the validated element back.
+Its refusals are written as they were -- a `try` around the `yield` catches
+the element's error and raises the container's own, with the path extended --
+because the error is thrown into the generator at that `yield`.
+
+`validate_iteratively` drives those generators, one per open container, on a
+list. A yielded leaf, or `dynamic`, is validated by calling its `validate`, as
+before. A yielded container is opened in place: the guard does for it what
+`with_recursion_detection` does for a call -- the depth marker, the depth and
+revisit checks, the stop flag, the compiled validator when there is one that
+fits, marks restored on the way out, an overflow raised beneath it recovered
+at its level -- and then its generator goes on the list. No frame is held per
+level, so the depth a value can be validated to is the depth limit, not what
+the stack leaves of it, and a level costs a generator resume where it cost two
+calls through the wrapper.
+
+A `dynamic` position still calls `validate`, so each `dynamic` between the top
+and a leaf holds a few frames: one set per value handed to a `dynamic`, not per
+level of what it was handed.
+"""
+
+# What each container's `_validation_steps` is: it yields the element type
+# and raw element it needs validated, is sent the validated element, and
+# returns the container's value.
+ValidationSteps: TypeAlias = Generator[tuple["CtyType[Any]", object], "CtyValue[Any]", "CtyValue[Any]"]
+
+
+def validate_iteratively(steps: ValidationSteps) -> CtyValue[Any]:
+    """Run `steps`, and the steps of every container it yields, without recursing.
+
+    `steps` is the top container's, already under its own guard entry; this is
+    what its guarded `validate` returns. Every container opened below it gets
+    a guard entry here, one depth marker on the validation path each, so the
+    path is exactly as deep as the recursive descent made it and a `dynamic`
+    validated from here sees its true depth.
+    """
+    context = get_recursion_context()
+    # One per walk rather than one shared: a detector reads the context it
+    # holds, and a walk outlives the moment another thread could rebind it.
+    detector = RecursionDetector(context)
+    path = context.validation_path
+    base = len(path)
+    # The open containers, innermost last: the generator and the type and raw
+    # value it was opened for, which the guard needs when it closes.
+    open_nodes: list[tuple[ValidationSteps, Any, Any]] = [(steps, None, None)]
+    current = steps
+    sent: Any = None
+    thrown: BaseException | None = None
+    try:
+        while True:
+            try:
+                if thrown is None:
+                    element_type, raw = current.send(sent)
+                else:
+                    failure, thrown = thrown, None
+                    element_type, raw = current.throw(failure)
+            except StopIteration as done:
+                _, owner, value = open_nodes.pop()
+                if not open_nodes:
+                    return done.value  # type: ignore[no-any-return]
+                sent = _closed_with(done.value, context, owner, value)
+                path.pop()
+                current = open_nodes[-1][0]
+                continue
+            except Exception as failure:
+                _, owner, value = open_nodes.pop()
+                if not open_nodes:
+                    raise
+                sent, thrown = _closed_by(failure, context, owner, value)
+                path.pop()
+                current = open_nodes[-1][0]
+                continue
+
+            sent, thrown, opened = _step(context, detector, element_type, raw)
+            if opened is not None:
+                current = opened
+                open_nodes.append((current, element_type, raw))
+    finally:
+        del path[base:]
+
+
+def _step(
+    context: Any, detector: RecursionDetector, element_type: Any, raw: object
+) -> tuple[Any, BaseException | None, ValidationSteps | None]:
+    """Validate a yielded element, or open it: (value, None, None), (None, error, None) or (None, None, steps).
+
+    A container is opened with its depth marker pushed, which its close pops;
+    answered by the guard instead, it pops the marker here.
+    """
+    open_steps = getattr(element_type, "_validation_steps", None)
+    if open_steps is None:
+        try:
+            return element_type.validate(raw), None, None
+        except Exception as failure:
+            return None, failure, None
+
+    context.validation_path.append(None)
+    try:
+        answer = guard_answer(context, detector, element_type, raw)
+        if answer is None:
+            return None, None, open_steps(raw)
+        sent, thrown = _closed_with(answer, context, element_type, raw), None
+    except Exception as failure:
+        sent, thrown = _closed_by(failure, context, element_type, raw)
+    context.validation_path.pop()
+    return sent, thrown, None
+
+
+def _closed_with(result: Any, context: Any, owner: Any, value: Any) -> Any:
+    """What a container that produced `result` hands its parent, as the guard's wrapper returns it."""
+    if context.validation_stopped:
+        return _unknown_with_source_marks(value, owner)
+    return reapply_marks(value, result)
+
+
+def _closed_by(failure: Exception, context: Any, owner: Any, value: Any) -> tuple[Any, Any]:
+    """What a container closed by `failure` hands its parent: (value, None) or (None, error).
+
+    The guard's wrapper recovers an overflow raised beneath it, at its own
+    level, and passes everything else up; so does this.
+    """
+    if not isinstance(failure, RecursionError):
+        return None, failure
+    try:
+        return _recover_from_overflow(failure, context, value, owner), None
+    except RecursionError as unrecovered:
+        return None, unrecovered
+
+
+# 🌊🪢🔚
@@ -77,9 +77,9 @@ def preserves_marks(func: ValidateFn) -> ValidateFn:
     three and cut the maximum validatable nesting depth by a third. Leaf types
     have no such cost: their frame is live once, at the bottom.
 
-    That per-level frame cost is not incidental -- `FRAMES_PER_VALIDATION_LEVEL`
-    is what the advertised depth limit is derived from, so a third frame here
-    would silently make that number a lie again.
+    Nested containers no longer call through the wrapper at all --
+    `validate_iteratively` opens them on a work stack and re-applies their
+    marks itself -- but a top-level container and every `dynamic` still do.
 
     Declared as an identity on the function type so each `validate` keeps its
     own signature. `validate` implementations return differently-parameterised
@@ -35,6 +35,7 @@ from pyvider.cty.config.defaults import (
     MIN_OWNED_OVERFLOW_DEPTH,
     default_max_validation_depth,
 )
+from pyvider.cty.validation.compiled import compiled_validation
 
 
 def _guard_depth_limit() -> int:
@@ -344,6 +345,49 @@ def _recover_from_overflow(exc: RecursionError, context: RecursionContext, value
     return degraded
 
 
+def guard_answer(context: RecursionContext, detector: RecursionDetector, owner: Any, value: Any) -> Any:
+    """What the guard answers for `value` as `owner` without walking it node by node, or None.
+
+    The answer is an unknown when validation is stopped or must stop here, and
+    the compiled validator's result when `owner` has one that fits under the
+    depth limit. None means the caller descends -- `with_recursion_detection`
+    through the function it wraps, `validate_iteratively` by opening the node on
+    its work stack. Both call this with the node's depth marker already pushed.
+    """
+    # Check if validation was already stopped by a nested call
+    if context.validation_stopped:
+        return _unknown_with_source_marks(value, owner)
+
+    should_continue, reason = detector.should_continue_validation(value)
+    if not should_continue:
+        # Set flag to stop all parent validations
+        context.validation_stopped = True
+
+        # Only construct debug strings on the error path
+        scope_name = f"{owner.__class__.__name__}.validate(type={type(value).__name__})"
+        logger.warning(
+            "CTY validation stopped due to recursion detection",
+            reason=reason,
+            value_type=type(value).__name__,
+            path=scope_name,
+        )
+        return _unknown_with_source_marks(value, owner)
+
+    # A type with no `dynamic` below it is validated by its compiled validator,
+    # under this one guard entry, when every level it can reach is within the
+    # depth this entry would have allowed the guarded descent. Anything else
+    # descends node by node. The depth metric records the type's depth, which
+    # is what the value reaches at most.
+    plan = compiled_validation(owner)
+    if plan is None:
+        return None
+    reach = len(context.validation_path) + plan[1] - 1
+    if reach > context.max_depth_allowed:
+        return None
+    context.max_depth_reached = max(context.max_depth_reached, reach)
+    return plan[0](value)
+
+
 def with_recursion_detection(func: Callable[..., Any]) -> Callable[..., Any]:
     """
     Decorator for advanced recursion detection in validation functions.
@@ -371,15 +415,15 @@ def with_recursion_detection(func: Callable[..., Any]) -> Callable[..., Any]:
         context.validation_path.append(None)
 
         # Marks are restored here rather than by a second decorator layered over
-        # this one. Every wrapper around a recursive validate keeps its frame
-        # alive for the whole descent, so a separate @preserves_marks on these
-        # types cost a third frame per nesting level and dropped the maximum
-        # validatable depth by a third. Leaf types, which cannot recurse, use
-        # the decorator; see validation/marks.py.
+        # this one. This wrapper's frame is live for the whole of its
+        # container's walk, so a separate @preserves_marks on these types would
+        # cost a frame for nothing. Leaf types, which cannot recurse, use the
+        # decorator; see validation/marks.py.
         #
-        # Two frames per level is a published number: FRAMES_PER_VALIDATION_LEVEL
-        # is what the advertised depth limit is derived from. Adding a frame here
-        # without updating it makes that limit undeliverable again.
+        # The containers nested below this one are not called through here:
+        # `validate_iteratively` opens them on its work stack and does this
+        # wrapper's work for each with `guard_answer` and the same closing
+        # steps. What is done here and what is done there must stay the same.
         #
         # Every exit from here goes through reapply_marks, including the guard's
         # early ones. Stopping validation is exactly when a value must not
@@ -389,27 +433,9 @@ def with_recursion_detection(func: Callable[..., Any]) -> Callable[..., Any]:
         from pyvider.cty.validation.marks import reapply_marks
 
         try:
-            # Check if validation was already stopped by a nested call
-            if context.validation_stopped:
-                return _unknown_with_source_marks(value, self)
-
-            should_continue, reason = _detector.should_continue_validation(value)
-            if not should_continue:
-                # Set flag to stop all parent validations
-                context.validation_stopped = True
-
-                # Only construct debug strings on the error path
-                scope_name = f"{self.__class__.__name__}.validate(type={type(value).__name__})"
-                logger.warning(
-                    "CTY validation stopped due to recursion detection",
-                    reason=reason,
-                    value_type=type(value).__name__,
-                    path=scope_name,
-                )
-                return _unknown_with_source_marks(value, self)
-
-            # The decorator no longer passes the internal flag down.
-            result = func(self, value, *args, **kwargs)
+            result = guard_answer(context, _detector, self, value)
+            if result is None:
+                result = func(self, value, *args, **kwargs)
 
             # Check again after validation in case a nested call stopped validation
             if context.validation_stopped:
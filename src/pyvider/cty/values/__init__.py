@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 from pyvider.cty.values.base import CtyValue
+from pyvider.cty.values.columnar import ColumnarRows, columnar, validate_columnar
 from pyvider.cty.values.markers import (
     UNREFINED_UNKNOWN,
     RefinedUnknownValue,
@@ -26,9 +27,12 @@ with its corresponding CtyType and associated metadata.
 
 __all__ = [
     "UNREFINED_UNKNOWN",
+    "ColumnarRows",
     "CtyValue",
     "RefinedUnknownValue",
     "UnknownValue",
+    "columnar",
+    "validate_columnar",
 ]
 
 # 🌊🪢🔚
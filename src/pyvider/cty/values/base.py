@@ -6,7 +6,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator, Set as AbstractSet
+from collections.abc import Iterable, Iterator, Set as AbstractSet
 from decimal import Decimal
 from typing import (
     TYPE_CHECKING,
@@ -17,7 +17,7 @@ from typing import (
     cast,
 )
 
-from attrs import define, evolve, field
+from attrs import define, evolve, field, fields
 
 from pyvider.cty.config.defaults import (
     ERR_CANNOT_COMPARE_CTYVALUE_WITH,
@@ -33,7 +33,12 @@ from pyvider.cty.config.defaults import (
     ERR_VALUE_TYPE_NOT_SUBSCRIPTABLE,
 )
 from pyvider.cty.values.frozen import FrozenDict
-from pyvider.cty.values.markers import UNREFINED_UNKNOWN
+from pyvider.cty.values.markers import (
+    UNREFINED_UNKNOWN,
+    RefinedUnknownValue,
+    UnknownValue,
+    UnrefinedUnknownValue,
+)
 
 T = TypeVar("T", covariant=True)
 
@@ -57,6 +62,8 @@ if TYPE_CHECKING:
 _PRESENT = 0
 _EXHAUSTED: tuple[int, ...] = (3,)
 
+_NO_MARKS: frozenset[Any] = frozenset()
+
 _TYPES_BOUND: bool = False
 _CtyDynamic: Any = None
 _CtyList: Any = None
@@ -69,6 +76,10 @@ _CtyString: Any = None
 _CtyBool: Any = None
 _CtyCapsule: Any = None
 _CtyCapsuleWithOps: Any = None
+_ColumnarRows: Any = None
+# The types with no fields, any two instances of which are equal: their shared
+# values are kept per class rather than per instance. See `_shared`.
+_FIELDLESS_TYPES: frozenset[type] = frozenset()
 
 
 # The payload types the constructor turns into their immutable counterparts,
@@ -86,7 +97,8 @@ _PLAIN_PAYLOAD_TYPES: frozenset[type] = frozenset(
 def _bind_types() -> None:
     """Resolve the type classes into module globals, once."""
     global _TYPES_BOUND, _CtyDynamic, _CtyList, _CtyMap, _CtyObject, _CtySet, _CtyTuple
-    global _CtyNumber, _CtyString, _CtyBool, _CtyCapsule, _CtyCapsuleWithOps
+    global _CtyNumber, _CtyString, _CtyBool, _CtyCapsule, _CtyCapsuleWithOps, _ColumnarRows
+    global _FIELDLESS_TYPES
     from pyvider.cty.types import (
         CtyBool,
         CtyCapsule,
@@ -105,6 +117,10 @@ def _bind_types() -> None:
     _CtySet, _CtyTuple, _CtyNumber = CtySet, CtyTuple, CtyNumber
     _CtyString, _CtyBool, _CtyCapsule = CtyString, CtyBool, CtyCapsule
     _CtyCapsuleWithOps = CtyCapsuleWithOps
+    _FIELDLESS_TYPES = frozenset({CtyBool, CtyDynamic, CtyNumber, CtyString})
+    from pyvider.cty.values.columnar import ColumnarRows
+
+    _ColumnarRows = ColumnarRows
     _TYPES_BOUND = True
 
 
@@ -119,6 +135,11 @@ def _payload_pairs(left: Any, right: Any) -> tuple[tuple[Any, Any], ...] | None:
     if isinstance(left, tuple) and isinstance(right, tuple):
         if len(left) != len(right):
             return None
+        if not _TYPES_BOUND:
+            _bind_types()
+        if type(left) is _ColumnarRows and type(right) is _ColumnarRows and cast(Any, left).same_layout(right):
+            # Compared column by column, without building a row on either side.
+            return () if left == right else None
         return tuple(zip(left, right, strict=True))
     left_items = getattr(left, "items", None)
     right_items = getattr(right, "items", None)
@@ -129,6 +150,37 @@ def _payload_pairs(left: Any, right: Any) -> tuple[tuple[Any, Any], ...] | None:
     return () if left == right else None
 
 
+# The payloads `marks._MUTABLE_CONTAINERS` names. A hash taken over one could go
+# stale under an in-place edit, so it is not kept.
+_MUTABLE_PAYLOADS = (dict, list, set, bytearray)
+
+
+def _hash_is_stable(node: CtyValue[Any], children: tuple[CtyValue[Any], ...]) -> bool:
+    """Whether `node`'s hash may be kept on it, by the rule `collect_marks_deep` memoizes under.
+
+    Its payload cannot change in place, and every value the hash was built
+    from -- the children the fold walked, or a `dynamic` wrapper's value --
+    had its own kept, which it only could by this same rule.
+
+    Never a capsule's, and so never anything enclosing one. Its payload is an
+    arbitrary Python object that rule says nothing about, as the encoders'
+    fragment memo already decides, and its `hash_fn` reads whatever that
+    object holds now. A stale hash here is a wrong answer from `__eq__`,
+    which refuses two values whose kept hashes differ without asking
+    `equal_fn`.
+    """
+    if not _TYPES_BOUND:
+        _bind_types()
+    if isinstance(node.vtype, _CtyCapsule):
+        return False
+    payload = node.value
+    if isinstance(payload, _MUTABLE_PAYLOADS) and not isinstance(payload, FrozenDict):
+        return False
+    if isinstance(payload, CtyValue) and payload._hash_memo is None:
+        return False
+    return all(child._hash_memo is not None for child in children)
+
+
 @define(frozen=True, slots=True)
 class CtyValue(Generic[T]):
     vtype: CtyType[T] = field()
@@ -161,6 +213,35 @@ class CtyValue(Generic[T]):
     # for the same list unmarked.
     _stripped: Any = field(default=None, init=False, eq=False, repr=False)
 
+    # Encoded fragments, by codec: `{"msgpack": (schema, bytes), "json":
+    # (schema, str)}`, filled by the encoders for a container whose encoding
+    # they have just written. Only ever filled under a root whose
+    # `collect_marks_deep` memo proved the whole subtree immutable -- the
+    # encoding of anything else could go stale under an in-place mutation --
+    # and replaced whole, never updated in place, so a concurrent reader sees
+    # one mapping or the other. `evolve` (a new mark, say) starts empty.
+    _encoded: dict[str, tuple[Any, Any]] | None = field(default=None, init=False, eq=False, repr=False)
+
+    # Hashed views of a set's, list's or tuple's members, by name, each filled
+    # on first ask under the same immutability rule and replaced whole as
+    # `_encoded` is. See `pyvider.cty.values.membership`.
+    _members: dict[str, Any] | None = field(default=None, init=False, eq=False, repr=False)
+
+    # `__hash__`'s answer, kept under the same immutability rule. A parent's
+    # fold reads a child's from here rather than walking into it, so a shared
+    # element is hashed once for every set, dict and parent that asks.
+    _hash_memo: int | None = field(default=None, init=False, eq=False, repr=False)
+
+    # Where this value sorts in a set and what makes it the same member, by
+    # name (`order`, `identity`, `hash_bytes`), under the same rule and
+    # replaced whole. See `pyvider.cty.values.set_order._kept`.
+    _set_keys: dict[str, Any] | None = field(default=None, init=False, eq=False, repr=False)
+
+    # `is_wholly_known`'s answer. Filled, with `_deep_marks`, when the value is
+    # built from children that already have both, so a validated container
+    # answers both questions without a walk. See `_summarize`.
+    _wholly_known: bool | None = field(default=None, init=False, eq=False, repr=False)
+
     def __attrs_post_init__(self) -> None:
         if not _TYPES_BOUND:
             _bind_types()
@@ -189,6 +270,7 @@ class CtyValue(Generic[T]):
             self._freeze_raw_payload()
         if type(self.marks) is not frozenset:
             object.__setattr__(self, "marks", frozenset(self.marks))
+        _summarize(self)
 
     def _freeze_raw_payload(self) -> None:
         """Make a payload handed straight to the constructor as immutable as `validate`'s.
@@ -333,6 +415,10 @@ class CtyValue(Generic[T]):
         """
         if not isinstance(other, CtyValue):
             return NotImplemented
+        # Two hashes already worked out that differ settle it without a walk.
+        mine, theirs = self._hash_memo, other._hash_memo
+        if mine is not None and theirs is not None and mine != theirs:
+            return False
         children = self._eq_shallow(other)
         if children is None:
             return False
@@ -540,18 +626,53 @@ class CtyValue(Generic[T]):
         this shape in one codebase. The walk below is an explicit post-order:
         every node's hash is computed once, after its children's, and each node
         reads theirs out of `computed` rather than asking for them.
+
+        **Kept on the node, as of 2026-10-17,** in `_hash_memo`, for a node
+        whose payload cannot change in place and whose children's hashes were
+        kept too -- the rule `_deep_marks` follows. The walk stops at a node
+        that has one. It used to fold the whole subtree on every call, so
+        `distinct` over 10k objects, a set built of them, and `Equals`
+        bucketing the same members each paid for every element's full tree.
         """
-        order: list[CtyValue[Any]] = []
+        memo = self._hash_memo
+        if memo is not None:
+            return memo
+        order: list[tuple[CtyValue[Any], tuple[CtyValue[Any], ...]]] = []
         stack: list[CtyValue[Any]] = [self]
         while stack:
             node = stack.pop()
-            order.append(node)
-            stack.extend(node._hash_descendants())
+            children = node._hash_descendants() if node._hash_memo is None else ()
+            order.append((node, children))
+            stack.extend(children)
         computed: dict[int, int] = {}
-        for node in reversed(order):
-            computed[id(node)] = node._hash_node(computed)
+        for node, children in reversed(order):
+            kept = node._hash_memo
+            if kept is None:
+                kept = node._hash_node(computed)
+                if _hash_is_stable(node, children):
+                    object.__setattr__(node, "_hash_memo", kept)
+            computed[id(node)] = kept
         return computed[id(self)]
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickled as its fields, without the memos.
+
+        attrs pickles every slot of a slotted class, and two of the memos are
+        `hash()`es of strings -- `_hash_memo`, and the buckets `_members` keys
+        by -- which differ between processes unless PYTHONHASHSEED is pinned.
+        A value that crossed to a batch codec's pool worker with its parent's
+        would sit in the wrong bucket of every set and dict there. The types
+        do the same (`reduce_rebuilding`).
+
+        A subclass comes back as itself, with any fields and attributes of its
+        own, as attrs pickled it.
+        """
+        cls = type(self)
+        if cls is CtyValue:
+            return _rebuilt_value, (self.vtype, self.value, self.is_unknown, self.is_null, self.marks)
+        state = {a.name: getattr(self, a.name) for a in fields(cls) if a.init}
+        return _rebuilt_subclass_value, (cls, state, dict(getattr(self, "__dict__", {})))
+
     def _hash_descendants(self) -> tuple[CtyValue[Any], ...]:
         """The child values this one's hash is built from, and only those.
 
@@ -573,6 +694,10 @@ class CtyValue(Generic[T]):
         items: tuple[Any, ...] = ()
         if isinstance(payload, dict):
             items = tuple(payload.values())
+        elif type(payload) is _ColumnarRows:
+            # Its rows are built on each read, so rows handed out here would not
+            # be the rows `_payload_hash` reads back; each row hashes itself there.
+            return ()
         elif isinstance(payload, tuple | list | frozenset):
             items = tuple(payload)
         return tuple(item for item in items if isinstance(item, CtyValue))
@@ -664,6 +789,9 @@ class CtyValue(Generic[T]):
         known -- which is the right answer to a different question than the one
         callers deciding "can I draw a conclusion from this value" are asking.
         """
+        known = self._wholly_known
+        if known is not None:
+            return known
         stack: list[Any] = [self]
         visited: set[int] = set()
         while stack:
@@ -674,7 +802,7 @@ class CtyValue(Generic[T]):
             visited.add(current_id)
             if isinstance(current, CtyValue):
                 if current.is_unknown:
-                    return False
+                    return self._keep_known(False)
                 if current.is_null:
                     continue
                 stack.append(current.value)
@@ -682,7 +810,13 @@ class CtyValue(Generic[T]):
                 stack.extend(current.values())
             elif isinstance(current, (list, tuple, set, frozenset)):
                 stack.extend(current)
-        return True
+        return self._keep_known(True)
+
+    def _keep_known(self, known: bool) -> bool:
+        """`known`, kept as the answer when the mark walk has proved this value immutable."""
+        if self._deep_marks is not None:
+            _set_wholly_known(self, known)
+        return known
 
     def has_mark(self, mark: object) -> bool:
         return mark in self.marks
@@ -714,17 +848,35 @@ class CtyValue(Generic[T]):
     def is_empty(self) -> bool:
         return not self.value if hasattr(self.value, "__len__") else False
 
+    # The four single-element edits below validate the one element they add
+    # and build the rest as it stands. They used to copy the payload and run
+    # `validate` over the whole of it, so building an n-key map one key at a
+    # time validated n**2/2 elements: 2000 keys took 2.1 s. The elements kept
+    # were validated when this value was built -- by `validate`, a decoder or
+    # one of these -- and validating a value against the type it already has
+    # hands it back unchanged, so the answer is the same value; the copy that
+    # remains is one C-level pass over a tuple or dict. A payload assembled by
+    # hand through the constructor is not checked here, as it is not checked
+    # anywhere short of `validate`.
+
     def with_key(self, key: str, value: Any) -> Self:
+        from ..exceptions import CtyValidationError
         from ..types import CtyMap
+        from ..types.collections.map import _element_error, _normalized_key
 
         if not isinstance(self.vtype, CtyMap):
             raise TypeError("'.with_key()' can only be used on CtyMap values.")
         if not isinstance(self.value, dict):
             raise TypeError("Internal value of CtyMap must be a dict.")
-        new_dict = self.value.copy()
-        new_dict[key] = value
-        # validate() returns CtyValue[Any] due to .value: object limitation
-        return self.vtype.validate(new_dict)  # type: ignore[no-any-return]
+        entries = dict(self.value)
+        # A key already present is replaced in place. Any other key is
+        # refused, as `validate` refuses it, if its NFC form is one of them.
+        normalized = _normalized_key(key, {} if key in entries else entries)
+        try:
+            entries[normalized] = self.vtype.element_type.validate(value)
+        except CtyValidationError as e:
+            raise _element_error(e, normalized, value) from e
+        return cast(Self, CtyValue._trusted(self.vtype, FrozenDict(entries)))
 
     def without_key(self, key: str) -> Self:
         from ..types import CtyMap
@@ -735,10 +887,11 @@ class CtyValue(Generic[T]):
             raise TypeError("Internal value of CtyMap must be a dict.")
         if key not in self.value:
             return self
-        new_dict = self.value.copy()
-        del new_dict[key]
-        # validate() returns CtyValue[Any] due to .value: object limitation
-        return self.vtype.validate(new_dict)  # type: ignore[no-any-return]
+        entries = dict(self.value)
+        del entries[key]
+        if not entries:
+            return cast(Self, CtyValue._empty(self.vtype))
+        return cast(Self, CtyValue._trusted(self.vtype, FrozenDict(entries)))
 
     def append(self, value: Any) -> Self:
         from ..types import CtyList
@@ -747,10 +900,8 @@ class CtyValue(Generic[T]):
             raise TypeError("'.append()' can only be used on CtyList values.")
         if not isinstance(self.value, list | tuple):
             raise TypeError("Internal value of CtyList must be a list or tuple.")
-        new_list = list(self.value)
-        new_list.append(value)
-        # validate() returns CtyValue[Any] due to .value: object limitation
-        return self.vtype.validate(new_list)  # type: ignore[no-any-return]
+        element = _list_element(self.vtype.element_type, len(self.value), value)
+        return cast(Self, CtyValue._trusted(self.vtype, (*self.value, element)))
 
     def with_element_at(self, index: int, value: Any) -> Self:
         from ..types import CtyList
@@ -759,25 +910,302 @@ class CtyValue(Generic[T]):
             raise TypeError("'.with_element_at()' can only be used on CtyList values.")
         if not isinstance(self.value, list | tuple):
             raise TypeError("Internal value of CtyList must be a list or tuple.")
-        new_list = list(self.value)
-        if not (-len(new_list) <= index < len(new_list)):
+        elements = self.value
+        if not (-len(elements) <= index < len(elements)):
             raise IndexError("list index out of range")
-        new_list[index] = value
-        # validate() returns CtyValue[Any] due to .value: object limitation
-        return self.vtype.validate(new_list)  # type: ignore[no-any-return]
-
+        position = index % len(elements)
+        element = _list_element(self.vtype.element_type, position, value)
+        return cast(
+            Self, CtyValue._trusted(self.vtype, (*elements[:position], element, *elements[position + 1 :]))
+        )
+
+    # Both answer the shared value (see `_shared`) only when asked on this
+    # class: a subclass asking gets an instance of itself, as it always did.
     @classmethod
     def unknown(cls, vtype: CtyType[Any], value: Any = UNREFINED_UNKNOWN) -> CtyValue[Any]:
+        if cls is CtyValue:
+            if value is UNREFINED_UNKNOWN:
+                return _shared(vtype, _UNKNOWN)
+            if isinstance(value, UnknownValue):
+                return CtyValue._trusted(vtype, value, is_unknown=True)
         return cls(vtype=vtype, is_unknown=True, value=value)
 
     @classmethod
     def null(cls, vtype: CtyType[Any]) -> CtyValue[Any]:
+        if cls is CtyValue:
+            return _shared(vtype, _NULL)
         return cls(vtype=vtype, is_null=True)
 
+    @staticmethod
+    def _empty(vtype: CtyType[Any]) -> CtyValue[Any]:
+        """The known, unmarked, empty list, set or map of `vtype`, shared like a null."""
+        return _shared(vtype, _EMPTY)
+
+    @staticmethod
+    def _boolean(vtype: CtyType[Any], truth: bool) -> CtyValue[Any]:
+        """`true` or `false` of `vtype`, a `CtyBool`, shared like a null."""
+        return _shared(vtype, _TRUE if truth else _FALSE)
+
+    @staticmethod
+    def _trusted(
+        vtype: CtyType[Any],
+        value: object | None,
+        marks: frozenset[Any] = _NO_MARKS,
+        *,
+        is_unknown: bool = False,
+        is_null: bool = False,
+    ) -> CtyValue[Any]:
+        """A `CtyValue` built without `__attrs_post_init__`, for a caller that already knows it is well formed.
+
+        Internal, but stable: the codecs, `walk.transform`, `unknown_as_null`
+        and the collection functions build through it, and so may anything in
+        this package that meets the same contract. Construction is the most
+        frequent thing cty does, and the checks it skips are about half of what
+        constructing a value costs -- 1.0 us against 0.45 us, measured.
+
+        The caller vouches for what `__attrs_post_init__` would otherwise
+        establish:
+
+        - `value` is already immutable: a tuple, `FrozenDict` or frozenset of
+          `CtyValue`s of the right types for a container, a normalised leaf
+          payload for a primitive, an `UnknownValue` for an unknown, None for a
+          null. Nothing here copies or freezes it.
+        - `marks` is a frozenset.
+        - `is_unknown` and `is_null` are not both set, and a null's `value` is
+          None.
+        - `vtype` is not `dynamic` wrapping a `CtyValue` whose knownness or
+          nullness differs from the flags given -- the constructor copies them
+          from the wrapped value, and this does not.
+
+        A value built from input that has not been through `validate` or an
+        equivalent check belongs in the constructor, not here.
+        """
+        built: CtyValue[Any] = _new_value(CtyValue)
+        _set_vtype(built, vtype)
+        _set_value(built, value)
+        _set_is_unknown(built, is_unknown)
+        _set_is_null(built, is_null)
+        _set_marks(built, marks)
+        _set_stripped(built, None)
+        _set_encoded(built, None)
+        _set_members(built, None)
+        _set_hash_memo(built, None)
+        _set_set_keys(built, None)
+        # `_summarize`'s leaf case, inline: most values built are leaves, and
+        # the call alone was a fifth of building one.
+        if type(value) in _LEAF_PAYLOADS:
+            _set_deep_marks(built, marks)
+            _set_wholly_known(built, not is_unknown)
+        else:
+            _set_deep_marks(built, None)
+            _set_wholly_known(built, None)
+            _summarize(built)
+        return built
+
+    @staticmethod
+    def _trusted_many(vtype: CtyType[Any], payloads: Iterable[object]) -> tuple[CtyValue[Any], ...]:
+        """Known, unmarked values of `vtype`, one per payload, each as `_trusted` would build it.
+
+        For the many-leaves-of-one-type results -- a map's keys, a decoded list
+        of strings -- where even `_trusted`'s call per element shows. The
+        contract is `_trusted`'s, for every payload.
+        """
+        new, set_vtype, set_value = _new_value, _set_vtype, _set_value
+        set_is_unknown, set_is_null, set_marks = _set_is_unknown, _set_is_null, _set_marks
+        set_deep_marks, set_stripped, set_encoded = _set_deep_marks, _set_stripped, _set_encoded
+        set_members, set_hash_memo, set_set_keys = _set_members, _set_hash_memo, _set_set_keys
+        set_wholly_known = _set_wholly_known
+        built: list[CtyValue[Any]] = []
+        append = built.append
+        for payload in payloads:
+            value: CtyValue[Any] = new(CtyValue)
+            set_vtype(value, vtype)
+            set_value(value, payload)
+            set_is_unknown(value, False)
+            set_is_null(value, False)
+            set_marks(value, _NO_MARKS)
+            set_deep_marks(value, _NO_MARKS)
+            set_stripped(value, None)
+            set_encoded(value, None)
+            set_members(value, None)
+            set_hash_memo(value, None)
+            set_set_keys(value, None)
+            set_wholly_known(value, True)
+            append(value)
+        return tuple(built)
+
 
 # A `dynamic` wrapper's payload is a `CtyValue`; known-immutable, skip the fallback.
 _PLAIN_PAYLOAD_TYPES = _PLAIN_PAYLOAD_TYPES | {CtyValue}
 
+# `CtyValue._trusted`'s tools: the slot descriptors' setters, bound once. Each
+# field has to be set, the memo fields included -- a slot never set raises on
+# read rather than answering its default -- and `object.__setattr__` by name
+# costs half as much again as calling the descriptor directly.
+_new_value = object.__new__
+_set_vtype = CtyValue.__dict__["vtype"].__set__
+_set_value = CtyValue.__dict__["value"].__set__
+_set_is_unknown = CtyValue.__dict__["is_unknown"].__set__
+_set_is_null = CtyValue.__dict__["is_null"].__set__
+_set_marks = CtyValue.__dict__["marks"].__set__
+_set_deep_marks = CtyValue.__dict__["_deep_marks"].__set__
+_set_stripped = CtyValue.__dict__["_stripped"].__set__
+_set_encoded = CtyValue.__dict__["_encoded"].__set__
+_set_members = CtyValue.__dict__["_members"].__set__
+_set_hash_memo = CtyValue.__dict__["_hash_memo"].__set__
+_set_set_keys = CtyValue.__dict__["_set_keys"].__set__
+_set_wholly_known = CtyValue.__dict__["_wholly_known"].__set__
+
+# The payloads that hold nothing below them. The summary of a value holding one
+# is its own marks and knownness; a capsule's payload is anything, and is left
+# to the walks.
+_LEAF_PAYLOADS: frozenset[type] = frozenset(
+    {str, bool, int, float, bytes, Decimal, type(None), UnrefinedUnknownValue, RefinedUnknownValue}
+)
+
+
+def _summarize(built: CtyValue[Any]) -> None:
+    """Fill `built`'s `_deep_marks` and `_wholly_known` from its children's, where it can.
+
+    Bottom-up, at construction: a validated container's children are values
+    built -- and summarized -- before it, so "marked anywhere below" and
+    "unknown anywhere below" are one pass over its own children rather than a
+    walk of the subtree on first ask. `unknown_as_null`, `distinct`, the
+    encoders and the function wrapper ask one or the other about every value
+    they are handed, and a freshly validated 20k-object list cost its first
+    `collect_marks_deep` 34 ms and every `is_wholly_known` 64 ms.
+
+    Left unset, so the walks answer as before, for any payload that can change
+    in place -- a list, a dict, a lazily decoded object, columnar rows -- and
+    for any child not summarized itself. Setting them is what proves the
+    subtree immutable, the rule every memo on this class is kept under.
+    """
+    payload = built.value
+    payload_type = type(payload)
+    if payload_type in _LEAF_PAYLOADS:
+        _set_deep_marks(built, built.marks)
+        _set_wholly_known(built, not built.is_unknown)
+        return
+    children: Iterable[Any]
+    if payload_type is tuple or payload_type is frozenset:
+        children = cast("tuple[Any, ...]", payload)
+    elif payload_type is FrozenDict:
+        children = cast("FrozenDict", payload).values()
+    elif payload_type is CtyValue:
+        children = (payload,)
+    else:
+        return
+    marks = built.marks
+    known = not built.is_unknown
+    for child in children:
+        if type(child) is not CtyValue:
+            return
+        below = child._deep_marks
+        child_known = child._wholly_known
+        if below is None or child_known is None:
+            return
+        if below:
+            marks = marks | below
+        if not child_known:
+            known = False
+    _set_deep_marks(built, marks)
+    _set_wholly_known(built, known)
+
+
+# The values `_shared` keeps, one per kind per type.
+_NULL, _UNKNOWN, _EMPTY, _FALSE, _TRUE = range(5)
+_fieldless_shared: dict[type, dict[int, CtyValue[Any]]] = {}
+_NO_MEMO_FIELD = object()
+
+
+def _shared(vtype: CtyType[Any], kind: int) -> CtyValue[Any]:
+    """The one null, bare unknown, empty collection, `true` or `false` of `vtype`.
+
+    Each of these used to be a new value every time it was asked for, and
+    they are asked for constantly: every optional attribute an object is not
+    given is a null, and every unknown element of a decoded plan is a bare
+    unknown. A sparse object with forty unset attributes was forty nulls, each
+    a separate `CtyValue` identical to the rest. They are immutable and carry
+    no marks -- marking one answers a new value -- so one instance serves.
+
+    Kept on the type itself (`_flyweight_memo`) for the types that contain
+    others, so two equal but separate container types keep separate ones and
+    interned types (`pyvider.cty.types.interning`) share theirs. A type with
+    no fields keeps them per class, since every `CtyString()` is equal to
+    every other. A type that is neither -- a capsule, a subclass -- has each
+    built anew, as before.
+
+    A repeated value is also a faster comparison: `__eq__` on two of the same
+    object is decided without looking inside. Nothing relies on the sharing;
+    it is a saving, not a contract, and `is` between two nulls is not a test
+    anyone should write.
+    """
+    memo: Any = getattr(vtype, "_flyweight_memo", _NO_MEMO_FIELD)
+    if memo is None:
+        memo = {}
+        object.__setattr__(vtype, "_flyweight_memo", memo)
+    elif memo is _NO_MEMO_FIELD:
+        if not _TYPES_BOUND:
+            _bind_types()
+        if type(vtype) not in _FIELDLESS_TYPES:
+            return _build_shared(vtype, kind)
+        memo = _fieldless_shared.setdefault(type(vtype), {})
+    found: CtyValue[Any] | None = memo.get(kind)
+    if found is None:
+        # Two threads can both build one; `setdefault` keeps whichever was
+        # stored first, and the other is an ordinary equal value.
+        found = memo.setdefault(kind, _build_shared(vtype, kind))
+    return found
+
+
+def _build_shared(vtype: CtyType[Any], kind: int) -> CtyValue[Any]:
+    if kind == _NULL:
+        return CtyValue._trusted(vtype, None, is_null=True)
+    if kind == _UNKNOWN:
+        return CtyValue._trusted(vtype, UNREFINED_UNKNOWN, is_unknown=True)
+    if kind == _EMPTY:
+        if not _TYPES_BOUND:
+            _bind_types()
+        return CtyValue._trusted(vtype, FrozenDict() if isinstance(vtype, _CtyMap) else ())
+    return CtyValue._trusted(vtype, kind == _TRUE)
+
+
+def _rebuilt_value(
+    vtype: CtyType[Any], value: object | None, is_unknown: bool, is_null: bool, marks: frozenset[Any]
+) -> CtyValue[Any]:
+    return CtyValue._trusted(vtype, value, marks, is_unknown=is_unknown, is_null=is_null)
+
+
+def _rebuilt_subclass_value(
+    cls: type[CtyValue[Any]], state: dict[str, Any], extra: dict[str, Any]
+) -> CtyValue[Any]:
+    """A pickled `CtyValue` subclass, rebuilt from its init fields with every memo at its default."""
+    built = _new_value(cls)
+    for a in fields(cls):
+        factory = getattr(a.default, "factory", None)
+        if a.init:
+            answer = state[a.name]
+        elif factory is not None:
+            answer = factory()
+        else:
+            answer = a.default
+        object.__setattr__(built, a.name, answer)
+    if extra:
+        vars(built).update(extra)
+    _summarize(built)
+    return built
+
+
+def _list_element(element_type: CtyType[Any], index: int, value: object) -> CtyValue[Any]:
+    """`value` validated as a list's element at `index`, refused as the list's `validate` refuses it."""
+    from ..exceptions import CtyValidationError
+    from ..types.collections.list import _element_error
+
+    try:
+        return element_type.validate(value)
+    except CtyValidationError as e:
+        raise _element_error(e, index, value) from e
+
 
 def _member_key(member: object) -> tuple[Any, ...]:
     """The canonical key of a container member, which need not be a CtyValue.
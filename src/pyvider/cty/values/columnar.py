@@ -0,0 +1,306 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""A list or set of objects held one column per attribute, each row built when it is read.
+
+A list of 100k objects validated the ordinary way is 100k `CtyValue`s for the
+rows, 100k `FrozenDict`s, and a `CtyValue` per attribute per row -- each with
+its eight slots -- around payloads that are mostly short strings and small
+numbers. For the inventory-shaped results a data source returns, that
+bookkeeping is nearly all of the memory: a row of six primitive attributes
+costs about 1.4 KB as values and about 60 bytes as column entries.
+
+`columnar(value)` answers the same value, equal and hash-equal to it, with a
+`ColumnarRows` payload. It holds one tuple per attribute, in the schema's
+declared order:
+
+ - a known, unmarked primitive attribute is stored as its raw payload -- the
+   `str`, the number, the `bool`;
+ - an unmarked null is stored as `None`, which no known primitive's payload
+   is;
+ - anything else -- a marked attribute, an unknown, an attribute of a
+   container or `dynamic` type -- is stored as the `CtyValue` itself.
+
+A row that is itself null, unknown or marked is kept whole, apart from the
+columns. Nothing else is. So a null or an unknown costs a column entry like
+any other attribute; separate null and unknown bitmaps would cost more, not
+less, alongside an entry every row already has.
+
+It is a `tuple`, so every `isinstance(payload, tuple)` test -- the list and
+set code, the codecs, `walk`, the mark walks -- keeps passing. Its tuple
+storage is empty: length, indexing, iteration, comparison, hashing, `+`,
+`count`, `index`, `repr` and pickling are all answered from the columns, and
+a row is built from them each time it is read rather than kept, which is the
+point. So `rows[0] is rows[0]` is false, while `rows[0] == rows[0]` holds.
+Code in C that reads a tuple's storage directly without going through its
+methods -- `json.dumps` handed the payload itself, say -- sees it empty;
+nothing in this package hands a payload to one.
+
+A set's payload is its elements in canonical order, a tuple like a list's, so
+one payload serves both.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, SupportsIndex, overload
+
+from pyvider.cty.values.base import CtyValue
+from pyvider.cty.values.frozen import FrozenDict
+
+if TYPE_CHECKING:
+    from pyvider.cty.types import CtyObject, CtyType
+
+
+class ColumnarRows(tuple):  # type: ignore[type-arg]
+    """The rows of a list or set of `element_type`, one column per attribute.
+
+    Built by `columnar` and `validate_columnar`, not directly. A tuple
+    subclass cannot declare `__slots__`, so these live in the instance dict --
+    one per list, not per row.
+    """
+
+    element_type: CtyObject
+    _attributes: tuple[tuple[str, CtyType[Any]], ...]
+    _columns: tuple[tuple[Any, ...], ...]
+    _apart: dict[int, CtyValue[Any]]
+    _length: int
+
+    def __new__(
+        cls,
+        element_type: CtyObject,
+        columns: tuple[tuple[Any, ...], ...],
+        apart: dict[int, CtyValue[Any]],
+        length: int,
+    ) -> ColumnarRows:
+        rows = tuple.__new__(cls)
+        rows.element_type = element_type
+        rows._attributes = tuple((name, attr_type) for name, _, _, attr_type in element_type._plan()[0])
+        rows._columns = columns
+        rows._apart = apart
+        rows._length = length
+        return rows
+
+    def _row(self, index: int) -> CtyValue[Any]:
+        if self._apart:
+            whole = self._apart.get(index)
+            if whole is not None:
+                return whole
+        trusted, null = CtyValue._trusted, CtyValue.null
+        attributes: dict[str, CtyValue[Any]] = {}
+        for (name, attr_type), column in zip(self._attributes, self._columns, strict=True):
+            entry = column[index]
+            if entry is None:
+                attributes[name] = null(attr_type)
+            elif type(entry) is CtyValue:
+                attributes[name] = entry
+            else:
+                attributes[name] = trusted(attr_type, entry)
+        return trusted(self.element_type, FrozenDict(attributes))
+
+    def boxed_values(self) -> tuple[CtyValue[Any], ...]:
+        """The entries held as values, and the rows kept whole -- all that can carry a mark."""
+        boxed = [entry for column in self._columns for entry in column if type(entry) is CtyValue]
+        return (*boxed, *self._apart.values())
+
+    def same_layout(self, other: ColumnarRows) -> bool:
+        """Whether `other` stores its rows exactly as this does, so comparing storage compares rows."""
+        return self.element_type == other.element_type and self._length == other._length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> CtyValue[Any]: ...
+    @overload
+    def __getitem__(self, index: slice) -> tuple[CtyValue[Any], ...]: ...
+    def __getitem__(self, index: SupportsIndex | slice) -> Any:
+        if isinstance(index, slice):
+            return tuple(self._row(i) for i in range(*index.indices(self._length)))
+        position = index.__index__()
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError("tuple index out of range")
+        return self._row(position)
+
+    def __iter__(self) -> Iterator[CtyValue[Any]]:
+        return (self._row(i) for i in range(self._length))
+
+    def __reversed__(self) -> Iterator[CtyValue[Any]]:
+        return (self._row(i) for i in range(self._length - 1, -1, -1))
+
+    def __contains__(self, item: object) -> bool:
+        return any(row == item for row in self)
+
+    def count(self, item: object) -> int:
+        return sum(1 for row in self if row == item)
+
+    def index(self, item: object, start: SupportsIndex = 0, stop: SupportsIndex = 2**63 - 1) -> int:
+        for position in range(*slice(start, stop).indices(self._length)):
+            if self._row(position) == item:
+                return position
+        raise ValueError("tuple.index(x): x not in tuple")
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is ColumnarRows and self.same_layout(other):
+            # Each row has exactly one storage, so equal storage is equal rows
+            # and any difference is a difference in some row.
+            return self._columns == other._columns and self._apart == other._apart
+        if not isinstance(other, tuple) or len(other) != self._length:
+            return False
+        return all(row == item for row, item in zip(self, other, strict=True))
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __lt__(self, other: tuple[Any, ...]) -> bool:
+        return tuple(self) < tuple(other)
+
+    def __le__(self, other: tuple[Any, ...]) -> bool:
+        return tuple(self) <= tuple(other)
+
+    def __gt__(self, other: tuple[Any, ...]) -> bool:
+        return tuple(self) > tuple(other)
+
+    def __ge__(self, other: tuple[Any, ...]) -> bool:
+        return tuple(self) >= tuple(other)
+
+    def __add__(self, other: tuple[Any, ...]) -> tuple[Any, ...]:
+        return (*self, *other)
+
+    def __radd__(self, other: tuple[Any, ...]) -> tuple[Any, ...]:
+        return (*other, *self)
+
+    def __mul__(self, times: SupportsIndex) -> tuple[Any, ...]:
+        return tuple(self) * times
+
+    __rmul__ = __mul__
+
+    def __repr__(self) -> str:
+        return repr(tuple(self))
+
+    def __copy__(self) -> ColumnarRows:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> ColumnarRows:
+        return self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (ColumnarRows, (self.element_type, self._columns, self._apart, self._length))
+
+
+def columnar(value: CtyValue[Any]) -> CtyValue[Any]:
+    """`value`, with a `ColumnarRows` payload if it is a known list or set of objects.
+
+    The answer is equal and hash-equal to `value`, keeps its marks, and
+    behaves as it does everywhere -- validation, the codecs, `walk`, the
+    functions. Anything else -- a null, an unknown, a list of strings, a value
+    already columnar -- is returned as it is, so this can be applied without
+    checking first.
+    """
+    from pyvider.cty.types import CtyList, CtyObject, CtySet
+
+    vtype = value.type
+    if (
+        value.is_unknown
+        or value.is_null
+        or not isinstance(vtype, CtyList | CtySet)
+        or not isinstance(vtype.element_type, CtyObject)
+        or type(value.value) is ColumnarRows
+        or not isinstance(value.value, tuple)
+    ):
+        return value
+    rows = _Columns(vtype.element_type)
+    for row in value.value:
+        rows.add(row)
+    return CtyValue._trusted(vtype, rows.payload(), value.marks)
+
+
+def validate_columnar(cty_type: CtyType[Any], rows: Iterable[object]) -> CtyValue[Any]:
+    """`cty_type.validate(list(rows))`, held columnar, for a list or set of objects.
+
+    A list's rows are validated one at a time and go straight into the
+    columns, so the rows as values never all exist at once. A set has to see
+    every element to drop duplicates and order them, so it is validated whole
+    and then made columnar. Refusals are `validate`'s, with its paths. Any
+    other type is validated as `validate` would and returned as it is.
+    """
+    from pyvider.cty.exceptions import CtyValidationError
+    from pyvider.cty.types import CtyList, CtyObject
+    from pyvider.cty.types.collections.list import _element_error
+
+    if not isinstance(cty_type, CtyList) or not isinstance(cty_type.element_type, CtyObject):
+        return columnar(cty_type.validate(list(rows)))
+    element_type = cty_type.element_type
+    columns = _Columns(element_type)
+    for index, raw in enumerate(rows):
+        try:
+            columns.add(element_type.validate(raw))
+        except CtyValidationError as error:
+            raise _element_error(error, index, raw) from error
+    return CtyValue._trusted(cty_type, columns.payload())
+
+
+class _Columns:
+    """`ColumnarRows` being filled, one row at a time."""
+
+    __slots__ = ("_apart", "_attributes", "_columns", "_element_type", "_length")
+
+    def __init__(self, element_type: CtyObject) -> None:
+        from pyvider.cty.types import CtyBool, CtyNumber, CtyString
+
+        self._element_type = element_type
+        # (name, type, the primitive type class or None) per attribute: only a
+        # primitive's payload can stand for its value without the value.
+        self._attributes = tuple(
+            (
+                name,
+                attr_type,
+                type(attr_type) if isinstance(attr_type, CtyString | CtyNumber | CtyBool) else None,
+            )
+            for name, _, _, attr_type in element_type._plan()[0]
+        )
+        self._columns: tuple[list[Any], ...] = tuple([] for _ in self._attributes)
+        self._apart: dict[int, CtyValue[Any]] = {}
+        self._length = 0
+
+    def add(self, row: CtyValue[Any]) -> None:
+        index = self._length
+        self._length += 1
+        payload = row.value
+        if row.is_null or row.is_unknown or row.marks or not row.type.equal(self._element_type):
+            self._apart[index] = row
+            for column in self._columns:
+                column.append(None)
+            return
+        for (name, attr_type, primitive), column in zip(self._attributes, self._columns, strict=True):
+            attribute: CtyValue[Any] = payload[name]  # type: ignore[index]
+            # Stored bare only where the row rebuilt from it is this value: a
+            # null with no payload and a primitive's own payload, each of the
+            # declared type. A null at `dynamic` can carry its type as payload.
+            if attribute.marks:
+                column.append(attribute)
+            elif attribute.is_null:
+                bare = attribute.value is None and attribute.vtype == attr_type
+                column.append(None if bare else attribute)
+            elif primitive is not None and not attribute.is_unknown and type(attribute.vtype) is primitive:
+                column.append(attribute.value)
+            else:
+                column.append(attribute)
+
+    def payload(self) -> ColumnarRows:
+        return ColumnarRows(
+            self._element_type, tuple(tuple(column) for column in self._columns), self._apart, self._length
+        )
+
+
+# 🌊🪢🔚
@@ -373,7 +373,22 @@ def _equals_set(a: CtyValue[Any], b: CtyValue[Any]) -> CtyValue[Any]:
         if isinstance(element, CtyValue) and element.is_unknown:
             return _undecided()
 
-    if _contains_every(a_items, b_items) and _contains_every(b_items, a_items):
+    # Two sets `CtySet.validate` made hold their members in the same canonical
+    # order, so equal sets usually pair off index by index. Each pair found
+    # equivalent is a member each side has, so a full pairing is equality
+    # without hashing or bucketing either side. Anything short of that -- a
+    # length that differs, a tie in the order laid out the other way round, a
+    # difference -- is settled by membership below, which is the answer.
+    if len(a_items) == len(b_items) and all(
+        _equals_item(x, y).value is True for x, y in zip(a_items, b_items, strict=True)
+    ):
+        return _bool(True)
+
+    from pyvider.cty.values.membership import member_buckets
+
+    if _contains_every(a_items, b_items, member_buckets(b)) and _contains_every(
+        b_items, a_items, member_buckets(a)
+    ):
         return _bool(True)
     return _bool(False)
 
@@ -397,7 +412,9 @@ def _bucket(member: Any) -> int:
         return 0
 
 
-def _contains_every(needles: tuple[Any, ...], haystack: tuple[Any, ...]) -> bool:
+def _contains_every(
+    needles: tuple[Any, ...], haystack: tuple[Any, ...], buckets: dict[int, tuple[Any, ...]]
+) -> bool:
     """Whether every needle has an *equivalent* in haystack. go-cty's `Set.Has`.
 
     Bucketed by hash, which is what go-cty's set package does and what
@@ -411,10 +428,10 @@ def _contains_every(needles: tuple[Any, ...], haystack: tuple[Any, ...]) -> bool
     re-checks the whole haystack instead of concluding from the hash. That keeps
     the result identical to the pairwise scan while paying for it at most once,
     because the first genuine miss ends the walk.
+
+    `buckets` is the haystack's `membership.member_buckets`, kept on the set
+    value, so a set compared again does not bucket its members again.
     """
-    buckets: dict[int, list[Any]] = {}
-    for candidate in haystack:
-        buckets.setdefault(_bucket(candidate), []).append(candidate)
 
     def equivalent_in(candidates: Any) -> bool:
         return any(_equals_item(needle, candidate).value is True for candidate in candidates)
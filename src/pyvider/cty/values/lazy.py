@@ -0,0 +1,148 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""An object payload that decodes each attribute from the wire on first read.
+
+A provider handed a large resource state often reads two attributes of it and
+passes the rest straight back: the plan carries the prior state through, a
+read returns most of what it was given. Decoding all of it into `CtyValue`s,
+and then encoding all of it again, is nearly the whole cost of such a call.
+
+`cty_from_msgpack_lazy` answers a `CtyValue` whose payload is one of these. It
+holds the payload bytes and, per top-level attribute, where that attribute's
+encoding starts and ends. Reading an attribute -- `value["name"]`,
+`CtyObject.get_attribute`, a path step, `deep_values` arriving at it --
+decodes that one attribute and keeps the result. `cty_to_msgpack` under the
+same schema copies each attribute's original bytes instead of encoding it,
+which is sound because neither side can change: the payload is immutable and
+bytes off the wire carry no marks.
+
+It is a `FrozenDict`, so every `isinstance(payload, dict)` test keeps passing.
+Lookups by name are lazy. Anything that needs every attribute -- `items()`,
+`values()`, `==`, `repr`, hashing the value, pickling it -- decodes the rest
+first, into exactly the dict the eager decoder builds, after which this is
+that dict. Only the top level is lazy; an attribute decodes whole.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from pyvider.cty.values.frozen import FrozenDict
+
+if TYPE_CHECKING:
+    from _collections_abc import dict_items, dict_keys, dict_values
+
+    from pyvider.cty.types import CtyObject, CtyType
+    from pyvider.cty.values.base import CtyValue
+
+
+class LazyObjectPayload(FrozenDict):
+    """An object's attributes, decoded from `source` one at a time as they are read.
+
+    The dict storage holds the attributes decoded so far; `spans` holds where
+    in `source` every attribute the payload carried is encoded. An optional
+    attribute the payload left out is a null, known up front.
+    """
+
+    __slots__ = ("_complete", "_decode", "_names", "_spans", "schema", "source")
+
+    def __init__(
+        self,
+        source: memoryview,
+        spans: dict[str, tuple[int, int]],
+        schema: CtyObject,
+        absent: dict[str, CtyValue[Any]],
+        decode: Callable[[memoryview, CtyType[Any]], CtyValue[Any]],
+    ) -> None:
+        dict.__init__(self, absent)
+        self.source = source
+        self.schema = schema
+        self._spans = spans
+        self._decode = decode
+        self._complete = not spans
+        # The schema's order, which is the order the eager decoder inserts in.
+        self._names = dict.fromkeys(name for name in schema.attribute_types if name in spans or name in absent)
+
+    def encoded(self, name: str) -> memoryview | None:
+        """`name`'s bytes as they arrived, or None for an attribute that was not sent."""
+        span = self._spans.get(name)
+        return None if span is None else self.source[span[0] : span[1]]
+
+    def decoded_values(self) -> tuple[Any, ...]:
+        """The attributes decoded so far -- all that can carry a mark."""
+        return tuple(dict.values(self))
+
+    def __missing__(self, name: str) -> CtyValue[Any]:
+        span = self._spans.get(name)
+        if span is None:
+            raise KeyError(name)
+        value = self._decode(self.source[span[0] : span[1]], self.schema.attribute_types[name])
+        # `setdefault` is atomic: two threads decoding one attribute keep one answer.
+        return dict.setdefault(self, name, value)
+
+    def _materialize(self) -> None:
+        if self._complete:
+            return
+        # Rebuilt rather than topped up, so the storage ends in schema order
+        # whatever order the attributes were first read in.
+        decoded = {name: self[name] for name in self._names}
+        dict.clear(self)
+        dict.update(self, decoded)
+        self._complete = True
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name in self._names:
+            return self[name]
+        return default
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __reversed__(self) -> Iterator[str]:
+        return reversed(self._names)
+
+    def keys(self) -> dict_keys[str, Any]:
+        return self._names.keys()
+
+    def values(self) -> dict_values[str, Any]:
+        self._materialize()
+        return dict.values(self)
+
+    def items(self) -> dict_items[str, Any]:
+        self._materialize()
+        return dict.items(self)
+
+    def __eq__(self, other: object) -> bool:
+        self._materialize()
+        if isinstance(other, LazyObjectPayload):
+            other._materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __or__(self, other: Any) -> Any:
+        return dict(self.items()) | other
+
+    def __ror__(self, other: Any) -> Any:
+        return other | dict(self.items())
+
+    def __repr__(self) -> str:
+        self._materialize()
+        return dict.__repr__(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (FrozenDict, (dict(self.items()),))
+
+
+# 🌊🪢🔚
@@ -26,6 +26,12 @@ class UnrefinedUnknownValue(UnknownValue):
     def __repr__(self) -> str:
         return "UNREFINED_UNKNOWN"
 
+    def __reduce__(self) -> str:
+        # The singleton by name, so an unpickled unknown -- one sent back from
+        # a worker process -- is `UNREFINED_UNKNOWN` itself rather than a
+        # second instance that compares unequal to it.
+        return "UNREFINED_UNKNOWN"
+
 
 @define(frozen=True, slots=True, auto_attribs=True, match_args=True)
 class RefinedUnknownValue(UnknownValue):
@@ -0,0 +1,202 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Hashed views of a set's, list's or tuple's members, built on first ask and kept on the value.
+
+Membership was a scan everywhere it was asked. `contains` compared the needle
+with each element in turn, a set path step (`KeyStep`) searched the payload
+tuple, `sethaselement` worked out every member's identity key on every call,
+`Equals` on two sets bucketed the right-hand side's members afresh, and
+`setintersection` and `setsubtract` built a frozenset of each argument per
+call. A nested-block set is asked these questions over and over within one
+plan, and each time paid for the whole set.
+
+Each view is built once per value and kept in `CtyValue._members`, by name:
+
+ - `by_value`: the members, hashed as Python hashes them. `x in by_value` is
+   `x in payload` -- the hash is consistent with `==` -- without the walk;
+ - `by_identity`: each member's `set_order.identity_key`, which is cty's set
+   membership, bucket first (`sethaselement`);
+ - `buckets`: the members grouped by `equality._bucket`, for `Equals`;
+ - `undecided`: the members `==` cannot settle a `contains` against, which
+   still go through `equals` one by one;
+ - `ordered`: each member beside its `set_order.order_key`, for the set
+   functions' merges -- or None for a payload not in that order, or holding
+   an unknown member.
+
+Kept only where `collect_marks_deep` could memoize the value, which it does
+only for a subtree it proved immutable -- the rule `_deep_marks` and
+`_encoded` already follow. A member's hash is over its whole subtree, so a
+view over anything that can still change in place could answer for a value
+that no longer exists. Otherwise each view is built per call, as before.
+
+Nor over a capsule, anywhere in the members, as the encoders' fragment memo
+already decides. Its payload is an arbitrary Python object that proof says
+nothing about, and its `equal_fn` and `hash_fn` read whatever that object
+holds now.
+
+The memo is replaced whole, never updated in place, so a concurrent reader
+sees one mapping or the other.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
+from itertools import pairwise
+from typing import Any, cast
+
+from pyvider.cty.config.defaults import MEMBERSHIP_CAPSULE_CACHE_SIZE
+from pyvider.cty.values.base import CtyValue
+
+# Payloads that can hide an unknown below the top level. A CtyValue holding
+# anything else is a leaf, so `is_unknown` is the complete answer for it.
+_NESTING_PAYLOADS = (CtyValue, dict, list, tuple, set, frozenset)
+
+
+def _is_known_leaf(value: CtyValue[Any]) -> bool:
+    """Wholly known and non-null, decided without a walk.
+
+    Nulls are excluded deliberately. `CtyValue.__eq__` requires the types to
+    match, but `equals` treats nulls of any type as equal, as go-cty does -- so
+    the `==` shortcut disagrees with the real comparison for a null of one type
+    searched for in a collection of another. False here means "ask properly".
+    """
+    return not value.is_unknown and not value.is_null and not isinstance(value.value, _NESTING_PAYLOADS)
+
+
+def members_by_value(collection: CtyValue[Any]) -> frozenset[Any] | None:
+    """The members as a frozenset, or None if one of them will not hash.
+
+    A `CtyValue` always hashes; only a raw member of a hand-built payload can
+    refuse, and for that the caller scans as before.
+    """
+    return cast("frozenset[Any] | None", _view(collection, "by_value", _by_value))
+
+
+def members_by_identity(collection: CtyValue[Any]) -> frozenset[tuple[Any, ...]]:
+    """Every member's `identity_key`, which is what `sethaselement` compares."""
+    return cast("frozenset[tuple[Any, ...]]", _view(collection, "by_identity", _by_identity))
+
+
+def member_buckets(collection: CtyValue[Any]) -> dict[int, tuple[Any, ...]]:
+    """The members grouped by `equality._bucket`, in payload order within a bucket."""
+    return cast("dict[int, tuple[Any, ...]]", _view(collection, "buckets", _buckets))
+
+
+def undecided_members(collection: CtyValue[Any]) -> tuple[Any, ...]:
+    """The members that could be `equals` to a wholly known needle without being `==` to it.
+
+    Anything but a known, non-null leaf: a container can hide an unknown, and
+    a raw member has no type to say so.
+    """
+    return cast("tuple[Any, ...]", _view(collection, "undecided", _undecided))
+
+
+def ordered_members(collection: CtyValue[Any]) -> tuple[tuple[tuple[Any, ...], Any], ...] | None:
+    """Every member beside its `order_key`, if the payload is in that order and wholly decided.
+
+    `CtySet.validate` always lays a set out this way; a hand-built payload may
+    not be, and an unknown member has no place in the order to merge by, so
+    those answer None. Checked rather than trusted, and kept like the rest.
+    """
+    return cast("tuple[tuple[tuple[Any, ...], Any], ...] | None", _view(collection, "ordered", _ordered))
+
+
+def _view(collection: CtyValue[Any], name: str, build: Callable[[tuple[Any, ...]], Any]) -> Any:
+    kept = collection._members
+    if kept is not None and name in kept:
+        return kept[name]
+    view = build(tuple(cast("Iterable[Any]", collection.value or ())))
+    if _immutable(collection):
+        object.__setattr__(collection, "_members", {**(collection._members or {}), name: view})
+    return view
+
+
+def _immutable(collection: CtyValue[Any]) -> bool:
+    from pyvider.cty.marks import collect_marks_deep
+
+    if collection._deep_marks is None:
+        collect_marks_deep(collection)
+    return collection._deep_marks is not None and not _holds_capsule(collection)
+
+
+def _holds_capsule(collection: CtyValue[Any]) -> bool:
+    """Whether a capsule is anywhere below `collection`: from its type, or where that says `dynamic`, its values."""
+    verdict = _type_holds_capsule(collection.vtype)
+    if verdict is not None:
+        return verdict
+    from pyvider.cty.types import CtyCapsule
+
+    stack: list[Any] = [collection]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, CtyValue):
+            if isinstance(node.vtype, CtyCapsule):
+                return True
+            stack.append(node.value)
+        elif isinstance(node, tuple | frozenset):
+            stack.extend(node)
+        elif isinstance(node, Mapping):
+            stack.extend(node.values())
+    return False
+
+
+@lru_cache(maxsize=MEMBERSHIP_CAPSULE_CACHE_SIZE)
+def _type_holds_capsule(vtype: Any) -> bool | None:
+    """True if `vtype` is or contains a capsule, None if only its values can say (a `dynamic` in it), else False."""
+    from pyvider.cty.types import CtyCapsule, CtyDynamic
+
+    verdict: bool | None = False
+    stack = [vtype]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, CtyCapsule):
+            return True
+        if isinstance(node, CtyDynamic):
+            verdict = None
+        elif (structure := node._structure()) is not None:
+            stack.extend(structure[1])
+    return verdict
+
+
+def _by_value(members: tuple[Any, ...]) -> frozenset[Any] | None:
+    try:
+        return frozenset(members)
+    except TypeError:
+        return None
+
+
+def _by_identity(members: tuple[Any, ...]) -> frozenset[tuple[Any, ...]]:
+    from pyvider.cty.values.set_order import identity_key
+
+    return frozenset(identity_key(member) for member in members)
+
+
+def _buckets(members: tuple[Any, ...]) -> dict[int, tuple[Any, ...]]:
+    from pyvider.cty.values.equality import _bucket
+
+    grouped: dict[int, list[Any]] = {}
+    for member in members:
+        grouped.setdefault(_bucket(member), []).append(member)
+    return {bucket: tuple(group) for bucket, group in grouped.items()}
+
+
+def _ordered(members: tuple[Any, ...]) -> tuple[tuple[tuple[Any, ...], Any], ...] | None:
+    from pyvider.cty.values.set_order import order_key
+
+    if any(not isinstance(member, CtyValue) or member.is_unknown for member in members):
+        return None
+    keyed = tuple((order_key(member), member) for member in members)
+    if any(later < earlier for (earlier, _), (later, _) in pairwise(keyed)):
+        return None
+    return keyed
+
+
+def _undecided(members: tuple[Any, ...]) -> tuple[Any, ...]:
+    return tuple(member for member in members if not (isinstance(member, CtyValue) and _is_known_leaf(member)))
+
+
+# 🌊🪢🔚
@@ -41,9 +41,10 @@ place go-cty guarantees nothing.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Sequence
 from decimal import Decimal, localcontext
-from typing import TYPE_CHECKING, Any, cast
+from functools import cache
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 if TYPE_CHECKING:
     from pyvider.cty.values.base import CtyValue
@@ -65,6 +66,53 @@ _GO_ESCAPES = {
 
 # `big.Float.String()` is `Text('g', 10)`.
 _GO_FLOAT_DIGITS = 10
+_GO_INT_TEXT_LIMIT = 10**_GO_FLOAT_DIGITS
+
+# Payloads `_kept` builds keys for afresh every time.
+_PLAIN_LEAVES = frozenset({str, bool, int, Decimal, type(None)})
+
+
+class _Bound(NamedTuple):
+    CtyBool: Any
+    CtyCapsule: Any
+    CtyDynamic: Any
+    CtyList: Any
+    CtyMap: Any
+    CtyNumber: Any
+    CtyObject: Any
+    CtySet: Any
+    CtyString: Any
+    CtyTuple: Any
+    CtyValue: Any
+    collect_marks_deep: Any
+
+
+@cache
+def _bound() -> _Bound:
+    """The type classes, `CtyValue` and `collect_marks_deep`, imported on first use.
+
+    Each of those modules imports this one, so none can be imported at load
+    time; and an import statement per element hashed or keyed showed in
+    profiles of `CtySet.validate`.
+    """
+    from pyvider.cty import types
+    from pyvider.cty.marks import collect_marks_deep
+    from pyvider.cty.values.base import CtyValue
+
+    return _Bound(
+        types.CtyBool,
+        types.CtyCapsule,
+        types.CtyDynamic,
+        types.CtyList,
+        types.CtyMap,
+        types.CtyNumber,
+        types.CtyObject,
+        types.CtySet,
+        types.CtyString,
+        types.CtyTuple,
+        CtyValue,
+        collect_marks_deep,
+    )
 
 
 def go_quoted(text: str) -> str:
@@ -76,6 +124,10 @@ def go_quoted(text: str) -> str:
     is escaped here in Go's spelling -- `\\x` below 0x80, `\\u` below 0x10000,
     `\\U` above -- so the bytes compare the same way.
     """
+    if text.isprintable() and '"' not in text and "\\" not in text:
+        # Nothing to escape, which is nearly every string: every other key of
+        # `_GO_ESCAPES` is a character `isprintable` refuses.
+        return f'"{text}"'
     out = ['"']
     for char in text:
         escape = _GO_ESCAPES.get(char)
@@ -95,14 +147,21 @@ def go_quoted(text: str) -> str:
     return "".join(out)
 
 
-def go_number_text(number: Decimal) -> str:
+def go_number_text(number: Decimal | int) -> str:
     """A number the way `big.Float.String()` writes it: `Text('g', 10)`.
 
     Ten significant digits, trailing zeros removed, and the C rule for which
     notation to use -- exponent form when the decimal exponent is below -4 or at
     least the precision. So 1e10 is `1e+10` and 0.0001 is `0.0001`, and
     2**100 + 1 is `1.2676506e+30` however many digits it actually has.
+
+    An `int` payload of at most ten digits is already that text, which is
+    every count, port and size a set of objects is ordered by.
     """
+    if not isinstance(number, Decimal):
+        if -_GO_INT_TEXT_LIMIT < number < _GO_INT_TEXT_LIMIT:
+            return str(number)
+        number = Decimal(number)
     if number.is_nan():
         # go-cty's `big.Float` cannot hold one, so this is unreachable through a
         # value go-cty would accept; spelled rather than raising, because a sort
@@ -137,24 +196,16 @@ def _append_hash(value: CtyValue[Any], out: list[str]) -> None:
     Marks are stripped there before hashing and are absent here for the same
     reason: a mark is not part of a value for equality, and so not for order.
     """
-    from pyvider.cty.types import (
-        CtyBool,
-        CtyCapsule,
-        CtyDynamic,
-        CtyList,
-        CtyMap,
-        CtyNumber,
-        CtyObject,
-        CtySet,
-        CtyString,
-        CtyTuple,
-    )
-    from pyvider.cty.values.base import CtyValue as _CtyValue
+    b = _bound()
 
+    kept = value._set_keys
+    if kept is not None and "hash_bytes" in kept:
+        out.append(kept["hash_bytes"])
+        return
     value = value.unmark()[0] if value.marks else value
     # A `dynamic` position holds the concrete value, and that is what go-cty
     # would have been handed in the first place.
-    while isinstance(value.type, CtyDynamic) and isinstance(value.value, _CtyValue):
+    while isinstance(value.type, b.CtyDynamic) and isinstance(value.value, b.CtyValue):
         value = value.value
 
     if value.is_unknown:
@@ -165,18 +216,21 @@ def _append_hash(value: CtyValue[Any], out: list[str]) -> None:
         return
 
     match value.type:
-        case CtyNumber():
-            out.append(go_number_text(value.value if isinstance(value.value, Decimal) else Decimal(0)))
-        case CtyBool():
+        case b.CtyNumber():
+            number = value.value
+            out.append(
+                go_number_text(number if isinstance(number, Decimal) or type(number) is int else Decimal(0))
+            )
+        case b.CtyBool():
             out.append("T" if value.value else "F")
-        case CtyString():
+        case b.CtyString():
             out.append(go_quoted(str(value.value)))
-        case CtyCapsule():
+        case b.CtyCapsule():
             # go-cty writes `?` for a capsule with no `HashKey` op, which is
             # every capsule this package defines, so every capsule value hashes
             # alike and the tie-break in `order_key` decides.
             out.append("«?»")
-        case CtyMap() | CtyList() | CtySet() | CtyObject() | CtyTuple():
+        case b.CtyMap() | b.CtyList() | b.CtySet() | b.CtyObject() | b.CtyTuple():
             _append_container_hash(value, out)
         case _:
             out.append(repr(value.value))
@@ -184,13 +238,13 @@ def _append_hash(value: CtyValue[Any], out: list[str]) -> None:
 
 def _append_container_hash(value: CtyValue[Any], out: list[str]) -> None:
     """The three bracketings go-cty uses, and what goes between them."""
-    from pyvider.cty.types import CtyList, CtyMap, CtyObject, CtySet
+    b = _bound()
 
-    if isinstance(value.type, CtyMap | CtyObject):
+    if isinstance(value.type, b.CtyMap | b.CtyObject):
         mapping = cast("dict[Any, Any]", value.value)
         # A map hashes its keys as values and an object hashes only the
         # attribute values, both in name order.
-        if isinstance(value.type, CtyMap):
+        if isinstance(value.type, b.CtyMap):
             out.append("{")
             for key in sorted(mapping, key=str):
                 _append_hash_member(key, out)
@@ -207,11 +261,11 @@ def _append_container_hash(value: CtyValue[Any], out: list[str]) -> None:
         return
 
     sequence = cast("Iterable[Any]", value.value)
-    if isinstance(value.type, CtyList | CtySet):
+    if isinstance(value.type, b.CtyList | b.CtySet):
         out.append("[")
         # A set's own members are hashed in this same order, so that two equal
         # sets nested inside a set hash alike however they were built.
-        members = sorted(sequence, key=order_key) if isinstance(value.type, CtySet) else list(sequence)
+        members = in_order(value) if isinstance(value.type, b.CtySet) else sequence
         for member in members:
             _append_hash_member(member, out)
             out.append(";")
@@ -233,9 +287,7 @@ def _append_hash_member(member: object, out: list[str]) -> None:
     dict here holds the key as a plain `str`. Anything else a hand-built value
     might be carrying falls back to its repr, which is orderable and stable.
     """
-    from pyvider.cty.values.base import CtyValue as _CtyValue
-
-    if isinstance(member, _CtyValue):
+    if isinstance(member, _bound().CtyValue):
         _append_hash(member, out)
     elif isinstance(member, str):
         out.append(go_quoted(member))
@@ -249,7 +301,13 @@ def hash_bytes(value: CtyValue[Any]) -> str:
     Compared as a Python string rather than as bytes, which is the same order:
     UTF-8 preserves code-point order, and every character Go escapes is escaped
     into ASCII by `go_quoted` before it can matter.
+
+    Kept on the value, like the two keys below; see `_kept`.
     """
+    return cast(str, _kept(value, "hash_bytes", _hash_bytes))
+
+
+def _hash_bytes(value: CtyValue[Any]) -> str:
     out: list[str] = []
     _append_hash(value, out)
     return "".join(out)
@@ -263,26 +321,30 @@ def order_key(value: object) -> tuple[Any, ...]:
     directly, and everything else by its hash bytes, with the canonical key
     breaking a tie so the order stays total.
     """
-    from pyvider.cty.types import CtyBool, CtyDynamic, CtyNumber, CtyString
-    from pyvider.cty.values.base import CtyValue as _CtyValue
+    b = _bound()
 
-    if not isinstance(value, _CtyValue):
+    if not isinstance(value, b.CtyValue):
         # Ranked -1 for the same reason `_member_key` does: a raw member sorts
         # ahead of every real type rank rather than interleaving with them.
         return (0, -1, repr(value))
+    element = cast("CtyValue[Any]", value)
 
-    while isinstance(value.type, CtyDynamic) and isinstance(value.value, _CtyValue):
-        value = value.value
+    while isinstance(element.type, b.CtyDynamic) and isinstance(element.value, b.CtyValue):
+        element = element.value
 
-    if value.is_null:
+    if element.is_null:
         return (2,)
-    if value.is_unknown:
+    if element.is_unknown:
         return (1,)
 
-    type_rank = value.type._type_order
-    if isinstance(value.type, CtyBool | CtyNumber | CtyString):
-        return (0, type_rank, value.value)
-    return (0, type_rank, hash_bytes(value), value._canonical_sort_key())
+    type_rank = element.type._type_order
+    if isinstance(element.type, b.CtyBool | b.CtyNumber | b.CtyString):
+        return (0, type_rank, element.value)
+    return cast("tuple[Any, ...]", _kept(element, "order", _composite_order_key))
+
+
+def _composite_order_key(value: CtyValue[Any]) -> tuple[Any, ...]:
+    return (0, value.type._type_order, hash_bytes(value), value._canonical_sort_key())
 
 
 def identity_key(value: CtyValue[Any]) -> tuple[Any, ...]:
@@ -306,7 +368,54 @@ def identity_key(value: CtyValue[Any]) -> tuple[Any, ...]:
 
     Found 2026-08-19 by the stdlib fuzz, through `sethaselement`.
     """
+    return cast("tuple[Any, ...]", _kept(value, "identity", _identity_key))
+
+
+def _identity_key(value: CtyValue[Any]) -> tuple[Any, ...]:
     return (hash_bytes(value), value._canonical_sort_key())
 
 
+def in_order(value: CtyValue[Any]) -> Sequence[Any]:
+    """A set's members in the order go-cty iterates them: `order_key`'s.
+
+    `CtySet.validate` and the decoders lay a set out in that order already, so
+    a payload the `ordered` membership view finds in order is handed back as it
+    is rather than sorted again -- the view is kept on the value, so asking is
+    free from the second time on. A frozenset, a hand-built tuple and a set
+    holding an unknown member are sorted, on keys their members keep.
+    """
+    from pyvider.cty.values.membership import ordered_members
+
+    members = value.value
+    if isinstance(members, tuple) and ordered_members(value) is not None:
+        return members
+    return sorted(cast("Iterable[Any]", members or ()), key=order_key)
+
+
+def _kept(value: CtyValue[Any], name: str, build: Callable[[CtyValue[Any]], Any]) -> Any:
+    """`build(value)`, kept in `value._set_keys` under `name`.
+
+    Every element of a set has its keys worked out on the way in, by
+    `validate` or a decoder, and they used to be worked out again by every
+    encoder, `walk` and set function that ordered the same set. Kept under the
+    rule `collect_marks_deep` memoizes by, and replaced whole, as the other
+    memos on `CtyValue` are: a key over a payload that can still change in
+    place could go stale.
+
+    Not for a string, number or bool, or a null: their keys cost less to
+    build again than to keep, and a set of strings is the commonest set.
+    """
+    if type(value.value) in _PLAIN_LEAVES:
+        return build(value)
+    kept = value._set_keys
+    if kept is not None and name in kept:
+        return kept[name]
+    key = build(value)
+    if value._deep_marks is None:
+        _bound().collect_marks_deep(value)
+    if value._deep_marks is not None:
+        object.__setattr__(value, "_set_keys", {**(value._set_keys or {}), name: key})
+    return key
+
+
 # 🌊🪢🔚
@@ -47,7 +47,9 @@ from pyvider.cty.types import (
 )
 from pyvider.cty.types.structural.dynamic import unwrap_dynamic
 from pyvider.cty.values import CtyValue
-from pyvider.cty.values.set_order import order_key as set_order_key
+from pyvider.cty.values.columnar import ColumnarRows, columnar
+from pyvider.cty.values.frozen import FrozenDict
+from pyvider.cty.values.set_order import in_order as set_in_order
 
 __all__ = ["deep_values", "transform", "walk"]
 
@@ -94,9 +96,10 @@ def _child_steps(value: CtyValue[Any]) -> list[tuple[PathStep, CtyValue[Any]]]:
         # one IndexStep into an int-keyed IndexStep and a KeyStep, so the
         # key-addressed half is the one that fits.
         #
-        # Sorted because a frozenset has no order to report, and a traversal
-        # whose output changes between runs is not one you can test or diff.
-        elements = sorted(cast(Any, inner.value), key=set_order_key)
+        # In set order because a frozenset has no order to report, and a
+        # traversal whose output changes between runs is not one you can test
+        # or diff. A validated set is in it already and is not sorted again.
+        elements = set_in_order(inner)
         return [(KeyStep(element), element) for element in elements]
     return []
 
@@ -158,6 +161,40 @@ def _payload_key(step: PathStep) -> Any:
     raise TypeError(f"cannot rebuild a keyed container from {type(step).__name__}")
 
 
+def _trusted_rebuild(vtype: CtyType[Any], payload: Any, children: list[CtyValue[Any]]) -> CtyValue[Any] | None:
+    """The rebuilt container, built directly, when `validate` would only hand it back; else None.
+
+    Every child of a list, map or object that still has exactly the type its
+    position declares is a value `validate` would accept as it is, so the
+    container `validate` would build from them is the payload as given -- an
+    object's in declared attribute order, which is the order `validate` builds
+    in. A tuple's type is derived from its children, so it always qualifies.
+    A set never does: `validate` re-deduplicates it and hoists its elements'
+    marks. Anything else, including a child whose type changed and must be
+    refused, goes through `validate`.
+    """
+    if isinstance(vtype, CtyTuple):
+        return CtyValue._trusted(_rebuilt_type(vtype, children), tuple(children))
+    if isinstance(vtype, CtyList):
+        element_type = vtype.element_type
+        if all(child.type == element_type for child in children):
+            return CtyValue._trusted(vtype, tuple(children))
+        return None
+    if isinstance(vtype, CtyMap):
+        element_type = vtype.element_type
+        if all(child.type == element_type for child in children):
+            return CtyValue._trusted(vtype, FrozenDict(payload))
+        return None
+    if isinstance(vtype, CtyObject):
+        attribute_types = vtype.attribute_types
+        if len(payload) == len(attribute_types) and all(
+            name in payload and payload[name].type == attribute_type
+            for name, attribute_type in attribute_types.items()
+        ):
+            return CtyValue._trusted(vtype, FrozenDict((name, payload[name]) for name in attribute_types))
+    return None
+
+
 def _rebuild(
     original: CtyValue[Any],
     child_steps: list[tuple[PathStep, CtyValue[Any]]],
@@ -191,12 +228,18 @@ def _rebuild(
     else:
         payload = children
 
-    rebuilt = _rebuilt_type(vtype, children).validate(payload)
+    rebuilt = _trusted_rebuild(vtype, payload, children)
+    if rebuilt is None:
+        rebuilt = _rebuilt_type(vtype, children).validate(payload)
     # Marks live on the value, so a rebuild has to put the container's own back.
     # Element marks travel with the elements, except on a set, where `validate`
     # hoists them onto the set exactly as go-cty's `SetVal` does.
     if inner.marks:
         rebuilt = rebuilt.with_marks(inner.marks)
+    # A columnar list or set stays columnar: rebuilt from its changed rows, it
+    # would otherwise come back holding every row as a value.
+    if type(inner.value) is ColumnarRows:
+        rebuilt = columnar(rebuilt)
     if inner is original:
         return rebuilt
     # Put the dynamic wrapper back on, since the caller's value was typed that
@@ -0,0 +1,96 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""The batch codecs answer what a loop over the single-value codecs answers.
+
+Same bytes, same values, same order, and the same first error -- whether the
+batch runs here or is fanned out across a process pool. The break these tests
+catch is shared per-batch state leaking between values (a packer not reset, a
+conversion decision reused for a different type) or a fan-out that reorders
+chunks.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+import pickle
+from typing import Any
+
+import pytest
+
+from pyvider.cty import CtyDynamic, CtyList, CtyNumber, CtyObject, CtyString, CtyValue
+from pyvider.cty.codec import cty_from_msgpack, cty_from_msgpack_many, cty_to_msgpack, cty_to_msgpack_many
+from pyvider.cty.config.defaults import CODEC_BATCH_PARALLEL_THRESHOLD
+from pyvider.cty.exceptions import CtyMarksSerializationError, CtyValidationError
+from pyvider.cty.json_codec import cty_from_json, cty_from_json_many, cty_to_json, cty_to_json_many
+from pyvider.cty.values.markers import UNREFINED_UNKNOWN
+
+SCHEMA = CtyObject(
+    attribute_types={
+        "name": CtyString(),
+        "size": CtyNumber(),
+        "tags": CtyList(element_type=CtyString()),
+        "extra": CtyDynamic(),
+    }
+)
+
+
+def _instances(count: int) -> list[CtyValue[Any]]:
+    return [
+        SCHEMA.validate({"name": f"vm-{i}", "size": i, "tags": ["a"] * (i % 3), "extra": {"n": i}})
+        for i in range(count)
+    ]
+
+
+def test_msgpack_batch_is_the_loop() -> None:
+    values = [*_instances(20), CtyValue.unknown(SCHEMA), CtyValue.null(SCHEMA)]
+    encoded = cty_to_msgpack_many(values, SCHEMA)
+    assert encoded == [cty_to_msgpack(value, SCHEMA) for value in values]
+    assert cty_from_msgpack_many(encoded, SCHEMA) == [cty_from_msgpack(data, SCHEMA) for data in encoded]
+
+
+def test_json_batch_is_the_loop() -> None:
+    values = _instances(20)
+    encoded = cty_to_json_many(values, SCHEMA)
+    assert encoded == [cty_to_json(value, SCHEMA) for value in values]
+    assert cty_from_json_many(encoded, SCHEMA) == [cty_from_json(data, SCHEMA) for data in encoded]
+
+
+def test_json_batch_converts_per_value_type() -> None:
+    # Two value types in one batch; only one of them needs converting.
+    loose = CtyObject(attribute_types={"n": CtyString()})
+    target = CtyObject(attribute_types={"n": CtyNumber()})
+    values = [target.validate({"n": 1}), loose.validate({"n": "2"}), target.validate({"n": 3})]
+    assert cty_to_json_many(values, target) == [cty_to_json(value, target) for value in values]
+
+
+def test_the_first_failure_is_the_one_raised() -> None:
+    values = _instances(3)
+    values.insert(1, values[0].mark("sensitive"))
+    with pytest.raises(CtyMarksSerializationError):
+        cty_to_msgpack_many(values, SCHEMA)
+
+    payloads = cty_to_msgpack_many(_instances(3), SCHEMA)
+    with pytest.raises(CtyValidationError):
+        cty_from_msgpack_many([payloads[0], cty_to_msgpack(CtyString().validate("x"), CtyString())], SCHEMA)
+
+
+def test_the_unknown_singleton_survives_pickling() -> None:
+    assert pickle.loads(pickle.dumps(UNREFINED_UNKNOWN)) is UNREFINED_UNKNOWN  # noqa: S301
+
+
+@pytest.mark.slow
+def test_a_process_pool_answers_the_same_in_the_same_order() -> None:
+    values = [*_instances(CODEC_BATCH_PARALLEL_THRESHOLD + 5), CtyValue.unknown(SCHEMA)]
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        encoded = cty_to_msgpack_many(values, SCHEMA, executor=pool)
+        decoded = cty_from_msgpack_many(encoded, SCHEMA, executor=pool)
+        as_json = cty_to_json_many(values[:-1], SCHEMA, executor=pool)
+    assert encoded == cty_to_msgpack_many(values, SCHEMA)
+    assert decoded == values
+    assert as_json == cty_to_json_many(values[:-1], SCHEMA)
+
+
+# 🌊🪢🔚
@@ -0,0 +1,114 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""`cty_from_msgpack` builds values through a plan compiled per schema.
+
+The plan only vouches for the shapes an encoder writes and sends everything
+else back to `validate` from the root. The break these tests catch is a plan
+that accepts something and builds a different value from the one `validate`
+builds, or that answers an error `validate` would not have answered.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+import unicodedata
+
+import msgpack
+import pytest
+
+from pyvider.cty import (
+    CtyBool,
+    CtyDynamic,
+    CtyList,
+    CtyMap,
+    CtyNumber,
+    CtyObject,
+    CtySet,
+    CtyString,
+    CtyTuple,
+    CtyValue,
+)
+from pyvider.cty.codec import _decoder_plan, _ext_hook, _OffPlan, cty_from_msgpack, cty_to_msgpack
+from pyvider.cty.exceptions import CtyValidationError
+
+INNER = CtyObject(attribute_types={"cidr": CtyString(), "any": CtyDynamic()})
+SCHEMA = CtyObject(
+    attribute_types={
+        "name": CtyString(),
+        "port": CtyNumber(),
+        "on": CtyBool(),
+        "tags": CtyMap(element_type=CtyString()),
+        "ids": CtySet(element_type=CtyNumber()),
+        "rules": CtyList(element_type=INNER),
+        "pair": CtyTuple(element_types=(CtyString(), CtyNumber())),
+        "note": CtyString(),
+    },
+    optional_attributes=frozenset({"note"}),
+)
+
+RAW: dict[str, Any] = {
+    "name": "café",
+    "port": 8080,
+    "on": True,
+    "tags": {"b": "2", "a": "1"},
+    "ids": [3, 1, 2, 2**70, Decimal("0.1")],
+    "rules": [{"cidr": "10.0.0.0/8", "any": {"k": [1, 2]}}, {"cidr": "0.0.0.0/0", "any": None}],
+    "pair": ("x", 1),
+}
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        SCHEMA.validate(RAW),
+        SCHEMA.validate({**RAW, "tags": None, "ids": [], "note": "n"}),
+        SCHEMA.validate({**RAW, "ids": [CtyValue.unknown(CtyNumber()), CtyValue.unknown(CtyNumber()), 1]}),
+        SCHEMA.validate({**RAW, "rules": CtyValue.unknown(SCHEMA.attribute_types["rules"])}),
+    ],
+)
+def test_plan_builds_what_validate_builds(value: CtyValue[Any]) -> None:
+    payload = msgpack.unpackb(cty_to_msgpack(value, SCHEMA), ext_hook=_ext_hook, raw=False)
+    built = _decoder_plan(SCHEMA)(payload)
+    assert built == SCHEMA.validate(payload)
+    assert built == value
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        {"cidr": "x", "any": None, "extra": 1},
+        {"cidr": "x"},
+        {"cidr": "x", "any": None, unicodedata.normalize("NFD", "café"): 1},
+        {"cidr": b"x", "any": None},
+        {"cidr": "x", "any": [b"not json", 1]},
+    ],
+)
+def test_off_plan_shapes_are_left_to_validate(raw: dict[Any, Any]) -> None:
+    with pytest.raises(_OffPlan):
+        _decoder_plan(INNER)(raw)
+
+
+def test_errors_are_the_ones_validate_raises() -> None:
+    schema = CtyList(element_type=INNER)
+    data = msgpack.packb([{"cidr": "a", "any": None}, {"cidr": 1, "any": None}])
+    with pytest.raises(CtyValidationError) as decoded:
+        cty_from_msgpack(data, schema)
+    with pytest.raises(CtyValidationError) as validated:
+        schema.validate(msgpack.unpackb(data))
+    assert type(decoded.value) is type(validated.value)
+    assert str(decoded.value) == str(validated.value)
+    assert decoded.value.path == validated.value.path
+
+
+def test_a_lenient_reading_still_decodes() -> None:
+    # Not what an encoder writes, so off the plan -- but `validate` accepts it,
+    # and so does the decoder.
+    decoded = cty_from_msgpack(msgpack.packb({"b": "true"}), CtyObject(attribute_types={"b": CtyBool()}))
+    assert decoded.value["b"].value is True
+
+
+# 🌊🪢🔚
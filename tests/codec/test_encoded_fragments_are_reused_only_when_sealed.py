@@ -0,0 +1,102 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Encoders keep a container's encoding on it, and only when it cannot change.
+
+A kept fragment is reused verbatim by every later encoding under the same
+schema, so the break that matters is a stale one: a fragment kept over a
+subtree that was mutated in place afterwards, or one that outlives a mark.
+The other break is a reused fragment that is not byte-for-byte what encoding
+the subtree afresh writes.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import msgpack
+import pytest
+
+from pyvider.cty import CtyList, CtyMap, CtyNumber, CtyObject, CtyString, CtyValue
+from pyvider.cty.codec import _convert_value_to_serializable, _msgpack_default_handler, cty_to_msgpack
+from pyvider.cty.exceptions import CtyMarksSerializationError
+from pyvider.cty.json_codec import CtyJsonError, cty_to_json
+from pyvider.cty.types import BytesCapsule
+
+ROW = CtyObject(attribute_types={"name": CtyString(), "size": CtyNumber()})
+SCHEMA = CtyObject(attribute_types={"id": CtyString(), "rows": CtyList(element_type=ROW)})
+RAW = {"id": "a", "rows": [{"name": f"row-{i:04d}", "size": i} for i in range(100)]}
+
+
+def _walked(value: CtyValue[Any], schema: Any) -> bytes:
+    return msgpack.packb(
+        _convert_value_to_serializable(value, schema), default=_msgpack_default_handler, use_bin_type=True
+    )
+
+
+def _with_id(value: CtyValue[Any], new_id: str) -> CtyValue[Any]:
+    return CtyValue(vtype=SCHEMA, value={**value.value, "id": CtyString().validate(new_id)})  # type: ignore[dict-item]
+
+
+def test_a_shared_subtree_is_encoded_once() -> None:
+    value = SCHEMA.validate(RAW)
+    first = cty_to_msgpack(value, SCHEMA)
+    rows = value.value["rows"]  # type: ignore[index]
+    assert rows._encoded is not None
+    assert "msgpack" in rows._encoded
+
+    changed = _with_id(value, "b")
+    assert cty_to_msgpack(changed, SCHEMA) == _walked(changed, SCHEMA)
+    assert cty_to_msgpack(value, SCHEMA) == first
+
+
+def test_json_keeps_its_own_fragment() -> None:
+    value = SCHEMA.validate(RAW)
+    first = cty_to_json(value, SCHEMA)
+    assert "json" in value.value["rows"]._encoded  # type: ignore[index]
+    assert cty_to_json(value, SCHEMA) == first
+    changed = _with_id(value, "b")
+    assert cty_to_json(changed, SCHEMA) == cty_to_json(SCHEMA.validate({**RAW, "id": "b"}), SCHEMA)
+
+
+def test_nothing_is_kept_over_a_mutable_member() -> None:
+    # Hand-built, holding a raw dict the caller can still change.
+    member: dict[str, Any] = {"k": "v" * 300}
+    schema = CtyList(element_type=CtyMap(element_type=CtyString()))
+    value = CtyValue(vtype=schema, value=(member,))
+    before = cty_to_msgpack(value, schema)
+    assert value._encoded is None
+    member["k"] = "w" * 300
+    assert cty_to_msgpack(value, schema) != before
+
+
+def test_nothing_is_kept_over_a_capsule() -> None:
+    schema = CtyList(element_type=BytesCapsule)
+    value = schema.validate([b"x" * 300])
+    cty_to_msgpack(value, schema)
+    assert value._encoded is None
+
+
+def test_a_mark_is_not_inherited_from_a_kept_fragment() -> None:
+    value = SCHEMA.validate(RAW)
+    cty_to_msgpack(value, SCHEMA)
+    cty_to_json(value, SCHEMA)
+    marked = value.mark("sensitive")
+    with pytest.raises(CtyMarksSerializationError):
+        cty_to_msgpack(marked, SCHEMA)
+    with pytest.raises(CtyJsonError):
+        cty_to_json(marked, SCHEMA)
+
+
+def test_a_fragment_is_kept_per_schema_object() -> None:
+    value = SCHEMA.validate(RAW)
+    rows_type = SCHEMA.attribute_types["rows"]
+    cty_to_json(value, SCHEMA)
+    # A different schema object is a different key, even an equal one.
+    other = CtyList(element_type=CtyObject(attribute_types={"name": CtyString(), "size": CtyNumber()}))
+    assert cty_to_json(value.value["rows"], other) == cty_to_json(value.value["rows"], rows_type)  # type: ignore[index]
+
+
+# 🌊🪢🔚
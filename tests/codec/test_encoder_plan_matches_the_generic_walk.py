@@ -0,0 +1,126 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""`cty_to_msgpack` encodes through a plan compiled per schema.
+
+The plan is `_convert_value_to_serializable` with the type dispatch done once,
+ahead of time, writing into a packer instead of building a mirror for `packb`.
+The break these tests catch is the two drifting apart: a plan that orders,
+spells or locates something differently from the walk it replaced. The walk
+stays in the module as the reference.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+import msgpack
+import pytest
+
+from pyvider.cty import (
+    CtyBool,
+    CtyDynamic,
+    CtyList,
+    CtyMap,
+    CtyNumber,
+    CtyObject,
+    CtySet,
+    CtyString,
+    CtyTuple,
+    CtyValue,
+)
+from pyvider.cty.codec import (
+    _convert_value_to_serializable,
+    _encoder_plan,
+    _msgpack_default_handler,
+    _new_packer,
+    _write_with_plan,
+    cty_to_msgpack,
+)
+from pyvider.cty.exceptions import CtyMarksSerializationError
+
+SCHEMA = CtyObject(
+    attribute_types={
+        "name": CtyString(),
+        "port": CtyNumber(),
+        "ratio": CtyNumber(),
+        "on": CtyBool(),
+        "tags": CtyMap(element_type=CtyString()),
+        "ids": CtySet(element_type=CtyNumber()),
+        "rules": CtyList(element_type=CtyObject(attribute_types={"cidr": CtyString(), "any": CtyDynamic()})),
+        "pair": CtyTuple(element_types=(CtyString(), CtyNumber())),
+        "note": CtyString(),
+    },
+    optional_attributes=frozenset({"note"}),
+)
+
+RAW: dict[str, Any] = {
+    "name": "web",
+    "port": 8080,
+    "ratio": Decimal("0.1"),
+    "on": True,
+    "tags": {"b": "2", "a": "1"},
+    "ids": [3, 1, 2, 2**70],
+    "rules": [{"cidr": "10.0.0.0/8", "any": {"k": [1, 2]}}, {"cidr": "0.0.0.0/0", "any": None}],
+    "pair": ("x", 1),
+}
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        SCHEMA.validate(RAW),
+        SCHEMA.validate({**RAW, "tags": None, "ids": []}),
+        CtyValue.unknown(SCHEMA),
+        CtyValue.null(SCHEMA),
+        SCHEMA.validate({**RAW, "rules": CtyValue.unknown(SCHEMA.attribute_types["rules"])}),
+    ],
+)
+def test_plan_writes_what_the_walk_builds(value: CtyValue[Any]) -> None:
+    walked = msgpack.packb(
+        _convert_value_to_serializable(value, SCHEMA),
+        default=_msgpack_default_handler,
+        use_bin_type=True,
+    )
+    assert cty_to_msgpack(value, SCHEMA) == walked
+
+
+def test_equal_schemas_share_one_plan() -> None:
+    rebuilt = CtyObject(
+        attribute_types=dict(SCHEMA.attribute_types),
+        optional_attributes=frozenset({"note"}),
+    )
+    assert rebuilt is not SCHEMA
+    assert _encoder_plan(rebuilt) is _encoder_plan(SCHEMA)
+
+
+def test_a_marked_value_is_located_as_the_walk_locates_it() -> None:
+    secret = CtyString().validate("s").mark("sensitive")
+    inner = CtyObject(attribute_types={"token": CtyString()})
+    schema = CtyMap(element_type=CtyList(element_type=inner))
+    value = CtyValue(
+        vtype=schema,
+        value={
+            "prod": CtyValue(
+                vtype=schema.element_type, value=(CtyValue(vtype=inner, value={"token": secret}),)
+            )
+        },
+    )
+
+    with pytest.raises(CtyMarksSerializationError) as walked:
+        _convert_value_to_serializable(value, schema)
+    with pytest.raises(CtyMarksSerializationError) as planned:
+        _write_with_plan(value, schema, _new_packer())
+
+    assert walked.value.path == '["prod"][0].token'
+    assert planned.value.path == walked.value.path
+
+
+def test_bytes_are_unchanged_for_a_raw_leaf() -> None:
+    assert cty_to_msgpack("hello", CtyString()) == b"\xa5hello"  # type: ignore[arg-type]
+
+
+# 🌊🪢🔚
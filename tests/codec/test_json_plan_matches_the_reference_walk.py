@@ -0,0 +1,158 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""`cty_to_json` writes through a plan compiled per type, into one chunk list.
+
+The plan is `_marshal` with the type dispatch and attribute-name escaping done
+once, ahead of time. The break these tests catch is the two drifting apart: a
+plan that orders, spells, separates or locates something differently from the
+walk it replaced -- a stray comma where an optional attribute is absent, a
+refusal that names the wrong path. The walk stays in the module as the
+reference.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+import io
+from typing import Any
+
+import pytest
+
+from pyvider.cty import (
+    CtyBool,
+    CtyDynamic,
+    CtyList,
+    CtyMap,
+    CtyNumber,
+    CtyObject,
+    CtySet,
+    CtyString,
+    CtyTuple,
+    CtyValue,
+    cty_to_json_into,
+)
+from pyvider.cty.json_codec import CtyJsonError, _marshal, _marshal_string, cty_to_json
+from pyvider.cty.types import BytesCapsule
+
+SCHEMA = CtyObject(
+    attribute_types={
+        "name": CtyString(),
+        "port": CtyNumber(),
+        "ratio": CtyNumber(),
+        "on": CtyBool(),
+        "tags": CtyMap(element_type=CtyString()),
+        "ids": CtySet(element_type=CtyNumber()),
+        "rules": CtyList(element_type=CtyObject(attribute_types={"cidr": CtyString(), "any": CtyDynamic()})),
+        "pair": CtyTuple(element_types=(CtyString(), CtyNumber())),
+        "blob": BytesCapsule,
+        "a_note": CtyString(),
+    },
+    optional_attributes=frozenset(["a_note"]),
+)
+
+RAW: dict[str, Any] = {
+    "name": "<web> & \u2028 é",
+    "port": 8080,
+    "ratio": Decimal("0.1"),
+    "on": True,
+    "tags": {"b": "2", "a": "1"},
+    "ids": [3, 1, 2, 2**70],
+    "rules": [{"cidr": "10.0.0.0/8", "any": {"k": [1, 2]}}, {"cidr": "0.0.0.0/0", "any": None}],
+    "pair": ("x", 1),
+    "blob": b"hi",
+}
+
+
+def _reference(value: CtyValue[Any], cty_type: Any) -> bytes:
+    return _marshal(value, cty_type, "").encode()
+
+
+@pytest.mark.parametrize(
+    ("value", "cty_type"),
+    [
+        (SCHEMA.validate(RAW), SCHEMA),
+        (SCHEMA.validate({**RAW, "tags": {}, "ids": [], "rules": [], "a_note": "n"}), SCHEMA),
+        (SCHEMA.validate({**RAW, "tags": None, "blob": None}), SCHEMA),
+        (CtyValue.null(SCHEMA), SCHEMA),
+        (SCHEMA.validate(RAW), CtyDynamic()),
+        (CtyDynamic().validate(SCHEMA.validate(RAW)), CtyDynamic()),
+        (CtyValue.null(CtyDynamic()), CtyDynamic()),
+        (CtyObject(attribute_types={}).validate({}), CtyObject(attribute_types={})),
+        (CtyTuple(element_types=()).validate(()), CtyTuple(element_types=())),
+    ],
+)
+def test_the_plan_writes_the_walks_bytes(value: CtyValue[Any], cty_type: Any) -> None:
+    assert cty_to_json(value, cty_type) == _reference(value, cty_type)
+
+
+def test_only_the_absent_first_attribute_loses_no_comma() -> None:
+    schema = CtyObject(
+        attribute_types={"a": CtyString(), "b": CtyString(), "c": CtyString()},
+        optional_attributes=frozenset(["a", "c"]),
+    )
+    value = CtyValue(vtype=schema, value={"b": CtyString().validate("x")})
+    assert cty_to_json(value, schema) == b'{"b":"x"}' == _reference(value, schema)
+
+
+@pytest.mark.parametrize(
+    ("raw", "message"),
+    [
+        ({**RAW, "rules": [RAW["rules"][0], {"cidr": "x", "any": Decimal("NaN")}]}, ".rules[1].any"),
+        ({**RAW, "tags": {"a": "1", "z": CtyValue.unknown(CtyString())}}, ".tags['z'] is not known"),
+        ({**RAW, "pair": ("x", Decimal("Infinity"))}, ".pair[1]: cannot serialize infinity as JSON"),
+        ({**RAW, "ids": CtyValue.unknown(SCHEMA.attribute_types["ids"])}, ".ids is not known"),
+    ],
+)
+def test_a_refusal_names_the_walks_path(raw: dict[str, Any], message: str) -> None:
+    value = SCHEMA.validate(raw)
+    with pytest.raises(CtyJsonError) as walked:
+        _reference(value, SCHEMA)
+    with pytest.raises(CtyJsonError) as planned:
+        cty_to_json(value, SCHEMA)
+    assert str(planned.value) == str(walked.value)
+    assert message in str(planned.value)
+
+
+def test_an_unknown_root_is_refused_as_value() -> None:
+    with pytest.raises(CtyJsonError, match=r"^value is not known"):
+        cty_to_json(CtyValue.unknown(SCHEMA), SCHEMA)
+
+
+@pytest.mark.parametrize("text", ["", "plain", '"q" \\ \n\t\x00\x1f', "<&>\u2028\u2029", "é\U0001f30a"])
+def test_a_string_is_escaped_as_go_escapes_it(text: str) -> None:
+    import json
+
+    expected = json.dumps(text, ensure_ascii=False)
+    for character, escape in (
+        ("<", "\\u003c"),
+        (">", "\\u003e"),
+        ("&", "\\u0026"),
+        ("\u2028", "\\u2028"),
+        ("\u2029", "\\u2029"),
+    ):
+        expected = expected.replace(character, escape)
+    assert _marshal_string(text) == expected
+
+
+def test_into_appends_the_same_bytes_to_a_buffer_or_a_stream() -> None:
+    value = SCHEMA.validate(RAW)
+    buffer = bytearray(b"head:")
+    assert cty_to_json_into(value, SCHEMA, buffer) == len(cty_to_json(value, SCHEMA))
+    assert bytes(buffer) == b"head:" + cty_to_json(value, SCHEMA)
+    stream = io.BytesIO()
+    cty_to_json_into(value, SCHEMA, stream)
+    assert stream.getvalue() == cty_to_json(value, SCHEMA)
+
+
+def test_into_writes_nothing_when_refused() -> None:
+    value = SCHEMA.validate({**RAW, "ratio": Decimal("NaN")})
+    buffer = bytearray()
+    with pytest.raises(CtyJsonError):
+        cty_to_json_into(value, SCHEMA, buffer)
+    assert buffer == bytearray()
+
+
+# 🌊🪢🔚
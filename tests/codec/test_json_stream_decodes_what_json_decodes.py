@@ -0,0 +1,180 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""`cty_from_json_stream` decodes what `cty_from_json` decodes, a chunk at a time.
+
+Every case is read in chunks of one byte and of seven, so every token and every
+multi-byte character is cut by a read somewhere. The break these tests catch
+is a token that spans two reads being decoded as two (a number losing its
+tail digits, a string its escape), a rule `_JsonObject.pairs` exists for
+being skipped because no raw object was built, and a syntax error reported at
+a position in the window instead of in the document.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from decimal import Decimal
+import io
+import json
+import mmap
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pyvider.cty import (
+    CtyBool,
+    CtyDynamic,
+    CtyList,
+    CtyMap,
+    CtyNumber,
+    CtyObject,
+    CtySet,
+    CtyString,
+    CtyTuple,
+    CtyType,
+    cty_from_json_stream,
+    json_codec,
+)
+from pyvider.cty.json_codec import CtyJsonError, cty_from_json, cty_to_json
+
+SCHEMA = CtyObject(
+    attribute_types={
+        "name": CtyString(),
+        "size": CtyNumber(),
+        "on": CtyBool(),
+        "tags": CtyMap(element_type=CtyString()),
+        "ids": CtySet(element_type=CtyNumber()),
+        "rows": CtyList(element_type=CtyObject(attribute_types={"k": CtyString(), "any": CtyDynamic()})),
+        "pair": CtyTuple(element_types=(CtyString(), CtyNumber())),
+    }
+)
+NUMBERS = CtyList(element_type=CtyNumber())
+STRINGS = CtyList(element_type=CtyString())
+
+
+@pytest.fixture(params=[1, 7], autouse=True)
+def chunk_size(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> Iterator[int]:
+    monkeypatch.setattr(json_codec, "JSON_STREAM_CHUNK_SIZE", request.param)
+    yield request.param
+
+
+def _streamed(document: bytes, cty_type: CtyType[Any]) -> Any:
+    return cty_from_json_stream(io.BytesIO(document), cty_type)
+
+
+@pytest.mark.parametrize(
+    ("document", "cty_type"),
+    [
+        (
+            cty_to_json(
+                SCHEMA.validate(
+                    {
+                        "name": 'ö "quoted" \\ \U0001f30a <tag>',
+                        "size": Decimal("12345678901234567890.125"),
+                        "on": True,
+                        "tags": {"b": "2", "a": "1"},
+                        "ids": [3, 1, 2**70],
+                        "rows": [{"k": "x", "any": {"n": [1, 2.5]}}, {"k": "y", "any": None}],
+                        "pair": ("p", -1),
+                    }
+                ),
+                SCHEMA,
+            ),
+            SCHEMA,
+        ),
+        (b' \n{ "name" : "\\u00e9\\ud83c\\udf0a" ,\n "size":"1e3", "on":"true" }\r\n', SCHEMA),
+        (b'{"name":1.50,"size":-0,"on":false,"tags":null,"ids":[],"rows":[],"pair":null}', SCHEMA),
+        (b'{"a":"x","a":1}', CtyObject(attribute_types={"a": CtyString()})),
+        (b'{"caf\\u0065\\u0301":"1"}', CtyMap(element_type=CtyString())),
+        (b'{"value":[1,"a"],"type":["tuple",["number","string"]]}', CtyDynamic()),
+        (b"[1, 1, 2]", CtySet(element_type=CtyNumber())),
+        (b"null", CtyList(element_type=CtyString())),
+        (b"1E+400", CtyNumber()),
+    ],
+)
+def test_the_same_value_as_cty_from_json(document: bytes, cty_type: CtyType[Any]) -> None:
+    streamed = _streamed(document, cty_type)
+    assert streamed == cty_from_json(document, cty_type)
+    assert cty_to_json(streamed, cty_type) == cty_to_json(cty_from_json(document, cty_type), cty_type)
+
+
+@pytest.mark.parametrize(
+    ("document", "cty_type"),
+    [
+        (b'{"a":"x","a":1}', CtyObject(attribute_types={"a": CtyNumber()})),
+        (b'{"b":1}', CtyObject(attribute_types={"a": CtyNumber()})),
+        (b'{"rows":[{"k":"x"},{"k":[]}]}', SCHEMA),
+        (b'{"pair":["a",1,2]}', SCHEMA),
+        (b"[1]", CtyMap(element_type=CtyNumber())),
+        (b'{"value":1,"type":"nope","type":"number"}', CtyDynamic()),
+        (b"NaN", CtyNumber()),
+        (b"[-Infinity]", CtyList(element_type=CtyNumber())),
+    ],
+)
+def test_the_same_refusal_as_cty_from_json(document: bytes, cty_type: CtyType[Any]) -> None:
+    with pytest.raises(Exception) as expected:
+        cty_from_json(document, cty_type)
+    with pytest.raises(type(expected.value)) as streamed:
+        _streamed(document, cty_type)
+    assert str(streamed.value) == str(expected.value)
+
+
+@pytest.mark.parametrize(
+    ("document", "cty_type"),
+    [
+        (b"", CtyDynamic()),
+        (b"  ", CtyDynamic()),
+        (b"[1,]", NUMBERS),
+        (b"[1 2]", NUMBERS),
+        (b"[1", NUMBERS),
+        (b'{"a" 1}', CtyDynamic()),
+        (b"{1:2}", CtyMap(element_type=CtyNumber())),
+        (b'"abc', CtyString()),
+        (b"tru", CtyBool()),
+        (b"1 2", CtyNumber()),
+        (b'"\\x"', CtyString()),
+        (b'"a\nb"', CtyString()),
+        (b"-", CtyNumber()),
+        (b"\xef\xbb\xbf1", CtyNumber()),
+        (b'[\n  "a",\n  "b"\n  "c"\n]', STRINGS),
+        (b'{"s":"line one",\n\n  "t": [1, 2, x]}', CtyDynamic()),
+    ],
+)
+def test_a_malformed_document_raises_what_json_loads_raises(document: bytes, cty_type: CtyType[Any]) -> None:
+    with pytest.raises(json.JSONDecodeError) as expected:
+        cty_from_json(document, cty_type)
+    with pytest.raises(json.JSONDecodeError) as streamed:
+        _streamed(document, cty_type)
+    assert (streamed.value.msg, streamed.value.pos, streamed.value.lineno, streamed.value.colno) == (
+        expected.value.msg,
+        expected.value.pos,
+        expected.value.lineno,
+        expected.value.colno,
+    )
+    assert str(streamed.value) == str(expected.value)
+
+
+def test_invalid_utf8_is_refused_as_decoding_bytes_refuses_it() -> None:
+    with pytest.raises(UnicodeDecodeError):
+        _streamed(b'["ok", "\xff"]', CtyList(element_type=CtyString()))
+
+
+def test_a_document_is_read_from_an_mmap(tmp_path: Path) -> None:
+    schema = CtyList(element_type=CtyString())
+    value = schema.validate([f"item-{i}" for i in range(100)])
+    path = tmp_path / "state.json"
+    path.write_bytes(cty_to_json(value, schema))
+    with path.open("rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        assert cty_from_json_stream(mapped, schema) == value
+
+
+def test_a_refusal_is_a_cty_error_where_cty_from_json_raises_one() -> None:
+    with pytest.raises(CtyJsonError, match=r"\.rows\[0\]\.k: string is required"):
+        _streamed(b'{"rows":[{"k":[1]}]}', SCHEMA)
+
+
+# 🌊🪢🔚
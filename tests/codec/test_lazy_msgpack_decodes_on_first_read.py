@@ -0,0 +1,140 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""`cty_from_msgpack_lazy` decodes an object's attributes as they are read.
+
+The answer has to be indistinguishable from `cty_from_msgpack`'s to anything
+that looks at it -- equality, hashing, paths, marks, re-encoding -- while
+decoding nothing nobody asked for. The break these tests catch is a consumer
+that sees the half-decoded dict storage, and a re-encoding that copies bytes
+it should not.
+"""
+
+from __future__ import annotations
+
+import io
+import pickle
+from typing import Any
+
+import msgpack
+import pytest
+
+from pyvider.cty import CtyDynamic, CtyList, CtyMap, CtyNumber, CtyObject, CtyString, CtyValue
+from pyvider.cty.codec import cty_from_msgpack, cty_from_msgpack_lazy, cty_to_msgpack, cty_to_msgpack_into
+from pyvider.cty.exceptions import CtyMarksSerializationError, CtyValidationError
+from pyvider.cty.marks import collect_marks_deep
+from pyvider.cty.path import CtyPath
+from pyvider.cty.values.lazy import LazyObjectPayload
+from pyvider.cty.walk import deep_values
+
+ROW = CtyObject(attribute_types={"x": CtyString(), "y": CtyNumber()})
+SCHEMA = CtyObject(
+    attribute_types={
+        "id": CtyString(),
+        "rows": CtyList(element_type=ROW),
+        "meta": CtyMap(element_type=CtyString()),
+        "any": CtyDynamic(),
+        "note": CtyString(),
+    },
+    optional_attributes=frozenset({"note"}),
+)
+VALUE = SCHEMA.validate(
+    {"id": "i-1", "rows": [{"x": str(i), "y": i} for i in range(50)], "meta": {"a": "b"}, "any": [1, "x"]}
+)
+DATA = cty_to_msgpack(VALUE, SCHEMA)
+
+
+def _decoded(value: CtyValue[Any]) -> int:
+    return dict.__len__(value.value)  # type: ignore[arg-type]
+
+
+def test_reading_one_attribute_decodes_only_that_one() -> None:
+    lazy = cty_from_msgpack_lazy(DATA, SCHEMA)
+    assert isinstance(lazy.value, LazyObjectPayload)
+    assert lazy["id"].value == "i-1"
+    assert CtyPath.get_attr("meta").apply_path(lazy) == VALUE.value["meta"]  # type: ignore[index]
+    assert _decoded(lazy) == 2
+    assert collect_marks_deep(lazy) == frozenset()
+    assert _decoded(lazy) == 2
+
+
+def test_it_is_the_eager_value_to_everything_that_looks() -> None:
+    lazy = cty_from_msgpack_lazy(DATA, SCHEMA)
+    assert lazy == cty_from_msgpack(DATA, SCHEMA)
+    assert hash(cty_from_msgpack_lazy(DATA, SCHEMA)) == hash(VALUE)
+    assert pickle.loads(pickle.dumps(cty_from_msgpack_lazy(DATA, SCHEMA))) == VALUE  # noqa: S301
+    assert list(deep_values(cty_from_msgpack_lazy(DATA, SCHEMA))) == list(deep_values(VALUE))
+    assert dict(cty_from_msgpack_lazy(DATA, SCHEMA).value) == dict(VALUE.value)  # type: ignore[call-overload]
+
+
+def test_re_encoding_copies_the_bytes_that_arrived() -> None:
+    # Keys out of order and a number go-cty would write as a float: not what
+    # this encoder writes, so an identical result means a copy, not a re-encode.
+    wire = msgpack.packb({"note": None, "meta": {}, "id": "x", "any": None, "rows": [{"y": 1.0, "x": "a"}]})
+    lazy = cty_from_msgpack_lazy(wire, SCHEMA)
+    assert lazy["rows"][0]["y"].value == 1
+    encoded = cty_to_msgpack(lazy, SCHEMA)
+    assert encoded != cty_to_msgpack(cty_from_msgpack(wire, SCHEMA), SCHEMA)
+    assert b"\xcb?\xf0\x00\x00\x00\x00\x00\x00" in encoded
+    assert cty_from_msgpack(encoded, SCHEMA) == lazy
+
+    stream = io.BytesIO()
+    assert cty_to_msgpack_into(lazy, SCHEMA, stream) == len(encoded)
+    assert stream.getvalue() == encoded
+
+
+def test_an_optional_attribute_left_out_is_a_null() -> None:
+    wire = msgpack.packb({"id": "x", "rows": [], "meta": {}, "any": None})
+    lazy = cty_from_msgpack_lazy(wire, SCHEMA)
+    assert lazy["note"].is_null
+    assert lazy == cty_from_msgpack(wire, SCHEMA)
+    assert cty_from_msgpack(cty_to_msgpack(lazy, SCHEMA), SCHEMA) == lazy
+
+
+@pytest.mark.parametrize(
+    "wire",
+    [
+        msgpack.packb(None),
+        msgpack.packb({"id": "x"}),
+        msgpack.packb({"id": "x", "rows": [], "meta": {}, "any": None, "extra": 1}),
+    ],
+)
+def test_a_payload_the_index_will_not_vouch_for_decodes_eagerly(wire: bytes) -> None:
+    try:
+        expected: Any = cty_from_msgpack(wire, SCHEMA)
+    except CtyValidationError as error:
+        expected = error
+    if isinstance(expected, CtyValidationError):
+        with pytest.raises(type(expected)):
+            cty_from_msgpack_lazy(wire, SCHEMA)
+    else:
+        assert cty_from_msgpack_lazy(wire, SCHEMA) == expected
+        assert not isinstance(cty_from_msgpack_lazy(wire, SCHEMA).value, LazyObjectPayload)
+
+
+def test_a_bad_attribute_raises_the_eager_error_when_read() -> None:
+    wire = msgpack.packb({"id": "x", "rows": [{"x": 1, "y": 1}], "meta": {}, "any": None})
+    with pytest.raises(CtyValidationError) as eager:
+        cty_from_msgpack(wire, SCHEMA)
+    lazy = cty_from_msgpack_lazy(wire, SCHEMA)
+    assert lazy["id"].value == "x"
+    with pytest.raises(CtyValidationError) as read:
+        lazy["rows"]
+    assert str(read.value) == str(eager.value)
+
+
+def test_a_reused_buffer_does_not_change_the_value() -> None:
+    buffer = bytearray(DATA)
+    lazy = cty_from_msgpack_lazy(buffer, SCHEMA)  # type: ignore[arg-type]
+    buffer[:] = b"\x00" * len(buffer)
+    assert lazy == VALUE
+
+
+def test_a_marked_lazy_value_is_still_refused() -> None:
+    with pytest.raises(CtyMarksSerializationError):
+        cty_to_msgpack(cty_from_msgpack_lazy(DATA, SCHEMA).mark("sensitive"), SCHEMA)
+
+
+# 🌊🪢🔚
@@ -0,0 +1,46 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""`cty_to_msgpack_into` writes what `cty_to_msgpack` returns, and nothing on failure."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+import io
+
+import pytest
+
+from pyvider.cty import CtyList, CtyNumber, CtyObject, CtyString
+from pyvider.cty.codec import cty_to_msgpack, cty_to_msgpack_into
+from pyvider.cty.exceptions import SerializationError
+
+SCHEMA = CtyObject(attribute_types={"name": CtyString(), "sizes": CtyList(element_type=CtyNumber())})
+VALUE = SCHEMA.validate({"name": "disk", "sizes": [1, Decimal("2.5"), 2**80]})
+
+
+def test_a_bytearray_is_extended_in_place() -> None:
+    out = bytearray(b"\x92")
+    written = cty_to_msgpack_into(VALUE, SCHEMA, out)
+    expected = cty_to_msgpack(VALUE, SCHEMA)
+    assert written == len(expected)
+    assert bytes(out) == b"\x92" + expected
+
+
+def test_a_binary_stream_is_written_to() -> None:
+    out = io.BytesIO()
+    cty_to_msgpack_into(VALUE, SCHEMA, out)
+    cty_to_msgpack_into(VALUE, SCHEMA, out)
+    assert out.getvalue() == cty_to_msgpack(VALUE, SCHEMA) * 2
+
+
+def test_a_refused_value_writes_nothing() -> None:
+    nan = SCHEMA.validate({"name": "disk", "sizes": [1, Decimal("NaN")]})
+    out = io.BytesIO()
+    with pytest.raises(SerializationError):
+        cty_to_msgpack_into(nan, SCHEMA, out)
+    assert out.getvalue() == b""
+
+
+# 🌊🪢🔚
@@ -0,0 +1,57 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""The type-spec of a dynamic value is computed once per type, in both directions."""
+
+from __future__ import annotations
+
+import pytest
+
+from pyvider.cty import CtyDynamic, CtyList, CtyObject, CtyString
+from pyvider.cty.codec import cty_from_msgpack, cty_to_msgpack
+from pyvider.cty.conversion import type_from_spec_bytes, type_spec_bytes
+from pyvider.cty.conversion.type_spec import _TypeSpecCache
+from pyvider.cty.exceptions import DeserializationError
+
+OBJ = CtyObject(attribute_types={"a": CtyString(), "b": CtyList(element_type=CtyString())})
+
+
+def test_encoding_a_type_fills_the_decode_direction() -> None:
+    spec = type_spec_bytes(OBJ)
+    assert spec == b'["object",{"a":"string","b":["list","string"]}]'
+    assert type_from_spec_bytes(spec) is type_from_spec_bytes(spec)
+    assert type_from_spec_bytes(spec) == OBJ
+
+
+def test_a_non_canonical_spelling_does_not_become_the_encoding() -> None:
+    spaced = b'[ "list", "string" ]'
+    assert type_from_spec_bytes(spaced) == CtyList(element_type=CtyString())
+    assert type_spec_bytes(CtyList(element_type=CtyString())) == b'["list","string"]'
+
+
+def test_each_direction_is_bounded() -> None:
+    cache = _TypeSpecCache(maxsize=2)
+    types = [CtyList(element_type=t) for t in (CtyString(), OBJ, CtyDynamic())]
+    for t in types:
+        cache.spec_bytes(t)
+    assert len(cache._to_bytes) == 2
+    assert len(cache._to_type) == 2
+    assert types[0] not in cache._to_bytes
+
+
+def test_a_malformed_spec_still_fails_every_time() -> None:
+    payload = bytes.fromhex("92") + bytes.fromhex("c403") + b"nop" + bytes.fromhex("a178")
+    for _ in range(2):
+        with pytest.raises(DeserializationError):
+            cty_from_msgpack(payload, CtyDynamic())
+
+
+def test_round_trip_through_a_dynamic_list() -> None:
+    schema = CtyList(element_type=CtyDynamic())
+    value = schema.validate([OBJ.validate({"a": "x", "b": ["y"]}), OBJ.validate({"a": "z", "b": []})])
+    assert cty_from_msgpack(cty_to_msgpack(value, schema), schema) == value
+
+
+# 🌊🪢🔚
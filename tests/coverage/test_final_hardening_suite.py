@@ -67,7 +67,8 @@ class TestFinalCoverageSuite:
         """Covers internal TypeErrors for comparisons on malformed CtyValues."""
         # Create a CtyValue that should be comparable but whose internal .value is not
         malformed_number = CtyValue(vtype=CtyNumber(), value="not-a-decimal")
-        n5 = CtyNumber().validate(5)
+        # A `Decimal` payload: an `int` argument would be kept as an `int`.
+        n5 = CtyNumber().validate(Decimal(5))
 
         # The comparison should fail inside the CtyValue dunder method, raising a Python TypeError
         # because it cannot compare a string to a Decimal.
@@ -0,0 +1,68 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Set algebra over two canonically ordered sets is a linear merge.
+
+`setunion`, `setintersection`, `setsubtract` and `setsymmetricdifference`
+walk their arguments' payloads side by side when both are already in the
+order `CtySet.validate` sorts into, and `Equals` pairs two such sets off index
+by index. The break these tests catch is a merge that answers differently from
+`validate` over the same elements: a result out of order, a signed zero
+collapsed into its twin, or a converted or partly unknown argument that no
+longer takes the route it needs.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from pyvider.cty import CtyNumber, CtyObject, CtySet, CtyString, CtyValue
+from pyvider.cty.functions import setintersection, setsubtract, setsymmetricdifference, setunion
+from pyvider.cty.values import UNREFINED_UNKNOWN
+
+TAGS = CtySet(element_type=CtyString())
+NUMBERS = CtySet(element_type=CtyNumber())
+ROWS = CtySet(element_type=CtyObject(attribute_types={"cidr": CtyString()}))
+
+
+def _tags(*tags: str) -> CtyValue[object]:
+    return TAGS.validate(list(tags))
+
+
+def test_results_are_what_validate_makes_of_the_same_elements() -> None:
+    a, b, c = _tags("env", "team", "tier"), _tags("owner", "team"), _tags("tier", "zone")
+    assert setunion(a, b, c) == _tags("env", "owner", "team", "tier", "zone")
+    assert setunion(a, b, c).value == _tags("env", "owner", "team", "tier", "zone").value
+    assert setintersection(a, b) == _tags("team")
+    assert setsubtract(a, b).value == _tags("env", "tier").value
+    assert setsymmetricdifference(a, b, c).value == _tags("env", "owner", "zone").value
+    assert setintersection(a, _tags()).value == ()
+    rows = ROWS.validate([{"cidr": "10.0.0.0/8"}, {"cidr": "192.168.0.0/16"}])
+    assert setsubtract(rows, ROWS.validate([{"cidr": "10.0.0.0/8"}])) == ROWS.validate(
+        [{"cidr": "192.168.0.0/16"}]
+    )
+
+
+def test_a_signed_zero_is_its_own_member() -> None:
+    zeros = NUMBERS.validate([0, Decimal("-0")])
+    assert len(setunion(zeros, NUMBERS.validate([0])).value) == 2
+    assert len(setsubtract(zeros, NUMBERS.validate([0])).value) == 1
+    assert len(setintersection(zeros, NUMBERS.validate([Decimal("-0"), 3])).value) == 1
+
+
+def test_converted_and_unknown_arguments_take_the_general_route() -> None:
+    assert setunion(_tags("a"), NUMBERS.validate([1])) == _tags("1", "a")
+    partly = TAGS.validate(["a", UNREFINED_UNKNOWN, UNREFINED_UNKNOWN])
+    assert len(setunion(partly, _tags("a", "b")).value) == 4
+    assert setintersection(partly, _tags("a")).is_unknown
+
+
+def test_equal_sets_pair_off_and_unequal_ones_do_not() -> None:
+    assert _tags("a", "b").equals(_tags("b", "a")).value is True
+    assert _tags("a", "b").equals(_tags("a", "c")).value is False
+    assert NUMBERS.validate([0]).equals(NUMBERS.validate([Decimal("-0")])).value is True
+
+
+# 🌊🪢🔚
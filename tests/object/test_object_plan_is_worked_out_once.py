@@ -0,0 +1,87 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""A `CtyObject` works out its attributes' NFC names and optionality once, and an ASCII input is not copied.
+
+The break these tests catch is the shortcut answering differently from the
+normalizing path: an accented key or name that no longer matches its other
+spelling, a collision or non-string key that gets through, a dict subclass
+whose lookups are trusted, or a plan that is rebuilt per call or shared
+between schemas.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any
+
+import pytest
+
+from pyvider.cty import CtyNumber, CtyObject, CtyString
+from pyvider.cty.exceptions import CtyAttributeValidationError
+from pyvider.cty.types.structural.object import _by_nfc_name
+
+DECOMPOSED = "café"
+COMPOSED = "café"
+
+
+def _schema() -> CtyObject:
+    return CtyObject(
+        attribute_types={DECOMPOSED: CtyString(), "port": CtyNumber(), "note": CtyString()},
+        optional_attributes=frozenset(["note"]),
+    )
+
+
+@pytest.mark.parametrize("key", [DECOMPOSED, COMPOSED])
+def test_either_spelling_fills_the_attribute(key: str) -> None:
+    schema = _schema()
+    for _ in range(3):  # guarded, then compiled
+        validated = schema.validate({key: "x", "port": 1})
+        assert validated.value[DECOMPOSED].value == "x"
+        assert validated.value["note"].is_null
+
+
+def test_the_plan_is_kept_on_the_schema() -> None:
+    schema = _schema()
+    schema.validate({COMPOSED: "x", "port": 1})
+    plan = schema._plan()
+    assert schema._plan() is plan
+    attributes, expected = plan
+    assert expected == frozenset({COMPOSED, "port", "note"})
+    assert [(name, optional) for name, _, optional, _ in attributes] == [
+        (DECOMPOSED, False),
+        ("port", False),
+        ("note", True),
+    ]
+    assert _schema()._plan_memo is None
+
+
+def test_an_ascii_dict_is_read_in_place_and_anything_else_is_copied() -> None:
+    ascii_keys = {"port": 1, "note": None}
+    assert _by_nfc_name(ascii_keys) is ascii_keys
+    accented: dict[object, Any] = {DECOMPOSED: "x"}
+    assert _by_nfc_name(accented) == {COMPOSED: "x"}
+    subclass: defaultdict[object, Any] = defaultdict(int, port=1)
+    assert _by_nfc_name(subclass) is not subclass
+    assert type(_by_nfc_name(subclass)) is dict
+
+
+@pytest.mark.parametrize(
+    ("raw", "message"),
+    [
+        ({COMPOSED: "x", DECOMPOSED: "y", "port": 1}, "normalize to the same NFC string"),
+        ({COMPOSED: "x", "port": 1, 1: 2}, "must be strings"),
+        ({COMPOSED: "x", "port": 1, "extra": 1, "zz": 2}, "Unknown attributes: extra, zz"),
+        ({COMPOSED: "x"}, "Missing required attribute"),
+    ],
+)
+def test_refusals_are_unchanged(raw: dict[object, Any], message: str) -> None:
+    schema = _schema()
+    for _ in range(3):
+        with pytest.raises(CtyAttributeValidationError, match=message):
+            schema.validate(raw)
+
+
+# 🌊🪢🔚
@@ -0,0 +1,73 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""A set member's order and identity keys are kept on it, and a set in order is not sorted again.
+
+`CtySet.validate` and the decoders work out every member's keys on the way in,
+and the encoders, `walk` and the set functions used to work them out again.
+The break these tests catch is a kept key that differs from the one built
+fresh, a key kept over a payload that can still change, a payload taken as in
+order when it is not, or a quoting shortcut that disagrees with Go's `%q`.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from pyvider.cty import CtyList, CtyNumber, CtyObject, CtySet, CtyString, CtyValue
+from pyvider.cty.codec import cty_to_msgpack
+from pyvider.cty.json_codec import cty_to_json
+from pyvider.cty.values import set_order
+from pyvider.cty.values.set_order import go_quoted, identity_key, in_order, order_key
+
+ROW = CtyObject(attribute_types={"cidr": CtyString(), "ports": CtySet(element_type=CtyNumber())})
+ROWS = CtySet(element_type=ROW)
+RAW = [{"cidr": "10.1.0.0/16", "ports": [443, 80]}, {"cidr": "10.0.0.0/8", "ports": [22]}]
+
+
+def test_kept_keys_are_the_fresh_ones() -> None:
+    rows = ROWS.validate(RAW)
+    for row in rows.value:
+        assert row._set_keys is not None
+        assert order_key(row) == set_order._composite_order_key(row)
+        assert identity_key(row) == set_order._identity_key(row)
+        assert set(row._set_keys) == {"order", "identity", "hash_bytes"}
+
+
+def test_a_set_in_order_is_handed_back_and_one_out_of_order_is_sorted() -> None:
+    rows = ROWS.validate(RAW)
+    assert in_order(rows) is rows.value
+    backwards = CtyValue(vtype=ROWS, value=tuple(reversed(rows.value)))
+    assert list(in_order(backwards)) == list(rows.value)
+    assert cty_to_msgpack(backwards, ROWS) == cty_to_msgpack(rows, ROWS)
+    assert cty_to_json(backwards, ROWS) == cty_to_json(rows, ROWS)
+
+
+def test_a_payload_that_can_still_change_keeps_no_keys() -> None:
+    pairs = CtyList(element_type=CtyString())
+    inner = [CtyString().validate("a")]
+    hand_built = CtyValue(vtype=CtyList(element_type=pairs), value=(CtyValue(vtype=pairs, value=(inner,)),))
+    identity_key(hand_built)
+    assert hand_built._set_keys is None
+
+
+@pytest.mark.parametrize(
+    ("text", "quoted"),
+    [
+        ("", '""'),
+        ("plain", '"plain"'),
+        ('say "hi"', '"say \\"hi\\""'),
+        ("back\\slash", '"back\\\\slash"'),
+        ("tab\there", '"tab\\there"'),
+        ("café", '"café"'),
+        ("zero\u200bwidth", '"zero\\u200bwidth"'),
+        ("\x7f", '"\\x7f"'),
+    ],
+)
+def test_quoting_is_gos(text: str, quoted: str) -> None:
+    assert go_quoted(text) == quoted
+
+
+# 🌊🪢🔚
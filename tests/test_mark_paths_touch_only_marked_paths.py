@@ -0,0 +1,104 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Stripping and restoring marks costs what the marked paths do, not what the tree does.
+
+`unmark_deep_with_paths` skips any subtree whose construction-time summary
+says nothing below it is marked. `mark_with_paths` merges its paths on their
+common prefixes and rebuilds each container on the way down once. The break
+these tests catch is a skipped subtree that did hold a mark, a path lost in
+the merge, or a container rebuilt once per path again.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from pyvider.cty import CtyCapsule, CtyDynamic, CtyList, CtyNumber, CtyObject, CtyString, CtyValue, mark_paths
+from pyvider.cty.mark_paths import mark_with_paths, unmark_deep_with_paths
+from pyvider.cty.marks import collect_marks_deep
+from pyvider.cty.path import CtyPath, GetAttrStep, IndexStep
+
+SENSITIVE = "sensitive"
+ROW = CtyObject(attribute_types={"name": CtyString(), "port": CtyNumber()})
+ROWS = CtyList(element_type=ROW)
+
+
+def _rows(marked: set[int]) -> CtyValue[Any]:
+    secret = CtyString().validate("s").mark(SENSITIVE)
+    return ROWS.validate(
+        [{"name": secret if index in marked else f"r{index}", "port": index} for index in range(50)]
+    )
+
+
+def test_clean_subtrees_come_back_untouched() -> None:
+    rows = _rows({3, 40})
+    bare, found = unmark_deep_with_paths(rows)
+
+    assert set(found) == {
+        CtyPath([IndexStep(3), GetAttrStep("name")]),
+        CtyPath([IndexStep(40), GetAttrStep("name")]),
+    }
+    assert collect_marks_deep(bare) == frozenset()
+    assert all(bare.value[i] is rows.value[i] for i in range(50) if i not in {3, 40})
+    assert mark_with_paths(bare, found) == rows
+
+
+def test_marks_beside_an_unsummarized_payload_are_still_found() -> None:
+    box = CtyCapsule("Box", list)
+    holder = CtyObject(attribute_types={"box": box, "name": CtyString()})
+    value = CtyList(element_type=holder).validate(
+        [
+            {
+                "box": CtyValue(vtype=box, value=[1]).mark("boxed"),
+                "name": CtyString().validate("n").mark(SENSITIVE),
+            }
+        ]
+    )
+    assert value._deep_marks is None
+
+    _, found = unmark_deep_with_paths(value)
+
+    assert found == {
+        CtyPath([IndexStep(0), GetAttrStep("box")]): frozenset({"boxed"}),
+        CtyPath([IndexStep(0), GetAttrStep("name")]): frozenset({SENSITIVE}),
+    }
+
+
+def test_each_container_is_rebuilt_once_however_many_paths_it_holds(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = _rows({1, 2, 7, 30})
+    bare, found = unmark_deep_with_paths(rows)
+    found[CtyPath([IndexStep(7), GetAttrStep("port")])] = frozenset({"audit"})
+    found[CtyPath([IndexStep(99), GetAttrStep("name")])] = frozenset({"gone"})
+    found[CtyPath([])] = frozenset({"root"})
+
+    rebuilt: list[CtyValue[Any]] = []
+    evolved = mark_paths._evolved
+    monkeypatch.setattr(
+        mark_paths, "_evolved", lambda value, payload: rebuilt.append(value) or evolved(value, payload)
+    )
+    restored = mark_with_paths(bare, found)
+
+    # The list once, and each of the four rows once.
+    assert len(rebuilt) == 5
+    assert restored.marks == frozenset({"root"})
+    assert restored.value[7].value["port"].marks == frozenset({"audit"})
+    assert restored.value[7].value["name"].marks == frozenset({SENSITIVE})
+    assert restored.value[0] is bare.value[0]
+
+
+def test_the_dynamic_wrapper_is_seen_through_on_the_way_back() -> None:
+    wrapped = CtyValue(vtype=CtyDynamic(), value=_rows({5}))
+    bare, found = unmark_deep_with_paths(wrapped)
+    assert collect_marks_deep(bare) == frozenset()
+
+    restored = mark_with_paths(bare, found)
+
+    assert restored.value.value[5].value["name"].marks == frozenset({SENSITIVE})
+
+
+# 🌊🪢🔚
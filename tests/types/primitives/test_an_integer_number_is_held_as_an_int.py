@@ -0,0 +1,103 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""A number that arrives as an int64-range integer is held as a Python `int`.
+
+Nothing outside the payload may notice: the wire bytes, equality, hashing,
+set identity and every stdlib answer have to be what the `Decimal` payload
+gave. The break these tests catch is a consumer that still assumes a
+`Decimal` -- it reads an `int` as zero, or calls a method it does not have --
+and an integer fast path that loses the sign of a zero `big.Float` keeps.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+import msgpack
+import pytest
+
+from pyvider.cty import CtyList, CtyNumber, CtyObject, CtySet
+from pyvider.cty.codec import _convert_value_to_serializable, cty_from_msgpack, cty_to_msgpack
+from pyvider.cty.functions import STDLIB
+from pyvider.cty.json_codec import cty_from_json, cty_to_json
+from pyvider.cty.values.set_order import hash_bytes, identity_key
+
+N = CtyNumber()
+INTEGERS = [0, 1, -1, 127, 128, -33, 65535, 10**10 - 1, 10**10, 2**63 - 1, -(2**63)]
+
+
+@pytest.mark.parametrize(
+    ("raw", "held"),
+    [(5, int), (True, int), (2**63, Decimal), (-(2**63) - 1, Decimal), (Decimal(5), Decimal), (5.0, Decimal)],
+)
+def test_only_an_int64_integer_is_held_as_an_int(raw: Any, held: type) -> None:
+    assert type(N.validate(raw).value) is held
+
+
+@pytest.mark.parametrize("number", INTEGERS)
+def test_the_bytes_are_the_ones_a_decimal_wrote(number: int) -> None:
+    held, decimal = N.validate(number), N.validate(Decimal(number))
+    assert cty_to_msgpack(held, N) == cty_to_msgpack(decimal, N)
+    assert _convert_value_to_serializable(held, N) == _convert_value_to_serializable(decimal, N)
+    assert cty_to_json(held, N) == cty_to_json(decimal, N)
+    assert hash_bytes(held) == hash_bytes(decimal)
+
+
+def test_both_wires_read_an_integer_back_as_an_int() -> None:
+    schema = CtyObject(attribute_types={"port": N, "sizes": CtyList(element_type=N)})
+    value = schema.validate({"port": 8080, "sizes": [1, 2**70, 2.5]})
+    for decoded in (
+        cty_from_msgpack(cty_to_msgpack(value, schema), schema),
+        cty_from_json(cty_to_json(value, schema), schema),
+    ):
+        assert decoded == value
+        assert type(decoded["port"].value) is int
+        assert [type(size.value) for size in decoded["sizes"]] == [int, Decimal, Decimal]
+
+
+@pytest.mark.parametrize(("number", "held"), [(2**63 - 1, int), (2**63, Decimal), (2**64 - 1, Decimal)])
+def test_a_msgpack_integer_is_held_as_validate_would_hold_it(number: int, held: type) -> None:
+    # Written as msgpack integers, as a peer may write a uint64; this
+    # package's own encoder writes anything past int64 as text.
+    schema = CtyList(element_type=N)
+    assert type(cty_from_msgpack(msgpack.packb(number), N).value) is held
+    assert type(cty_from_msgpack(msgpack.packb([number]), schema).value[0].value) is held
+    assert cty_from_msgpack(msgpack.packb(number), N) == N.validate(number)
+
+
+def test_a_negative_zero_off_the_json_wire_keeps_its_sign() -> None:
+    decoded = cty_from_json(b"-0", N)
+    assert isinstance(decoded.value, Decimal)
+    assert decoded.value.is_signed()
+
+
+def test_an_int_and_a_decimal_are_the_same_number() -> None:
+    assert N.validate(5) == N.validate(Decimal(5))
+    assert hash(N.validate(5)) == hash(N.validate(Decimal("5.0")))
+    assert identity_key(N.validate(5)) == identity_key(N.validate(Decimal(5)))
+    assert len(CtySet(element_type=N).validate([5, Decimal(5)]).value) == 1
+
+
+@pytest.mark.parametrize(
+    ("func", "args"),
+    [("add", [2, 3]), ("subtract", [2**63 - 1, -(2**63)]), ("multiply", [-(2**63), 2**63 - 1]), ("abs", [-7])],
+)
+def test_integer_arithmetic_answers_what_decimal_arithmetic_did(func: str, args: list[int]) -> None:
+    held = STDLIB[func](*[N.validate(arg) for arg in args])
+    decimal = STDLIB[func](*[N.validate(Decimal(arg)) for arg in args])
+    assert held == decimal
+    assert cty_to_msgpack(held, N) == cty_to_msgpack(decimal, N)
+
+
+@pytest.mark.parametrize(("func", "args"), [("multiply", [0, -5]), ("negate", [0])])
+def test_a_zero_answer_keeps_the_sign_go_cty_gives_it(func: str, args: list[int]) -> None:
+    answer = STDLIB[func](*[N.validate(arg) for arg in args])
+    assert isinstance(answer.value, Decimal)
+    assert answer.value.is_signed()
+
+
+# 🌊🪢🔚
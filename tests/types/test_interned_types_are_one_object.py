@@ -0,0 +1,155 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Structurally equal types can be made one object, and a type's hash is worked out once.
+
+The break these tests catch is a shortcut that changes an answer: two
+unequal types interned to one object, a memoized hash that disagrees with the
+hash of an equal type that has none yet, or a memo that crosses a process
+boundary inside a pickle, where hashes of strings are different.
+"""
+
+from __future__ import annotations
+
+import gc
+import pickle
+from typing import Any
+
+import pytest
+
+from pyvider.cty import (
+    CtyBool,
+    CtyDynamic,
+    CtyList,
+    CtyMap,
+    CtyNumber,
+    CtyObject,
+    CtySet,
+    CtyString,
+    CtyTuple,
+    CtyType,
+    intern_type,
+    parse_tf_type_to_ctytype,
+    parser,
+)
+from pyvider.cty.types import interning
+
+
+def _schema() -> CtyObject:
+    row = CtyObject(
+        attribute_types={"name": CtyString(), "tags": CtyMap(element_type=CtyString())},
+        optional_attributes=frozenset(["tags"]),
+    )
+    return CtyObject(
+        attribute_types={
+            "rows": CtyList(element_type=row),
+            "ids": CtySet(element_type=CtyNumber()),
+            "pair": CtyTuple(element_types=(row, CtyBool())),
+            "any": CtyDynamic(),
+        }
+    )
+
+
+def test_equal_types_intern_to_one_object() -> None:
+    first, second = intern_type(_schema()), intern_type(_schema())
+    assert first is second
+    assert first == _schema()
+    rows, pair = first.attribute_types["rows"], first.attribute_types["pair"]  # type: ignore[attr-defined]
+    assert rows.element_type is pair.element_types[0]
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        CtyObject(attribute_types={"rows": CtyList(element_type=CtyString())}),
+        CtySet(element_type=CtyList(element_type=CtyString())),
+        CtyList(element_type=CtyList(element_type=CtyNumber())),
+        CtyObject(
+            attribute_types={"name": CtyString(), "tags": CtyMap(element_type=CtyString())},
+            optional_attributes=frozenset(["name"]),
+        ),
+    ],
+)
+def test_unequal_types_stay_apart(other: CtyType[Any]) -> None:
+    interned = intern_type(other)
+    assert interned == other
+    assert interned is not intern_type(CtyList(element_type=CtyList(element_type=CtyString())))
+
+
+def test_attribute_order_is_kept() -> None:
+    ab = intern_type(CtyObject(attribute_types={"a": CtyString(), "b": CtyNumber()}))
+    ba = intern_type(CtyObject(attribute_types={"b": CtyNumber(), "a": CtyString()}))
+    assert ab == ba
+    assert list(ab.attribute_types) == ["a", "b"]  # type: ignore[attr-defined]
+    assert list(ba.attribute_types) == ["b", "a"]  # type: ignore[attr-defined]
+
+
+def test_an_unreferenced_canonical_type_leaves_the_table() -> None:
+    gc.collect()
+    before = len(interning._canonical)
+    interned = intern_type(CtyMap(element_type=CtyList(element_type=CtyTuple(element_types=(CtyString(),)))))
+    assert len(interning._canonical) == before + 3
+    del interned
+    gc.collect()
+    assert len(interning._canonical) == before
+
+
+def test_the_parser_interns_when_asked(monkeypatch: pytest.MonkeyPatch) -> None:
+    spec = ["object", {"a": ["list", "string"], "b": ["map", ["list", "string"]]}]
+    assert parse_tf_type_to_ctytype(spec) is not parse_tf_type_to_ctytype(spec)
+    monkeypatch.setenv("PYVIDER_CTY_INTERN_TYPES", "true")
+    parsed = parse_tf_type_to_ctytype(spec)
+    assert parsed is parse_tf_type_to_ctytype(spec)
+    assert parsed.attribute_types["a"] is parsed.attribute_types["b"].element_type  # type: ignore[attr-defined]
+
+
+def test_the_parser_reads_the_setting_once_per_parse(monkeypatch: pytest.MonkeyPatch) -> None:
+    reads: list[bool] = []
+    monkeypatch.setattr(parser, "type_interning_enabled", lambda: reads.append(True) or True)
+    parsed = parse_tf_type_to_ctytype(
+        ["object", {"a": ["list", "string"], "b": ["tuple", ["number", "bool"]]}]
+    )
+    assert reads == [True]
+    assert parsed is intern_type(parsed)
+
+
+def test_a_memoized_hash_is_the_hash_of_an_equal_fresh_type() -> None:
+    memoized = _schema()
+    hash(memoized)
+    assert memoized._hash_memo is not None
+    fresh = _schema()
+    assert fresh._hash_memo is None
+    assert hash(fresh) == hash(memoized)
+    # Inner types hashed as part of the outer one answer the same as when asked alone.
+    rows = _schema().attribute_types["rows"]
+    assert hash(fresh.attribute_types["rows"]) == hash(rows)
+
+
+def test_a_differing_memo_settles_inequality() -> None:
+    left = CtyList(element_type=CtyString())
+    right = CtyList(element_type=CtyNumber())
+    hash(left), hash(right)
+    assert left != right
+    assert left == CtyList(element_type=CtyString())
+
+
+def test_a_deep_type_hashes_without_recursing() -> None:
+    deep: CtyType[Any] = CtyString()
+    for _ in range(5000):
+        deep = CtyList(element_type=deep)
+    assert isinstance(hash(deep), int)
+    assert intern_type(deep) == deep
+
+
+def test_a_pickle_carries_no_memo() -> None:
+    schema = _schema()
+    hash(schema)
+    restored = pickle.loads(pickle.dumps(schema))  # noqa: S301
+    assert restored == schema
+    assert restored._hash_memo is None
+    assert hash(restored) == hash(schema)
+
+
+# 🌊🪢🔚
@@ -0,0 +1,138 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""`usable_as`, `can_convert_unsafe` and `conformance_errors` share one bounded answer cache.
+
+The break these tests catch is a remembered answer that differs from a fresh
+one: an entry found for the wrong pair or the wrong relation, a cached
+`conformance_errors` list changed through the copy one caller was handed, a
+failure remembered as an answer, or a bound that is not kept.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from pyvider.cty import (
+    CtyDynamic,
+    CtyList,
+    CtyMap,
+    CtyNumber,
+    CtyObject,
+    CtySet,
+    CtyString,
+    CtyTuple,
+    CtyType,
+    conformance_errors,
+)
+from pyvider.cty.conformance import _conformance
+from pyvider.cty.conversion import can_convert_unsafe
+from pyvider.cty.conversion.explicit import _can_convert_unsafe
+from pyvider.cty.types import clear_type_relation_cache, type_relation_cache_info
+from pyvider.cty.types.base import _usable_walk
+from pyvider.cty.types.relations import _TypeRelationCache
+
+ROW = CtyObject(
+    attribute_types={"name": CtyString(), "size": CtyNumber(), "tags": CtyMap(element_type=CtyString())},
+    optional_attributes=frozenset(["tags"]),
+)
+PAIRS: list[tuple[CtyType[Any], CtyType[Any]]] = [
+    (CtyList(element_type=ROW), CtyList(element_type=CtyObject(attribute_types={"name": CtyString()}))),
+    (CtyObject(attribute_types={"name": CtyString()}), ROW),
+    (CtyList(element_type=CtyString()), CtySet(element_type=CtyNumber())),
+    (CtyTuple(element_types=(CtyString(), CtyNumber())), CtyList(element_type=CtyString())),
+    (CtyMap(element_type=CtyNumber()), CtyMap(element_type=CtyDynamic())),
+    (CtyList(element_type=CtyString()), CtyString()),
+]
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache() -> None:
+    clear_type_relation_cache()
+
+
+@pytest.mark.parametrize(("source", "target"), PAIRS + [(t, s) for s, t in PAIRS])
+def test_a_remembered_answer_is_the_walked_answer(source: CtyType[Any], target: CtyType[Any]) -> None:
+    for _ in range(2):
+        assert source.usable_as(target) is _usable_walk(source, target)
+        assert can_convert_unsafe(source, target) is _can_convert_unsafe(source, target)
+        assert conformance_errors(source, target) == list(_conformance(source, target))
+
+
+def test_the_counters_count_lookups() -> None:
+    source, target = PAIRS[0]
+    for _ in range(3):
+        source.usable_as(target)
+    conformance_errors(source, target)
+    info = type_relation_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+    clear_type_relation_cache()
+    assert type_relation_cache_info()[:2] == (0, 0)
+    assert type_relation_cache_info().currsize == 0
+
+
+def test_equal_types_and_primitives_are_answered_without_an_entry() -> None:
+    assert CtyList(element_type=ROW).usable_as(CtyList(element_type=ROW))
+    assert conformance_errors(CtyString(), CtyString()) == []
+    assert conformance_errors(CtyString(), CtyNumber()) != []
+    assert type_relation_cache_info().currsize == 0
+
+
+def test_a_caller_cannot_change_the_remembered_errors() -> None:
+    source, target = PAIRS[1]
+    errors = conformance_errors(source, target)
+    assert errors
+    errors.clear()
+    assert conformance_errors(source, target) == list(_conformance(source, target))
+
+
+def test_the_least_recently_used_answer_goes_first() -> None:
+    cache = _TypeRelationCache(2)
+    calls: list[str] = []
+
+    def compute(source: str, target: str) -> str:
+        calls.append(source)
+        return source + target
+
+    cache.answer("r", "a", "1", compute)
+    cache.answer("r", "b", "1", compute)
+    cache.answer("r", "a", "1", compute)
+    cache.answer("r", "c", "1", compute)
+    cache.answer("r", "a", "1", compute)
+    cache.answer("r", "b", "1", compute)
+    assert calls == ["a", "b", "c", "b"]
+    assert cache.info() == (2, 4, 2, 2)
+
+
+def test_a_failure_is_not_remembered() -> None:
+    cache = _TypeRelationCache(8)
+
+    def fail(source: str, target: str) -> bool:
+        raise RuntimeError(source)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            cache.answer("r", "a", "b", fail)
+    assert cache.info() == (0, 2, 8, 0)
+
+
+def test_threads_asking_at_once_get_the_same_answers() -> None:
+    def ask(index: int) -> tuple[bool, bool, int]:
+        source, target = PAIRS[index % len(PAIRS)]
+        return (
+            source.usable_as(target),
+            can_convert_unsafe(source, target),
+            len(conformance_errors(source, target)),
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        answers = list(pool.map(ask, range(400)))
+    assert answers == [ask(index) for index in range(400)]
+
+
+# 🌊🪢🔚
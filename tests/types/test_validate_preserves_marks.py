@@ -191,7 +191,8 @@ class TestDeepMarkMemo:
         """What keeps stdlib calls off an O(n) walk per argument."""
         value = CtyList(element_type=CtyString()).validate(["a", "b"])
 
-        assert value._deep_marks is None
+        # Taken as the value is built, from its elements' own.
+        assert value._deep_marks == frozenset()
         assert collect_marks_deep(value) == frozenset()
         assert value._deep_marks == frozenset()
 
@@ -229,7 +230,7 @@ class TestDeepMarkMemo:
 
         marked = value.mark(SENSITIVE)
 
-        assert marked._deep_marks is None
+        assert marked._deep_marks == frozenset({SENSITIVE})
         assert collect_marks_deep(marked) == frozenset({SENSITIVE})
 
     def test_a_payload_cannot_be_mutated_behind_the_memo(self) -> None:
@@ -352,7 +353,7 @@ class TestMarksSurviveTheRecursionGuard:
 
         inner = CtyList(element_type=CtyString())
         seed = inner.validate([marked_string()])
-        assert seed._deep_marks is None
+        assert seed._deep_marks == frozenset({SENSITIVE})
 
         assert collect_marks_deep(seed) == frozenset({SENSITIVE})
         assert seed._deep_marks == frozenset({SENSITIVE})
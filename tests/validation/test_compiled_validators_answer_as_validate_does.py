@@ -0,0 +1,176 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""A schema with no `dynamic` in it is validated by closures compiled for it, under one guard entry.
+
+A type's first validation runs node by node under the guard; from its second
+on, and whenever `compile_validator()` is asked, the compiled closures run.
+The break these tests catch is the two disagreeing: a value, a mark, a
+refusal or a refusal's path that comes out differently, a `dynamic` position
+validated without its guard, or a guard limit the compiled path ignores.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from pyvider.cty import (
+    CtyBool,
+    CtyDynamic,
+    CtyList,
+    CtyMap,
+    CtyNumber,
+    CtyObject,
+    CtySet,
+    CtyString,
+    CtyTuple,
+    CtyType,
+    CtyValue,
+)
+from pyvider.cty.exceptions import CtyValidationError
+from pyvider.cty.marks import CtyMark
+from pyvider.cty.validation import clear_recursion_context, get_recursion_context
+from pyvider.cty.validation.compiled import compiled_validation
+from pyvider.cty.values.markers import UnknownValue
+
+SENSITIVE = CtyMark("sensitive")
+
+
+def _schema() -> CtyObject:
+    row = CtyObject(
+        attribute_types={"name": CtyString(), "port": CtyNumber(), "note": CtyString()},
+        optional_attributes=frozenset(["note"]),
+    )
+    return CtyObject(
+        attribute_types={
+            "rows": CtyList(element_type=row),
+            "tags": CtyMap(element_type=CtyString()),
+            "ids": CtySet(element_type=CtyNumber()),
+            "pair": CtyTuple(element_types=(CtyString(), CtyBool())),
+            "nested": CtyList(element_type=CtyMap(element_type=CtySet(element_type=CtyString()))),
+        }
+    )
+
+
+def _raw(**changes: Any) -> dict[str, Any]:
+    raw: dict[str, Any] = {
+        "rows": [{"name": "a", "port": 1}, {"name": "b", "port": Decimal("2.5"), "note": None}],
+        "tags": {"café": "x", "b": UnknownValue()},
+        "ids": [3, 1, 3, CtyValue.unknown(CtyNumber())],
+        "pair": ("p", True),
+        "nested": [{"k": ["z", "y", "z"]}],
+    }
+    raw.update(changes)
+    return raw
+
+
+def _outcome(validate: Callable[[object], CtyValue[Any]], raw: object) -> Any:
+    try:
+        return validate(raw)
+    except CtyValidationError as error:
+        return (type(error), str(error), error.path)
+
+
+CASES = [
+    _raw(),
+    _raw(rows=[{"name": "a", "port": 1}, {"name": "b", "port": "nope"}]),
+    _raw(rows=[{"name": "a"}]),
+    _raw(rows=[{"name": "a", "port": 1, "extra": 1}]),
+    _raw(tags={"a": 1.5, "b": ["x"]}),
+    _raw(tags={1: "x"}),
+    _raw(tags={"é": "x", "é": "y"}),
+    _raw(ids=["x"]),
+    _raw(pair=("p",)),
+    _raw(pair=("p", "maybe")),
+    _raw(nested=[{"k": ["z", 1]}, {"k": [{"no": 1}]}]),
+    _raw(nested={"not": "a list"}),
+    None,
+    UnknownValue(),
+    "not an object",
+]
+
+
+@pytest.mark.parametrize("raw", CASES)
+def test_the_compiled_validator_answers_as_the_guarded_descent(raw: object) -> None:
+    guarded = _outcome(_schema().validate, raw)
+    schema = _schema()
+    compiled = schema.compile_validator()
+    assert compiled != schema.validate
+    assert _outcome(compiled, raw) == guarded
+    # `validate` itself: guarded on first use, compiled from the second.
+    assert _outcome(schema.validate, raw) == guarded
+    assert _outcome(schema.validate, raw) == guarded
+
+
+def test_marks_survive_at_every_level() -> None:
+    schema = _schema()
+    raw = _raw(
+        rows=[{"name": CtyString().validate("a").mark(SENSITIVE), "port": 1}],
+        tags=CtyMap(element_type=CtyString()).validate({"a": "x"}).mark(SENSITIVE),
+        ids=[CtyNumber().validate(1).mark(SENSITIVE)],
+    )
+    guarded = _schema().validate(raw)
+    compiled = schema.compile_validator()(raw)
+    assert compiled == guarded
+    assert compiled.value["rows"].value[0].value["name"].marks == frozenset({SENSITIVE})
+    assert compiled.value["tags"].marks == frozenset({SENSITIVE})
+    assert compiled.value["ids"].marks == frozenset({SENSITIVE})
+    marked = schema.compile_validator()(CtyValue(vtype=CtyDynamic(), value=None).mark(SENSITIVE))
+    assert marked.is_null
+    assert marked.marks == frozenset({SENSITIVE})
+
+
+def test_a_dynamic_position_keeps_its_guard_and_the_rest_compiles() -> None:
+    loose = CtyObject(attribute_types={"any": CtyDynamic(), "rows": CtyList(element_type=CtyString())})
+    assert loose.compile_validator() == loose.validate
+    assert compiled_validation(loose, at_once=True) is None
+    assert compiled_validation(loose.attribute_types["rows"]) is not None
+    raw = {"any": {"k": [1]}, "rows": ["a"]}
+    first, second = loose.validate(raw), loose.validate(raw)
+    assert first == second
+    assert not second.value["any"].is_unknown
+
+
+def test_a_type_compiles_on_its_second_use() -> None:
+    schema = CtyList(element_type=CtyString())
+    assert compiled_validation(schema) is None
+    assert compiled_validation(schema) is not None
+
+
+def test_a_lowered_depth_limit_still_stops_a_compiled_type() -> None:
+    schema = CtyList(element_type=CtyList(element_type=CtyString()))
+    schema.compile_validator()
+    clear_recursion_context()
+    original = get_recursion_context().max_depth_allowed
+    try:
+        get_recursion_context().max_depth_allowed = 1
+        assert schema.validate([["a"]]).is_unknown
+        get_recursion_context().max_depth_allowed = 2
+        assert not schema.validate([["a"]]).is_unknown
+    finally:
+        get_recursion_context().max_depth_allowed = original
+        clear_recursion_context()
+
+
+def test_a_self_referencing_input_is_refused_at_the_schemas_depth() -> None:
+    looped: list[Any] = []
+    looped.append(looped)
+    schema = CtyList(element_type=CtyList(element_type=CtyString()))
+    with pytest.raises(CtyValidationError, match=r"^At \[0\]\[0\]: String validation error"):
+        schema.compile_validator()(looped)
+
+
+def test_a_type_deeper_than_the_guard_allows_is_not_compiled() -> None:
+    deep: CtyType[Any] = CtyString()
+    for _ in range(get_recursion_context().max_depth_allowed + 5):
+        deep = CtyList(element_type=deep)
+    assert deep.compile_validator() == deep.validate
+
+
+# 🌊🪢🔚
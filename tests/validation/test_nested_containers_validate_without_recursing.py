@@ -0,0 +1,108 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Nested containers are validated on a work stack, with the guard applied to every one of them.
+
+A container's elements are yielded to `validate_iteratively`, which opens a
+nested container in place rather than calling its `validate`. The break these
+tests catch is the walk doing less than the recursive descent did: a depth
+that still costs frames, a refusal whose path loses levels, a mark or a stop
+dropped at a level nothing called `validate` for, or a validation path left
+behind by a refusal.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import sys
+from typing import Any
+
+import pytest
+
+from pyvider.cty import CtyDynamic, CtyList, CtyMap, CtyObject, CtySet, CtyString, CtyType, CtyValue
+from pyvider.cty.exceptions import CtySetValidationError, CtyValidationError
+from pyvider.cty.marks import CtyMark
+from pyvider.cty.validation import clear_recursion_context, get_recursion_context
+
+SENSITIVE = CtyMark("sensitive")
+
+
+def _nested(depth: int, leaf: object = "x") -> tuple[CtyType[Any], Any]:
+    cty_type: CtyType[Any] = CtyString()
+    raw: Any = leaf
+    for level in range(depth):
+        if level % 2:
+            cty_type, raw = CtyList(element_type=cty_type), [raw]
+        else:
+            cty_type, raw = CtyObject(attribute_types={"k": cty_type}), {"k": raw}
+    return cty_type, raw
+
+
+@pytest.fixture
+def depth_limit() -> Iterator[None]:
+    clear_recursion_context()
+    context = get_recursion_context()
+    original = context.max_depth_allowed
+    context.max_depth_allowed = 100_000
+    try:
+        yield
+    finally:
+        context.max_depth_allowed = original
+        clear_recursion_context()
+
+
+@pytest.mark.usefixtures("depth_limit")
+def test_a_value_far_deeper_than_the_stack_validates() -> None:
+    depth = sys.getrecursionlimit() * 5
+    cty_type, raw = _nested(depth)
+    validated = cty_type.validate(raw)
+    assert not validated.is_unknown
+    assert get_recursion_context().max_depth_reached == depth
+    under_dynamic = CtyDynamic().validate(raw)
+    assert not under_dynamic.value.is_unknown
+
+
+def test_a_refusal_deep_down_names_every_level() -> None:
+    cty_type, raw = _nested(60, leaf=["not", "a", "string"])
+    with pytest.raises(CtyValidationError) as caught:
+        cty_type.validate(raw)
+    assert str(caught.value.path).count(".k") == 30
+    assert str(caught.value.path).count("[0]") == 30
+    assert get_recursion_context().validation_path == []
+
+
+def test_marks_come_back_at_a_level_nothing_called_validate_for() -> None:
+    inner = CtyList(element_type=CtyString())
+    cty_type = CtyMap(element_type=CtyList(element_type=inner))
+    marked = inner.validate(["a"]).mark(SENSITIVE)
+    validated = cty_type.validate({"k": [marked, ["b"]]})
+    assert validated.value["k"].value[0].marks == frozenset({SENSITIVE})
+    assert validated.value["k"].value[1].marks == frozenset()
+
+
+def test_a_stop_below_degrades_the_whole_value_with_its_marks() -> None:
+    cty_type, raw = _nested(40)
+    marked = CtyValue(vtype=cty_type, value=None).mark(SENSITIVE)
+    clear_recursion_context()
+    context = get_recursion_context()
+    original = context.max_depth_allowed
+    try:
+        context.max_depth_allowed = 10
+        stopped = CtyList(element_type=cty_type).validate([raw, marked])
+    finally:
+        context.max_depth_allowed = original
+        clear_recursion_context()
+    assert stopped.is_unknown
+    assert stopped.marks == frozenset({SENSITIVE})
+
+
+def test_a_set_still_wraps_what_its_nested_elements_raise() -> None:
+    cty_type = CtySet(element_type=CtyList(element_type=CtyList(element_type=CtyString())))
+    with pytest.raises(CtySetValidationError):
+        cty_type.validate([[["a"]], [[1.5j]]])
+    assert get_recursion_context().validation_path == []
+
+
+# 🌊🪢🔚
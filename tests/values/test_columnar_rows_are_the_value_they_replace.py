@@ -0,0 +1,171 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""A columnar list or set of objects is the value it was made from, everywhere it is used.
+
+`columnar` and `validate_columnar` hold the rows one column per attribute and
+build each row when it is read. The break these tests catch is a columnar
+value answering differently from the ordinary one: a row rebuilt with the
+wrong payload or type, a mark, null or unknown lost in a column, an equality,
+hash, encoding or pickle that differs, a `walk` that loses a change or the
+columns, or a refusal that differs from `validate`'s.
+"""
+
+from __future__ import annotations
+
+import pickle
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from pyvider.cty import (
+    CtyBool,
+    CtyDynamic,
+    CtyList,
+    CtyNumber,
+    CtyObject,
+    CtySet,
+    CtyString,
+    CtyValue,
+    collect_marks_deep,
+    columnar,
+    cty_from_json,
+    cty_to_json,
+    transform,
+    unmark_deep,
+    validate_columnar,
+)
+from pyvider.cty.codec import cty_from_msgpack, cty_to_msgpack
+from pyvider.cty.exceptions import CtyListValidationError
+from pyvider.cty.functions import distinct, element, length, reverse
+from pyvider.cty.marks import CtyMark
+from pyvider.cty.values import UNREFINED_UNKNOWN, ColumnarRows
+
+SENSITIVE = CtyMark("sensitive")
+ROW = CtyObject(
+    attribute_types={
+        "id": CtyString(),
+        "size": CtyNumber(),
+        "on": CtyBool(),
+        "tags": CtyList(element_type=CtyString()),
+        "any": CtyDynamic(),
+        "note": CtyString(),
+    },
+    optional_attributes=frozenset(["note", "any"]),
+)
+LIST = CtyList(element_type=ROW)
+
+
+def _raw(count: int = 6) -> list[Any]:
+    rows: list[Any] = [
+        {"id": f"i{i}", "size": i, "on": i % 2 == 0, "tags": [str(i)], "note": None if i % 3 else "n"}
+        for i in range(count)
+    ]
+    rows[1] = dict(rows[1], size=UNREFINED_UNKNOWN, any=CtyString().validate("x"))
+    rows[2] = dict(rows[2], id=CtyString().validate("secret").mark(SENSITIVE))
+    rows[3] = None
+    rows[4] = ROW.validate(dict(rows[4])).mark(SENSITIVE)
+    rows[5] = dict(rows[5], any=CtyValue.null(CtyDynamic()))
+    return rows
+
+
+def test_a_columnar_list_is_the_list_it_was_made_from() -> None:
+    ordinary = LIST.validate(_raw())
+    held = validate_columnar(LIST, _raw())
+    assert type(held.value) is ColumnarRows
+    assert columnar(ordinary) == held == ordinary
+    assert hash(held) == hash(ordinary)
+    assert list(held.value) == list(ordinary.value)
+    assert held.value[2].value["id"].marks == frozenset({SENSITIVE})
+    assert held.value[1].value["size"].is_unknown
+    assert held.value[3].is_null
+    assert held.value[-1] == ordinary.value[-1]
+    assert held.value[1:3] == ordinary.value[1:3]
+    assert collect_marks_deep(held) == collect_marks_deep(ordinary) == frozenset({SENSITIVE})
+    assert unmark_deep(held) == unmark_deep(ordinary)
+
+
+def test_encodings_and_pickles_are_the_same() -> None:
+    ordinary = LIST.validate(_raw())
+    held = columnar(ordinary)
+    unmarked, _ = unmark_deep(held)
+    assert cty_to_msgpack(unmarked, LIST) == cty_to_msgpack(unmark_deep(ordinary)[0], LIST)
+    assert cty_from_msgpack(cty_to_msgpack(unmarked, LIST), LIST) == unmarked
+    # JSON has no unknowns, and from the third row on there are none.
+    known, _ = unmark_deep(validate_columnar(LIST, _raw()[2:]))
+    assert cty_to_json(known, LIST) == cty_to_json(unmark_deep(LIST.validate(_raw()[2:]))[0], LIST)
+    assert cty_from_json(cty_to_json(known, LIST), LIST) == known
+    restored = pickle.loads(pickle.dumps(held))  # noqa: S301
+    assert type(restored.value) is ColumnarRows
+    assert restored.value._columns == held.value._columns
+
+
+def test_a_set_and_the_functions_answer_as_for_the_ordinary_value() -> None:
+    set_type = CtySet(element_type=ROW)
+    raw = [row for row in _raw() if isinstance(row, dict)]
+    ordinary = set_type.validate(raw)
+    held = columnar(ordinary)
+    assert type(held.value) is ColumnarRows
+    assert held == ordinary
+    assert hash(held) == hash(ordinary)
+    assert set_type.validate(held) == held
+    assert length(held) == length(ordinary)
+    listed, ordinary_list = validate_columnar(LIST, raw), LIST.validate(raw)
+    assert reverse(listed) == reverse(ordinary_list)
+    assert distinct(listed) == distinct(ordinary_list)
+    assert element(listed, CtyNumber().validate(1)) == ordinary_list.value[1]
+
+
+def test_walk_sees_every_row_and_a_rebuild_stays_columnar() -> None:
+    held = validate_columnar(LIST, _raw())
+
+    def grow(path: Any, value: CtyValue[Any]) -> CtyValue[Any]:
+        if isinstance(value.type, CtyNumber) and not (value.is_unknown or value.is_null):
+            return CtyNumber().validate(value.value + 100)
+        return value
+
+    assert transform(held, lambda path, value: value) is held
+    grown = transform(held, grow)
+    assert type(grown.value) is ColumnarRows
+    assert grown == transform(LIST.validate(_raw()), grow)
+    assert grown.value[0].value["size"].value == 100
+
+
+def test_a_refusal_is_the_one_validate_raises() -> None:
+    raw = _raw()
+    raw[2] = {"id": "x"}
+    with pytest.raises(CtyListValidationError) as columnar_refusal:
+        validate_columnar(LIST, raw)
+    with pytest.raises(CtyListValidationError) as ordinary_refusal:
+        LIST.validate(raw)
+    assert str(columnar_refusal.value) == str(ordinary_refusal.value)
+
+
+def test_values_it_does_not_apply_to_come_back_as_they_are() -> None:
+    strings = CtyList(element_type=CtyString()).validate(["a"])
+    assert columnar(strings) is strings
+    assert columnar(CtyValue.null(LIST)).is_null
+    held = validate_columnar(LIST, [])
+    assert columnar(held) is held
+    assert held == LIST.validate([])
+
+
+def test_rows_cost_a_fraction_of_their_values() -> None:
+    raw = [{"id": f"i{i}", "size": i, "on": True, "tags": [], "note": "n"} for i in range(2000)]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        ordinary = LIST.validate(raw)
+        middle = tracemalloc.get_traced_memory()[0]
+        held = validate_columnar(LIST, raw)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert held == ordinary
+    assert (after - middle) * 4 < middle - before
+
+
+# 🌊🪢🔚
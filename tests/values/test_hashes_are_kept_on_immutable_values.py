@@ -0,0 +1,112 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""A value's hash is kept on it, and on each of its children, once worked out.
+
+`CtyValue.__hash__` stops its fold at a node that already has one, so
+`distinct`, set and dict keys and `Equals` bucketing hash a shared element
+once. The break these tests catch is a kept hash that differs from the one
+the fold would give, a hash kept over a payload that can still change, or a
+kept hash that crosses a pickle into a process where strings hash differently.
+"""
+
+from __future__ import annotations
+
+import pickle
+from typing import Any
+
+from attrs import define, field
+
+from pyvider.cty import CtyCapsuleWithOps, CtyDynamic, CtyList, CtyNumber, CtyObject, CtyString, CtyValue
+from pyvider.cty.functions import distinct
+
+ROW = CtyObject(attribute_types={"name": CtyString(), "ports": CtyList(element_type=CtyNumber())})
+ROWS = CtyList(element_type=ROW)
+
+
+def test_the_kept_hash_is_the_folded_one_and_children_keep_theirs() -> None:
+    rows = ROWS.validate([{"name": "a", "ports": [1, 2]}, {"name": "b", "ports": [3]}])
+    fresh = ROWS.validate([{"name": "a", "ports": [1, 2]}, {"name": "b", "ports": [3]}])
+    assert hash(rows) == hash(fresh)
+    assert rows._hash_memo == hash(rows)
+    first = rows.value[0]
+    assert first._hash_memo is not None
+    assert first.value["ports"]._hash_memo is not None
+    assert hash(ROWS.validate([first])) == hash(ROWS.validate([{"name": "a", "ports": [1, 2]}]))
+    wrapped = CtyValue(vtype=CtyDynamic(), value=first)
+    assert hash(wrapped) == hash(CtyValue(vtype=CtyDynamic(), value=fresh.value[0]))
+    assert wrapped._hash_memo is not None
+
+
+def test_kept_hashes_do_not_change_answers() -> None:
+    rows = ROWS.validate(
+        [{"name": "a", "ports": [1]}, {"name": "b", "ports": [1]}, {"name": "a", "ports": [1]}]
+    )
+    hash(rows)
+    assert distinct(rows) == ROWS.validate([{"name": "a", "ports": [1]}, {"name": "b", "ports": [1]}])
+    a, b = rows.value[0], rows.value[1]
+    assert a != b
+    assert a == rows.value[2]
+    assert a == ROW.validate({"name": "a", "ports": [1]})
+
+
+def test_a_payload_that_can_still_change_keeps_no_hash() -> None:
+    box = CtyCapsuleWithOps("Box", list, hash_fn=lambda payload: hash(tuple(payload)))
+    contents = [1]
+    boxed = CtyValue(vtype=box, value=contents)
+    before = hash(boxed)
+    contents.append(2)
+    assert boxed._hash_memo is None
+    assert hash(boxed) != before
+
+
+class _Box:
+    def __init__(self, x: int) -> None:
+        self.x = x
+
+
+def test_nothing_is_kept_over_a_capsule() -> None:
+    box = CtyCapsuleWithOps("Box", _Box, equal_fn=lambda a, b: a.x == b.x, hash_fn=lambda a: hash(a.x))
+    contents = _Box(1)
+    held, other = box.validate(contents), box.validate(_Box(2))
+    enclosing = CtyList(element_type=box).validate([held])
+    for value in (held, other, enclosing):
+        hash(value)
+    assert held._hash_memo is None
+    assert enclosing._hash_memo is None
+
+    contents.x = 2
+    assert held == other
+    assert held.equals(other).value is True
+    assert hash(held) == hash(other)
+
+
+def test_a_pickled_value_leaves_its_hash_behind() -> None:
+    rows = ROWS.validate([{"name": "a", "ports": [1, 2]}])
+    hash(rows)
+    restored = pickle.loads(pickle.dumps(rows))  # noqa: S301
+    assert restored == rows
+    assert restored._hash_memo is None
+    assert restored.value[0]._hash_memo is None
+    assert hash(restored) == hash(rows)
+
+
+@define(frozen=True, slots=True, eq=False)
+class _Tagged(CtyValue[Any]):
+    note: str = field(default="")
+
+
+def test_a_pickled_subclass_comes_back_as_itself() -> None:
+    tagged = _Tagged(vtype=ROW, value=ROW.validate({"name": "a", "ports": [1]}).value, note="kept")
+    hash(tagged)
+    restored = pickle.loads(pickle.dumps(tagged))  # noqa: S301
+    assert type(restored) is _Tagged
+    assert restored == tagged
+    assert restored.note == "kept"
+    assert restored._hash_memo is None
+    assert hash(restored) == hash(tagged)
+
+
+# 🌊🪢🔚
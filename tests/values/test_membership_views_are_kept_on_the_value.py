@@ -0,0 +1,110 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Membership in a set, list or tuple is answered from hashed views kept on the value.
+
+`contains`, `sethaselement`, a `KeyStep` into a set, `Equals` on two sets,
+`setintersection` and `setsubtract` each build their view of a collection's
+members once. The break these tests catch is a view that answers differently
+from the scan it replaced: a hit against unknowns that is no longer a hit, a
+miss against unknowns that becomes a definite false, a null of another type or
+`-0` that matches differently, or a view kept on a value that can still change
+in place -- its own payload, or a capsule's below it.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from pyvider.cty import (
+    CtyCapsuleWithOps,
+    CtyDynamic,
+    CtyList,
+    CtyNumber,
+    CtyObject,
+    CtySet,
+    CtyString,
+    CtyValue,
+)
+from pyvider.cty.functions import contains, sethaselement, setintersection, setsubtract
+from pyvider.cty.path import KeyStep
+from pyvider.cty.values import UNREFINED_UNKNOWN
+
+ROW = CtyObject(attribute_types={"name": CtyString(), "port": CtyNumber()})
+ROWS = CtySet(element_type=ROW)
+
+
+def _rows(*ports: int) -> CtyValue[object]:
+    return ROWS.validate([{"name": f"n{port}", "port": port} for port in ports])
+
+
+def test_answers_are_the_scans_and_the_views_are_kept() -> None:
+    rows = _rows(1, 2, 3)
+    hit, miss = ROW.validate({"name": "n2", "port": 2}), ROW.validate({"name": "n9", "port": 9})
+    for _ in range(2):
+        assert contains(rows, hit).value is True
+        assert contains(rows, miss).value is False
+        assert sethaselement(rows, hit).value is True
+        assert sethaselement(rows, miss).value is False
+        assert KeyStep(hit).apply(rows) == hit
+        assert rows.equals(_rows(3, 2, 1)).value is True
+        assert rows.equals(_rows(1, 2)).value is False
+        assert _rows(1, 2).equals(rows).value is False
+        assert setintersection(rows, _rows(2, 3, 4)) == _rows(2, 3)
+        assert setsubtract(rows, _rows(2)) == _rows(1, 3)
+    assert rows._members is not None
+    assert set(rows._members) == {"by_value", "by_identity", "buckets", "undecided", "ordered"}
+
+
+def test_unknowns_still_decide_as_before() -> None:
+    partly = ROWS.validate([{"name": "n1", "port": 1}, {"name": "n2", "port": UNREFINED_UNKNOWN}])
+    assert contains(partly, ROW.validate({"name": "n1", "port": 1})).value is True
+    assert contains(partly, ROW.validate({"name": "n2", "port": 7})).is_unknown
+    assert contains(partly, ROW.validate({"name": "n3", "port": 7})).value is False
+    strings = CtyList(element_type=CtyString()).validate(["a", UNREFINED_UNKNOWN])
+    assert contains(strings, CtyString().validate("a")).value is True
+    assert contains(strings, CtyString().validate("b")).is_unknown
+    assert contains(strings, CtyValue.null(CtyString())).is_unknown
+
+
+def test_cty_equality_is_kept_where_it_differs_from_python_equality() -> None:
+    numbers = CtySet(element_type=CtyNumber()).validate([0])
+    assert sethaselement(numbers, CtyNumber().validate(Decimal("-0"))).value is False
+    dynamic = CtyList(element_type=CtyDynamic()).validate([CtyValue.null(CtyString())])
+    assert contains(dynamic, CtyValue.null(CtyNumber())).value is True
+
+
+def test_a_payload_that_can_still_change_keeps_no_view() -> None:
+    nested = CtyList(element_type=CtyList(element_type=CtyString()))
+    inner: list[object] = [CtyString().validate("a")]
+    hand_built = CtyValue(vtype=nested, value=[CtyValue(vtype=nested.element_type, value=(inner,))])
+    needle = CtyList(element_type=CtyString()).validate(["a"])
+    contains(hand_built, needle)
+    assert hand_built._members is None
+
+
+class _Box:
+    def __init__(self, x: int) -> None:
+        self.x = x
+
+
+def test_nothing_is_kept_over_a_capsule() -> None:
+    box = CtyCapsuleWithOps("Box", _Box, equal_fn=lambda a, b: a.x == b.x, hash_fn=lambda a: hash(a.x))
+    held = _Box(1)
+    boxes = CtyList(element_type=box).validate([held])
+    wrapped = CtyList(element_type=CtyDynamic()).validate([CtyList(element_type=box).validate([held])])
+    needle = box.validate(_Box(2))
+    assert contains(boxes, needle).value is False
+    assert contains(wrapped, CtyList(element_type=box).validate([_Box(2)])).value is False
+    assert boxes._members is None
+    assert wrapped._members is None
+
+    held.x = 2
+
+    assert contains(boxes, needle).value is True
+    assert contains(wrapped, CtyList(element_type=box).validate([_Box(2)])).value is True
+
+
+# 🌊🪢🔚
@@ -0,0 +1,123 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""A type's null, bare unknown, empty collection, `true` and `false` are one value each.
+
+The break these tests catch is sharing that reaches further than it should: a
+shared value that a mark, a refinement or a later edit changes for every
+holder, a container type answering another equal-but-separate type's value, a
+capsule or subclass handed a value of the wrong type, or a shared value that
+is not equal to the one the constructor builds.
+"""
+
+from __future__ import annotations
+
+import pickle
+from typing import Any
+
+import pytest
+
+from pyvider.cty import (
+    CtyBool,
+    CtyCapsule,
+    CtyList,
+    CtyMap,
+    CtyObject,
+    CtySet,
+    CtyString,
+    CtyValue,
+    intern_type,
+)
+from pyvider.cty.codec import cty_from_msgpack, cty_to_msgpack
+from pyvider.cty.marks import CtyMark
+from pyvider.cty.refinement import refine
+from pyvider.cty.values import UNREFINED_UNKNOWN
+
+SENSITIVE = CtyMark("sensitive")
+
+
+def test_a_container_type_keeps_its_own() -> None:
+    first, second = CtyList(element_type=CtyString()), CtyList(element_type=CtyString())
+    assert CtyValue.null(first) is CtyValue.null(first)
+    assert CtyValue.unknown(first) is CtyValue.unknown(first, UNREFINED_UNKNOWN)
+    assert CtyValue.null(first) is not CtyValue.null(second)
+    assert CtyValue.null(first) == CtyValue.null(second)
+    assert CtyValue.null(first).type is first
+    assert CtyValue.null(intern_type(first)) is CtyValue.null(intern_type(second))
+
+
+def test_a_fieldless_type_shares_across_instances() -> None:
+    assert CtyValue.null(CtyString()) is CtyValue.null(CtyString())
+    assert CtyBool().validate("true") is CtyBool().validate(1) is CtyBool().validate(True)
+    assert CtyBool().validate(False).value is False
+    assert CtyValue.null(CtyString()) == CtyValue(vtype=CtyString(), is_null=True)
+
+
+@pytest.mark.parametrize(
+    ("cty_type", "empty"),
+    [
+        (CtyList(element_type=CtyString()), []),
+        (CtySet(element_type=CtyString()), []),
+        (CtyMap(element_type=CtyString()), {}),
+    ],
+)
+def test_validate_and_decode_answer_the_shared_empty(cty_type: Any, empty: Any) -> None:
+    shared = cty_type.validate(empty)
+    assert cty_type.validate(empty) is shared
+    assert cty_type.compile_validator()(empty) is shared
+    # The decoder keeps its plan per equal schema, so the empty it answers is
+    # the one of the schema instance it was planned for.
+    decoded = cty_from_msgpack(cty_to_msgpack(shared, cty_type), cty_type)
+    assert decoded == shared
+    assert decoded is decoded.type.validate(empty)
+    assert shared == CtyValue(vtype=cty_type, value=empty)
+    marked = cty_type.validate(CtyValue(vtype=cty_type, value=empty).mark(SENSITIVE))
+    assert marked.marks == frozenset({SENSITIVE})
+    assert shared.marks == frozenset()
+
+
+def test_sparse_objects_hold_one_null_per_attribute_type() -> None:
+    attributes = {f"a{i}": CtyString() for i in range(8)}
+    schema = CtyObject(attribute_types=attributes, optional_attributes=frozenset(attributes))
+    rows = CtyList(element_type=schema).validate([{"a0": "x"}, {"a1": "y"}])
+    nulls = {id(row.value[name]) for row in rows.value for name in attributes if row.value[name].is_null}
+    assert len(nulls) == 1
+
+
+def test_marks_and_refinements_make_new_values() -> None:
+    shared = CtyValue.null(CtyString())
+    assert shared.mark(SENSITIVE) is not shared
+    assert shared.marks == frozenset()
+    unknown = CtyValue.unknown(CtyString())
+    refined = refine(unknown).not_null().new_value()
+    assert refined is not unknown
+    assert CtyValue.unknown(CtyString()).value is UNREFINED_UNKNOWN
+
+
+def test_types_outside_the_scheme_are_built_as_before() -> None:
+    capsule = CtyCapsule("Box", object)
+    assert CtyValue.null(capsule) is not CtyValue.null(capsule)
+    assert CtyValue.null(capsule) == CtyValue.null(capsule)
+    list_type = CtyList(element_type=CtyString())
+    CtyValue.null(list_type)
+    restored = pickle.loads(pickle.dumps(list_type))  # noqa: S301
+    assert restored._flyweight_memo is None
+    assert CtyValue.null(restored).type is restored
+
+
+def test_a_value_subclass_gets_its_own_instances() -> None:
+    class Tagged(CtyValue[Any]):
+        pass
+
+    null = Tagged.null(CtyString())
+    assert type(null) is Tagged
+    assert null.is_null
+    assert null is not Tagged.null(CtyString())
+    assert type(Tagged.unknown(CtyString())) is Tagged
+    assert type(Tagged.unknown(CtyString(), value=UNREFINED_UNKNOWN)) is Tagged
+    assert CtyValue.null(CtyString()) is CtyValue.null(CtyString())
+
+
+# 🌊🪢🔚
@@ -0,0 +1,121 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""`with_key`, `without_key`, `append` and `with_element_at` validate only what they add.
+
+So do `merge`, `zipmap` and `concat` where every entry already has the type
+its position declares. The break these tests catch is the shortcut answering
+differently from validating the whole payload again: a key that is not
+normalized or that collides without being refused, a refusal with another
+message or path, a mark, a `dynamic` element or an object's attribute order
+that comes out different, or an edit that validates every element again.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from pyvider.cty import CtyDynamic, CtyList, CtyMap, CtyNumber, CtyObject, CtyString, CtyValue
+from pyvider.cty.exceptions import CtyValidationError
+from pyvider.cty.functions import concat, merge, zipmap
+from pyvider.cty.marks import CtyMark
+
+SENSITIVE = CtyMark("sensitive")
+COMPOSED = "caf\u00e9"
+DECOMPOSED = "cafe\u0301"
+
+
+def _refusal(call: Any) -> tuple[type, str, str]:
+    with pytest.raises(CtyValidationError) as refusal:
+        call()
+    return type(refusal.value), str(refusal.value), str(refusal.value.path)
+
+
+@pytest.mark.parametrize("element_type", [CtyString(), CtyDynamic()])
+def test_map_edits_match_validating_the_whole_map(element_type: Any) -> None:
+    map_type = CtyMap(element_type=element_type)
+    start = map_type.validate({"a": "x", COMPOSED: CtyString().validate("y").mark(SENSITIVE)})
+    for key, value in [
+        ("b", "z"),
+        ("a", "w"),
+        (COMPOSED, "v"),
+        ("\u00fc", CtyNumber().validate(1)),
+        ("nai\u0308ve", "n"),
+    ]:
+        if element_type == CtyString() and not isinstance(value, str):
+            continue
+        expected = map_type.validate({**start.value, key: value})
+        edited = start.with_key(key, value)
+        assert edited == expected
+        assert list(edited.value) == list(expected.value)
+    assert start.without_key("a") == map_type.validate({COMPOSED: start.value[COMPOSED]})
+    assert start.without_key("a").without_key(COMPOSED) is map_type.validate({})
+
+
+def test_map_refusals_are_validates() -> None:
+    map_type = CtyMap(element_type=CtyNumber())
+    start = map_type.validate({COMPOSED: 1})
+    for key, value in [(DECOMPOSED, 2), ("b", "not a number"), (3, 1)]:
+        assert _refusal(lambda k=key, v=value: start.with_key(k, v)) == _refusal(
+            lambda k=key, v=value: map_type.validate({**start.value, k: v})
+        )
+
+
+def test_list_edits_match_validating_the_whole_list() -> None:
+    list_type = CtyList(element_type=CtyNumber())
+    start = list_type.validate([1, CtyNumber().validate(2).mark(SENSITIVE), 3])
+    assert start.append("4") == list_type.validate([*start.value, "4"])
+    for index in (0, 1, -1, -3):
+        raw = list(start.value)
+        raw[index] = 9
+        assert start.with_element_at(index, 9) == list_type.validate(raw)
+    assert _refusal(lambda: start.append("x")) == _refusal(lambda: list_type.validate([*start.value, "x"]))
+    assert _refusal(lambda: start.with_element_at(-2, "x")) == _refusal(
+        lambda: list_type.validate([start.value[0], "x", start.value[2]])
+    )
+    with pytest.raises(IndexError):
+        start.with_element_at(3, 1)
+
+
+def test_the_kept_elements_are_not_validated_again(monkeypatch: pytest.MonkeyPatch) -> None:
+    list_type = CtyList(element_type=CtyString())
+    value = list_type.validate([str(i) for i in range(50)])
+    seen: list[object] = []
+    original = CtyString.validate
+
+    def counting(self: CtyString, raw: object) -> CtyValue[str]:
+        seen.append(raw)
+        return original(self, raw)
+
+    monkeypatch.setattr(CtyString, "validate", counting)
+    value.append("x").with_element_at(0, "y")
+    CtyMap(element_type=CtyString()).validate({}).with_key("k", "v")
+    assert seen == ["x", "y", "v"]
+
+
+def test_merge_zipmap_and_concat_answer_as_validate_does() -> None:
+    map_type = CtyMap(element_type=CtyString())
+    left = map_type.validate({"a": "1", "b": CtyString().validate("2").mark(SENSITIVE)})
+    right = map_type.validate({"b": "3", COMPOSED: "4"})
+    merged = merge(left, right)
+    assert merged == map_type.validate({**left.value, **right.value})
+    assert list(merged.value) == ["a", "b", COMPOSED]
+
+    schema = CtyObject(attribute_types={"z": CtyString(), "a": CtyNumber()})
+    first = schema.validate({"a": 1, "z": "x"})
+    assert list(merge(first, first).value) == ["z", "a"]
+
+    keys = CtyList(element_type=CtyString()).validate(["k", COMPOSED])
+    values = CtyList(element_type=CtyString()).validate(["1", "2"])
+    assert zipmap(keys, values) == map_type.validate({"k": "1", COMPOSED: "2"})
+    assert zipmap(keys.mark(SENSITIVE), values).marks == frozenset({SENSITIVE})
+
+    numbers = CtyList(element_type=CtyNumber()).validate([1])
+    assert concat(values, numbers) == CtyList(element_type=CtyString()).validate(["1", "2", "1"])
+
+
+# 🌊🪢🔚
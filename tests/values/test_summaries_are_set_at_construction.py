@@ -0,0 +1,64 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""A built container already knows whether anything below it is marked or unknown.
+
+Each value is summarized from its children as it is built, so
+`collect_marks_deep` and `is_wholly_known` answer a fresh value without
+walking it. The break these tests catch is a summary that disagrees with the
+walk, or one taken over a payload that can still change in place.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pyvider.cty import CtyDynamic, CtyList, CtyMap, CtyNumber, CtyObject, CtySet, CtyString, CtyValue
+from pyvider.cty.marks import collect_marks_deep
+
+ROW = CtyObject(attribute_types={"name": CtyString(), "ports": CtyList(element_type=CtyNumber())})
+ROWS = CtyList(element_type=ROW)
+
+
+def test_a_validated_value_is_summarized_all_the_way_up() -> None:
+    rows = ROWS.validate([{"name": "a", "ports": [1, 2]}, {"name": "b", "ports": []}])
+    assert rows._deep_marks == frozenset()
+    assert rows._wholly_known is True
+    assert rows.value[0].value["ports"]._deep_marks == frozenset()
+    assert collect_marks_deep(rows) == frozenset()
+    assert rows.is_wholly_known()
+
+
+def test_a_marked_or_unknown_child_is_reported_by_every_parent() -> None:
+    port = CtyNumber().validate(22).mark("sensitive")
+    marked = ROWS.validate([{"name": "a", "ports": [port]}])
+    assert marked._deep_marks == frozenset({"sensitive"})
+    assert collect_marks_deep(marked) == frozenset({"sensitive"})
+    assert marked.is_wholly_known()
+
+    pending = ROWS.validate([{"name": CtyValue.unknown(CtyString()), "ports": []}])
+    assert pending._wholly_known is False
+    assert not pending.is_wholly_known()
+    assert not CtyValue(vtype=CtyDynamic(), value=pending).is_wholly_known()
+
+    tags = CtySet(element_type=CtyString()).validate(["a", CtyString().validate("b").mark("m")])
+    assert tags._deep_marks == collect_marks_deep(tags) == frozenset({"m"})
+    labels = CtyMap(element_type=CtyString()).validate({"k": "v"}).mark("outer")
+    assert labels._deep_marks == frozenset({"outer"})
+    assert labels._wholly_known is True
+
+
+def test_a_payload_that_can_still_change_is_left_to_the_walk() -> None:
+    inner: list[Any] = [CtyNumber().validate(1)]
+    nested = CtyValue(vtype=CtyList(element_type=CtyList(element_type=CtyNumber())), value=[inner])
+    assert nested._deep_marks is None
+    assert nested._wholly_known is None
+    assert nested.is_wholly_known()
+    inner.append(CtyValue.unknown(CtyNumber()).mark("late"))
+    assert not nested.is_wholly_known()
+    assert collect_marks_deep(nested) == frozenset({"late"})
+
+
+# 🌊🪢🔚
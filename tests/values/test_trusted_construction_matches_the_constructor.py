@@ -0,0 +1,148 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""`CtyValue._trusted` builds the value the constructor builds, for payloads already validated.
+
+The codecs, `transform`, `unknown_as_null`, the collection functions and the
+types' own `validate` build their results through it. The break these tests
+catch is a trusted value that differs from a constructed one: a field or memo
+slot left unset, an equality, hash or pickle that differs, an adopter whose
+result is not the one `validate` gives, or a rebuild that trusts children of
+the wrong type.
+"""
+
+from __future__ import annotations
+
+import pickle
+from typing import Any
+
+import pytest
+
+from pyvider.cty import (
+    CtyBool,
+    CtyList,
+    CtyMap,
+    CtyNumber,
+    CtyObject,
+    CtySet,
+    CtyString,
+    CtyTuple,
+    CtyType,
+    CtyValue,
+)
+from pyvider.cty.codec import cty_from_msgpack, cty_to_msgpack
+from pyvider.cty.exceptions import CtyValidationError
+from pyvider.cty.functions import distinct, keys, reverse, slice, sort, values
+from pyvider.cty.json_codec import cty_from_json, cty_to_json
+from pyvider.cty.marks import CtyMark
+from pyvider.cty.unknown import unknown_as_null
+from pyvider.cty.values.markers import UnknownValue
+from pyvider.cty.walk import transform
+
+SENSITIVE = CtyMark("sensitive")
+ROW = CtyObject(
+    attribute_types={"name": CtyString(), "port": CtyNumber(), "note": CtyString()},
+    optional_attributes=frozenset(["note"]),
+)
+SCHEMA = CtyObject(
+    attribute_types={
+        "rows": CtyList(element_type=ROW),
+        "tags": CtyMap(element_type=CtyString()),
+        "ids": CtySet(element_type=CtyNumber()),
+        "pair": CtyTuple(element_types=(CtyString(), CtyBool())),
+    }
+)
+RAW: dict[str, Any] = {
+    "rows": [{"name": "a", "port": 1}, {"name": "b", "port": 2, "note": "n"}],
+    "tags": {"café": "x", "b": "y"},
+    "ids": [3, 1, 3],
+    "pair": ("p", True),
+}
+
+
+def _fields(value: CtyValue[Any]) -> tuple[Any, ...]:
+    return (value.type, value.value, value.is_unknown, value.is_null, value.marks)
+
+
+@pytest.mark.parametrize(
+    ("vtype", "payload", "flags"),
+    [
+        (CtyString(), "x", {}),
+        (CtyNumber(), 7, {}),
+        (CtyString(), None, {"is_null": True}),
+        (CtyString(), UnknownValue(), {"is_unknown": True}),
+    ],
+)
+def test_a_trusted_value_is_the_constructed_value(vtype: CtyType[Any], payload: object, flags: Any) -> None:
+    trusted = CtyValue._trusted(vtype, payload, **flags)
+    built = CtyValue(vtype=vtype, value=payload, **flags)
+    assert _fields(trusted) == _fields(built)
+    assert trusted == built
+    assert hash(trusted) == hash(built)
+    assert trusted.mark(SENSITIVE) == built.mark(SENSITIVE)
+    restored = pickle.loads(pickle.dumps(trusted))  # noqa: S301
+    assert restored.type == built.type
+    assert _fields(restored)[2:] == _fields(built)[2:]
+
+
+def test_trusted_marks_and_many_are_the_constructors() -> None:
+    marked = CtyValue._trusted(CtyString(), "x", frozenset({SENSITIVE}))
+    assert marked == CtyValue(vtype=CtyString(), value="x", marks=frozenset({SENSITIVE}))
+    assert marked.unmark()[1] == frozenset({SENSITIVE})
+    many = CtyValue._trusted_many(CtyString(), ["a", "b"])
+    assert many == (CtyString().validate("a"), CtyString().validate("b"))
+    assert CtyValue.null(CtyString()) == CtyValue(vtype=CtyString(), value=None, is_null=True)
+
+
+def test_validate_and_the_codecs_build_what_the_constructor_would() -> None:
+    validated = SCHEMA.validate(RAW)
+    assert SCHEMA.validate(RAW) == validated
+    assert cty_from_msgpack(cty_to_msgpack(validated, SCHEMA), SCHEMA) == validated
+    assert cty_from_json(cty_to_json(validated, SCHEMA), SCHEMA) == validated
+    rows = validated.value["rows"]
+    assert rows.value == tuple(ROW.validate(row) for row in RAW["rows"])
+    assert validated.value["rows"].value[0].value["note"].is_null
+
+
+def test_the_collection_functions_answer_as_validate_does() -> None:
+    strings = CtyList(element_type=CtyString())
+    listed = strings.validate(["b", "a", "b"])
+    assert sort(listed) == strings.validate(["a", "b", "b"])
+    assert reverse(listed) == strings.validate(["b", "a", "b"])
+    assert distinct(listed) == strings.validate(["b", "a"])
+    assert slice(listed, CtyNumber().validate(1), CtyNumber().validate(3)) == strings.validate(["a", "b"])
+    mapped = CtyMap(element_type=CtyNumber()).validate({"café": 1, "a": 2})
+    assert keys(mapped) == strings.validate(["a", "café"])
+    assert values(mapped) == CtyList(element_type=CtyNumber()).validate([2, 1])
+
+
+def test_transform_and_unknown_as_null_rebuild_what_validate_would() -> None:
+    validated = SCHEMA.validate(RAW)
+
+    def shout(path: Any, value: CtyValue[Any]) -> CtyValue[Any]:
+        if isinstance(value.type, CtyString) and not (value.is_unknown or value.is_null):
+            return CtyString().validate(value.value.upper())
+        return value
+
+    expected = dict(RAW, tags={"café": "X", "b": "Y"}, pair=("P", True))
+    expected["rows"] = [{"name": "A", "port": 1}, {"name": "B", "port": 2, "note": "N"}]
+    assert transform(validated, shout) == SCHEMA.validate(expected)
+    with_unknown = SCHEMA.validate(dict(RAW, tags={"café": UnknownValue()}))
+    assert unknown_as_null(with_unknown) == SCHEMA.validate(dict(RAW, tags={"café": None}))
+
+
+def test_a_rebuild_with_a_child_of_the_wrong_type_is_still_refused() -> None:
+    listed = CtyList(element_type=CtyString()).validate(["a"])
+
+    def retype(path: Any, value: CtyValue[Any]) -> CtyValue[Any]:
+        if isinstance(value.type, CtyString):
+            return CtyNumber().validate(1)
+        return value
+
+    with pytest.raises(CtyValidationError):
+        transform(listed, retype)
+
+
+# 🌊🪢🔚